@@ -47,6 +47,7 @@ if not os.path.exists(EXAMPLES_PATH):  # pragma: no cover
     os.makedirs(EXAMPLES_PATH)
 
 from ansys.additive.core.additive import Additive  # noqa: F401, E402
+from ansys.additive.core.async_additive import AsyncAdditive  # noqa: F401, E402
 from ansys.additive.core.exceptions import (  # noqa: F401, E402
     BetaFeatureNotEnabledError,
 )
@@ -83,6 +84,7 @@ from ansys.additive.core.porosity import (  # noqa: F401, E402
     PorositySummary,
 )
 from ansys.additive.core.simulation import (  # noqa: F401, E402
+    SimulationLogs,
     SimulationStatus,
     SimulationType,
 )
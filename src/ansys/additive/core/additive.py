@@ -21,9 +21,13 @@
 # SOFTWARE.
 """Provides a client for interacting with the Additive service."""
 
+import contextlib
 import logging
 import os
 import time
+import weakref
+from collections.abc import Container
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import grpc
@@ -37,6 +41,7 @@ from ansys.additive.core.exceptions import BetaFeatureNotEnabledError
 from ansys.additive.core.logger import LOG
 from ansys.additive.core.machine import MachineConstants
 from ansys.additive.core.material import RESERVED_MATERIAL_NAMES, AdditiveMaterial
+from ansys.additive.core.material_cache import MaterialCache
 from ansys.additive.core.material_tuning import (
     MaterialTuningInput,
     MaterialTuningSummary,
@@ -68,7 +73,7 @@ from ansys.additive.core.simulation import (
     SimulationType,
 )
 from ansys.additive.core.simulation_error import SimulationError
-from ansys.additive.core.simulation_requests import create_request
+from ansys.additive.core.simulation_requests import DEFAULT_UPLOAD_CHUNK_SIZE, create_request
 from ansys.additive.core.simulation_task import SimulationTask
 from ansys.additive.core.simulation_task_manager import SimulationTaskManager
 from ansys.additive.core.single_bead import SingleBeadInput, SingleBeadSummary
@@ -85,6 +90,9 @@ from ansys.api.additive.v0.additive_materials_pb2 import (
 from ansys.api.additive.v0.additive_operations_pb2 import OperationMetadata
 from ansys.api.additive.v0.additive_settings_pb2 import SettingsRequest
 
+MAX_CONCURRENT_SUBMISSIONS = 8
+"""Maximum number of simulation requests prepared and submitted in parallel."""
+
 
 class Additive:
     """Provides the client interface to one or more Additive services.
@@ -139,6 +147,32 @@ class Additive:
         Otherwise, the socket filename will be "additive-<uds_id>.sock".
     allow_remote_host: bool, default: False
         Whether to allow connections to remote hosts when using 'insecure' or 'mtls' transport modes.
+    server_connections: list[str | grpc.Channel], None, default: None
+        Servers to distribute simulations across. Each item is either an address of
+        the form ``host:port`` or a connected :class:`grpc.Channel <grpc.Channel>`.
+        If provided, the ``channel``, ``host`` and ``port`` parameters are ignored.
+        Materials and settings requests are sent to the first server.
+    material_cache_size: int, default: 16
+        Maximum number of materials retrieved with :meth:`material` to keep in memory.
+        Use ``0`` to request materials from the server every time.
+    material_cache_ttl: float, None, default: None
+        Time in seconds after which cached materials and material names are requested
+        from the server again. If ``None``, they are kept until a material is added
+        or removed, or :meth:`clear_material_cache` is called.
+    upload_chunk_size: int, default: 2097152
+        Size in bytes of the chunks geometry files are uploaded in. Files are read
+        and hashed ahead of the upload on a worker thread.
+    keep_logs_in_memory: bool, default: False
+        Whether simulation summaries hold their logs in memory. If ``False``, the logs
+        of each simulation are written to a file in the user data folder and read when
+        accessed.
+    defer_vtk_files: bool, default: True
+        Whether the VTK files of microstructure summaries are written when their paths
+        are first accessed. If ``False``, they are written to the user data folder as
+        soon as each simulation completes.
+    result_file_members: Container[str], None, default: None
+        Names of the files to extract from downloaded result archives, such as specific
+        thermal history VTK files. If ``None``, all files are extracted.
 
     Examples
     --------
@@ -183,6 +217,13 @@ class Additive:
         uds_dir: Path | str | None = None,
         uds_id: str | None = None,
         allow_remote_host: bool = False,
+        server_connections: list[str | grpc.Channel] | None = None,
+        material_cache_size: int = MaterialCache.DEFAULT_MAX_SIZE,
+        material_cache_ttl: float | None = None,
+        upload_chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+        keep_logs_in_memory: bool = False,
+        defer_vtk_files: bool = True,
+        result_file_members: Container[str] | None = None,
     ) -> None:
         """Initialize server connections."""
         if not product_version:
@@ -193,19 +234,48 @@ class Additive:
         if log_file:
             LOG.log_to_file(filename=log_file, level=log_level)
 
-        self._server = Additive._connect_to_server(
-            channel,
-            host,
-            port,
-            product_version,
-            LOG,
-            linux_install_path,
-            transport_mode,
-            certs_dir,
-            uds_dir,
-            uds_id,
-            allow_remote_host,
-        )
+        if server_connections:
+            self._servers = [
+                Additive._connect_to_server(
+                    connection if isinstance(connection, grpc.Channel) else None,
+                    *(
+                        (None, port)
+                        if isinstance(connection, grpc.Channel)
+                        else Additive._split_address(connection)
+                    ),
+                    product_version,
+                    LOG,
+                    linux_install_path,
+                    transport_mode,
+                    certs_dir,
+                    uds_dir,
+                    uds_id,
+                    allow_remote_host,
+                )
+                for connection in server_connections
+            ]
+        else:
+            self._servers = [
+                Additive._connect_to_server(
+                    channel,
+                    host,
+                    port,
+                    product_version,
+                    LOG,
+                    linux_install_path,
+                    transport_mode,
+                    certs_dir,
+                    uds_dir,
+                    uds_id,
+                    allow_remote_host,
+                )
+            ]
+        # The first server handles requests that are not simulations
+        self._server = self._servers[0]
+        # Number of concurrent simulations each server is configured to run
+        self._server_capacities = [1] * len(self._servers)
+        # Tasks submitted to each server, used to estimate server load
+        self._server_tasks = [weakref.WeakSet() for _ in self._servers]
 
         # HACK: Set the number of concurrent simulations per server
         # when generating documentation to reduce time.
@@ -215,6 +285,11 @@ class Additive:
         LOG.info(self.apply_server_settings(initial_settings))
 
         self._enable_beta_features = enable_beta_features
+        self._material_cache = MaterialCache(material_cache_size, material_cache_ttl)
+        self._upload_chunk_size = upload_chunk_size
+        self._keep_logs_in_memory = keep_logs_in_memory
+        self._defer_vtk_files = defer_vtk_files
+        self._result_file_members = result_file_members
 
         # Setup data directory
         self._user_data_path = USER_DATA_PATH
@@ -222,6 +297,14 @@ class Additive:
             os.makedirs(self._user_data_path)
         LOG.info("user data path: " + self._user_data_path)
 
+    @staticmethod
+    def _split_address(address: str) -> tuple[str, int]:
+        """Split an address of the form ``host:port`` into its host and port."""
+        host, _, port = address.rpartition(":")
+        if not host or not port.isdigit():
+            raise ValueError(f"Improperly formed server address {address}, expected 'host:port'")
+        return host, int(port)
+
     @staticmethod
     def _connect_to_server(
         channel: grpc.Channel | None = None,
@@ -356,7 +439,8 @@ class Additive:
         if self._server is None:
             about += "Client is not connected to a server.\n"
         else:
-            about += str(self._server.status()) + "\n"
+            for server in self._servers:
+                about += str(server.status()) + "\n"
         return about
 
     def apply_server_settings(self, settings: dict[str, str]) -> list[str]:
@@ -373,7 +457,7 @@ class Additive:
         Returns
         -------
         list[str]
-            List of messages from the server.
+            List of messages from the servers.
 
         """
         request = SettingsRequest()
@@ -382,9 +466,40 @@ class Additive:
             setting.key = setting_key
             setting.value = setting_value
 
-        response = self._server.settings_stub.ApplySettings(request)
+        responses = [server.settings_stub.ApplySettings(request) for server in self._servers]
+        messages = (
+            responses[0].messages
+            if len(responses) == 1
+            else [message for response in responses for message in response.messages]
+        )
+
+        if "NumConcurrentSims" in settings and len(self._servers) > 1:
+            self._server_capacities = [self._server_capacity(s) for s in self._servers]
+
+        return messages
+
+    @staticmethod
+    def _server_capacity(server: ServerConnection) -> int:
+        """Get the number of simulations a server is configured to run concurrently.
+
+        Parameters
+        ----------
+        server: ServerConnection
+            Server to read the ``NumConcurrentSims`` setting of.
+
+        Returns
+        -------
+        int
+            Number of concurrent simulations, or ``1`` if the server does not report
+            a valid value.
 
-        return response.messages
+        """
+        response = server.settings_stub.ListSettings(Empty())
+        for setting in response.settings:
+            if setting.key == "NumConcurrentSims":
+                with contextlib.suppress(ValueError):
+                    return max(1, int(setting.value))
+        return 1
 
     def list_server_settings(self) -> dict[str, str]:
         """Get a dictionary of settings for the server."""
@@ -482,20 +597,96 @@ class Additive:
         if not isinstance(inputs, list):
             if not progress_handler:
                 progress_handler = DefaultSingleSimulationProgressHandler()
-            simulation_task = self._simulate(inputs, self._server, progress_handler)
+            server = self._assign_servers(1)[0]
+            simulation_task = self._simulate(inputs, server, progress_handler)
+            self._track_task(simulation_task, server)
             task_manager.add_task(simulation_task)
             return task_manager
 
         if len(inputs) == 0:
             raise ValueError("No simulation inputs provided")
 
-        LOG.info(f"Starting {len(inputs)} simulations")
+        # Validate all inputs before submitting any of them
         for sim_input in inputs:
-            task = self._simulate(sim_input, self._server, progress_handler)
+            Additive._validate_simulation_input(sim_input, self.enable_beta_features)
+
+        LOG.info(f"Starting {len(inputs)} simulations")
+        start_time = time.perf_counter()
+        servers = self._assign_servers(len(inputs))
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_CONCURRENT_SUBMISSIONS, len(inputs)),
+            thread_name_prefix="pyadditive-submit",
+        ) as executor:
+            tasks = list(
+                executor.map(
+                    lambda args: self._simulate(*args, progress_handler),
+                    zip(inputs, servers, strict=True),
+                )
+            )
+        for task, server in zip(tasks, servers, strict=True):
+            self._track_task(task, server)
             task_manager.add_task(task)
 
+        elapsed = time.perf_counter() - start_time
+        rate = len(inputs) / elapsed if elapsed > 0 else float("inf")
+        LOG.info(
+            f"Submitted {len(inputs)} simulations in {elapsed:.2f} s ({rate:.1f} simulations/s)"
+        )
         return task_manager
 
+    def _track_task(self, task: SimulationTask, server: ServerConnection) -> None:
+        """Record a task submitted to a server for use in load estimates."""
+        if len(self._servers) > 1 and server in self._servers:
+            self._server_tasks[self._servers.index(server)].add(task)
+
+    def _assign_servers(self, count: int) -> list[ServerConnection]:
+        """Choose a server for each of a number of new simulations.
+
+        Each simulation is assigned to the server with the lowest load, where load
+        is the number of queued and running simulations on the server divided by
+        the number of simulations it runs concurrently.
+
+        Parameters
+        ----------
+        count: int
+            Number of simulations to assign.
+
+        Returns
+        -------
+        list[ServerConnection]
+            Server to use for each simulation.
+
+        """
+        if len(self._servers) == 1:
+            return [self._server] * count
+
+        depths = [self._queue_depth(i) for i in range(len(self._servers))]
+        assigned = []
+        for _ in range(count):
+            i = min(
+                range(len(self._servers)),
+                key=lambda i: (depths[i] + 1) / self._server_capacities[i],
+            )
+            depths[i] += 1
+            assigned.append(self._servers[i])
+        return assigned
+
+    def _queue_depth(self, server_index: int) -> int:
+        """Get the number of unfinished simulations this client submitted to a server.
+
+        Parameters
+        ----------
+        server_index: int
+            Index of the server in the list of servers.
+
+        Returns
+        -------
+        int
+            Number of queued and running simulations.
+
+        """
+        return sum(1 for t in self._server_tasks[server_index] if not t.done)
+
     def _simulate(
         self,
         simulation_input: (
@@ -526,33 +717,21 @@ class Additive:
 
         """  # noqa: E501
 
-        if simulation_input.material == AdditiveMaterial():
-            raise ValueError("A material is not assigned to the simulation input")
-
-        if (
-            isinstance(simulation_input, (Microstructure3DInput, ThermalHistoryInput))
-            and self.enable_beta_features is False
-        ):
-            raise BetaFeatureNotEnabledError(
-                "This simulation requires beta features to be enabled.\n"
-                "Set enable_beta_features=True when creating the Additive client."
-            )
-
-        if (
-            simulation_input.machine.heat_source_model
-            != MachineConstants.HEAT_SOURCE_MODEL_NAME_GAUSSIAN
-            and self.enable_beta_features is False
-        ):
-            raise BetaFeatureNotEnabledError(
-                "Heat source models other than the default require beta features to be enabled.\n"
-                "Set enable_beta_features=True when creating the Additive client."
-            )
+        Additive._validate_simulation_input(simulation_input, self.enable_beta_features)
 
         try:
-            request = create_request(simulation_input, server, progress_handler)
+            request = create_request(
+                simulation_input, server, progress_handler, self._upload_chunk_size
+            )
             long_running_op = server.simulation_stub.Simulate(request)
             simulation_task = SimulationTask(
-                server, long_running_op, simulation_input, self._user_data_path
+                server,
+                long_running_op,
+                simulation_input,
+                self._user_data_path,
+                self._keep_logs_in_memory,
+                self._defer_vtk_files,
+                self._result_file_members,
             )
             LOG.debug(f"Simulation task created for {simulation_input.id}")
 
@@ -561,15 +740,70 @@ class Additive:
             errored_op = Operation(name=simulation_input.id, done=True)
             errored_op.metadata.Pack(metadata)
             simulation_task = SimulationTask(
-                server, errored_op, simulation_input, self._user_data_path
+                server,
+                errored_op,
+                simulation_input,
+                self._user_data_path,
+                self._keep_logs_in_memory,
+                self._defer_vtk_files,
+                self._result_file_members,
             )
 
         if progress_handler:
-            time.sleep(0.1)  # Allow time for the server to start the simulation
             progress_handler.update(simulation_task.status())
 
         return simulation_task
 
+    @staticmethod
+    def _validate_simulation_input(
+        simulation_input: (
+            SingleBeadInput
+            | PorosityInput
+            | MicrostructureInput
+            | ThermalHistoryInput
+            | Microstructure3DInput
+        ),
+        enable_beta_features: bool,
+    ) -> None:
+        """Check that a simulation input can be submitted to the server.
+
+        Parameters
+        ----------
+        simulation_input: SingleBeadInput, PorosityInput, MicrostructureInput, ThermalHistoryInput, Microstructure3DInput
+            Parameters to use for simulation.
+        enable_beta_features: bool
+            Flag indicating if beta features are enabled.
+
+        Raises
+        ------
+        ValueError
+            If a material is not assigned to the simulation input.
+        BetaFeatureNotEnabledError
+            If the simulation input requires beta features and they are not enabled.
+
+        """  # noqa: E501
+        if simulation_input.material._is_default():
+            raise ValueError("A material is not assigned to the simulation input")
+
+        if (
+            isinstance(simulation_input, (Microstructure3DInput, ThermalHistoryInput))
+            and enable_beta_features is False
+        ):
+            raise BetaFeatureNotEnabledError(
+                "This simulation requires beta features to be enabled.\n"
+                "Set enable_beta_features=True when creating the Additive client."
+            )
+
+        if (
+            simulation_input.machine.heat_source_model
+            != MachineConstants.HEAT_SOURCE_MODEL_NAME_GAUSSIAN
+            and enable_beta_features is False
+        ):
+            raise BetaFeatureNotEnabledError(
+                "Heat source models other than the default require beta features to be enabled.\n"
+                "Set enable_beta_features=True when creating the Additive client."
+            )
+
     def materials_list(self) -> list[str]:
         """Get a list of material names used in additive simulations.
 
@@ -579,8 +813,11 @@ class Additive:
             Names of available additive materials.
 
         """
-        response = self._server.materials_stub.GetMaterialsList(Empty())
-        return response.names
+        names = self._material_cache.names()
+        if names is None:
+            names = list(self._server.materials_stub.GetMaterialsList(Empty()).names)
+            self._material_cache.set_names(names)
+        return names
 
     def material(self, name: str) -> AdditiveMaterial:
         """Get a material for use in an additive simulation.
@@ -596,9 +833,22 @@ class Additive:
             Requested material definition.
 
         """
-        request = GetMaterialRequest(name=name)
-        result = self._server.materials_stub.GetMaterial(request)
-        return AdditiveMaterial._from_material_message(result)
+        material = self._material_cache.material(name)
+        if material is None:
+            request = GetMaterialRequest(name=name)
+            result = self._server.materials_stub.GetMaterial(request)
+            material = self._material_cache.add_material(
+                name, AdditiveMaterial._from_material_message(result)
+            )
+        return material
+
+    def clear_material_cache(self):
+        """Remove all materials and material names retrieved from the server from memory.
+
+        Use this method when materials are added to or removed from the server by
+        another client.
+        """
+        self._material_cache.clear()
 
     @staticmethod
     def load_material(
@@ -684,6 +934,7 @@ class Additive:
         request = AddMaterialRequest(id=misc.short_uuid(), material=material._to_material_message())
         LOG.info(f"Adding material {request.material.name}")
         response = self._server.materials_stub.AddMaterial(request)
+        self._material_cache.clear()
 
         if response.HasField("error"):
             raise RuntimeError(response.error)
@@ -703,6 +954,7 @@ class Additive:
             raise ValueError(f"Unable to remove Ansys-supplied material '{name}'.")
 
         self._server.materials_stub.RemoveMaterial(RemoveMaterialRequest(name=name))
+        self._material_cache.clear()
 
     def tune_material(
         self,
@@ -783,7 +1035,15 @@ class Additive:
         request = input._to_request()
         operation = self._server.simulation_stub.Simulate(request)
         LOG.debug(f"Material tuning operation created for {input.id}")
-        return SimulationTask(self._server, operation, input, out_dir)
+        return SimulationTask(
+            self._server,
+            operation,
+            input,
+            out_dir,
+            self._keep_logs_in_memory,
+            self._defer_vtk_files,
+            self._result_file_members,
+        )
 
     def simulate_study(
         self,
@@ -815,24 +1075,19 @@ class Additive:
             Handler for progress updates. If ``None``, a :class:`ParametricStudyProcessHandler` will be used.
 
         """
-        SLEEP_INTERVAL = 2
         progress_handler = ParametricStudyProgressHandler(study)
-        summaries = []
 
         try:
-            task_mgr = self.simulate_study_async(
-                study, simulation_ids, types, priority, iteration, progress_handler
-            )
-            # Allow time for the server to start the simulations
-            time.sleep(SLEEP_INTERVAL)
-            while not task_mgr.done:
-                task_mgr.status(progress_handler)
-                current_summaries = task_mgr.summaries()
-                new_summaries = [s for s in current_summaries if s not in summaries]
-                if new_summaries:
-                    study.update(new_summaries)
-                    summaries = current_summaries
-                time.sleep(SLEEP_INTERVAL)
+            # Status changes reported by the progress handler are saved along with
+            # the results rather than each time a simulation changes state
+            with study.batch():
+                task_mgr = self.simulate_study_async(
+                    study, simulation_ids, types, priority, iteration, progress_handler
+                )
+                # Record each result as soon as its simulation completes
+                for summary in task_mgr.as_completed(progress_handler):
+                    study.update([summary])
+                    study.save(study.file_name)
 
         except Exception as e:
             LOG.error(f"Error running study: {e}")
@@ -884,7 +1139,8 @@ class Additive:
         study.clear_errors(ids)
         return self.simulate_async(inputs, progress_handler)
 
-    def _check_for_duplicate_id(self, inputs):
+    @staticmethod
+    def _check_for_duplicate_id(inputs):
         """Check for duplicate simulation IDs in a list of inputs.
 
         If an input does not have an ID, one will be assigned.
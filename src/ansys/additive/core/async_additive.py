@@ -0,0 +1,579 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides an asyncio client for interacting with the Additive service."""
+
+import asyncio
+import os
+from collections.abc import Container
+from pathlib import Path
+
+import grpc
+from google.longrunning.operations_pb2 import Operation
+from google.protobuf.empty_pb2 import Empty
+
+from ansys.additive.core import USER_DATA_PATH
+from ansys.additive.core.additive import MAX_CONCURRENT_SUBMISSIONS, Additive
+from ansys.additive.core.async_simulation_task import AsyncSimulationTask
+from ansys.additive.core.async_simulation_task_manager import AsyncSimulationTaskManager
+from ansys.additive.core.logger import LOG
+from ansys.additive.core.material import AdditiveMaterial
+from ansys.additive.core.microstructure import (
+    MicrostructureInput,
+    MicrostructureSummary,
+)
+from ansys.additive.core.microstructure_3d import (
+    Microstructure3DInput,
+    Microstructure3DSummary,
+)
+from ansys.additive.core.parametric_study import ParametricStudy
+from ansys.additive.core.parametric_study.parametric_study_progress_handler import (
+    ParametricStudyProgressHandler,
+)
+from ansys.additive.core.porosity import PorosityInput, PorositySummary
+from ansys.additive.core.progress_handler import IProgressHandler
+from ansys.additive.core.server_connection import AsyncServerConnection
+from ansys.additive.core.server_connection.constants import LOCALHOST, TransportMode
+from ansys.additive.core.simulation import SimulationStatus, SimulationType
+from ansys.additive.core.simulation_error import SimulationError
+from ansys.additive.core.simulation_requests import (
+    DEFAULT_UPLOAD_CHUNK_SIZE,
+    create_request_async,
+)
+from ansys.additive.core.single_bead import SingleBeadInput, SingleBeadSummary
+from ansys.additive.core.thermal_history import (
+    ThermalHistoryInput,
+    ThermalHistorySummary,
+)
+from ansys.api.additive.v0.additive_materials_pb2 import GetMaterialRequest
+from ansys.api.additive.v0.additive_operations_pb2 import OperationMetadata
+from ansys.api.additive.v0.additive_settings_pb2 import SettingsRequest
+
+
+class AsyncAdditive:
+    """Provides an asyncio client interface to an Additive service.
+
+    This class is the :mod:`asyncio` counterpart of :class:`Additive <.additive.Additive>`.
+    Calls to the server are made on a :class:`grpc.aio.Channel`, so many simulations can be
+    submitted and awaited from a single event loop without dedicating a thread to each.
+
+    The client connects to an already running server. The connection is established by
+    :meth:`connect` or by entering the client as an asynchronous context manager.
+
+    Parameters
+    ----------
+    channel: grpc.aio.Channel, default: None
+        Asyncio server connection. If provided, it is assumed that the
+        :class:`grpc.aio.Channel <grpc.aio.Channel>` object is connected to the server.
+        Also, if provided, the ``host`` and ``port`` parameters are ignored.
+    host: str, default: None
+        Host name or IPv4 address of the server. This parameter is ignored if the
+        ``channel`` parameter is other than ``None``. If neither is provided, the
+        ``ANSYS_ADDITIVE_ADDRESS`` environment variable is used when set.
+    port: int, default: 50052
+        Port number to use when connecting to the server.
+    nsims_per_server: int, default: 1
+        Number of simultaneous simulations to run on the server. Each simulation
+        requires a license checkout. If a license is not available, the simulation
+        fails.
+    log_level: str, default: ""
+        Minimum severity level of messages to log. Valid values are "DEBUG", "INFO",
+        "WARNING", "ERROR", and "CRITICAL". The default value equates to "WARNING".
+    log_file: str, default: ""
+        File name to write log messages to.
+    enable_beta_features: bool, default: False
+        Flag indicating if beta features are enabled.
+    transport_mode : TransportMode | str, default: TransportMode.UDS
+        The transport mode to use for the connection. Can be a member of the :class:`TransportMode <.constants.TransportMode>` enum or a string
+        ('insecure', 'mtls', or 'uds').
+    certs_dir : Path | str | None
+        Directory to use for TLS certificates. Applicable if `transport_mode` is 'mtls'.
+    uds_dir : Path | str | None
+        Optional directory containing Unix Domain Socket files. Applicable if `transport_mode` is 'uds'.
+    uds_id : str | None
+        Optional identifier for the Unix Domain Socket. Applicable if `transport_mode` is 'uds'.
+    allow_remote_host: bool, default: False
+        Whether to allow connections to remote hosts when using 'insecure' or 'mtls' transport modes.
+    upload_chunk_size: int, default: 2097152
+        Size in bytes of the chunks geometry files are uploaded in.
+    keep_logs_in_memory: bool, default: False
+        Whether simulation summaries hold their logs in memory. If ``False``, the logs
+        of each simulation are written to a file in the user data folder and read when
+        accessed.
+    defer_vtk_files: bool, default: True
+        Whether the VTK files of microstructure summaries are written when their paths
+        are first accessed. If ``False``, they are written to the user data folder as
+        soon as each simulation completes.
+    result_file_members: Container[str], None, default: None
+        Names of the files to extract from downloaded result archives, such as specific
+        thermal history VTK files. If ``None``, all files are extracted.
+
+    Examples
+    --------
+    Connect to a server and run a simulation.
+
+    >>> async with AsyncAdditive(host="localhost", transport_mode="insecure") as additive:
+    ...     material = await additive.material("17-4PH")
+    ...     summary = await additive.simulate(SingleBeadInput(material=material))
+
+    """
+
+    DEFAULT_ADDITIVE_SERVICE_PORT = Additive.DEFAULT_ADDITIVE_SERVICE_PORT
+
+    def __init__(
+        self,
+        channel: grpc.aio.Channel | None = None,
+        host: str | None = None,
+        port: int = DEFAULT_ADDITIVE_SERVICE_PORT,
+        nsims_per_server: int = 1,
+        log_level: str = "",
+        log_file: str = "",
+        enable_beta_features: bool = False,
+        transport_mode: TransportMode | str = TransportMode.UDS,
+        certs_dir: Path | str | None = None,
+        uds_dir: Path | str | None = None,
+        uds_id: str | None = None,
+        allow_remote_host: bool = False,
+        upload_chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+        keep_logs_in_memory: bool = False,
+        defer_vtk_files: bool = True,
+        result_file_members: Container[str] | None = None,
+    ) -> None:
+        """Initialize the client. No connection is made until :meth:`connect` is called."""
+        if channel and not isinstance(channel, grpc.aio.Channel):
+            raise ValueError("channel must be a grpc.aio.Channel object")
+
+        if log_level:
+            LOG.setLevel(log_level)
+        if log_file:
+            LOG.log_to_file(filename=log_file, level=log_level)
+
+        self._channel = channel
+        if host:
+            self._addr = f"{host}:{port}"
+        elif os.getenv("ANSYS_ADDITIVE_ADDRESS"):
+            self._addr = os.getenv("ANSYS_ADDITIVE_ADDRESS")
+        else:
+            # UDS connections do not use the address, but it is still validated
+            self._addr = f"{LOCALHOST}:{port}"
+        self._transport_mode = transport_mode
+        self._certs_dir = certs_dir
+        self._uds_dir = uds_dir
+        self._uds_id = uds_id
+        self._allow_remote_host = allow_remote_host
+        self._nsims_per_server = nsims_per_server
+        self._enable_beta_features = enable_beta_features
+        self._upload_chunk_size = upload_chunk_size
+        self._keep_logs_in_memory = keep_logs_in_memory
+        self._defer_vtk_files = defer_vtk_files
+        self._result_file_members = result_file_members
+        self._server: AsyncServerConnection | None = None
+
+        # Setup data directory
+        self._user_data_path = USER_DATA_PATH
+        if not os.path.exists(self._user_data_path):  # pragma: no cover
+            os.makedirs(self._user_data_path)
+
+    async def connect(self) -> None:
+        """Connect to the server and apply the initial server settings.
+
+        Raises
+        ------
+        RuntimeError
+            If the server does not respond.
+
+        """
+        if self._server is not None:
+            return
+        if self._channel:
+            server = AsyncServerConnection(channel=self._channel, log=LOG)
+        else:
+            server = AsyncServerConnection(
+                addr=self._addr,
+                log=LOG,
+                transport_mode=self._transport_mode,
+                certs_dir=self._certs_dir,
+                uds_dir=self._uds_dir,
+                uds_id=self._uds_id,
+                allow_remote_host=self._allow_remote_host,
+            )
+        if not await server.ready():
+            raise RuntimeError(f"Unable to connect to server {server.channel_str}")
+        LOG.info(f"Connected to {server.channel_str}")
+        self._server = server
+
+        # HACK: Set the number of concurrent simulations per server
+        # when generating documentation to reduce time.
+        nsims_per_server = 8 if os.getenv("GENERATING_DOCS", None) else self._nsims_per_server
+        LOG.info(await self.apply_server_settings({"NumConcurrentSims": str(nsims_per_server)}))
+
+    async def close(self) -> None:
+        """Close the connection to the server."""
+        if self._server is not None:
+            await self._server.close()
+            self._server = None
+
+    async def __aenter__(self) -> "AsyncAdditive":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @property
+    def enable_beta_features(self) -> bool:
+        """Flag indicating if beta features are enabled."""
+        return self._enable_beta_features
+
+    @enable_beta_features.setter
+    def enable_beta_features(self, value: bool) -> None:
+        """Set the flag indicating if beta features are enabled."""
+        self._enable_beta_features = value
+
+    @property
+    def connected(self) -> bool:
+        """Return True if :meth:`connect` has been called and the client is not closed."""
+        return self._server is not None
+
+    async def apply_server_settings(self, settings: dict[str, str]) -> list[str]:
+        """Apply settings to the server.
+
+        Parameters
+        ----------
+        settings: dict[str, str]
+            Dictionary of settings to apply to the server.
+
+        Returns
+        -------
+        list[str]
+            List of messages from the server.
+
+        """
+        request = SettingsRequest()
+        for setting_key, setting_value in settings.items():
+            setting = request.settings.add()
+            setting.key = setting_key
+            setting.value = setting_value
+
+        response = await self._server.settings_stub.ApplySettings(request)
+
+        return response.messages
+
+    async def simulate(
+        self,
+        inputs: (
+            SingleBeadInput
+            | PorosityInput
+            | MicrostructureInput
+            | ThermalHistoryInput
+            | Microstructure3DInput
+            | list
+        ),
+        progress_handler: IProgressHandler | None = None,
+    ) -> (
+        SingleBeadSummary
+        | PorositySummary
+        | MicrostructureSummary
+        | ThermalHistorySummary
+        | Microstructure3DSummary
+        | SimulationError
+        | list
+    ):
+        """Execute additive simulations.
+
+        Parameters
+        ----------
+        inputs: SingleBeadInput, PorosityInput, MicrostructureInput, ThermalHistoryInput, Microstructure3DInput, list
+            Parameters to use for simulations. A list of inputs may be provided to run multiple
+            simulations.
+        progress_handler: IProgressHandler, None, default: None
+            Handler for progress updates. If ``None``, no progress updates are provided.
+
+        Returns
+        -------
+        SingleBeadSummary, PorositySummary, MicrostructureSummary, ThermalHistorySummary,
+        Microstructure3DSummary, SimulationError, list
+            One or more summaries of simulation results. If a list of inputs is provided, a
+            list is returned.
+
+        """  # noqa: E501
+        task_mgr = await self.simulate_async(inputs, progress_handler)
+        await task_mgr.wait_all(progress_handler=progress_handler)
+        summaries = task_mgr.summaries()
+
+        for summ in summaries:
+            if isinstance(summ, SimulationError):
+                LOG.error(f"\nError: {summ.message}")
+
+        return summaries if isinstance(inputs, list) else summaries[0]
+
+    async def simulate_async(
+        self,
+        inputs: (
+            SingleBeadInput
+            | PorosityInput
+            | MicrostructureInput
+            | ThermalHistoryInput
+            | Microstructure3DInput
+            | list
+        ),
+        progress_handler: IProgressHandler | None = None,
+    ) -> AsyncSimulationTaskManager:
+        """Submit additive simulations without waiting for them to complete.
+
+        All inputs are validated before any simulation is submitted. The simulation
+        requests are then submitted to the server concurrently, up to
+        :data:`MAX_CONCURRENT_SUBMISSIONS <.additive.MAX_CONCURRENT_SUBMISSIONS>` at a time.
+
+        Parameters
+        ----------
+        inputs: SingleBeadInput, PorosityInput, MicrostructureInput, ThermalHistoryInput, Microstructure3DInput, list
+            Parameters to use for simulations. A list of inputs may be provided to run multiple
+            simulations.
+        progress_handler: IProgressHandler, None, default: None
+            Handler for progress updates. If ``None``, no progress updates are provided.
+
+        Returns
+        -------
+        AsyncSimulationTaskManager
+            A task manager to handle all tasks sent to the server by this function call.
+
+        """  # noqa: E501
+        Additive._check_for_duplicate_id(inputs)
+
+        if not isinstance(inputs, list):
+            inputs = [inputs]
+        elif len(inputs) == 0:
+            raise ValueError("No simulation inputs provided")
+
+        # Validate all inputs before submitting any of them
+        for sim_input in inputs:
+            Additive._validate_simulation_input(sim_input, self.enable_beta_features)
+
+        LOG.info(f"Starting {len(inputs)} simulations")
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SUBMISSIONS)
+
+        async def submit(sim_input) -> AsyncSimulationTask:
+            async with semaphore:
+                return await self._simulate(sim_input, progress_handler)
+
+        tasks = await asyncio.gather(*(submit(i) for i in inputs))
+
+        task_manager = AsyncSimulationTaskManager()
+        for task in tasks:
+            task_manager.add_task(task)
+        return task_manager
+
+    async def _simulate(
+        self,
+        simulation_input: (
+            SingleBeadInput
+            | PorosityInput
+            | MicrostructureInput
+            | ThermalHistoryInput
+            | Microstructure3DInput
+        ),
+        progress_handler: IProgressHandler | None = None,
+    ) -> AsyncSimulationTask:
+        """Submit a single simulation.
+
+        Parameters
+        ----------
+        simulation_input: SingleBeadInput, PorosityInput, MicrostructureInput, ThermalHistoryInput, Microstructure3DInput
+            Parameters to use for simulation.
+        progress_handler: IProgressHandler, None, default: None
+            Handler for progress updates. If ``None``, no progress updates are provided.
+
+        Returns
+        -------
+        AsyncSimulationTask
+            A task that can be used to monitor the simulation progress.
+
+        """  # noqa: E501
+        try:
+            request = await create_request_async(
+                simulation_input, self._server, progress_handler, self._upload_chunk_size
+            )
+            long_running_op = await self._server.simulation_stub.Simulate(request)
+            simulation_task = AsyncSimulationTask(
+                self._server,
+                long_running_op,
+                simulation_input,
+                self._user_data_path,
+                self._keep_logs_in_memory,
+                self._defer_vtk_files,
+                self._result_file_members,
+            )
+            LOG.debug(f"Simulation task created for {simulation_input.id}")
+
+        except Exception as e:
+            metadata = OperationMetadata(simulation_id=simulation_input.id, message=str(e))
+            errored_op = Operation(name=simulation_input.id, done=True)
+            errored_op.metadata.Pack(metadata)
+            simulation_task = AsyncSimulationTask(
+                self._server,
+                errored_op,
+                simulation_input,
+                self._user_data_path,
+                self._keep_logs_in_memory,
+                self._defer_vtk_files,
+                self._result_file_members,
+            )
+
+        if progress_handler:
+            progress_handler.update(await simulation_task.status())
+
+        return simulation_task
+
+    async def materials_list(self) -> list[str]:
+        """Get a list of material names used in additive simulations.
+
+        Returns
+        -------
+        list[str]
+            Names of available additive materials.
+
+        """
+        response = await self._server.materials_stub.GetMaterialsList(Empty())
+        return response.names
+
+    async def material(self, name: str) -> AdditiveMaterial:
+        """Get a material for use in an additive simulation.
+
+        Parameters
+        ----------
+        name: str
+            Name of material.
+
+        Returns
+        -------
+        AdditiveMaterial
+            Requested material definition.
+
+        """
+        request = GetMaterialRequest(name=name)
+        result = await self._server.materials_stub.GetMaterial(request)
+        return AdditiveMaterial._from_material_message(result)
+
+    async def simulate_study(
+        self,
+        study: ParametricStudy,
+        simulation_ids: list[str] | None = None,
+        types: list[SimulationType] | None = None,
+        priority: int | None = None,
+        iteration: int = None,
+    ):
+        """Run the simulations in a parametric study.
+
+        Parameters
+        ----------
+        study : ParametricStudy
+            Parametric study to run.
+        simulation_ids : list[str], default: None
+            List of simulation IDs to run. If this value is ``None``,
+            all simulations with a status of ``Pending`` are run.
+        types : list[SimulationType], default: None
+            Type of simulations to run. If this value is ``None``,
+            all simulation types are run.
+        priority : int, default: None
+            Priority of simulations to run. If this value is ``None``,
+            all priorities are run.
+        iteration : int, default: None
+            Iteration number of simulations to run. The default is ``None``,
+            all iterations are run.
+
+        """
+        progress_handler = ParametricStudyProgressHandler(study)
+
+        try:
+            # Status changes reported by the progress handler are saved along with
+            # the results rather than each time a simulation changes state
+            with study.batch():
+                task_mgr = await self.simulate_study_async(
+                    study, simulation_ids, types, priority, iteration, progress_handler
+                )
+
+                def update_study(summary):
+                    # The progress handler changes the study from the event loop,
+                    # so it must not do so while the study is being updated
+                    with progress_handler._study_lock:
+                        study.update([summary])
+                        study.save(study.file_name)
+
+                # Record each result as soon as its simulation completes. Results are
+                # recorded one at a time, in a worker thread since saving blocks.
+                async for summary in task_mgr.as_completed(progress_handler):
+                    await asyncio.to_thread(update_study, summary)
+
+        except Exception as e:
+            LOG.error(f"Error running study: {e}")
+            study.reset_simulation_status()
+            raise RuntimeError from e
+
+    async def simulate_study_async(
+        self,
+        study: ParametricStudy,
+        simulation_ids: list[str] | None = None,
+        types: list[SimulationType] | None = None,
+        priority: int | None = None,
+        iteration: int | None = None,
+        progress_handler: IProgressHandler | None = None,
+    ) -> AsyncSimulationTaskManager:
+        """Submit the simulations in a parametric study without waiting for them to complete.
+
+        Notes
+        -----
+            The caller of this method is responsible for updating the study with the results of the simulations.
+            See :meth:`SimulationTaskManager.summaries` and :meth:`ParametricStudy.update`.
+
+        Parameters
+        ----------
+        study : ParametricStudy
+            Parametric study to run.
+        simulation_ids : list[str], default: None
+            List of simulation IDs to run. If this value is ``None``,
+            all simulations with a status of ``Pending`` are run.
+        types : list[SimulationType], default: None
+            Type of simulations to run. If this value is ``None``,
+            all simulation types are run.
+        priority : int, default: None
+            Priority of simulations to run. If this value is ``None``,
+            all priorities are run.
+        iteration : int, default: None
+            Iteration number of simulations to run. The default is ``None``,
+            all iterations are run.
+        progress_handler : IProgressHandler, None, default: None
+            Handler for progress updates.
+
+        """
+        # The study requests materials by name synchronously, so fetch the study
+        # material before creating the inputs.
+        material = await self.material(str(study.material_name))
+        inputs = study.simulation_inputs(
+            lambda _: material, simulation_ids, types, priority, iteration
+        )
+        if not inputs:
+            # no simulations met the provided criteria, return an empty task manager
+            return AsyncSimulationTaskManager()
+        ids = [i.id for i in inputs]
+        study.set_simulation_status(ids, SimulationStatus.PENDING)
+        study.clear_errors(ids)
+        return await self.simulate_async(inputs, progress_handler)
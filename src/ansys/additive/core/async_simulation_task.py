@@ -0,0 +1,146 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Container for a simulation task running on an asyncio server connection."""
+
+from google.longrunning.operations_pb2 import (
+    CancelOperationRequest,
+    GetOperationRequest,
+    Operation,
+    WaitOperationRequest,
+)
+from google.protobuf.duration_pb2 import Duration
+
+from ansys.additive.core.download import download_files_async
+from ansys.additive.core.logger import LOG
+from ansys.additive.core.progress_handler import IProgressHandler, Progress
+from ansys.additive.core.simulation_task import SimulationTask
+from ansys.api.additive.v0.additive_simulation_pb2 import SimulationResponse
+
+
+class AsyncSimulationTask(SimulationTask):
+    """Provides a simulation task whose server interactions are awaitable.
+
+    The task holds an :class:`AsyncServerConnection <.async_server_connection.AsyncServerConnection>`
+    and exposes :meth:`status`, :meth:`wait` and :meth:`cancel` as coroutines.
+
+    Parameters
+    ----------
+    server_connection: AsyncServerConnection
+        The asyncio client connection to the Additive server.
+    long_running_operation: Operation
+        The long-running operation representing the simulation on the server.
+    simulation_input: SingleBeadInput | PorosityInput | MicrostructureInput | ThermalHistoryInput | Microstructure3DInput | MaterialTuningInput
+        The simulation input.
+    user_data_path: str
+        The path to the user data directory.
+
+    """  # noqa: E501
+
+    async def status(self) -> Progress:
+        """Fetch status from the server to update progress and results.
+
+        Returns
+        -------
+        Progress
+            The progress of the operation.
+
+        """
+        get_request = GetOperationRequest(name=self._long_running_op.name)
+        self._long_running_op = await self._server.operations_stub.GetOperation(get_request)
+        return await self._update_operation_status_async(self._long_running_op)
+
+    async def wait(
+        self,
+        *,
+        progress_update_interval: int = 5,
+        progress_handler: IProgressHandler | None = None,
+    ) -> None:
+        """Wait for simulation to finish while updating progress.
+
+        Parameters
+        ----------
+        progress_update_interval: int, default: 5
+            A timeout value (in seconds) to give to the looped WaitOperation() calls to return an
+            updated message for a progress update.
+        progress_handler: IProgressHandler, None, default: None
+            Handler for progress updates. If ``None``, no progress updates are provided.
+
+        """
+        LOG.debug(f"Waiting for {self._long_running_op.name} to complete")
+        try:
+            while True:
+                timeout = Duration(seconds=progress_update_interval)
+                wait_request = WaitOperationRequest(
+                    name=self._long_running_op.name, timeout=timeout
+                )
+                awaited_operation = await self._server.operations_stub.WaitOperation(wait_request)
+                progress = await self._update_operation_status_async(awaited_operation)
+                if progress_handler:
+                    progress_handler.update(progress)
+                if awaited_operation.done:
+                    break
+        except Exception as e:
+            LOG.error(f"Error while awaiting operation: {e}")
+
+        # Perform a call to status to ensure all messages are received and summary is updated
+        progress = await self.status()
+        if progress_handler:
+            progress_handler.update(progress)
+
+    async def cancel(self) -> None:
+        """Cancel a running simulation."""
+        LOG.debug(f"Cancelling {self._long_running_op.name}")
+        request = CancelOperationRequest(name=self._long_running_op.name)
+        await self._server.operations_stub.CancelOperation(request)
+
+    async def _update_operation_status_async(self, operation: Operation) -> Progress:
+        """Download any result files and then update progress or summary.
+
+        Result files are fetched with the asyncio stub before the summary is
+        created so that summary creation does not block the event loop.
+
+        Parameters
+        ----------
+        operation: [google.longrunning.Operation]
+            The long-running operation.
+
+        Returns
+        -------
+        Progress
+            Progress created from long-running operation metadata.
+
+        """
+        self._downloaded_files.clear()
+        if operation.done and operation.HasField("response"):
+            response = SimulationResponse()
+            operation.response.Unpack(response)
+            self._downloaded_files = await download_files_async(
+                self._server.simulation_stub,
+                self._result_files(response),
+                extract=True,
+                members=self._result_file_members,
+            )
+        return self._update_operation_status(operation)
+
+    def _download_file(self, remote_file_name: str, local_folder: str) -> str:
+        """Return the local path of a result file downloaded by :meth:`_update_operation_status_async`."""  # noqa: E501
+        return self._downloaded_files[remote_file_name]
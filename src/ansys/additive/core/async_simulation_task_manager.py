@@ -0,0 +1,343 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Manages simulation tasks running on an asyncio server connection."""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+
+import grpc
+from google.longrunning.operations_pb2 import ListOperationsRequest, Operation
+
+from ansys.additive.core.async_simulation_task import AsyncSimulationTask
+from ansys.additive.core.logger import LOG
+from ansys.additive.core.material_tuning import MaterialTuningSummary
+from ansys.additive.core.microstructure import MicrostructureSummary
+from ansys.additive.core.microstructure_3d import Microstructure3DSummary
+from ansys.additive.core.porosity import PorositySummary
+from ansys.additive.core.progress_handler import IProgressHandler, Progress
+from ansys.additive.core.simulation import SimulationType
+from ansys.additive.core.simulation_error import SimulationError
+from ansys.additive.core.simulation_task_manager import (
+    MAX_CONCURRENT_CANCEL_REQUESTS,
+    MAX_CONCURRENT_STATUS_REQUESTS,
+    SimulationTaskManager,
+    _name_batches,
+    _name_filter,
+)
+from ansys.additive.core.single_bead import SingleBeadSummary
+from ansys.additive.core.thermal_history import ThermalHistorySummary
+
+
+class AsyncSimulationTaskManager:
+    """Provides a manager for asyncio simulation tasks.
+
+    The server interactions :meth:`status`, :meth:`wait_all`, :meth:`as_completed`
+    and :meth:`cancel` are coroutines that run concurrently for all tasks. The
+    bookkeeping of the tasks is delegated to a :class:`SimulationTaskManager`,
+    whose blocking server interactions are not used.
+    """
+
+    def __init__(self):
+        """Initialize the simulation task manager."""
+        self._manager = SimulationTaskManager()
+
+    @property
+    def tasks(self) -> list[AsyncSimulationTask]:
+        """Get the list of tasks managed by this manager."""
+        return self._manager.tasks
+
+    @property
+    def simulation_ids(self) -> list[str]:
+        """Get the list of the simulation ids managed by this manager."""
+        return self._manager.simulation_ids
+
+    @property
+    def done(self) -> bool:
+        """Check if all tasks are done."""
+        return self._manager.done
+
+    @property
+    def pending_count(self) -> int:
+        """Get the number of tasks that are not done."""
+        return self._manager.pending_count
+
+    @property
+    def finished_count(self) -> int:
+        """Get the number of tasks that are done."""
+        return self._manager.finished_count
+
+    def add_task(self, task: AsyncSimulationTask):
+        """Add a task to this manager.
+
+        Parameters
+        ----------
+        task: AsyncSimulationTask
+            The simulation task holding the long-running operation and corresponding server.
+
+        """
+        self._manager.add_task(task)
+
+    def summaries(self):
+        """Get a list of the summaries of completed simulations only.
+
+        Summaries are listed in the order their tasks were added.
+        """
+        return self._manager.summaries()
+
+    async def _list_operations_async(self, indices: list[int]) -> dict[int, Operation]:
+        """Fetch the operations of tasks with paged ListOperations() calls.
+
+        The operations of each server are listed in batches of at most
+        ``MAX_LISTED_OPERATION_NAMES`` names, with one filter per batch, and the servers
+        are listed concurrently. The listing of a batch stops as soon as all of its
+        operations are found. Servers that reject ListOperations() are not listed again.
+
+        Parameters
+        ----------
+        indices: list[int]
+            Indices of the tasks to fetch operations for.
+
+        Returns
+        -------
+        dict[int, Operation]
+            Operations found in the listings, keyed by task index.
+
+        """
+        operations = {}
+        unlisted_servers = self._manager._unlisted_servers
+
+        async def list_server(server, names: dict[str, int]) -> None:
+            try:
+                for batch in _name_batches(names):
+                    # Page tokens are only valid with the filter they were returned for
+                    name_filter = _name_filter(batch)
+                    page_token = ""
+                    while batch:
+                        response = await server.operations_stub.ListOperations(
+                            ListOperationsRequest(filter=name_filter, page_token=page_token)
+                        )
+                        for op in response.operations:
+                            if op.name in batch:
+                                operations[batch.pop(op.name)] = op
+                        page_token = response.next_page_token
+                        if not page_token:
+                            break
+            except grpc.RpcError as e:
+                LOG.debug(f"Unable to list operations, fetching them individually: {e}")
+                unlisted_servers.add(id(server))
+
+        await asyncio.gather(
+            *(
+                list_server(server, names)
+                for server, names in self._manager._group_by_server(indices)
+                if id(server) not in unlisted_servers
+            )
+        )
+        return operations
+
+    async def status(
+        self, progress_handler: IProgressHandler | None = None
+    ) -> list[tuple[str, Progress]]:
+        """Get status of each operation stored in this manager.
+
+        Only the operations of tasks that are not done are fetched from the server. The
+        last known status is returned for the other tasks. The operations are fetched
+        with one paged ListOperations() call per server. Operations that are not listed
+        are fetched with concurrent GetOperation() calls.
+
+        Parameters
+        ----------
+        progress_handler: IProgressHandler, None, default: None
+            Handler for progress updates of the operations fetched from the server. If
+            ``None``, no progress updates are provided.
+
+        Returns
+        -------
+        List of tuples with each tuple containing the operation name and an instance of Progress
+
+        """
+        manager = self._manager
+        indices = [i for i in range(len(manager.tasks)) if manager._needs_status(i)]
+        operations = await self._list_operations_async(indices)
+        for i, operation in operations.items():
+            progress = await manager.tasks[i]._update_operation_status_async(operation)
+            manager._record_status(i, progress, progress_handler)
+
+        # Fall back to fetching the remaining operations one by one
+        remaining = [i for i in indices if i not in operations]
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_STATUS_REQUESTS)
+
+        async def fetch_status(i: int) -> Progress:
+            async with semaphore:
+                return await manager.tasks[i].status()
+
+        progresses = await asyncio.gather(*(fetch_status(i) for i in remaining))
+        for i, progress in zip(remaining, progresses, strict=True):
+            manager._record_status(i, progress, progress_handler)
+
+        return [(p.sim_id, p) for p in (manager._progress[i] for i in range(len(manager.tasks)))]
+
+    async def wait_all(
+        self,
+        progress_handler: IProgressHandler | None = None,
+        progress_update_interval: int = 5,
+    ) -> None:
+        """Wait for all simulations to finish.
+
+        Parameters
+        ----------
+        progress_handler: IProgressHandler, None, default: None
+            Handler for progress updates. If ``None``, no progress updates are provided.
+        progress_update_interval: int, default: 5
+            A timeout value (in seconds) to give to each WaitOperation() call to return an
+            updated message for a progress update.
+
+        """
+        async for _ in self._wait_for_completions(progress_handler, progress_update_interval):
+            pass
+
+    async def as_completed(
+        self,
+        progress_handler: IProgressHandler | None = None,
+        progress_update_interval: int = 5,
+    ) -> AsyncIterator[
+        SingleBeadSummary
+        | PorositySummary
+        | MicrostructureSummary
+        | ThermalHistorySummary
+        | Microstructure3DSummary
+        | MaterialTuningSummary
+        | SimulationError
+    ]:
+        """Wait for all simulations to finish and yield each summary as it becomes available.
+
+        Summaries are yielded in the order the simulations complete, not the order in
+        which they were added. Simulations that finish without a summary, such as
+        cancelled simulations, are not yielded. Use :func:`asyncio.timeout` to limit
+        the time spent waiting.
+
+        Parameters
+        ----------
+        progress_handler: IProgressHandler, None, default: None
+            Handler for progress updates. If ``None``, no progress updates are provided.
+        progress_update_interval: int, default: 5
+            A timeout value (in seconds) to give to each WaitOperation() call to return an
+            updated message for a progress update.
+
+        Yields
+        ------
+        SingleBeadSummary, PorositySummary, MicrostructureSummary, ThermalHistorySummary, Microstructure3DSummary, MaterialTuningSummary, SimulationError
+            Summary of each completed simulation.
+
+        """  # noqa: E501
+        async for task in self._wait_for_completions(progress_handler, progress_update_interval):
+            if task.summary:
+                yield task.summary
+
+    async def _wait_for_completions(
+        self,
+        progress_handler: IProgressHandler | None = None,
+        progress_update_interval: int = 5,
+    ) -> AsyncIterator[AsyncSimulationTask]:
+        """Await all pending tasks concurrently and yield each one as it completes."""
+        manager = self._manager
+        manager._update_finished()
+        LOG.debug(f"Waiting for {len(manager._pending)} tasks to complete")
+
+        async def wait(i: int, task: AsyncSimulationTask) -> int:
+            await task.wait(
+                progress_update_interval=progress_update_interval,
+                progress_handler=progress_handler,
+            )
+            return i
+
+        waits = [asyncio.ensure_future(wait(i, t)) for i, t in manager._pending.items()]
+        try:
+            for next_done in asyncio.as_completed(waits):
+                i = await next_done
+                if manager.tasks[i].done:
+                    manager._finish(i)
+                yield manager.tasks[i]
+        finally:
+            # Stop waiting on the server if the caller stopped iterating
+            for w in waits:
+                w.cancel()
+
+    async def cancel(
+        self,
+        simulation_ids: list[str] | None = None,
+        types: list[SimulationType] | None = None,
+        predicate: Callable[[AsyncSimulationTask], bool] | None = None,
+    ) -> dict[str, bool]:
+        """Cancel the unfinished simulations matching all of the given filters.
+
+        The cancellation requests are sent concurrently, up to
+        ``MAX_CONCURRENT_CANCEL_REQUESTS`` at a time.
+
+        Parameters
+        ----------
+        simulation_ids: list[str], None, default: None
+            IDs of the simulations to cancel. If ``None``, simulations are not
+            filtered by ID.
+        types: list[SimulationType], None, default: None
+            Types of the simulations to cancel. If ``None``, simulations are not
+            filtered by type.
+        predicate: Callable[[AsyncSimulationTask], bool], None, default: None
+            Function returning ``True`` for each task to cancel. If ``None``,
+            simulations are not filtered by this function.
+
+        Returns
+        -------
+        dict[str, bool]
+            Whether the cancellation of each selected simulation was accepted by the
+            server, keyed by simulation ID.
+
+        """
+        manager = self._manager
+        selected = manager._select_pending(simulation_ids, types, predicate)
+        tasks = [manager.tasks[i] for i in selected]
+        LOG.debug(f"Cancelling {len(tasks)} tasks")
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_CANCEL_REQUESTS)
+
+        async def cancel_task(task: AsyncSimulationTask) -> bool:
+            async with semaphore:
+                try:
+                    await task.cancel()
+                    return True
+                except Exception as e:
+                    LOG.error(f"Unable to cancel {task.simulation_id}: {e}")
+                    return False
+
+        results = await asyncio.gather(*(cancel_task(t) for t in tasks))
+        return dict(zip([t.simulation_id for t in tasks], results, strict=True))
+
+    async def cancel_all(self) -> dict[str, bool]:
+        """Cancel all unfinished simulations belonging to this simulation task manager.
+
+        Returns
+        -------
+        dict[str, bool]
+            Whether the cancellation of each simulation was accepted by the server,
+            keyed by simulation ID.
+
+        """
+        return await self.cancel()
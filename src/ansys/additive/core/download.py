@@ -21,10 +21,22 @@
 # SOFTWARE.
 """Provides a function for downloading files from the server to the client."""
 
+import asyncio
+import contextlib
 import datetime
 import hashlib
 import os
+import struct
+import tempfile
+import zipfile
+import zlib
+from collections.abc import Container
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO
 
+import grpc
+
+from ansys.additive.core.logger import LOG
 from ansys.additive.core.progress_handler import (
     IProgressHandler,
     Progress,
@@ -34,15 +46,29 @@ from ansys.api.additive.v0.additive_server_info_pb2_grpc import ServerInfoServic
 from ansys.api.additive.v0.additive_simulation_pb2 import DownloadFileRequest
 from ansys.api.additive.v0.additive_simulation_pb2_grpc import SimulationServiceStub
 
+DOWNLOAD_RETRIES = 3
+"""Number of times a failed download is retried before giving up."""
+DOWNLOAD_WORKERS = 4
+"""Maximum number of files downloaded concurrently by :func:`download_files`."""
+
 
 def download_file(
     stub: SimulationServiceStub,
     remote_file_name: str,
     local_folder: str,
     progress_handler: IProgressHandler = None,
+    retries: int = DOWNLOAD_RETRIES,
+    extract: bool = False,
+    members: Container[str] | None = None,
 ) -> str:
     """Download a file from the server to the localhost.
 
+    The file is written to a ``.part`` file that replaces the destination once the
+    whole file has been received and its size checked. If the stream is interrupted
+    or a chunk fails its checksum, the download is retried from the start. The
+    ``.part`` file, or the files extracted from an archive, are removed if the
+    download fails.
+
     Parameters
     ----------
     stub: SimulationServiceStub
@@ -53,11 +79,19 @@ def download_file(
         Folder on your localhost to write your file to.
     progress_handler: ProgressLogger, None, default: None
         Progress update handler. If ``None``, no progress will be provided.
+    retries: int, default: DOWNLOAD_RETRIES
+        Number of times to retry the download if it fails.
+    extract: bool, default: False
+        Whether the file is a zip archive to extract into ``local_folder`` as it is
+        received. The archive itself is not written to disk.
+    members: Container[str], None, default: None
+        Names of the archive members to extract when ``extract`` is ``True``. If
+        ``None``, all members are extracted.
 
     Returns
     -------
     str
-        Local path of downloaded file.
+        Local path of downloaded file, or ``local_folder`` if the file is extracted.
 
     """
 
@@ -67,8 +101,203 @@ def download_file(
     dest = os.path.join(local_folder, os.path.basename(remote_file_name))
     request = DownloadFileRequest(remote_file_name=remote_file_name)
 
-    handle_download_file_response(dest, stub.DownloadFile(request), progress_handler)
-    return dest
+    for attempt in range(retries + 1):
+        try:
+            if extract:
+                extract_download_file_response(
+                    local_folder, stub.DownloadFile(request), members, progress_handler
+                )
+                return local_folder
+            handle_download_file_response(dest, stub.DownloadFile(request), progress_handler)
+            return dest
+        except (grpc.RpcError, ValueError) as e:
+            if attempt == retries:
+                raise
+            LOG.warning(f"Download of {remote_file_name} failed, retrying: {e}")
+
+
+async def download_file_async(
+    stub: SimulationServiceStub,
+    remote_file_name: str,
+    local_folder: str,
+    progress_handler: IProgressHandler = None,
+    retries: int = DOWNLOAD_RETRIES,
+    extract: bool = False,
+    members: Container[str] | None = None,
+) -> str:
+    """Download a file from the server to the localhost using an asyncio stub.
+
+    See :func:`download_file` for details.
+
+    Parameters
+    ----------
+    stub: SimulationServiceStub
+        gRPC stub for the simulation service bound to a :class:`grpc.aio.Channel`.
+    remote_file_name: str
+        Path to file on the server.
+    local_folder: str
+        Folder on your localhost to write your file to.
+    progress_handler: ProgressLogger, None, default: None
+        Progress update handler. If ``None``, no progress will be provided.
+    retries: int, default: DOWNLOAD_RETRIES
+        Number of times to retry the download if it fails.
+    extract: bool, default: False
+        Whether the file is a zip archive to extract into ``local_folder`` as it is
+        received. The archive itself is not written to disk.
+    members: Container[str], None, default: None
+        Names of the archive members to extract when ``extract`` is ``True``. If
+        ``None``, all members are extracted.
+
+    Returns
+    -------
+    str
+        Local path of downloaded file, or ``local_folder`` if the file is extracted.
+
+    """
+
+    if not os.path.isdir(local_folder):
+        os.makedirs(local_folder)
+
+    dest = os.path.join(local_folder, os.path.basename(remote_file_name))
+    request = DownloadFileRequest(remote_file_name=remote_file_name)
+
+    for attempt in range(retries + 1):
+        try:
+            # File operations are run in a worker thread to avoid blocking the event loop
+            with (
+                _ZipStreamExtractor(local_folder, members)
+                if extract
+                else await asyncio.to_thread(_PartFile, dest)
+            ) as f:
+                total_size = 0
+                async for response in stub.DownloadFile(request):
+                    await asyncio.to_thread(_write_download_chunk, f, response, progress_handler)
+                    total_size = response.total_size
+                if extract:
+                    await asyncio.to_thread(f.complete)
+                else:
+                    await asyncio.to_thread(f.complete, total_size)
+            return local_folder if extract else dest
+        except (grpc.RpcError, ValueError) as e:
+            if attempt == retries:
+                raise
+            LOG.warning(f"Download of {remote_file_name} failed, retrying: {e}")
+
+
+def download_files(
+    stub: SimulationServiceStub,
+    files: dict[str, str],
+    progress_handler: IProgressHandler = None,
+    max_workers: int = DOWNLOAD_WORKERS,
+    extract: bool = False,
+    members: Container[str] | None = None,
+) -> dict[str, str]:
+    """Download several files from the server to the localhost concurrently.
+
+    Parameters
+    ----------
+    stub: SimulationServiceStub
+        gRPC stub for the simulation service.
+    files: dict[str, str]
+        Folder on your localhost to write each file to, keyed by path to file on the server.
+    progress_handler: ProgressLogger, None, default: None
+        Progress update handler. If ``None``, no progress will be provided.
+    max_workers: int, default: DOWNLOAD_WORKERS
+        Maximum number of files to download at the same time.
+    extract: bool, default: False
+        Whether the files are zip archives to extract into their local folders as
+        they are received.
+    members: Container[str], None, default: None
+        Names of the archive members to extract when ``extract`` is ``True``. If
+        ``None``, all members are extracted.
+
+    Returns
+    -------
+    dict[str, str]
+        Local path of each downloaded file, or its local folder if the file is
+        extracted, keyed by path to file on the server.
+
+    """
+    if len(files) < 2:
+        return {
+            remote_file_name: download_file(
+                stub,
+                remote_file_name,
+                local_folder,
+                progress_handler,
+                extract=extract,
+                members=members,
+            )
+            for remote_file_name, local_folder in files.items()
+        }
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(files))) as executor:
+        futures = {
+            remote_file_name: executor.submit(
+                download_file,
+                stub,
+                remote_file_name,
+                local_folder,
+                progress_handler,
+                extract=extract,
+                members=members,
+            )
+            for remote_file_name, local_folder in files.items()
+        }
+        return {remote_file_name: f.result() for remote_file_name, f in futures.items()}
+
+
+async def download_files_async(
+    stub: SimulationServiceStub,
+    files: dict[str, str],
+    progress_handler: IProgressHandler = None,
+    max_workers: int = DOWNLOAD_WORKERS,
+    extract: bool = False,
+    members: Container[str] | None = None,
+) -> dict[str, str]:
+    """Download several files from the server to the localhost concurrently using an asyncio stub.
+
+    See :func:`download_files` for details.
+
+    Parameters
+    ----------
+    stub: SimulationServiceStub
+        gRPC stub for the simulation service bound to a :class:`grpc.aio.Channel`.
+    files: dict[str, str]
+        Folder on your localhost to write each file to, keyed by path to file on the server.
+    progress_handler: ProgressLogger, None, default: None
+        Progress update handler. If ``None``, no progress will be provided.
+    max_workers: int, default: DOWNLOAD_WORKERS
+        Maximum number of files to download at the same time.
+    extract: bool, default: False
+        Whether the files are zip archives to extract into their local folders as
+        they are received.
+    members: Container[str], None, default: None
+        Names of the archive members to extract when ``extract`` is ``True``. If
+        ``None``, all members are extracted.
+
+    Returns
+    -------
+    dict[str, str]
+        Local path of each downloaded file, or its local folder if the file is
+        extracted, keyed by path to file on the server.
+
+    """  # noqa: E501
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def download(remote_file_name: str, local_folder: str) -> str:
+        async with semaphore:
+            return await download_file_async(
+                stub,
+                remote_file_name,
+                local_folder,
+                progress_handler,
+                extract=extract,
+                members=members,
+            )
+
+    local_files = await asyncio.gather(*(download(*item) for item in files.items()))
+    return dict(zip(files, local_files, strict=True))
 
 
 def download_logs(
@@ -113,6 +342,10 @@ def handle_download_file_response(
     """
     Handle server response.
 
+    The response is written to a ``.part`` file that replaces the destination once
+    the whole file has been received. The ``.part`` file is removed if the response
+    is incomplete.
+
     Parameters
     ----------
     destination: str
@@ -124,22 +357,372 @@ def handle_download_file_response(
 
     """
 
-    with open(destination, "wb") as f:
+    with _PartFile(destination) as f:
+        total_size = 0
         for response in download_file_response:
-            if progress_handler:
+            _write_download_chunk(f, response, progress_handler)
+            total_size = response.total_size
+        f.complete(total_size)
+
+
+def extract_download_file_response(
+    folder: str,
+    download_file_response: any,
+    members: Container[str] | None = None,
+    progress_handler: IProgressHandler = None,
+) -> list[str]:
+    """
+    Handle a server response holding a zip archive by extracting it as it is received.
+
+    Parameters
+    ----------
+    folder: str
+        Folder to extract the archive to.
+    download_file_response: any
+        Download file response.
+    members: Container[str], None, default: None
+        Names of the members to extract. If ``None``, all members are extracted.
+    progress_handler: IProgressHandler, default: None
+        Progress handler.
+
+    Returns
+    -------
+    list[str]
+        Local paths of the extracted files.
+
+    """
+
+    with _ZipStreamExtractor(folder, members) as f:
+        for response in download_file_response:
+            _write_download_chunk(f, response, progress_handler)
+        f.complete()
+    return f.extracted
+
+
+class _PartFile:
+    """Write a download to a ``.part`` file that replaces the destination once complete.
+
+    The ``.part`` file is removed if it is closed before it is complete, so an
+    incomplete download is never left at the destination.
+
+    Parameters
+    ----------
+    destination: str
+        Destination of the file.
+
+    """
+
+    def __init__(self, destination: str):
+        self.destination = destination
+        self.part_file = destination + ".part"
+        self._completed = False
+        with contextlib.ExitStack() as stack:
+            self._file = stack.enter_context(open(self.part_file, "wb"))
+            self._files = stack.pop_all()
+
+    def __enter__(self) -> "_PartFile":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def write(self, content: bytes) -> None:
+        """Write the next chunk of the download."""
+        self._file.write(content)
+
+    def complete(self, total_size: int) -> None:
+        """Check the size of the download and move it to the destination.
+
+        A ``total_size`` of zero is not checked.
+        """
+        size = self._file.tell()
+        self._files.close()
+        if total_size and size != total_size:
+            raise ValueError(
+                f"Download error, received {size} bytes of {total_size} for {self.destination}"
+            )
+        os.replace(self.part_file, self.destination)
+        self._completed = True
+
+    def close(self) -> None:
+        """Close the ``.part`` file and remove it if the download is not complete."""
+        self._files.close()
+        if not self._completed:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self.part_file)
+
+
+class _ZipStreamExtractor:
+    """Extract the members of a zip archive while it is being received.
+
+    Members are read from their local file headers and inflated as the chunks
+    arrive, so the archive itself is never written to disk. From the first member
+    that cannot be extracted this way, such as a stored member followed by a data
+    descriptor, the rest of the archive is spooled to a temporary file and
+    extracted with :class:`zipfile.ZipFile` once it is complete.
+
+    Parameters
+    ----------
+    folder: str
+        Folder to extract the members to.
+    members: Container[str], None, default: None
+        Names of the members to extract. If ``None``, all members are extracted.
+
+    """
+
+    _LOCAL_FILE_HEADER = struct.Struct("<4s5H3I2H")
+    _LOCAL_FILE_SIGNATURE = b"PK\x03\x04"
+    _ARCHIVE_END_SIGNATURES = (b"PK\x01\x02", b"PK\x05\x06", b"PK\x06\x06")
+    _DATA_DESCRIPTOR_SIGNATURE = b"PK\x07\x08"
+    _ZIP64_EXTRA_ID = 0x0001
+    _FLAG_ENCRYPTED = 0x1
+    _FLAG_DATA_DESCRIPTOR = 0x8
+    _FLAG_UTF8 = 0x800
+
+    def __init__(self, folder: str, members: Container[str] | None = None):
+        self.folder = folder
+        self.extracted: list[str] = []
+        self._members = members
+        self._buffer = bytearray()
+        self._member = None
+        self._end_of_archive = False
+        self._received = 0
+        self._spool = None
+        self._spool_offset = 0
+        self._files = contextlib.ExitStack()
+
+    def __enter__(self) -> "_ZipStreamExtractor":
+        return self
+
+    def __exit__(self, exc_type, *args) -> None:
+        self.close()
+        if exc_type is not None:
+            # Do not leave the files of a failed extraction behind
+            partial = [self._member["file"].name] if self._member and self._member["file"] else []
+            for path in self.extracted + partial:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(path)
+
+    def write(self, content: bytes) -> None:
+        """Receive the next chunk of the archive and extract what it completes."""
+        if self._end_of_archive:
+            return
+        self._received += len(content)
+        if self._spool:
+            self._spool.write(content)
+            return
+        self._buffer += content
+        while not self._end_of_archive and (
+            self._read_member_data() if self._member else self._read_local_file_header()
+        ):
+            pass
+
+    def complete(self) -> None:
+        """Verify that the whole archive has been received and extracted."""
+        if self._spool:
+            self._extract_spool()
+        elif self._member or not self._end_of_archive:
+            raise ValueError("Download error, the zip archive is incomplete")
+
+    def close(self) -> None:
+        """Close the member being extracted and the spooled archive, if any."""
+        self._files.close()
+
+    def _read_local_file_header(self) -> bool:
+        if len(self._buffer) < 4:
+            return False
+        signature = bytes(self._buffer[:4])
+        if signature in self._ARCHIVE_END_SIGNATURES:
+            # Everything that follows the members is the central directory
+            self._end_of_archive = True
+            self._buffer.clear()
+            return False
+        if signature != self._LOCAL_FILE_SIGNATURE:
+            raise ValueError("Download error, invalid zip archive")
+        if len(self._buffer) < self._LOCAL_FILE_HEADER.size:
+            return False
+        (
+            _,
+            _,
+            flags,
+            method,
+            _,
+            _,
+            crc,
+            compressed_size,
+            _,
+            name_length,
+            extra_length,
+        ) = self._LOCAL_FILE_HEADER.unpack_from(self._buffer)
+        header_size = self._LOCAL_FILE_HEADER.size + name_length + extra_length
+        if len(self._buffer) < header_size:
+            return False
+        name = bytes(self._buffer[self._LOCAL_FILE_HEADER.size :][:name_length])
+        name = name.decode("utf-8" if flags & self._FLAG_UTF8 else "cp437")
+        extra = bytes(self._buffer[header_size - extra_length : header_size])
+
+        if flags & self._FLAG_ENCRYPTED:
+            raise ValueError(f"Download error, {name} is encrypted")
+        has_data_descriptor = bool(flags & self._FLAG_DATA_DESCRIPTOR)
+        if method not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED) or (
+            # The end of a stored member is only known from the central directory
+            has_data_descriptor and method == zipfile.ZIP_STORED
+        ):
+            LOG.debug(f"Unable to extract {name} while streaming, spooling the archive")
+            self._start_spool()
+            return False
+        del self._buffer[:header_size]
+        zip64_compressed_size = self._zip64_compressed_size(extra)
+        zip64 = zip64_compressed_size is not None
+        if zip64:
+            compressed_size = zip64_compressed_size
+
+        self._member = {
+            "name": name,
+            "file": self._open_member(name),
+            "crc": crc,
+            "actual_crc": 0,
+            "remaining": None if has_data_descriptor else compressed_size,
+            "decompressor": (
+                zlib.decompressobj(-zlib.MAX_WBITS) if method == zipfile.ZIP_DEFLATED else None
+            ),
+            "data_descriptor": has_data_descriptor,
+            "zip64": zip64,
+        }
+        return True
+
+    def _read_member_data(self) -> bool:
+        member = self._member
+        if member["remaining"] == 0 or (member["decompressor"] and member["decompressor"].eof):
+            return self._finish_member()
+        if not self._buffer:
+            return False
+        size = len(self._buffer)
+        if member["remaining"] is not None:
+            size = min(size, member["remaining"])
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        if member["decompressor"]:
+            decompressor = member["decompressor"]
+            data = decompressor.decompress(data)
+            if decompressor.eof and decompressor.unused_data:
+                # Data past the end of the deflate stream belongs to the next record
+                self._buffer[:0] = decompressor.unused_data
+                size -= len(decompressor.unused_data)
+        if member["remaining"] is not None:
+            member["remaining"] -= size
+        member["actual_crc"] = zlib.crc32(data, member["actual_crc"])
+        if member["file"]:
+            member["file"].write(data)
+        return True
+
+    def _finish_member(self) -> bool:
+        member = self._member
+        if member["data_descriptor"]:
+            sizes_length = 16 if member["zip64"] else 8
+            if len(self._buffer) < 4 + 4 + sizes_length:
+                return False
+            start = 4 if self._buffer[:4] == self._DATA_DESCRIPTOR_SIGNATURE else 0
+            (member["crc"],) = struct.unpack_from("<I", self._buffer, start)
+            del self._buffer[: start + 4 + sizes_length]
+        self.close()
+        self._member = None
+        if member["crc"] != member["actual_crc"]:
+            raise ValueError(f"Download error, CRC check failed for {member['name']}")
+        if member["file"]:
+            self.extracted.append(member["file"].name)
+        return True
+
+    def _start_spool(self) -> None:
+        """Write the rest of the archive, from the start of the buffer, to a temporary file."""
+        with contextlib.ExitStack() as stack:
+            self._spool = stack.enter_context(tempfile.TemporaryFile())
+            self._files.enter_context(stack.pop_all())
+        # Keep the offsets of the archive so that its central directory can be read. The
+        # members before the offset have been extracted, so their data is not needed.
+        self._spool_offset = self._received - len(self._buffer)
+        self._spool.seek(self._spool_offset)
+        self._spool.write(self._buffer)
+        self._buffer.clear()
+
+    def _extract_spool(self) -> None:
+        """Extract the members of the spooled archive that were not extracted while streaming."""
+        try:
+            with zipfile.ZipFile(self._spool) as archive:
+                for info in archive.infolist():
+                    if info.header_offset < self._spool_offset or (
+                        self._members is not None and info.filename not in self._members
+                    ):
+                        continue
+                    path = archive.extract(info, self.folder)
+                    if not info.is_dir():
+                        self.extracted.append(path)
+        except zipfile.BadZipFile as e:
+            raise ValueError(f"Download error, invalid zip archive: {e}") from e
+        self._end_of_archive = True
+
+    def _open_member(self, name: str) -> BinaryIO | None:
+        """Open the file to extract a member to, or return ``None`` to skip the member."""
+        if self._members is not None and name not in self._members:
+            return None
+        # Remove drive letters, absolute paths and parent references, as ZipFile does
+        parts = [
+            part
+            for part in os.path.splitdrive(name.replace("\\", "/"))[1].split("/")
+            if part not in ("", ".", "..")
+        ]
+        path = os.path.join(self.folder, *parts)
+        if name.endswith("/") or not parts:
+            os.makedirs(path, exist_ok=True)
+            return None
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with contextlib.ExitStack() as stack:
+            file = stack.enter_context(open(path, "wb"))
+            # Keep the file open until the member is finished or the extractor is closed
+            self._files.enter_context(stack.pop_all())
+        return file
+
+    def _zip64_compressed_size(self, extra: bytes) -> int | None:
+        """Get the compressed size from the Zip64 extra field, if the member has one."""
+        offset = 0
+        while offset + 4 <= len(extra):
+            header_id, length = struct.unpack_from("<2H", extra, offset)
+            if header_id == self._ZIP64_EXTRA_ID and length >= 16:
+                # Local file headers hold both sizes, the uncompressed size first
+                return struct.unpack_from("<2Q", extra, offset + 4)[1]
+            offset += 4 + length
+        return None
+
+
+def _write_download_chunk(
+    file: _PartFile | _ZipStreamExtractor,
+    response: any,
+    progress_handler: IProgressHandler = None,
+) -> None:
+    """Verify a chunk of a download file response and write it to a file.
+
+    Parameters
+    ----------
+    file: _PartFile, _ZipStreamExtractor
+        File to write the chunk to.
+    response: any
+        Download file response message.
+    progress_handler: IProgressHandler, default: None
+        Progress handler.
+
+    """
+    if progress_handler:
+        progress_handler.update(Progress.from_proto_msg(response.progress))  # pragma: no cover
+    if len(response.content) > 0:
+        md5 = hashlib.md5(response.content, usedforsecurity=False).hexdigest()
+        if md5 != response.content_md5:
+            msg = "Download error, MD5 sums did not match"
+            if progress_handler:  # pragma: no cover
                 progress_handler.update(
-                    Progress.from_proto_msg(response.progress)
-                )  # pragma: no cover
-            if len(response.content) > 0:
-                md5 = hashlib.md5(response.content, usedforsecurity=False).hexdigest()
-                if md5 != response.content_md5:
-                    msg = "Download error, MD5 sums did not match"
-                    if progress_handler:  # pragma: no cover
-                        progress_handler.update(
-                            Progress(
-                                state=ProgressState.ERROR,
-                                message=msg,
-                            )
-                        )
-                    raise ValueError(msg)
-                f.write(response.content)
+                    Progress(
+                        state=ProgressState.ERROR,
+                        message=msg,
+                    )
+                )
+            raise ValueError(msg)
+        file.write(response.content)
@@ -22,9 +22,12 @@
 """Provides a container for material parameters."""
 
 import collections
+import copy
 import csv
+import hashlib
 import json
 import math
+import operator
 import re
 
 from ansys.api.additive.v0.additive_domain_pb2 import (
@@ -37,6 +40,23 @@ from ansys.api.additive.v0.additive_domain_pb2 import (
     ThermalPropertiesDataPoint as ThermalPropertiesDataPointMessage,
 )
 
+
+class _DataPointRevision:
+    """Count of the changes made to data points.
+
+    Data points do not know which materials hold them, so materials compare the count
+    to the one their memoized message was created at.
+    """
+
+    value = 0
+
+    @classmethod
+    def record_change(cls, point: object, name: str) -> None:
+        """Record a change to an attribute of a data point, unless it is being initialized."""
+        if name in point.__dict__:
+            cls.value += 1
+
+
 RESERVED_MATERIAL_NAMES = [
     "17-4PH",
     "316L",
@@ -99,6 +119,10 @@ class CharacteristicWidthDataPoint:
         self._scan_speed = scan_speed
         self._characteristic_width = characteristic_width
 
+    def __setattr__(self, name: str, value):
+        _DataPointRevision.record_change(self, name)
+        super().__setattr__(name, value)
+
     def __repr__(self):
         repr = type(self).__name__ + "\n"
         for k in self.__dict__:
@@ -206,6 +230,10 @@ class ThermalPropertiesDataPoint:
         self._thermal_conductivity = thermal_conductivity
         self._thermal_conductivity_ratio = thermal_conductivity_ratio
 
+    def __setattr__(self, name: str, value):
+        _DataPointRevision.record_change(self, name)
+        super().__setattr__(name, value)
+
     def __repr__(self):
         repr = type(self).__name__ + "\n"
         for k in self.__dict__:
@@ -325,6 +353,11 @@ class ThermalPropertiesDataPoint:
         return msg
 
 
+# Attributes of AdditiveMaterial that are not scalar material parameters
+_DATA_TABLE_ATTRIBUTES = ("_characteristic_width_data", "_thermal_properties_data")
+_MEMO_ATTRIBUTES = ("_message", "_digest", "_memo_state")
+
+
 class AdditiveMaterial:
     """Provides the container for material properties used during additive manufacturing simulations."""
 
@@ -428,11 +461,51 @@ class AdditiveMaterial:
         else:
             self._thermal_properties_data = []
 
+    def __setattr__(self, name: str, value):
+        # Any change to the material invalidates the memoized message and digest
+        if name not in _MEMO_ATTRIBUTES:
+            self._clear_memo()
+        super().__setattr__(name, value)
+
+    def __getstate__(self) -> dict:
+        # The memo is only valid in the process that created it
+        return {k: v for k, v in self.__dict__.items() if k not in _MEMO_ATTRIBUTES}
+
+    def _clear_memo(self) -> None:
+        for name in _MEMO_ATTRIBUTES:
+            self.__dict__.pop(name, None)
+
+    def _memo_is_current(self) -> bool:
+        """Check if the memoized message was created from the current data points.
+
+        The data tables must hold the same data points, in the same order, and no data
+        point may have changed since the message was created.
+        """
+        state = self.__dict__.get("_memo_state")
+        if state is None:
+            return False
+        revision, tables = state
+        return revision == _DataPointRevision.value and all(
+            len(table) == len(points) and all(map(operator.is_, table, points))
+            for table, points in zip(
+                (self._characteristic_width_data, self._thermal_properties_data),
+                tables,
+                strict=True,
+            )
+        )
+
+    def _parameter_names(self) -> list[str]:
+        """Get the names of the attributes that hold scalar material parameters."""
+        return [
+            p
+            for p in self.__dict__
+            if p not in _DATA_TABLE_ATTRIBUTES and p not in _MEMO_ATTRIBUTES
+        ]
+
     def __repr__(self) -> str:
         repr = self.__class__.__name__ + "\n"
-        for p in self.__dict__:
-            if p != "_characteristic_width_data" and p != "_thermal_properties_data":
-                repr = repr + "{}: {}\n".format(p.replace("_", "", 1), getattr(self, p))
+        for p in self._parameter_names():
+            repr = repr + "{}: {}\n".format(p.replace("_", "", 1), getattr(self, p))
         repr = (
             repr
             + "characteristic_width_data: CharacteristicWidthDataPoint[]\n"
@@ -443,7 +516,32 @@ class AdditiveMaterial:
     def __eq__(self, __o: object) -> bool:
         if not isinstance(__o, AdditiveMaterial):
             return False
-        return all(getattr(self, k) == getattr(__o, k) for k in self.__dict__)
+        return self is __o or self._content_digest() == __o._content_digest()
+
+    def __hash__(self) -> int:
+        return hash(self._content_digest())
+
+    def _content_digest(self) -> bytes:
+        """Get a digest of the material parameters and data tables.
+
+        The digest is computed from the serialized material message and is memoized
+        with the message until the material is changed.
+        """
+        msg = self._to_material_message()
+        digest = self.__dict__.get("_digest")
+        if digest is None:
+            digest = hashlib.sha256(msg.SerializeToString(deterministic=True)).digest()
+            self._digest = digest
+        return digest
+
+    def _is_default(self) -> bool:
+        """Check if the material has default parameters and no data tables.
+
+        The cost of the check does not depend on the size of the data tables.
+        """
+        if self._characteristic_width_data or self._thermal_properties_data:
+            return False
+        return all(getattr(self, p) == v for p, v in _DEFAULT_PARAMETERS.items())
 
     def __validate_range(self, value, min, max, name):
         if math.isnan(value):
@@ -884,6 +982,10 @@ class AdditiveMaterial:
     @property
     def characteristic_width_data(self) -> list[CharacteristicWidthDataPoint]:
         """List of characteristic width data points."""
+        if isinstance(self._characteristic_width_data, tuple):
+            self._characteristic_width_data = [
+                copy.copy(c) for c in self._characteristic_width_data
+            ]
         return self._characteristic_width_data
 
     @characteristic_width_data.setter
@@ -898,6 +1000,8 @@ class AdditiveMaterial:
     @property
     def thermal_properties_data(self) -> list[ThermalPropertiesDataPoint]:
         """List of thermal properties data points."""
+        if isinstance(self._thermal_properties_data, tuple):
+            self._thermal_properties_data = [copy.copy(t) for t in self._thermal_properties_data]
         return self._thermal_properties_data
 
     @thermal_properties_data.setter
@@ -917,9 +1021,8 @@ class AdditiveMaterial:
         if not isinstance(msg, MaterialMessage):
             raise ValueError("Invalid message object passed to from_material_message()")
         material = AdditiveMaterial()
-        for p in material.__dict__:
-            if p != "_characteristic_width_data" and p != "_thermal_properties_data":
-                setattr(material, p, getattr(msg, p.replace("_", "", 1)))
+        for p in material._parameter_names():
+            setattr(material, p, getattr(msg, p.replace("_", "", 1)))
         for c in msg.characteristic_width_data_points:
             material.characteristic_width_data.append(
                 CharacteristicWidthDataPoint._from_characteristic_width_data_point_message(c)
@@ -933,19 +1036,44 @@ class AdditiveMaterial:
     def _to_material_message(self) -> MaterialMessage:
         """Create a material message from the additive material to send to the
         Additive service.
+
+        The message is memoized until the material or one of its data points is
+        changed, so the returned message is shared and must not be modified.
         """
+        if self._memo_is_current():
+            return self._message
+        self._clear_memo()
+        revision = _DataPointRevision.value
+        tables = (tuple(self._characteristic_width_data), tuple(self._thermal_properties_data))
         msg = MaterialMessage()
-        for p in self.__dict__:
-            if p != "_characteristic_width_data" and p != "_thermal_properties_data":
-                setattr(msg, p.replace("_", "", 1), getattr(self, p))
-        for c in self.characteristic_width_data:
+        for p in self._parameter_names():
+            setattr(msg, p.replace("_", "", 1), getattr(self, p))
+        for c in tables[0]:
             msg.characteristic_width_data_points.append(
                 c._to_characteristic_width_data_point_message()
             )
-        for t in self.thermal_properties_data:
+        for t in tables[1]:
             msg.thermal_properties_data_points.append(t._to_thermal_properties_data_point_message())
+        self._message = msg
+        self._memo_state = (revision, tables)
         return msg
 
+    def _copy_on_write(self) -> "AdditiveMaterial":
+        """Create a copy of the material that shares its data tables and message.
+
+        The tables of this material become read-only tuples. A copy gets its own
+        list of data points the first time the list is accessed, so changes made
+        to the copy never affect this material.
+        """
+        for name in _DATA_TABLE_ATTRIBUTES:
+            # The frozen table holds the same data points, so the memo stays valid
+            self.__dict__[name] = tuple(self.__dict__[name])
+        self._to_material_message()
+        clone = copy.copy(self)
+        # Copies are made without the memo, which is shared along with the data tables
+        clone.__dict__.update({k: self.__dict__[k] for k in _MEMO_ATTRIBUTES if k in self.__dict__})
+        return clone
+
     def _load_parameters(self, parameters_file: str):
         """Load material parameters from a JSON file."""
         with open(parameters_file, "r") as f:
@@ -994,3 +1122,9 @@ class AdditiveMaterial:
                         characteristic_width=float(row[2]),
                     )
                 )
+
+
+# Parameter values of a material that has not been assigned
+_DEFAULT_PARAMETERS = {
+    p: v for p, v in vars(AdditiveMaterial()).items() if p not in _DATA_TABLE_ATTRIBUTES
+}
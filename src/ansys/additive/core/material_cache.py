@@ -0,0 +1,166 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides a client-side cache of the materials on an Additive server."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from ansys.additive.core.material import AdditiveMaterial
+
+
+class MaterialCache:
+    """Provides a least recently used cache of materials and material names.
+
+    Cached materials are returned as copy-on-write instances, so changing a
+    returned material never changes the cached one.
+
+    Parameters
+    ----------
+    max_size: int, default: 16
+        Maximum number of materials to keep. Use ``0`` to disable caching.
+    ttl: float, None, default: None
+        Time in seconds after which cached entries expire. If ``None``, entries
+        do not expire.
+    clock: Callable[[], float], default: time.monotonic
+        Function that returns the current time in seconds.
+
+    """
+
+    DEFAULT_MAX_SIZE = 16
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the cache."""
+        if max_size < 0:
+            raise ValueError("max_size must not be negative.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be greater than zero.")
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Material name -> (time added, material)
+        self._materials: OrderedDict[str, tuple[float, AdditiveMaterial]] = OrderedDict()
+        self._names: tuple[float, list[str]] | None = None
+
+    def __len__(self) -> int:
+        return len(self._materials)
+
+    def _expired(self, added: float) -> bool:
+        return self._ttl is not None and self._clock() - added >= self._ttl
+
+    def material(self, name: str) -> AdditiveMaterial | None:
+        """Get a cached material.
+
+        Parameters
+        ----------
+        name: str
+            Name of the material.
+
+        Returns
+        -------
+        AdditiveMaterial, None
+            Copy of the cached material, or ``None`` if the material is not in
+            the cache or its entry has expired.
+
+        """
+        with self._lock:
+            entry = self._materials.get(name)
+            if entry is None:
+                return None
+            if self._expired(entry[0]):
+                del self._materials[name]
+                return None
+            self._materials.move_to_end(name)
+            return entry[1]._copy_on_write()
+
+    def add_material(self, name: str, material: AdditiveMaterial) -> AdditiveMaterial:
+        """Add a material to the cache.
+
+        The least recently used material is removed if the cache is full. The
+        cache takes ownership of ``material``, so it must not be changed afterwards.
+
+        Parameters
+        ----------
+        name: str
+            Name the material is requested by.
+        material: AdditiveMaterial
+            Material to cache.
+
+        Returns
+        -------
+        AdditiveMaterial
+            Copy of the cached material.
+
+        """
+        if self._max_size == 0:
+            return material
+        with self._lock:
+            self._materials[name] = (self._clock(), material)
+            self._materials.move_to_end(name)
+            while len(self._materials) > self._max_size:
+                self._materials.popitem(last=False)
+            return material._copy_on_write()
+
+    def names(self) -> list[str] | None:
+        """Get the cached list of material names.
+
+        Returns
+        -------
+        list[str], None
+            Copy of the cached names, or ``None`` if the names are not in the cache
+            or have expired.
+
+        """
+        with self._lock:
+            if self._names is None:
+                return None
+            if self._expired(self._names[0]):
+                self._names = None
+                return None
+            return list(self._names[1])
+
+    def set_names(self, names: list[str]):
+        """Cache the list of material names.
+
+        Parameters
+        ----------
+        names: list[str]
+            Names of the available materials.
+
+        """
+        if self._max_size == 0:
+            return
+        with self._lock:
+            self._names = (self._clock(), list(names))
+
+    def clear(self):
+        """Remove all materials and names from the cache."""
+        with self._lock:
+            self._materials.clear()
+            self._names = None
@@ -21,8 +21,11 @@
 # SOFTWARE.
 """Provides input and result summary containers for microstructure simulations."""
 
+import contextlib
 import math
 import os
+import shutil
+import tempfile
 
 import numpy as np
 import pandas as pd
@@ -33,6 +36,7 @@ from ansys.additive.core.machine import AdditiveMachine
 from ansys.additive.core.material import AdditiveMaterial
 from ansys.additive.core.simulation import (
     SimulationInputBase,
+    SimulationLogs,
     SimulationStatus,
     SimulationSummaryBase,
 )
@@ -523,24 +527,29 @@ class MicrostructureSummary(SimulationSummaryBase):
         self,
         input: MicrostructureInput,
         result: MicrostructureResultMessage,
-        logs: str,
+        logs: str | SimulationLogs,
         user_data_path: str,
         status: SimulationStatus = SimulationStatus.COMPLETED,
+        defer_vtk_files: bool = True,
     ) -> None:
-        """Initialize a ``MicrostructureSummary`` object."""
+        """Initialize a ``MicrostructureSummary`` object.
+
+        If ``defer_vtk_files`` is ``False``, the VTK files are written when the
+        summary is created rather than when their paths are first accessed.
+        """
         if not isinstance(input, MicrostructureInput):
             raise ValueError("Invalid input type passed to init, " + self.__class__.__name__)
         if not isinstance(result, MicrostructureResultMessage):
             raise ValueError("Invalid result type passed to init, " + self.__class__.__name__)
         if not user_data_path:
             raise ValueError("Invalid user data path, " + self.__class__.__name__)
-        if not isinstance(logs, str):
+        if not isinstance(logs, (str, SimulationLogs)):
             raise ValueError("Invalid logs type passed to init, " + self.__class__.__name__)
         super().__init__(logs, status)
         self._input = input
         id = input.id if input.id else misc.short_uuid()
         outpath = os.path.join(user_data_path, id)
-        self._result = Microstructure2DResult(result, outpath)
+        self._result = Microstructure2DResult(result, outpath, defer_vtk_files)
         self._logs = logs
 
     def __repr__(self):
@@ -563,27 +572,29 @@ class MicrostructureSummary(SimulationSummaryBase):
         """Path to the VTK file containing the 2D grain structure data in the XY plane.
 
         The VTK file contains these scalar data sets: ``GrainBoundaries``, ``Orientation_(deg)``, and
-        ``GrainNumber``.
+        ``GrainNumber``. The file is written when this property is first accessed.
         """
-        return self._result._xy_vtk
+        return _file_path(self._result._xy_vtk)
 
     @property
     def xz_vtk(self) -> str:
         """Path to the VTK file containing the 2D grain structure data in the XZ plane.
 
         The VTK file contains these scalar data sets: ``GrainBoundaries``,
-        ``Orientation_(deg)``, and ``GrainNumber``.
+        ``Orientation_(deg)``, and ``GrainNumber``. The file is written when this
+        property is first accessed.
         """
-        return self._result._xz_vtk
+        return _file_path(self._result._xz_vtk)
 
     @property
     def yz_vtk(self) -> str:
         """Path to the VTK file containing the 2D grain structure data in the YZ plane.
 
         The VTK file contains these scalar data sets: ``GrainBoundaries``,
-        ``Orientation_(deg)``, and ``GrainNumber``.
+        ``Orientation_(deg)``, and ``GrainNumber``. The file is written when this
+        property is first accessed.
         """
-        return self._result._yz_vtk
+        return _file_path(self._result._yz_vtk)
 
     @property
     def xy_circle_equivalence(self) -> pd.DataFrame:
@@ -626,14 +637,25 @@ class MicrostructureSummary(SimulationSummaryBase):
 
     @staticmethod
     def _circle_equivalence_frame(src: RepeatedCompositeFieldContainer) -> pd.DataFrame:
-        d = {}
-        d[CircleEquivalenceColumnNames.GRAIN_NUMBER] = np.asarray([x.grain_number for x in src])
-        d[CircleEquivalenceColumnNames.AREA_FRACTION] = np.asarray([x.area_fraction for x in src])
-        d[CircleEquivalenceColumnNames.DIAMETER] = np.asarray([x.diameter_um for x in src])
-        d[CircleEquivalenceColumnNames.ORIENTATION_ANGLE] = np.asarray(
-            [math.degrees(x.orientation_angle) for x in src]
+        columns = misc.decode_repeated_field(
+            src,
+            {
+                "grain_number": np.int64,
+                "area_fraction": np.float64,
+                "diameter_um": np.float64,
+                "orientation_angle": np.float64,
+            },
+        )
+        return pd.DataFrame(
+            {
+                CircleEquivalenceColumnNames.GRAIN_NUMBER: columns["grain_number"],
+                CircleEquivalenceColumnNames.AREA_FRACTION: columns["area_fraction"],
+                CircleEquivalenceColumnNames.DIAMETER: columns["diameter_um"],
+                CircleEquivalenceColumnNames.ORIENTATION_ANGLE: np.degrees(
+                    columns["orientation_angle"]
+                ),
+            }
         )
-        return pd.DataFrame(d)
 
     @staticmethod
     def _average_grain_size(df: pd.DataFrame) -> float:
@@ -657,27 +679,112 @@ class MicrostructureSummary(SimulationSummaryBase):
         ).sum()
 
 
+class _DeferredFile:
+    """Result file whose content is written to disk when its path is first requested.
+
+    Content larger than :attr:`SPILL_SIZE` is held in a closed temporary file rather
+    than in memory until it is written, so that no file descriptor is kept open.
+
+    Parameters
+    ----------
+    path: str
+        Path to write the file to.
+    content: bytes
+        File content.
+    defer: bool, default: True
+        Whether to wait until the path is requested to write the file. If ``False``,
+        the file is written immediately.
+
+    """
+
+    SPILL_SIZE = 8 * 1024**2
+    """Content size in bytes above which the content is not held in memory."""
+
+    def __init__(self, path: str, content: bytes, defer: bool = True) -> None:
+        self._path = path
+        self._content = content
+        self._spill = None
+        self._written = False
+        if not defer:
+            self._write()
+        elif len(content) > self.SPILL_SIZE:
+            fd, self._spill = tempfile.mkstemp(prefix="pyadditive-", suffix=".vtk")
+            with open(fd, "wb") as f:
+                f.write(content)
+            self._content = None
+
+    @property
+    def path(self) -> str:
+        """Path to the file, which is written if it does not exist yet."""
+        if not self._written:
+            self._write()
+        return self._path
+
+    def _write(self) -> None:
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        if self._spill:
+            shutil.move(self._spill, self._path)
+        else:
+            with open(self._path, "wb") as f:
+                f.write(self._content)
+        self._content = None
+        self._spill = None
+        self._written = True
+
+    def __str__(self) -> str:
+        return self._path
+
+    def __getstate__(self) -> dict:
+        # The temporary file belongs to this object, so its content is pickled instead
+        state = self.__dict__.copy()
+        if self._spill:
+            with open(self._spill, "rb") as f:
+                state["_content"] = f.read()
+            state["_spill"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        if state["_written"]:
+            self.__dict__.update(state)
+        else:
+            self.__init__(state["_path"], state["_content"])
+
+    def __del__(self):
+        if self._spill:
+            with contextlib.suppress(OSError):
+                os.remove(self._spill)
+
+
+def _file_path(file: _DeferredFile | str) -> str:
+    """Get the path of a result file, which is a string in summaries pickled by earlier versions."""
+    return file if isinstance(file, str) else file.path
+
+
 class Microstructure2DResult:
     """Provides the results of a 2D microstructure simulation."""
 
-    def __init__(self, msg: MicrostructureResultMessage, output_data_path: str) -> None:
+    def __init__(
+        self,
+        msg: MicrostructureResultMessage,
+        output_data_path: str,
+        defer_vtk_files: bool = True,
+    ) -> None:
         """Initialize a ``Microstructure2DResult`` object."""
         if not isinstance(msg, MicrostructureResultMessage):
             raise ValueError("Invalid msg parameter, " + self.__class__.__name__)
         if not output_data_path:
             raise ValueError("Invalid output data path, " + self.__class__.__name__)
 
-        if not os.path.exists(output_data_path):
-            os.makedirs(output_data_path)
-        self._xy_vtk = os.path.join(output_data_path, "xy.vtk")
-        with open(self._xy_vtk, "wb") as xy_vtk:
-            xy_vtk.write(msg.xy_vtk)
-        self._xz_vtk = os.path.join(output_data_path, "xz.vtk")
-        with open(self._xz_vtk, "wb") as xz_vtk:
-            xz_vtk.write(msg.xz_vtk)
-        self._yz_vtk = os.path.join(output_data_path, "yz.vtk")
-        with open(self._yz_vtk, "wb") as yz_vtk:
-            yz_vtk.write(msg.yz_vtk)
+        # VTK files are only written when their paths are requested, unless deferring is disabled
+        self._xy_vtk = _DeferredFile(
+            os.path.join(output_data_path, "xy.vtk"), msg.xy_vtk, defer_vtk_files
+        )
+        self._xz_vtk = _DeferredFile(
+            os.path.join(output_data_path, "xz.vtk"), msg.xz_vtk, defer_vtk_files
+        )
+        self._yz_vtk = _DeferredFile(
+            os.path.join(output_data_path, "yz.vtk"), msg.yz_vtk, defer_vtk_files
+        )
 
         self._xy_circle_equivalence = MicrostructureSummary._circle_equivalence_frame(
             msg.xy_circle_equivalence
@@ -27,9 +27,14 @@ import os
 from ansys.additive.core import misc
 from ansys.additive.core.machine import AdditiveMachine
 from ansys.additive.core.material import AdditiveMaterial
-from ansys.additive.core.microstructure import Microstructure2DResult
+from ansys.additive.core.microstructure import (
+    Microstructure2DResult,
+    _DeferredFile,
+    _file_path,
+)
 from ansys.additive.core.simulation import (
     SimulationInputBase,
+    SimulationLogs,
     SimulationStatus,
     SimulationSummaryBase,
 )
@@ -366,28 +371,32 @@ class Microstructure3DSummary(SimulationSummaryBase):
         self,
         input: Microstructure3DInput,
         result: Microstructure3DResult,
-        logs: str,
+        logs: str | SimulationLogs,
         user_data_path: str,
         status: SimulationStatus = SimulationStatus.COMPLETED,
+        defer_vtk_files: bool = True,
     ) -> None:
-        """Initialize a ``Microstructure3DSummary`` object."""
+        """Initialize a ``Microstructure3DSummary`` object.
+
+        If ``defer_vtk_files`` is ``False``, the VTK files are written when the
+        summary is created rather than when their paths are first accessed.
+        """
         if not isinstance(input, Microstructure3DInput):
             raise ValueError("Invalid input type, " + self.__class__.__name__)
         if not isinstance(result, Microstructure3DResult):
             raise ValueError("Invalid result type, " + self.__class__.__name__)
         if not user_data_path or (user_data_path == ""):
             raise ValueError("Invalid user data path, " + self.__class__.__name__)
-        if not isinstance(logs, str):
+        if not isinstance(logs, (str, SimulationLogs)):
             raise ValueError("Invalid logs type passed to init, " + self.__class__.__name__)
         super().__init__(logs, status)
         self._input = input
         id = input.id if input.id else misc.short_uuid()
         outpath = os.path.join(user_data_path, id)
-        os.makedirs(outpath, exist_ok=True)
-        self._grain_3d_vtk = os.path.join(outpath, self._3D_GRAIN_VTK_NAME)
-        with open(self._grain_3d_vtk, "wb") as f:
-            f.write(result.three_d_vtk)
-        self._2d_result = Microstructure2DResult(result.two_d_result, outpath)
+        self._grain_3d_vtk = _DeferredFile(
+            os.path.join(outpath, self._3D_GRAIN_VTK_NAME), result.three_d_vtk, defer_vtk_files
+        )
+        self._2d_result = Microstructure2DResult(result.two_d_result, outpath, defer_vtk_files)
         self._logs = logs
 
     def __repr__(self):
@@ -412,9 +421,10 @@ class Microstructure3DSummary(SimulationSummaryBase):
         """Path to the VTK file containing the 3D grain structure data.
 
         The VTK file contains these scalar data sets" ``GrainNumber``, ``Phi0_(deg)``,
-        ``Phi1_(deg)``, ``Phi2_(deg)``, and ``Temperatures``.
+        ``Phi1_(deg)``, ``Phi2_(deg)``, and ``Temperatures``. The file is written when
+        this property is first accessed.
         """
-        return self._grain_3d_vtk
+        return _file_path(self._grain_3d_vtk)
 
     @property
     def xy_average_grain_size(self) -> float:
@@ -21,8 +21,12 @@
 # SOFTWARE.
 """Provides miscellaneous utility functions."""
 
+import operator
 import random
 import string
+from collections.abc import Mapping, Sequence
+
+import numpy as np
 
 
 def short_uuid(nchars: int = 12) -> str:
@@ -39,3 +43,51 @@ def short_uuid(nchars: int = 12) -> str:
     alphabet = string.ascii_letters + string.digits
     nchars = max(6, nchars)
     return "".join(random.choices(alphabet, k=nchars))  # noqa: S311  # nosec B311
+
+
+def short_uuids(count: int, nchars: int = 12) -> list[str]:
+    """Generate a number of short UUIDs at once.
+
+    Parameters
+    ----------
+    count : int
+        Number of UUIDs to generate.
+    nchars : int, default 12
+        Number of characters in each UUID. Only applies if ``nchars`` is greater
+        than 6. See :func:`short_uuid`.
+
+    """
+    alphabet = np.frombuffer((string.ascii_letters + string.digits).encode(), dtype="S1")
+    nchars = max(6, nchars)
+    indices = np.random.default_rng().integers(len(alphabet), size=(count, nchars))
+    return alphabet[indices].view(f"S{nchars}").ravel().astype(f"U{nchars}").tolist()
+
+
+def decode_repeated_field(
+    messages: Sequence, fields: Mapping[str, np.dtype | type]
+) -> dict[str, np.ndarray]:
+    """Decode the numeric fields of a repeated protobuf message field into NumPy arrays.
+
+    The messages are read in a single pass and converted to arrays in bulk rather
+    than one list per field.
+
+    Parameters
+    ----------
+    messages : Sequence
+        Repeated message field, such as ``MeltPool.time_steps``.
+    fields : Mapping[str, np.dtype | type]
+        Data type of the array to create for each field, keyed by field name.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        Values of each field, keyed by field name.
+
+    """
+    getter = operator.attrgetter(*fields)
+    rows = list(map(getter, messages)) if len(fields) > 1 else [(getter(m),) for m in messages]
+    values = np.array(rows, dtype=np.float64).reshape(len(rows), len(fields))
+    return {
+        name: values[:, i].astype(dtype, copy=False)
+        for i, (name, dtype) in enumerate(fields.items())
+    }
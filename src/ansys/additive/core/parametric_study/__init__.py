@@ -35,3 +35,8 @@ from ansys.additive.core.parametric_study.parametric_utils import (  # noqa: F40
     build_rate,
     energy_density,
 )
+from ansys.additive.core.parametric_study.storage import (  # noqa: F401
+    PickleStudyStorage,
+    SQLiteStudyStorage,
+    StudyStorage,
+)
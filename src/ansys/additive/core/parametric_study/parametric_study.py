@@ -23,18 +23,20 @@
 
 from __future__ import annotations
 
+import copy
 import math
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     import os
+    from collections.abc import Iterator
 import pathlib
-import platform
+import time
 import warnings
+from contextlib import contextmanager
 from functools import wraps
 from typing import Callable
 
-import dill  # nosec: B403
 import numpy as np
 
 import ansys.additive.core.misc as misc
@@ -55,6 +57,7 @@ from ansys.additive.core.single_bead import MeltPool, SingleBeadInput, SingleBea
 
 from .constants import DEFAULT_ITERATION, DEFAULT_PRIORITY, FORMAT_VERSION, ColumnNames
 from .parametric_utils import build_rate, energy_density
+from .storage import PickleStudyStorage, SQLiteStudyStorage, StudyStorage
 
 # Suppress: FutureWarning in pandas: The behavior of DataFrame concatenation with empty or
 # all-NA entries is deprecated. In a future version, this will no longer exclude
@@ -65,21 +68,202 @@ import pandas as pd  # noqa: E402
 
 
 def save_on_return(func):
-    """Save study file upon method return."""
+    """Save study file upon method return.
+
+    Inside a :meth:`ParametricStudy.batch` block, the save is deferred until the
+    block's autosave policy requires it.
+    """
 
     @wraps(func)
     def wrap(self, *args, **kwargs):
         result = func(self, *args, **kwargs)
-        self.save(self.file_name)
+        batch = getattr(self, "_batch", None)
+        if batch is None:
+            self.save(self.file_name)
+        else:
+            batch.unsaved_changes += 1
+            if batch.save_due():
+                self.save(self.file_name)
         return result
 
     return wrap
 
 
+class _SaveBatch:
+    """Autosave policy for changes made inside a :meth:`ParametricStudy.batch` block."""
+
+    def __init__(self, max_changes: int | None, max_interval: float | None):
+        self.max_changes = max_changes
+        self.max_interval = max_interval
+        self.unsaved_changes = 0
+        self.last_save = time.monotonic()
+
+    def save_due(self) -> bool:
+        """Check if the unsaved changes should be written now."""
+        if self.max_changes is not None and self.unsaved_changes >= self.max_changes:
+            return True
+        return self.max_interval is not None and (
+            time.monotonic() - self.last_save >= self.max_interval
+        )
+
+    def saved(self):
+        """Record that the study was written."""
+        self.unsaved_changes = 0
+        self.last_save = time.monotonic()
+
+
+# Input parameters used to find duplicate simulations of each type
+_COMMON_DUPLICATE_CHECK_COLUMNS = [
+    ColumnNames.MATERIAL,
+    ColumnNames.HEATER_TEMPERATURE,
+    ColumnNames.LAYER_THICKNESS,
+    ColumnNames.BEAM_DIAMETER,
+    ColumnNames.LASER_POWER,
+    ColumnNames.SCAN_SPEED,
+    ColumnNames.TYPE,
+    ColumnNames.HEAT_SOURCE,
+    ColumnNames.RING_MODE_INDEX,
+    ColumnNames.DEFOCUS,
+    ColumnNames.LASER_SHAPE_PARAMETER,
+    ColumnNames.LASER_DISTRIBUTION_PARAMETER,
+    ColumnNames.FRESNAL_ABSORPTION_COEFFICIENT,
+    ColumnNames.ABSORPTION_IN_CONDUCTION_MODE,
+]
+_DUPLICATE_CHECK_COLUMNS = {
+    SimulationType.SINGLE_BEAD: _COMMON_DUPLICATE_CHECK_COLUMNS
+    + [
+        ColumnNames.SINGLE_BEAD_LENGTH,
+        ColumnNames.SB_THERMAL_HISTORY_FLAG,
+        ColumnNames.SB_THERMAL_HISTORY_INTERVAL,
+    ],
+    SimulationType.POROSITY: _COMMON_DUPLICATE_CHECK_COLUMNS
+    + [
+        ColumnNames.START_ANGLE,
+        ColumnNames.ROTATION_ANGLE,
+        ColumnNames.HATCH_SPACING,
+        ColumnNames.STRIPE_WIDTH,
+        ColumnNames.POROSITY_SIZE_X,
+        ColumnNames.POROSITY_SIZE_Y,
+        ColumnNames.POROSITY_SIZE_Z,
+    ],
+    SimulationType.MICROSTRUCTURE: _COMMON_DUPLICATE_CHECK_COLUMNS
+    + [
+        ColumnNames.START_ANGLE,
+        ColumnNames.ROTATION_ANGLE,
+        ColumnNames.HATCH_SPACING,
+        ColumnNames.STRIPE_WIDTH,
+        ColumnNames.MICRO_MIN_X,
+        ColumnNames.MICRO_MIN_Y,
+        ColumnNames.MICRO_MIN_Z,
+        ColumnNames.MICRO_SIZE_X,
+        ColumnNames.MICRO_SIZE_Y,
+        ColumnNames.MICRO_SIZE_Z,
+        ColumnNames.MICRO_SENSOR_DIM,
+        ColumnNames.COOLING_RATE,
+        ColumnNames.THERMAL_GRADIENT,
+        ColumnNames.MICRO_MELT_POOL_DEPTH,
+        ColumnNames.MICRO_MELT_POOL_WIDTH,
+        ColumnNames.RANDOM_SEED,
+    ],
+}
+
+# Number of significant digits compared when checking numeric parameters for duplicates
+_PARAMETER_SIGNIFICANT_DIGITS = 12
+
+
+def _parameter_keys(parameters: pd.DataFrame) -> list[tuple]:
+    """Create hashable keys from the input parameters of simulations.
+
+    Numbers are rounded to :obj:`_PARAMETER_SIGNIFICANT_DIGITS` significant digits,
+    so values that differ only by floating point error have the same key. Missing
+    values are all represented by ``None``.
+
+    Parameters
+    ----------
+    parameters : pd.DataFrame
+        Input parameters, one row per simulation.
+
+    Returns
+    -------
+    list[tuple]
+        Key for each row.
+
+    """
+    columns = []
+    for _, column in parameters.items():
+        values = column.to_numpy(dtype=object)
+        missing = pd.isna(values)
+        try:
+            numbers = np.where(missing, np.nan, values).astype(float)
+        except (TypeError, ValueError):
+            values = values.copy()
+        else:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                scale = 10.0 ** (
+                    np.floor(np.log10(np.abs(numbers))) - (_PARAMETER_SIGNIFICANT_DIGITS - 1)
+                )
+                numbers = np.where(scale > 0, np.round(numbers / scale) * scale, numbers)
+            values = numbers.astype(object)
+        values[missing] = None
+        columns.append(values)
+    return list(zip(*(c.tolist() for c in columns), strict=True))
+
+
+class _ParameterIndex:
+    """Index of the simulations in a parametric study data frame by input parameters."""
+
+    def __init__(self, data_frame: pd.DataFrame):
+        self.data_frame = data_frame
+        # Row label of each key and key of each row label for the checked rows
+        self.labels = {}
+        self.keys = {}
+        # Labels of rows that have not been checked for duplicates
+        self.pending = list(data_frame.index)
+
+    def remove(self, labels: list):
+        """Remove rows from the index."""
+        for label in labels:
+            key = self.keys.pop(label, None)
+            if key is not None and self.labels.get(key) == label:
+                del self.labels[key]
+        if self.pending:
+            removed = set(labels)
+            self.pending = [label for label in self.pending if label not in removed]
+
+
+# Values used for missing input parameters when creating simulation inputs
+_INPUT_DEFAULTS = {
+    ColumnNames.START_ANGLE: MachineConstants.DEFAULT_STARTING_LAYER_ANGLE,
+    ColumnNames.ROTATION_ANGLE: MachineConstants.DEFAULT_LAYER_ROTATION_ANGLE,
+    ColumnNames.HATCH_SPACING: MachineConstants.DEFAULT_HATCH_SPACING,
+    ColumnNames.STRIPE_WIDTH: MachineConstants.DEFAULT_SLICING_STRIPE_WIDTH,
+    ColumnNames.HEAT_SOURCE: MachineConstants.DEFAULT_HEAT_SOURCE_MODEL_NAME,
+    ColumnNames.RING_MODE_INDEX: MachineConstants.DEFAULT_RING_MODE_INDEX,
+    ColumnNames.DEFOCUS: MachineConstants.DEFAULT_DEFOCUS,
+    ColumnNames.MICRO_MIN_X: MicrostructureInput.DEFAULT_POSITION_COORDINATE,
+    ColumnNames.MICRO_MIN_Y: MicrostructureInput.DEFAULT_POSITION_COORDINATE,
+    ColumnNames.MICRO_MIN_Z: MicrostructureInput.DEFAULT_POSITION_COORDINATE,
+    ColumnNames.RANDOM_SEED: MicrostructureInput.DEFAULT_RANDOM_SEED,
+}
+
+# Material parameters applied to the dynamic defocus heat source model
+_HEAT_SOURCE_MATERIAL_COLUMNS = [
+    ColumnNames.LASER_SHAPE_PARAMETER,
+    ColumnNames.LASER_DISTRIBUTION_PARAMETER,
+    ColumnNames.FRESNAL_ABSORPTION_COEFFICIENT,
+    ColumnNames.ABSORPTION_IN_CONDUCTION_MODE,
+]
+
+
 class ParametricStudy:
     """Provides data storage and utility methods for a parametric study."""
 
-    def __init__(self, file_name: str | os.PathLike, material_name: str):
+    def __init__(
+        self,
+        file_name: str | os.PathLike,
+        material_name: str,
+        storage: StudyStorage | None = None,
+    ):
         """Initialize the parametric study.
 
         Parameters
@@ -89,6 +273,11 @@ class ParametricStudy:
             loaded and updated to the latest version of the file format.
         material_name: str
             Name of the material used in the parametric study.
+        storage: StudyStorage, None, default: None
+            Storage backend used to write the study file. If ``None``, an existing file
+            keeps the storage it was written with, and new files use
+            :class:`SQLiteStudyStorage <storage.SQLiteStudyStorage>`. If an existing file
+            was written with a different storage, it is converted to this storage.
 
         """
         study_path = pathlib.Path(file_name).absolute()
@@ -96,20 +285,44 @@ class ParametricStudy:
             study_path = pathlib.Path(str(study_path) + ".ps")
         if study_path.exists():
             self.__dict__ = ParametricStudy.load(study_path).__dict__
+            if storage is not None and type(storage) is not type(self._storage):
+                self._storage = storage
+                self.save(self.file_name)
         else:
-            self._init_new_study(study_path, material_name)
+            self._init_new_study(study_path, material_name, storage)
             LOG.info(f"Saving parametric study to {self.file_name}")
 
-    def _init_new_study(self, study_path: pathlib.Path, material: str):
+    def __getstate__(self) -> dict:
+        """Get the state of the parametric study for pickling."""
+        state = self.__dict__.copy()
+        state.pop("_batch", None)
+        state.pop("_id_index_cache", None)
+        state.pop("_parameter_index_cache", None)
+        return state
+
+    def __setstate__(self, state: dict):
+        """Restore a pickled parametric study."""
+        self.__dict__.update(state)
+        if "_storage" not in state:
+            # Study files written before storage backends were introduced keep
+            # their format unless the study is explicitly given another storage.
+            self._storage = PickleStudyStorage()
+
+    def _init_new_study(
+        self, study_path: pathlib.Path, material: str, storage: StudyStorage | None = None
+    ):
         self._file_name = study_path
         columns = [getattr(ColumnNames, k) for k in ColumnNames.__dict__ if not k.startswith("_")]
         self._data_frame = pd.DataFrame(columns=columns)
         self._format_version = FORMAT_VERSION
         self._material_name = material
+        self._storage = storage or SQLiteStudyStorage()
         self.save(self.file_name)
 
     @classmethod
-    def _new(cls, study_path: pathlib.Path, material: str = ""):
+    def _new(
+        cls, study_path: pathlib.Path, material: str = "", storage: StudyStorage | None = None
+    ):
         """Create a new parametric study with an empty dataframe.
 
         Parameters
@@ -120,9 +333,12 @@ class ParametricStudy:
         material: str, default ""
             Material to use for study.
 
+        storage: StudyStorage, None, default: None
+            Storage backend for the study file. If ``None``, the default storage is used.
+
         """
         study = cls.__new__(cls)
-        study._init_new_study(study_path, material)
+        study._init_new_study(study_path, material, storage)
         return study
 
     def import_csv_study(self, file_name: str | os.PathLike) -> list[str]:
@@ -168,16 +384,26 @@ class ParametricStudy:
         """Name of material used in the parametric study."""
         return self._material_name
 
+    @property
+    def storage(self) -> StudyStorage:
+        """Storage backend used to write the parametric study file."""
+        return self._storage
+
     def data_frame(self) -> pd.DataFrame:
         """Return a :class:`DataFrame <pandas.DataFrame>` containing the study simulations.
 
         For the column names used in the returned data frame, see
         the :class:`ColumnNames <constants.ColumnNames>` class.
 
+        Simulations are listed in the order they were added to the study,
+        and the returned data frame is indexed from zero.
+
         .. note::
            Updating the returned data frame does not update this parametric study.
         """
-        return self._data_frame.copy()
+        df = self._data_frame.copy()
+        df.index = pd.RangeIndex(len(df))
+        return df
 
     def save(self, file_name: str | os.PathLike):
         """Save the parametric study to a file.
@@ -188,10 +414,51 @@ class ParametricStudy:
             Name of the file to save the parametric study to.
 
         """
+        self._storage.save(self, file_name)
+        batch = getattr(self, "_batch", None)
+        if batch is not None and pathlib.Path(file_name) == pathlib.Path(self.file_name):
+            batch.saved()
+
+    @contextmanager
+    def batch(
+        self, max_changes: int | None = None, max_interval: float | None = None
+    ) -> Iterator[None]:
+        """Defer saving the study file while making several changes.
+
+        Methods that modify the study normally save it before returning. Inside
+        this context, saves are deferred and the study is saved once when the
+        context exits. Use ``max_changes`` or ``max_interval`` to also save
+        periodically during long-running blocks. Calling :meth:`save` inside the
+        context saves immediately. Nested contexts join the outermost one.
+
+        Parameters
+        ----------
+        max_changes : int, None, default: None
+            Save when this many changes have been made since the last save.
+            If ``None``, the number of changes does not trigger a save.
+        max_interval : float, None, default: None
+            Save when a change is made and at least this many seconds have passed
+            since the last save. If ``None``, elapsed time does not trigger a save.
+
+        Examples
+        --------
+        >>> with study.batch():
+        ...     study.set_priority(ids, 1)
+        ...     study.set_iteration(ids, 2)
+
+        """
+        if getattr(self, "_batch", None) is not None:
+            yield
+            return
 
-        pathlib.Path(file_name).parent.mkdir(parents=True, exist_ok=True)
-        with open(file_name, "wb") as f:
-            dill.dump(self, f)
+        self._batch = _SaveBatch(max_changes, max_interval)
+        try:
+            yield
+        finally:
+            batch = self._batch
+            self._batch = None
+            if batch.unsaved_changes:
+                self.save(self.file_name)
 
     @staticmethod
     def load(file_name: str | os.PathLike) -> ParametricStudy:
@@ -210,38 +477,35 @@ class ParametricStudy:
         ParametricStudy
             Loaded parametric study.
 
+        Notes
+        -----
+        The study keeps the storage format of the file. Study files written by
+        earlier versions of PyAdditive remain pickled. To convert a study file to
+        the :class:`SQLiteStudyStorage <storage.SQLiteStudyStorage>` format, open it
+        with ``ParametricStudy(file_name, material_name, SQLiteStudyStorage())``.
+
         """
         if not pathlib.Path(file_name).is_file():
             raise ValueError(f"{file_name} is not a valid file.")
 
-        # Hack to allow for sharing study files cross-platform.
-        temp = None
-        if platform.system() == "Windows":
-            temp = pathlib.PosixPath
-            pathlib.PosixPath = pathlib.WindowsPath
+        if SQLiteStudyStorage.is_study_file(file_name):
+            storage = SQLiteStudyStorage()
         else:
-            temp = pathlib.WindowsPath
-            pathlib.WindowsPath = pathlib.PosixPath
-
-        try:
-            with open(file_name, "rb") as f:
-                study = dill.load(f)  # noqa: S301 # nosec: B301
-        except Exception:
-            raise
-        finally:
-            # Undo hack
-            if platform.system() == "Windows":
-                pathlib.PosixPath = temp
-            else:
-                pathlib.WindowsPath = temp
-
-        if not isinstance(study, ParametricStudy):
-            raise ValueError(f"{file_name} is not a parametric study.")
+            storage = PickleStudyStorage()
+        study = ParametricStudy.__new__(ParametricStudy)
+        storage.load(study, file_name)
 
         study.file_name = file_name
-        study = ParametricStudy.update_format(study)
-        study.reset_simulation_status()
-        return study
+        updated = ParametricStudy.update_format(study)
+        # Only rewrite the file if its format was updated or simulations were left
+        # pending or running
+        statuses = updated._data_frame[ColumnNames.STATUS]
+        if (
+            updated is not study
+            or statuses.isin([SimulationStatus.PENDING, SimulationStatus.RUNNING]).any()
+        ):
+            updated.reset_simulation_status()
+        return updated
 
     @save_on_return
     def reset_simulation_status(self):
@@ -252,6 +516,7 @@ class ParametricStudy:
             )
         ].index
         self._data_frame.loc[idx, ColumnNames.STATUS] = SimulationStatus.NEW
+        self._storage.mark_modified(idx)
 
     @save_on_return
     def clear_errors(self, simulation_ids: list[str] | None = None):
@@ -268,8 +533,9 @@ class ParametricStudy:
         if simulation_ids is None:
             idx = self._data_frame.index
         else:
-            idx = self._data_frame[self._data_frame[ColumnNames.ID].isin(simulation_ids)].index
+            idx = self._rows_with_ids(simulation_ids)
         self._data_frame.loc[idx, ColumnNames.ERROR_MESSAGE] = None
+        self._storage.mark_modified(idx)
 
     @save_on_return
     def add_summaries(
@@ -332,7 +598,7 @@ class ParametricStudy:
                 ColumnNames.MELT_POOL_REFERENCE_DEPTH_OVER_WIDTH: mp.depth_over_width(),
             }
         )
-        self._data_frame = pd.concat([self._data_frame, row.to_frame().T], ignore_index=True)
+        self._append_rows(row.to_frame().T)
 
     def _add_porosity_summary(self, summary: PorositySummary, iteration: int = DEFAULT_ITERATION):
         br = build_rate(
@@ -358,7 +624,7 @@ class ParametricStudy:
                 ColumnNames.RELATIVE_DENSITY: summary.relative_density,
             }
         )
-        self._data_frame = pd.concat([self._data_frame, row.to_frame().T], ignore_index=True)
+        self._append_rows(row.to_frame().T)
 
     def _add_microstructure_summary(
         self, summary: MicrostructureSummary, iteration: int = DEFAULT_ITERATION
@@ -405,7 +671,7 @@ class ParametricStudy:
                 ColumnNames.YZ_AVERAGE_GRAIN_SIZE: summary.yz_average_grain_size,
             }
         )
-        self._data_frame = pd.concat([self._data_frame, row.to_frame().T], ignore_index=True)
+        self._append_rows(row.to_frame().T)
 
     def _common_param_to_dict(
         self,
@@ -581,81 +847,70 @@ class ParametricStudy:
 
         min_pv = min_pv_ratio or 0.0
         max_pv = max_pv_ratio or float("inf")
-        num_permutations_added = int()
-        for p in laser_powers:
-            for v in scan_speeds:
-                for thickness in lt:
-                    pv_ratio = round(p / v, 5)
-                    if pv_ratio < min_pv or pv_ratio > max_pv:
-                        continue
-
-                    for t in ht:
-                        for d in bd:
-                            # validate parameters by trying to create input objects
-                            try:
-                                machine = AdditiveMachine(
-                                    laser_power=p,
-                                    scan_speed=v,
-                                    heater_temperature=t,
-                                    layer_thickness=thickness,
-                                    beam_diameter=d,
-                                    heat_source_model=heat_source,
-                                    ring_mode_index=ring_mode_index,
-                                    defocus=defocus,
-                                )
-                                material = AdditiveMaterial(
-                                    laser_shape_parameter=laser_shape_parameter,
-                                    laser_distribution_parameter=laser_distribution_parameter,
-                                    fresnal_absorption_coefficient=fresnal_absorption_coefficient,
-                                    absorption_in_conduction_mode=absorption_conduction_mode,
-                                )
-                                SingleBeadInput(
-                                    bead_length=bead_length,
-                                    machine=machine,
-                                    material=material,
-                                    thermal_history_interval=interval,
-                                    output_thermal_history=thermal_history,
-                                )
-                            except ValueError as e:
-                                LOG.error(f"Invalid parameter combination: {e}")
-                                continue
-
-                            # add row to parametric study data frame
-                            row = pd.Series(
-                                {
-                                    ColumnNames.ITERATION: iteration,
-                                    ColumnNames.PRIORITY: priority,
-                                    ColumnNames.TYPE: SimulationType.SINGLE_BEAD,
-                                    ColumnNames.ID: self._create_unique_id(
-                                        prefix=f"sb_{iteration}"
-                                    ),
-                                    ColumnNames.STATUS: SimulationStatus.NEW,
-                                    ColumnNames.MATERIAL: self.material_name,
-                                    ColumnNames.HEATER_TEMPERATURE: t,
-                                    ColumnNames.LAYER_THICKNESS: thickness,
-                                    ColumnNames.BEAM_DIAMETER: d,
-                                    ColumnNames.LASER_POWER: p,
-                                    ColumnNames.SCAN_SPEED: v,
-                                    ColumnNames.PV_RATIO: p / v,
-                                    ColumnNames.ENERGY_DENSITY: None,
-                                    ColumnNames.BUILD_RATE: None,
-                                    ColumnNames.SINGLE_BEAD_LENGTH: bead_length,
-                                    ColumnNames.SB_THERMAL_HISTORY_FLAG: thermal_history,
-                                    ColumnNames.SB_THERMAL_HISTORY_INTERVAL: interval,
-                                    ColumnNames.HEAT_SOURCE: heat_source,
-                                    ColumnNames.RING_MODE_INDEX: ring_mode_index,
-                                    ColumnNames.DEFOCUS: defocus,
-                                    ColumnNames.LASER_SHAPE_PARAMETER: laser_shape_parameter,
-                                    ColumnNames.LASER_DISTRIBUTION_PARAMETER: laser_distribution_parameter,
-                                    ColumnNames.FRESNAL_ABSORPTION_COEFFICIENT: fresnal_absorption_coefficient,
-                                    ColumnNames.ABSORPTION_IN_CONDUCTION_MODE: absorption_conduction_mode,
-                                }
-                            )
-                            self._data_frame = pd.concat(
-                                [self._data_frame, row.to_frame().T], ignore_index=True
-                            )
-                            num_permutations_added += 1
-        return num_permutations_added - self._remove_duplicate_entries(overwrite=False)
+
+        # validate the parameters shared by all permutations once
+        try:
+            SingleBeadInput(
+                bead_length=bead_length,
+                machine=AdditiveMachine(
+                    heat_source_model=heat_source,
+                    ring_mode_index=ring_mode_index,
+                    defocus=defocus,
+                ),
+                material=AdditiveMaterial(
+                    laser_shape_parameter=laser_shape_parameter,
+                    laser_distribution_parameter=laser_distribution_parameter,
+                    fresnal_absorption_coefficient=fresnal_absorption_coefficient,
+                    absorption_in_conduction_mode=absorption_conduction_mode,
+                ),
+                thermal_history_interval=interval,
+                output_thermal_history=thermal_history,
+            )
+        except ValueError as e:
+            LOG.error(f"Invalid parameter combination: {e}")
+            return 0
+
+        grid = self._machine_permutations(
+            laser_power=laser_powers,
+            scan_speed=scan_speeds,
+            layer_thickness=lt,
+            heater_temperature=ht,
+            beam_diameter=bd,
+        )
+        pv_ratio = grid["laser_power"].astype(float) / grid["scan_speed"].astype(float)
+        rounded_pv_ratio = np.round(pv_ratio, 5)
+        keep = (rounded_pv_ratio >= min_pv) & (rounded_pv_ratio <= max_pv)
+        num_permutations = int(np.count_nonzero(keep))
+
+        return self._append_permutations(
+            {
+                ColumnNames.ITERATION: iteration,
+                ColumnNames.PRIORITY: priority,
+                ColumnNames.TYPE: SimulationType.SINGLE_BEAD,
+                ColumnNames.ID: self._create_unique_ids(f"sb_{iteration}", num_permutations),
+                ColumnNames.STATUS: SimulationStatus.NEW,
+                ColumnNames.MATERIAL: self.material_name,
+                ColumnNames.HEATER_TEMPERATURE: grid["heater_temperature"][keep],
+                ColumnNames.LAYER_THICKNESS: grid["layer_thickness"][keep],
+                ColumnNames.BEAM_DIAMETER: grid["beam_diameter"][keep],
+                ColumnNames.LASER_POWER: grid["laser_power"][keep],
+                ColumnNames.SCAN_SPEED: grid["scan_speed"][keep],
+                ColumnNames.PV_RATIO: pv_ratio[keep],
+                ColumnNames.ENERGY_DENSITY: None,
+                ColumnNames.BUILD_RATE: None,
+                ColumnNames.SINGLE_BEAD_LENGTH: bead_length,
+                ColumnNames.SB_THERMAL_HISTORY_FLAG: thermal_history,
+                ColumnNames.SB_THERMAL_HISTORY_INTERVAL: interval,
+                ColumnNames.HEAT_SOURCE: heat_source,
+                ColumnNames.RING_MODE_INDEX: ring_mode_index,
+                ColumnNames.DEFOCUS: defocus,
+                ColumnNames.LASER_SHAPE_PARAMETER: laser_shape_parameter,
+                ColumnNames.LASER_DISTRIBUTION_PARAMETER: laser_distribution_parameter,
+                ColumnNames.FRESNAL_ABSORPTION_COEFFICIENT: fresnal_absorption_coefficient,
+                ColumnNames.ABSORPTION_IN_CONDUCTION_MODE: absorption_conduction_mode,
+            },
+            num_permutations,
+        )
 
     @save_on_return
     def generate_porosity_permutations(
@@ -842,95 +1097,78 @@ class ParametricStudy:
         max_ed = max_energy_density or float("inf")
         min_br = min_build_rate or 0.0
         max_br = max_build_rate or float("inf")
-        num_permutations_added = int()
-        for p in laser_powers:
-            for v in scan_speeds:
-                for thickness in lt:
-                    for h in hs:
-                        br = build_rate(v, thickness, h)
-                        ed = energy_density(p, v, thickness, h)
-                        if br < min_br or br > max_br or ed < min_ed or ed > max_ed:
-                            continue
-
-                        for t in ht:
-                            for d in bd:
-                                for a in sa:
-                                    for r in ra:
-                                        for w in sw:
-                                            # validate parameters by trying to create input objects
-                                            try:
-                                                machine = AdditiveMachine(
-                                                    laser_power=p,
-                                                    scan_speed=v,
-                                                    heater_temperature=t,
-                                                    layer_thickness=thickness,
-                                                    beam_diameter=d,
-                                                    starting_layer_angle=a,
-                                                    layer_rotation_angle=r,
-                                                    hatch_spacing=h,
-                                                    slicing_stripe_width=w,
-                                                    heat_source_model=heat_source,
-                                                    ring_mode_index=ring_mode_index,
-                                                    defocus=defocus,
-                                                )
-                                                material = AdditiveMaterial(
-                                                    laser_shape_parameter=laser_shape_parameter,
-                                                    laser_distribution_parameter=laser_distribution_parameter,
-                                                    fresnal_absorption_coefficient=fresnal_absorption_coefficient,
-                                                    absorption_in_conduction_mode=absorption_conduction_mode,
-                                                )
-                                                PorosityInput(
-                                                    size_x=size_x,
-                                                    size_y=size_y,
-                                                    size_z=size_z,
-                                                    machine=machine,
-                                                    material=material,
-                                                )
-                                            except ValueError as e:
-                                                LOG.error(f"Invalid parameter combination: {e}")
-                                                continue
-
-                                            # add row to parametric study data frame
-                                            row = pd.Series(
-                                                {
-                                                    ColumnNames.ITERATION: iteration,
-                                                    ColumnNames.PRIORITY: priority,
-                                                    ColumnNames.TYPE: SimulationType.POROSITY,
-                                                    ColumnNames.ID: self._create_unique_id(
-                                                        prefix=f"por_{iteration}"
-                                                    ),
-                                                    ColumnNames.STATUS: SimulationStatus.NEW,
-                                                    ColumnNames.MATERIAL: self.material_name,
-                                                    ColumnNames.HEATER_TEMPERATURE: t,
-                                                    ColumnNames.LAYER_THICKNESS: thickness,
-                                                    ColumnNames.BEAM_DIAMETER: d,
-                                                    ColumnNames.LASER_POWER: p,
-                                                    ColumnNames.SCAN_SPEED: v,
-                                                    ColumnNames.PV_RATIO: p / v,
-                                                    ColumnNames.START_ANGLE: a,
-                                                    ColumnNames.ROTATION_ANGLE: r,
-                                                    ColumnNames.HATCH_SPACING: h,
-                                                    ColumnNames.STRIPE_WIDTH: w,
-                                                    ColumnNames.ENERGY_DENSITY: ed,
-                                                    ColumnNames.BUILD_RATE: br,
-                                                    ColumnNames.POROSITY_SIZE_X: size_x,
-                                                    ColumnNames.POROSITY_SIZE_Y: size_y,
-                                                    ColumnNames.POROSITY_SIZE_Z: size_z,
-                                                    ColumnNames.HEAT_SOURCE: heat_source,
-                                                    ColumnNames.RING_MODE_INDEX: ring_mode_index,
-                                                    ColumnNames.DEFOCUS: defocus,
-                                                    ColumnNames.LASER_SHAPE_PARAMETER: laser_shape_parameter,
-                                                    ColumnNames.LASER_DISTRIBUTION_PARAMETER: laser_distribution_parameter,
-                                                    ColumnNames.FRESNAL_ABSORPTION_COEFFICIENT: fresnal_absorption_coefficient,
-                                                    ColumnNames.ABSORPTION_IN_CONDUCTION_MODE: absorption_conduction_mode,
-                                                }
-                                            )
-                                            self._data_frame = pd.concat(
-                                                [self._data_frame, row.to_frame().T],
-                                                ignore_index=True,
-                                            )
-                                            num_permutations_added += 1
-        return num_permutations_added - self._remove_duplicate_entries(overwrite=False)
+
+        # validate the parameters shared by all permutations once
+        try:
+            PorosityInput(
+                size_x=size_x,
+                size_y=size_y,
+                size_z=size_z,
+                machine=AdditiveMachine(
+                    heat_source_model=heat_source,
+                    ring_mode_index=ring_mode_index,
+                    defocus=defocus,
+                ),
+                material=AdditiveMaterial(
+                    laser_shape_parameter=laser_shape_parameter,
+                    laser_distribution_parameter=laser_distribution_parameter,
+                    fresnal_absorption_coefficient=fresnal_absorption_coefficient,
+                    absorption_in_conduction_mode=absorption_conduction_mode,
+                ),
+            )
+        except ValueError as e:
+            LOG.error(f"Invalid parameter combination: {e}")
+            return 0
+
+        grid = self._machine_permutations(
+            laser_power=laser_powers,
+            scan_speed=scan_speeds,
+            layer_thickness=lt,
+            hatch_spacing=hs,
+            heater_temperature=ht,
+            beam_diameter=bd,
+            starting_layer_angle=sa,
+            layer_rotation_angle=ra,
+            slicing_stripe_width=sw,
+        )
+        br, ed, keep = self._build_rate_and_energy_density(grid, min_br, max_br, min_ed, max_ed)
+        num_permutations = int(np.count_nonzero(keep))
+
+        return self._append_permutations(
+            {
+                ColumnNames.ITERATION: iteration,
+                ColumnNames.PRIORITY: priority,
+                ColumnNames.TYPE: SimulationType.POROSITY,
+                ColumnNames.ID: self._create_unique_ids(f"por_{iteration}", num_permutations),
+                ColumnNames.STATUS: SimulationStatus.NEW,
+                ColumnNames.MATERIAL: self.material_name,
+                ColumnNames.HEATER_TEMPERATURE: grid["heater_temperature"][keep],
+                ColumnNames.LAYER_THICKNESS: grid["layer_thickness"][keep],
+                ColumnNames.BEAM_DIAMETER: grid["beam_diameter"][keep],
+                ColumnNames.LASER_POWER: grid["laser_power"][keep],
+                ColumnNames.SCAN_SPEED: grid["scan_speed"][keep],
+                ColumnNames.PV_RATIO: (
+                    grid["laser_power"][keep].astype(float) / grid["scan_speed"][keep].astype(float)
+                ),
+                ColumnNames.START_ANGLE: grid["starting_layer_angle"][keep],
+                ColumnNames.ROTATION_ANGLE: grid["layer_rotation_angle"][keep],
+                ColumnNames.HATCH_SPACING: grid["hatch_spacing"][keep],
+                ColumnNames.STRIPE_WIDTH: grid["slicing_stripe_width"][keep],
+                ColumnNames.ENERGY_DENSITY: ed[keep],
+                ColumnNames.BUILD_RATE: br[keep],
+                ColumnNames.POROSITY_SIZE_X: size_x,
+                ColumnNames.POROSITY_SIZE_Y: size_y,
+                ColumnNames.POROSITY_SIZE_Z: size_z,
+                ColumnNames.HEAT_SOURCE: heat_source,
+                ColumnNames.RING_MODE_INDEX: ring_mode_index,
+                ColumnNames.DEFOCUS: defocus,
+                ColumnNames.LASER_SHAPE_PARAMETER: laser_shape_parameter,
+                ColumnNames.LASER_DISTRIBUTION_PARAMETER: laser_distribution_parameter,
+                ColumnNames.FRESNAL_ABSORPTION_COEFFICIENT: fresnal_absorption_coefficient,
+                ColumnNames.ABSORPTION_IN_CONDUCTION_MODE: absorption_conduction_mode,
+            },
+            num_permutations,
+        )
 
     @save_on_return
     def generate_microstructure_permutations(
@@ -1193,160 +1431,237 @@ class ParametricStudy:
             melt_pool_width = melt_pool_width or MicrostructureInput.DEFAULT_MELT_POOL_WIDTH
             melt_pool_depth = melt_pool_depth or MicrostructureInput.DEFAULT_MELT_POOL_DEPTH
 
-        num_permutations_added = int()
-        for p in laser_powers:
-            for v in scan_speeds:
-                for thickness in lt:
-                    for h in hs:
-                        br = build_rate(v, thickness, h)
-                        ed = energy_density(p, v, thickness, h)
-                        if br < min_br or br > max_br or ed < min_ed or ed > max_ed:
-                            continue
-
-                        for t in ht:
-                            for d in bd:
-                                for a in sa:
-                                    for r in ra:
-                                        for w in sw:
-                                            # validate parameters by trying to create input objects
-                                            try:
-                                                machine = AdditiveMachine(
-                                                    laser_power=p,
-                                                    scan_speed=v,
-                                                    heater_temperature=t,
-                                                    layer_thickness=thickness,
-                                                    beam_diameter=d,
-                                                    starting_layer_angle=a,
-                                                    layer_rotation_angle=r,
-                                                    hatch_spacing=h,
-                                                    slicing_stripe_width=w,
-                                                    heat_source_model=heat_source,
-                                                    ring_mode_index=ring_mode_index,
-                                                    defocus=defocus,
-                                                )
-                                                material = AdditiveMaterial(
-                                                    laser_shape_parameter=laser_shape_parameter,
-                                                    laser_distribution_parameter=laser_distribution_parameter,
-                                                    fresnal_absorption_coefficient=fresnal_absorption_coefficient,
-                                                    absorption_in_conduction_mode=absorption_conduction_mode,
-                                                )
-                                                MicrostructureInput(
-                                                    sample_min_x=min_x,
-                                                    sample_min_y=min_y,
-                                                    sample_min_z=min_z,
-                                                    sample_size_x=size_x,
-                                                    sample_size_y=size_y,
-                                                    sample_size_z=size_z,
-                                                    sensor_dimension=sensor_dimension,
-                                                    use_provided_thermal_parameters=use_thermal_params,
-                                                    cooling_rate=(
-                                                        MicrostructureInput.DEFAULT_COOLING_RATE
-                                                        if cooling_rate is None
-                                                        or np.isnan(cooling_rate)
-                                                        else cooling_rate
-                                                    ),
-                                                    thermal_gradient=(
-                                                        MicrostructureInput.DEFAULT_THERMAL_GRADIENT  # noqa: E501, line too long
-                                                        if thermal_gradient is None
-                                                        or np.isnan(thermal_gradient)
-                                                        else thermal_gradient
-                                                    ),
-                                                    melt_pool_width=(
-                                                        MicrostructureInput.DEFAULT_MELT_POOL_WIDTH  # noqa: E501, line too long
-                                                        if melt_pool_width is None
-                                                        or np.isnan(melt_pool_width)
-                                                        else melt_pool_width
-                                                    ),
-                                                    melt_pool_depth=(
-                                                        MicrostructureInput.DEFAULT_MELT_POOL_DEPTH  # noqa: E501, line too long
-                                                        if melt_pool_depth is None
-                                                        or np.isnan(melt_pool_depth)
-                                                        else melt_pool_depth
-                                                    ),
-                                                    random_seed=(
-                                                        MicrostructureInput.DEFAULT_RANDOM_SEED
-                                                        if random_seed is None
-                                                        or np.isnan(random_seed)
-                                                        else random_seed
-                                                    ),
-                                                    machine=machine,
-                                                    material=material,
-                                                )
-                                            except ValueError as e:
-                                                LOG.error(f"Invalid parameter combination: {e}")
-                                                continue
-
-                                            # add row to parametric study data frame
-                                            row = pd.Series(
-                                                {
-                                                    ColumnNames.ITERATION: iteration,
-                                                    ColumnNames.PRIORITY: priority,
-                                                    ColumnNames.TYPE: SimulationType.MICROSTRUCTURE,
-                                                    ColumnNames.ID: self._create_unique_id(
-                                                        prefix=f"micro_{iteration}"
-                                                    ),
-                                                    ColumnNames.STATUS: SimulationStatus.NEW,
-                                                    ColumnNames.MATERIAL: self.material_name,
-                                                    ColumnNames.HEATER_TEMPERATURE: t,
-                                                    ColumnNames.LAYER_THICKNESS: thickness,
-                                                    ColumnNames.BEAM_DIAMETER: d,
-                                                    ColumnNames.LASER_POWER: p,
-                                                    ColumnNames.SCAN_SPEED: v,
-                                                    ColumnNames.PV_RATIO: p / v,
-                                                    ColumnNames.START_ANGLE: a,
-                                                    ColumnNames.ROTATION_ANGLE: r,
-                                                    ColumnNames.HATCH_SPACING: h,
-                                                    ColumnNames.STRIPE_WIDTH: w,
-                                                    ColumnNames.ENERGY_DENSITY: ed,
-                                                    ColumnNames.BUILD_RATE: br,
-                                                    ColumnNames.MICRO_MIN_X: min_x,
-                                                    ColumnNames.MICRO_MIN_Y: min_y,
-                                                    ColumnNames.MICRO_MIN_Z: min_z,
-                                                    ColumnNames.MICRO_SIZE_X: size_x,
-                                                    ColumnNames.MICRO_SIZE_Y: size_y,
-                                                    ColumnNames.MICRO_SIZE_Z: size_z,
-                                                    ColumnNames.MICRO_SENSOR_DIM: sensor_dimension,
-                                                    ColumnNames.COOLING_RATE: (
-                                                        float("nan")
-                                                        if cooling_rate is None
-                                                        else cooling_rate
-                                                    ),
-                                                    ColumnNames.THERMAL_GRADIENT: (
-                                                        float("nan")
-                                                        if thermal_gradient is None
-                                                        else thermal_gradient
-                                                    ),
-                                                    ColumnNames.MICRO_MELT_POOL_WIDTH: (
-                                                        float("nan")
-                                                        if melt_pool_width is None
-                                                        else melt_pool_width
-                                                    ),
-                                                    ColumnNames.MICRO_MELT_POOL_DEPTH: (
-                                                        float("nan")
-                                                        if melt_pool_depth is None
-                                                        else melt_pool_depth
-                                                    ),
-                                                    ColumnNames.RANDOM_SEED: (
-                                                        pd.NA  # random seed is of type int
-                                                        if random_seed is None
-                                                        or np.isnan(random_seed)
-                                                        else random_seed
-                                                    ),
-                                                    ColumnNames.HEAT_SOURCE: heat_source,
-                                                    ColumnNames.RING_MODE_INDEX: ring_mode_index,
-                                                    ColumnNames.DEFOCUS: defocus,
-                                                    ColumnNames.LASER_SHAPE_PARAMETER: laser_shape_parameter,
-                                                    ColumnNames.LASER_DISTRIBUTION_PARAMETER: laser_distribution_parameter,
-                                                    ColumnNames.FRESNAL_ABSORPTION_COEFFICIENT: fresnal_absorption_coefficient,
-                                                    ColumnNames.ABSORPTION_IN_CONDUCTION_MODE: absorption_conduction_mode,
-                                                }
-                                            )
-                                            self._data_frame = pd.concat(
-                                                [self._data_frame, row.to_frame().T],
-                                                ignore_index=True,
-                                            )
-                                            num_permutations_added += 1
-        return num_permutations_added - self._remove_duplicate_entries(overwrite=False)
+        # validate the parameters shared by all permutations once
+        try:
+            MicrostructureInput(
+                sample_min_x=min_x,
+                sample_min_y=min_y,
+                sample_min_z=min_z,
+                sample_size_x=size_x,
+                sample_size_y=size_y,
+                sample_size_z=size_z,
+                sensor_dimension=sensor_dimension,
+                use_provided_thermal_parameters=use_thermal_params,
+                cooling_rate=(
+                    MicrostructureInput.DEFAULT_COOLING_RATE
+                    if cooling_rate is None or np.isnan(cooling_rate)
+                    else cooling_rate
+                ),
+                thermal_gradient=(
+                    MicrostructureInput.DEFAULT_THERMAL_GRADIENT
+                    if thermal_gradient is None or np.isnan(thermal_gradient)
+                    else thermal_gradient
+                ),
+                melt_pool_width=(
+                    MicrostructureInput.DEFAULT_MELT_POOL_WIDTH
+                    if melt_pool_width is None or np.isnan(melt_pool_width)
+                    else melt_pool_width
+                ),
+                melt_pool_depth=(
+                    MicrostructureInput.DEFAULT_MELT_POOL_DEPTH
+                    if melt_pool_depth is None or np.isnan(melt_pool_depth)
+                    else melt_pool_depth
+                ),
+                random_seed=(
+                    MicrostructureInput.DEFAULT_RANDOM_SEED
+                    if random_seed is None or np.isnan(random_seed)
+                    else random_seed
+                ),
+                machine=AdditiveMachine(
+                    heat_source_model=heat_source,
+                    ring_mode_index=ring_mode_index,
+                    defocus=defocus,
+                ),
+                material=AdditiveMaterial(
+                    laser_shape_parameter=laser_shape_parameter,
+                    laser_distribution_parameter=laser_distribution_parameter,
+                    fresnal_absorption_coefficient=fresnal_absorption_coefficient,
+                    absorption_in_conduction_mode=absorption_conduction_mode,
+                ),
+            )
+        except ValueError as e:
+            LOG.error(f"Invalid parameter combination: {e}")
+            return 0
+
+        grid = self._machine_permutations(
+            laser_power=laser_powers,
+            scan_speed=scan_speeds,
+            layer_thickness=lt,
+            hatch_spacing=hs,
+            heater_temperature=ht,
+            beam_diameter=bd,
+            starting_layer_angle=sa,
+            layer_rotation_angle=ra,
+            slicing_stripe_width=sw,
+        )
+        br, ed, keep = self._build_rate_and_energy_density(grid, min_br, max_br, min_ed, max_ed)
+        num_permutations = int(np.count_nonzero(keep))
+
+        return self._append_permutations(
+            {
+                ColumnNames.ITERATION: iteration,
+                ColumnNames.PRIORITY: priority,
+                ColumnNames.TYPE: SimulationType.MICROSTRUCTURE,
+                ColumnNames.ID: self._create_unique_ids(f"micro_{iteration}", num_permutations),
+                ColumnNames.STATUS: SimulationStatus.NEW,
+                ColumnNames.MATERIAL: self.material_name,
+                ColumnNames.HEATER_TEMPERATURE: grid["heater_temperature"][keep],
+                ColumnNames.LAYER_THICKNESS: grid["layer_thickness"][keep],
+                ColumnNames.BEAM_DIAMETER: grid["beam_diameter"][keep],
+                ColumnNames.LASER_POWER: grid["laser_power"][keep],
+                ColumnNames.SCAN_SPEED: grid["scan_speed"][keep],
+                ColumnNames.PV_RATIO: (
+                    grid["laser_power"][keep].astype(float) / grid["scan_speed"][keep].astype(float)
+                ),
+                ColumnNames.START_ANGLE: grid["starting_layer_angle"][keep],
+                ColumnNames.ROTATION_ANGLE: grid["layer_rotation_angle"][keep],
+                ColumnNames.HATCH_SPACING: grid["hatch_spacing"][keep],
+                ColumnNames.STRIPE_WIDTH: grid["slicing_stripe_width"][keep],
+                ColumnNames.ENERGY_DENSITY: ed[keep],
+                ColumnNames.BUILD_RATE: br[keep],
+                ColumnNames.MICRO_MIN_X: min_x,
+                ColumnNames.MICRO_MIN_Y: min_y,
+                ColumnNames.MICRO_MIN_Z: min_z,
+                ColumnNames.MICRO_SIZE_X: size_x,
+                ColumnNames.MICRO_SIZE_Y: size_y,
+                ColumnNames.MICRO_SIZE_Z: size_z,
+                ColumnNames.MICRO_SENSOR_DIM: sensor_dimension,
+                ColumnNames.COOLING_RATE: float("nan") if cooling_rate is None else cooling_rate,
+                ColumnNames.THERMAL_GRADIENT: (
+                    float("nan") if thermal_gradient is None else thermal_gradient
+                ),
+                ColumnNames.MICRO_MELT_POOL_WIDTH: (
+                    float("nan") if melt_pool_width is None else melt_pool_width
+                ),
+                ColumnNames.MICRO_MELT_POOL_DEPTH: (
+                    float("nan") if melt_pool_depth is None else melt_pool_depth
+                ),
+                ColumnNames.RANDOM_SEED: (
+                    pd.NA  # random seed is of type int
+                    if random_seed is None or np.isnan(random_seed)
+                    else random_seed
+                ),
+                ColumnNames.HEAT_SOURCE: heat_source,
+                ColumnNames.RING_MODE_INDEX: ring_mode_index,
+                ColumnNames.DEFOCUS: defocus,
+                ColumnNames.LASER_SHAPE_PARAMETER: laser_shape_parameter,
+                ColumnNames.LASER_DISTRIBUTION_PARAMETER: laser_distribution_parameter,
+                ColumnNames.FRESNAL_ABSORPTION_COEFFICIENT: fresnal_absorption_coefficient,
+                ColumnNames.ABSORPTION_IN_CONDUCTION_MODE: absorption_conduction_mode,
+            },
+            num_permutations,
+        )
+
+    @staticmethod
+    def _machine_permutations(**parameters: list) -> dict[str, np.ndarray]:
+        """Create every permutation of a set of machine parameter values.
+
+        Each distinct value is validated once by assigning it to an
+        ``AdditiveMachine`` instance. Invalid values are logged and excluded
+        from the permutations.
+
+        Parameters
+        ----------
+        **parameters : list
+            Candidate values for each machine parameter, keyed by
+            ``AdditiveMachine`` attribute name.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            Object array of values for each parameter. Element ``i`` of every array
+            belongs to permutation ``i``. Permutations are ordered as nested loops over
+            the parameters in the order given, with the last parameter varying fastest.
+
+        """
+        axes = []
+        for name, values in parameters.items():
+            valid = []
+            for value in dict.fromkeys(values):
+                try:
+                    setattr(AdditiveMachine(), name, value)
+                    valid.append(value)
+                except ValueError as e:
+                    LOG.error(f"Invalid parameter combination: {e}")
+            axis = np.empty(len(values), dtype=object)
+            axis[:] = list(values)
+            axes.append(axis[[value in valid for value in values]])
+        indices = np.meshgrid(*(np.arange(len(axis)) for axis in axes), indexing="ij")
+        return {
+            name: axis[index.ravel()]
+            for name, axis, index in zip(parameters, axes, indices, strict=True)
+        }
+
+    @staticmethod
+    def _build_rate_and_energy_density(
+        grid: dict[str, np.ndarray],
+        min_build_rate: float,
+        max_build_rate: float,
+        min_energy_density: float,
+        max_energy_density: float,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Calculate the build rate and energy density of machine permutations.
+
+        Parameters
+        ----------
+        grid : dict[str, np.ndarray]
+            Machine parameter permutations as returned by :meth:`_machine_permutations`.
+        min_build_rate : float
+            Minimum build rate of the permutations to keep.
+        max_build_rate : float
+            Maximum build rate of the permutations to keep.
+        min_energy_density : float
+            Minimum energy density of the permutations to keep.
+        max_energy_density : float
+            Maximum energy density of the permutations to keep.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            Build rate and energy density of each permutation, and a mask of the
+            permutations within the given limits.
+
+        """
+        # same calculations as build_rate() and energy_density(), applied to all permutations
+        br = np.round(
+            grid["scan_speed"].astype(float)
+            * grid["layer_thickness"].astype(float)
+            * grid["hatch_spacing"].astype(float),
+            16,
+        )
+        ed = np.full_like(br, float("nan"))
+        np.divide(grid["laser_power"].astype(float), br, out=ed, where=br != 0)
+        # comparisons with NaN are false, so an undefined energy density is not filtered
+        outside = (
+            (br < min_build_rate)
+            | (br > max_build_rate)
+            | (ed < min_energy_density)
+            | (ed > max_energy_density)
+        )
+        return br, ed, ~outside
+
+    def _append_permutations(self, columns: dict[str, Any], count: int) -> int:
+        """Append permutations to the parametric study in a single operation.
+
+        Parameters
+        ----------
+        columns : dict[str, Any]
+            Values for each column, either a sequence with one element per permutation
+            or a single value shared by all permutations.
+        count : int
+            Number of permutations.
+
+        Returns
+        -------
+        int
+            Number of permutations added after duplicate simulations are removed.
+
+        """
+        if count == 0:
+            return 0
+        permutations = pd.DataFrame(columns, index=range(count), dtype=object)
+        self._append_rows(permutations)
+        return count - self._remove_duplicate_entries(overwrite=False)
 
     @save_on_return
     def update(
@@ -1380,9 +1695,10 @@ class ParametricStudy:
                     summary.yz_average_grain_size,
                 )
             elif isinstance(summary, SimulationError):
-                idx = self._data_frame[self._data_frame[ColumnNames.ID] == summary.input.id].index
+                idx = self._rows_with_ids([summary.input.id])
                 self._data_frame.loc[idx, ColumnNames.STATUS] = SimulationStatus.ERROR
                 self._data_frame.loc[idx, ColumnNames.ERROR_MESSAGE] = summary.message
+                self._storage.mark_modified(idx)
             else:
                 raise TypeError(f"Invalid simulation summary type: {type(summary)}")
 
@@ -1390,10 +1706,7 @@ class ParametricStudy:
         """Update the results of a single bead simulation in the parametric
         study data frame.
         """
-        idx = self._data_frame[
-            (self._data_frame[ColumnNames.ID] == id)
-            & (self._data_frame[ColumnNames.TYPE] == SimulationType.SINGLE_BEAD)
-        ].index
+        idx = self._rows_with_ids([id], SimulationType.SINGLE_BEAD)
         self._data_frame.loc[idx, ColumnNames.STATUS] = status
         self._data_frame.loc[idx, ColumnNames.MELT_POOL_WIDTH] = melt_pool.median_width()
         self._data_frame.loc[idx, ColumnNames.MELT_POOL_DEPTH] = melt_pool.median_depth()
@@ -1410,18 +1723,17 @@ class ParametricStudy:
         self._data_frame.loc[idx, ColumnNames.MELT_POOL_REFERENCE_DEPTH_OVER_WIDTH] = (
             melt_pool.depth_over_width()
         )
+        self._storage.mark_modified(idx)
 
     def _update_porosity(self, id: str, status: SimulationStatus, relative_density: float):
         """Update the results of a porosity simulation in the parametric study
         data frame.
         """
-        idx = self._data_frame[
-            (self._data_frame[ColumnNames.ID] == id)
-            & (self._data_frame[ColumnNames.TYPE] == SimulationType.POROSITY)
-        ].index
+        idx = self._rows_with_ids([id], SimulationType.POROSITY)
 
         self._data_frame.loc[idx, ColumnNames.STATUS] = status
         self._data_frame.loc[idx, ColumnNames.RELATIVE_DENSITY] = relative_density
+        self._storage.mark_modified(idx)
 
     def _update_microstructure(
         self,
@@ -1434,15 +1746,13 @@ class ParametricStudy:
         """Update the results of a microstructure simulation in the parametric
         study data frame.
         """
-        idx = self._data_frame[
-            (self._data_frame[ColumnNames.ID] == id)
-            & (self._data_frame[ColumnNames.TYPE] == SimulationType.MICROSTRUCTURE)
-        ].index
+        idx = self._rows_with_ids([id], SimulationType.MICROSTRUCTURE)
 
         self._data_frame.loc[idx, ColumnNames.STATUS] = status
         self._data_frame.loc[idx, ColumnNames.XY_AVERAGE_GRAIN_SIZE] = xy_avg_grain_size
         self._data_frame.loc[idx, ColumnNames.XZ_AVERAGE_GRAIN_SIZE] = xz_avg_grain_size
         self._data_frame.loc[idx, ColumnNames.YZ_AVERAGE_GRAIN_SIZE] = yz_avg_grain_size
+        self._storage.mark_modified(idx)
 
     @save_on_return
     def add_inputs(
@@ -1480,6 +1790,7 @@ class ParametricStudy:
             raise ValueError(
                 f"Simulation status must be '{SimulationStatus.NEW}' or '{SimulationStatus.SKIP}'"
             )
+        rows = []
         for input in inputs:
             dict = {}
             if isinstance(input, SingleBeadInput):
@@ -1539,15 +1850,20 @@ class ParametricStudy:
                 input.material.absorption_in_conduction_mode
             )
 
-            self._data_frame = pd.concat(
-                [self._data_frame, pd.Series(dict).to_frame().T], ignore_index=True
-            )
+            rows.append(dict)
+
+        if not rows:
+            return 0
+        self._append_rows(pd.DataFrame(rows, dtype=object))
         return len(inputs) - self._remove_duplicate_entries(overwrite=False)
 
-    @save_on_return
     def _remove_duplicate_entries(self, overwrite: bool = False) -> int:
         """Remove or update duplicate simulations from the parametric study.
 
+        Only the rows added since the previous call are checked. Each of them is
+        looked up by its input parameters in an index of the simulations already
+        in the study.
+
         Parameters
         ----------
         overwrite : bool, default: False
@@ -1562,131 +1878,117 @@ class ParametricStudy:
         """
 
         # For duplicate removal, the following rules are applied:
-        # - Sort simulatiuons by priority in the following order: completed > pending > skip > error
-        # - Select a subset of input columns based on simulation type to check for duplicates
-        # - Completed simulations will overwrite pending, skip and error simulations
-        # - Completed simulations will be overwritten by newer completed simulations if overwrite is True
-
-        column_names = [
-            getattr(ColumnNames, k) for k in ColumnNames.__dict__ if not k.startswith("_")
-        ]
-        sorted_df = pd.DataFrame(columns=column_names)
-        duplicates_removed_df = pd.DataFrame(columns=column_names)
-        current_df = self.data_frame()
-
-        if len(current_df) == 0:
+        # - Simulations are ranked by status in the order of the SimulationStatus enum,
+        #   so completed simulations rank highest
+        # - A subset of input columns based on simulation type is used to check for duplicates
+        # - A simulation replaces a duplicate with a lower ranked status
+        # - A simulation replaces a duplicate with the same status if overwrite is True
+        # - Rows with an unknown simulation type or status are removed
+
+        index = self._parameter_index()
+        df = self._data_frame
+        added = index.pending
+        index.pending = []
+        if len(added) == 0:
             return 0
 
-        # Filter and arrange as per status so that completed simulations are not overwritten by the
-        # ones lower in the list
-        for status in SimulationStatus:
-            if len(current_df[current_df[ColumnNames.STATUS] == status.value]) > 0:
-                sorted_df = pd.concat(
-                    [
-                        sorted_df,
-                        current_df[current_df[ColumnNames.STATUS] == status.value],
-                    ],
-                    ignore_index=True,
-                )
+        keys = {}
+        types = df.loc[added, ColumnNames.TYPE]
+        for simulation_type, columns in _DUPLICATE_CHECK_COLUMNS.items():
+            labels = types.index[types == simulation_type]
+            if len(labels) > 0:
+                keys.update(zip(labels, _parameter_keys(df.loc[labels, columns]), strict=True))
+
+        rank = {status: i for i, status in enumerate(SimulationStatus)}
+        statuses = df[ColumnNames.STATUS]
+        added_ranks = [rank.get(s) for s in statuses.loc[added].tolist()]
+        removed = []
+        for label, new_rank in zip(added, added_ranks, strict=True):
+            key = keys.get(label)
+            if key is None or new_rank is None:
+                removed.append(label)
+                continue
+            existing = index.labels.get(key)
+            if existing is not None:
+                existing_rank = rank.get(statuses.at[existing])
+                if new_rank > existing_rank or (new_rank == existing_rank and not overwrite):
+                    removed.append(label)
+                    continue
+                removed.append(existing)
+            index.labels[key] = label
+            index.keys[label] = key
+
+        if removed:
+            self._drop_rows(removed)
+        LOG.debug(f"Removed {len(removed)} duplicate simulation(s).")
+        return len(removed)
+
+    def _parameter_index(self) -> _ParameterIndex:
+        """Get the index of simulations by input parameters.
+
+        The index is rebuilt if the data frame was replaced other than by
+        :meth:`_append_rows`. All rows are then checked for duplicates by the
+        next call to :meth:`_remove_duplicate_entries`.
+        """
+        index = getattr(self, "_parameter_index_cache", None)
+        if index is None or index.data_frame is not self._data_frame:
+            index = _ParameterIndex(self._data_frame)
+            self._parameter_index_cache = index
+        return index
 
-        # Common columns to check for duplicates
-        common_params = [
-            ColumnNames.MATERIAL,
-            ColumnNames.HEATER_TEMPERATURE,
-            ColumnNames.LAYER_THICKNESS,
-            ColumnNames.BEAM_DIAMETER,
-            ColumnNames.LASER_POWER,
-            ColumnNames.SCAN_SPEED,
-            ColumnNames.TYPE,
-            ColumnNames.HEAT_SOURCE,
-            ColumnNames.RING_MODE_INDEX,
-            ColumnNames.DEFOCUS,
-            ColumnNames.LASER_SHAPE_PARAMETER,
-            ColumnNames.LASER_DISTRIBUTION_PARAMETER,
-            ColumnNames.FRESNAL_ABSORPTION_COEFFICIENT,
-            ColumnNames.ABSORPTION_IN_CONDUCTION_MODE,
-        ]
+    def _append_rows(self, rows: pd.DataFrame):
+        """Append rows to the data frame.
 
-        # Additional columns to check for duplicates as per simulation type
-        sb_params = common_params + [
-            ColumnNames.SINGLE_BEAD_LENGTH,
-            ColumnNames.SB_THERMAL_HISTORY_FLAG,
-            ColumnNames.SB_THERMAL_HISTORY_INTERVAL,
-        ]
+        Existing rows keep their labels and the appended rows are labeled after
+        them. Call :meth:`_remove_duplicate_entries` after appending rows.
 
-        porosity_params = common_params + [
-            ColumnNames.START_ANGLE,
-            ColumnNames.ROTATION_ANGLE,
-            ColumnNames.HATCH_SPACING,
-            ColumnNames.STRIPE_WIDTH,
-            ColumnNames.POROSITY_SIZE_X,
-            ColumnNames.POROSITY_SIZE_Y,
-            ColumnNames.POROSITY_SIZE_Z,
-        ]
-
-        microstructure_params = common_params + [
-            ColumnNames.START_ANGLE,
-            ColumnNames.ROTATION_ANGLE,
-            ColumnNames.HATCH_SPACING,
-            ColumnNames.STRIPE_WIDTH,
-            ColumnNames.MICRO_MIN_X,
-            ColumnNames.MICRO_MIN_Y,
-            ColumnNames.MICRO_MIN_Z,
-            ColumnNames.MICRO_SIZE_X,
-            ColumnNames.MICRO_SIZE_Y,
-            ColumnNames.MICRO_SIZE_Z,
-            ColumnNames.MICRO_SENSOR_DIM,
-            ColumnNames.COOLING_RATE,
-            ColumnNames.THERMAL_GRADIENT,
-            ColumnNames.MICRO_MELT_POOL_DEPTH,
-            ColumnNames.MICRO_MELT_POOL_WIDTH,
-            ColumnNames.RANDOM_SEED,
-        ]
-
-        single_bead_df = sorted_df[sorted_df[ColumnNames.TYPE] == SimulationType.SINGLE_BEAD]
-        porosity_df = sorted_df[sorted_df[ColumnNames.TYPE] == SimulationType.POROSITY]
-        microstructure_df = sorted_df[sorted_df[ColumnNames.TYPE] == SimulationType.MICROSTRUCTURE]
-
-        if overwrite:
-            # Drop duplicates and keep the latest completed simulation entry in case of adding a
-            # completed simulation when using add_summaries.
-            # Simulation status further narrows down subset of columns to check.
-
-            for df, params in zip(
-                [single_bead_df, porosity_df, microstructure_df],
-                [sb_params, porosity_params, microstructure_params],
-                strict=False,
-            ):
-                df.drop_duplicates(
-                    subset=params + [ColumnNames.STATUS],
-                    ignore_index=True,
-                    keep="last",
-                    inplace=True,
-                )
+        Parameters
+        ----------
+        rows : pd.DataFrame
+            Rows to append.
+
+        """
+        index = self._parameter_index()
+        ids = self._id_index()
+        df = self._data_frame
+        start = int(df.index.max()) + 1 if len(df) > 0 else 0
+        rows = rows.set_axis(pd.RangeIndex(start, start + len(rows)))
+        if not rows.columns.equals(df.columns):
+            rows = rows.reindex(columns=df.columns)
+        if len(df) > 0 and all(map(pd.api.types.is_object_dtype, df.dtypes)):
+            # In-place updates split the data frame into several blocks, and
+            # pd.concat() then checks each missing value of the existing rows in
+            # Python. Joining the values as a single array avoids that.
+            values = np.concatenate([df.to_numpy(), rows.to_numpy(dtype=object)])
+            self._data_frame = pd.DataFrame(
+                values, index=df.index.append(rows.index), columns=df.columns, dtype=object
+            )
+        else:
+            self._data_frame = pd.concat([df, rows])
+        index.data_frame = self._data_frame
+        index.pending.extend(rows.index)
+        for label, sim_id in zip(rows.index, rows[ColumnNames.ID], strict=True):
+            ids.setdefault(sim_id, []).append(label)
+        self._id_index_cache = (self._data_frame, self._data_frame.index, ids)
 
-        # Drop duplicates and keep the earlier entry in case of adding a pending/skip simulation
-        # when using add_inputs.
-        # Completed simulations will remain as is since they are already sorted and are higher
-        # up in the list.
+    def _drop_rows(self, labels: list):
+        """Remove rows from the data frame.
 
-        for df, params in zip(
-            [single_bead_df, porosity_df, microstructure_df],
-            [sb_params, porosity_params, microstructure_params],
-            strict=False,
-        ):
-            if len(df) > 0:
-                duplicates_removed_df = pd.concat(
-                    [
-                        duplicates_removed_df,
-                        df.drop_duplicates(subset=params, ignore_index=True, keep="first"),
-                    ]
-                )
+        Parameters
+        ----------
+        labels : list
+            Labels of the rows to remove.
 
-        self._data_frame = duplicates_removed_df
-        self._data_frame.reset_index(drop=True, inplace=True)
-        n_removed = len(current_df) - len(duplicates_removed_df)
-        LOG.debug(f"Removed {n_removed} duplicate simulation(s).")
-        return n_removed
+        """
+        index = self._parameter_index()
+        ids = self._id_index()
+        for label, sim_id in zip(labels, self._data_frame.loc[labels, ColumnNames.ID], strict=True):
+            ids[sim_id].remove(label)
+            if not ids[sim_id]:
+                del ids[sim_id]
+        self._data_frame.drop(index=labels, inplace=True)
+        index.remove(labels)
+        self._id_index_cache = (self._data_frame, self._data_frame.index, ids)
 
     @save_on_return
     def remove(self, ids: str | list[str]):
@@ -1700,8 +2002,7 @@ class ParametricStudy:
         """
         if isinstance(ids, str):
             ids = [ids]
-        idx = self._data_frame.index[self._data_frame[ColumnNames.ID].isin(ids)].tolist()
-        self._data_frame.drop(index=idx, inplace=True)
+        self._drop_rows(self._rows_with_ids(ids))
 
     @save_on_return
     def set_simulation_status(
@@ -1722,10 +2023,11 @@ class ParametricStudy:
         if isinstance(ids, str):
             ids = [ids]
         LOG.debug(f"Setting status of simulations {', '.join(ids)} to {status}.")
-        idx = self._data_frame.index[self._data_frame[ColumnNames.ID].isin(ids)]
+        idx = self._rows_with_ids(ids)
         self._data_frame.loc[idx, ColumnNames.STATUS] = status
         if status == SimulationStatus.ERROR:
             self._data_frame.loc[idx, ColumnNames.ERROR_MESSAGE] = err_msg
+        self._storage.mark_modified(idx)
 
     @save_on_return
     def set_priority(self, ids: str | list[str], priority: int):
@@ -1742,8 +2044,9 @@ class ParametricStudy:
         """
         if isinstance(ids, str):
             ids = [ids]
-        idx = self._data_frame.index[self._data_frame[ColumnNames.ID].isin(ids)]
+        idx = self._rows_with_ids(ids)
         self._data_frame.loc[idx, ColumnNames.PRIORITY] = priority
+        self._storage.mark_modified(idx)
 
     @save_on_return
     def set_iteration(self, ids: str | list[str], iteration: int):
@@ -1763,8 +2066,34 @@ class ParametricStudy:
         """
         if isinstance(ids, str):
             ids = [ids]
-        idx = self._data_frame.index[self._data_frame[ColumnNames.ID].isin(ids)]
+        idx = self._rows_with_ids(ids)
         self._data_frame.loc[idx, ColumnNames.ITERATION] = iteration
+        self._storage.mark_modified(idx)
+
+    def _create_unique_ids(self, prefix: str, count: int) -> list[str]:
+        """Create unique simulation IDs for a set of permutations.
+
+        Parameters
+        ----------
+        prefix : str
+            Prefix for the IDs.
+        count : int
+            Number of IDs to create.
+
+        Returns
+        -------
+        list[str]
+            Unique IDs.
+
+        """
+        existing = self._id_index()
+        ids = set()
+        while len(ids) < count:
+            for suffix in misc.short_uuids(count - len(ids), 6):
+                uid = f"{prefix}_{suffix}"
+                if uid not in existing:
+                    ids.add(uid)
+        return list(ids)
 
     def _create_unique_id(self, prefix: str | None = None, id: str | None = None) -> str:
         """Create a unique simulation ID for a permutation.
@@ -1784,14 +2113,65 @@ class ParametricStudy:
 
         """
 
-        if id is not None and not self._data_frame[ColumnNames.ID].str.match(f"{id}").any():
+        existing = self._id_index()
+        if id is not None and id not in existing:
             return id
         _prefix = id or prefix or "sim"
         uid = f"{_prefix}_{misc.short_uuid(6)}"
-        while self._data_frame[ColumnNames.ID].str.match(f"{uid}").any():
+        while uid in existing:
             uid = f"{_prefix}_{misc.short_uuid(6)}"
         return uid
 
+    def _id_index(self) -> dict[str, list]:
+        """Get the data frame row labels of each simulation ID.
+
+        The index is built the first time it is needed and rebuilt after rows are
+        added or removed, which replaces either the data frame or its row index.
+        Simulation IDs are not modified in place, so other changes to the data frame
+        keep the index valid.
+
+        Returns
+        -------
+        dict[str, list]
+            Row labels keyed by simulation ID.
+
+        """
+        df = self._data_frame
+        cache = getattr(self, "_id_index_cache", None)
+        if cache is None or cache[0] is not df or cache[1] is not df.index:
+            index = {}
+            for label, sim_id in zip(df.index, df[ColumnNames.ID], strict=True):
+                index.setdefault(sim_id, []).append(label)
+            cache = (df, df.index, index)
+            self._id_index_cache = cache
+        return cache[2]
+
+    def _rows_with_ids(
+        self, ids: list[str], simulation_type: SimulationType | None = None
+    ) -> pd.Index:
+        """Get the data frame row labels of simulations.
+
+        Parameters
+        ----------
+        ids : list[str]
+            IDs of the simulations.
+        simulation_type : SimulationType, default: None
+            Type of the simulations. If this value is ``None``, simulations of
+            any type are included.
+
+        Returns
+        -------
+        pd.Index
+            Row labels of the simulations.
+
+        """
+        index = self._id_index()
+        labels = [label for sim_id in dict.fromkeys(ids) for label in index.get(sim_id, ())]
+        if simulation_type is not None:
+            types = self._data_frame[ColumnNames.TYPE]
+            labels = [label for label in labels if types.at[label] == simulation_type]
+        return pd.Index(labels, dtype=self._data_frame.index.dtype)
+
     @save_on_return
     def clear(self):
         """Remove all permutations from the parametric study."""
@@ -1837,7 +2217,9 @@ class ParametricStudy:
         LOG.warning("Updating parametric study to latest version.")
 
         # WARNING: Create a new study with the same file name but empty data frame
-        new_study = ParametricStudy._new(pathlib.Path(study.file_name))
+        new_study = ParametricStudy._new(
+            pathlib.Path(study.file_name), storage=getattr(study, "_storage", None)
+        )
         df = study.data_frame()
 
         def add_missing_column(col_name, default_value, insert_after_col_name, data_frame=df):
@@ -2130,10 +2512,7 @@ class ParametricStudy:
         # add simulations to the parametric study and drop duplicates
         for status in [s.value for s in SimulationStatus]:
             if len(df[df[ColumnNames.STATUS] == status]) > 0:
-                self._data_frame = pd.concat(
-                    [self._data_frame, df[df[ColumnNames.STATUS] == status]],
-                    ignore_index=True,
-                )
+                self._append_rows(df[df[ColumnNames.STATUS] == status])
                 duplicates += self._remove_duplicate_entries(
                     overwrite=(status == SimulationStatus.COMPLETED)
                 )
@@ -2408,104 +2787,149 @@ class ParametricStudy:
             List of simulation inputs.
 
         """
-        inputs = []
+        return list(
+            self.iter_simulation_inputs(
+                get_material_func, simulation_ids, types, priority, iteration
+            )
+        )
+
+    def iter_simulation_inputs(
+        self,
+        get_material_func: Callable[[str], AdditiveMaterial],
+        simulation_ids: list[str] | None = None,
+        types: list[SimulationType] | None = None,
+        priority: int | None = None,
+        iteration: int | None = None,
+    ) -> Iterator[SingleBeadInput | PorosityInput | MicrostructureInput]:
+        """Generate simulation inputs from the parametric study.
 
-        df = self.filter_data_frame(simulation_ids, types, priority, iteration)
+        The inputs are created as they are requested. Missing input parameters are
+        replaced with their default values for all selected simulations at once, and
+        ``get_material_func`` is called only once, and the material it returns is
+        not modified.
 
-        # NOTE: We use iterrows() instead of itertuples() here to
-        # access values by column name
-        for _, row in df.iterrows():
+        Parameters
+        ----------
+        get_material_func: Callable[[str], AdditiveMaterial]
+            Function to get the material object from the material name.
+            This can be a call to the Additive server or another source.
+        simulation_ids : list[str], default: None
+            List of simulation IDs to run. If this value is ``None``,
+            all simulations with a status of ``New`` are run.
+        types : list[SimulationType], default: None
+            Type of simulations to run. If this value is ``None``,
+            all simulation types are run.
+        priority : int, default: None
+            Priority of simulations to run. If this value is ``None``,
+            all priorities are run.
+        iteration : int, default: None
+            Iteration number of simulations to run. The default is ``None``,
+            all iterations are run.
+
+        Yields
+        ------
+        SingleBeadInput, PorosityInput, MicrostructureInput
+            Simulation input.
+
+        """
+        df = ParametricStudy._fill_input_defaults(
+            self.filter_data_frame(simulation_ids, types, priority, iteration)
+        )
+        base_material = None
+        materials = {}
+        count = 0
+
+        for values in df.itertuples(index=False, name=None):
+            row = dict(zip(df.columns, values, strict=True))
             machine = ParametricStudy._create_machine(row)
-            material = ParametricStudy._create_material(
-                row, get_material_func, str(self.material_name)
+            heat_source_parameters = (
+                tuple(None if pd.isna(row[c]) else row[c] for c in _HEAT_SOURCE_MATERIAL_COLUMNS)
+                if row[ColumnNames.HEAT_SOURCE]
+                == MachineConstants.HEAT_SOURCE_MODEL_NAME_DYNAMIC_DEFOCUS
+                else None
             )
+            if heat_source_parameters not in materials:
+                if base_material is None:
+                    base_material = get_material_func(str(self.material_name))
+                materials[heat_source_parameters] = ParametricStudy._apply_heat_source_parameters(
+                    row, copy.deepcopy(base_material)
+                )
+            # A full copy of a material is expensive, so the inputs share the data
+            # tables until one of them changes its material.
+            material = materials[heat_source_parameters]._copy_on_write()
+
             sim_type = row[ColumnNames.TYPE]
             if sim_type == SimulationType.SINGLE_BEAD:
-                inputs.append(ParametricStudy._create_single_bead_input(row, material, machine))
+                yield ParametricStudy._create_single_bead_input(row, material, machine)
             elif sim_type == SimulationType.POROSITY:
-                inputs.append(ParametricStudy._create_porosity_input(row, material, machine))
+                yield ParametricStudy._create_porosity_input(row, material, machine)
             elif sim_type == SimulationType.MICROSTRUCTURE:
-                inputs.append(ParametricStudy._create_microstructure_input(row, material, machine))
+                yield ParametricStudy._create_microstructure_input(row, material, machine)
             else:  # pragma: no cover
                 LOG.warning(
                     f"Invalid simulation type: {row[ColumnNames.TYPE]} for {row[ColumnNames.ID]}, skipping"
                 )
                 continue
+            count += 1
 
-        if len(inputs) == 0:
+        if count == 0:
             LOG.warning("No simulations meet the specified crtiteria.")
 
-        return inputs
+    @staticmethod
+    def _fill_input_defaults(df: pd.DataFrame) -> pd.DataFrame:
+        """Replace missing input parameters with their default values.
+
+        An empty or non-string heat source model is also replaced with the default
+        heat source model.
+        """
+        df = df.copy()
+        for column, default in _INPUT_DEFAULTS.items():
+            values = df[column]
+            if column == ColumnNames.HEAT_SOURCE:
+                valid = np.array([isinstance(v, str) and v != "" for v in values], dtype=bool)
+            else:
+                valid = values.notna().to_numpy()
+            if not valid.all():
+                df[column] = values.where(valid, default)
+        return df
 
     @staticmethod
     def _create_machine(row: pd.Series) -> AdditiveMachine:
+        """Create a machine from a row filled by :meth:`_fill_input_defaults`."""
         return AdditiveMachine(
             laser_power=row[ColumnNames.LASER_POWER],
             scan_speed=row[ColumnNames.SCAN_SPEED],
             layer_thickness=row[ColumnNames.LAYER_THICKNESS],
             beam_diameter=row[ColumnNames.BEAM_DIAMETER],
             heater_temperature=row[ColumnNames.HEATER_TEMPERATURE],
-            starting_layer_angle=(
-                row[ColumnNames.START_ANGLE]
-                if not np.isnan(row[ColumnNames.START_ANGLE])
-                else MachineConstants.DEFAULT_STARTING_LAYER_ANGLE
-            ),
-            layer_rotation_angle=(
-                row[ColumnNames.ROTATION_ANGLE]
-                if not np.isnan(row[ColumnNames.ROTATION_ANGLE])
-                else MachineConstants.DEFAULT_LAYER_ROTATION_ANGLE
-            ),
-            hatch_spacing=(
-                row[ColumnNames.HATCH_SPACING]
-                if not np.isnan(row[ColumnNames.HATCH_SPACING])
-                else MachineConstants.DEFAULT_HATCH_SPACING
-            ),
-            slicing_stripe_width=(
-                row[ColumnNames.STRIPE_WIDTH]
-                if not np.isnan(row[ColumnNames.STRIPE_WIDTH])
-                else MachineConstants.DEFAULT_SLICING_STRIPE_WIDTH
-            ),
-            heat_source_model=(
-                row[ColumnNames.HEAT_SOURCE]
-                if isinstance(row[ColumnNames.HEAT_SOURCE], str) and row[ColumnNames.HEAT_SOURCE]
-                else MachineConstants.DEFAULT_HEAT_SOURCE_MODEL_NAME
-            ),
-            ring_mode_index=(
-                row[ColumnNames.RING_MODE_INDEX]
-                if not np.isnan(row[ColumnNames.RING_MODE_INDEX])
-                else MachineConstants.DEFAULT_RING_MODE_INDEX
-            ),
-            defocus=(
-                row[ColumnNames.DEFOCUS]
-                if not np.isnan(row[ColumnNames.DEFOCUS])
-                else MachineConstants.DEFAULT_DEFOCUS
-            ),
+            starting_layer_angle=row[ColumnNames.START_ANGLE],
+            layer_rotation_angle=row[ColumnNames.ROTATION_ANGLE],
+            hatch_spacing=row[ColumnNames.HATCH_SPACING],
+            slicing_stripe_width=row[ColumnNames.STRIPE_WIDTH],
+            heat_source_model=row[ColumnNames.HEAT_SOURCE],
+            ring_mode_index=row[ColumnNames.RING_MODE_INDEX],
+            defocus=row[ColumnNames.DEFOCUS],
         )
 
     @staticmethod
-    def _create_material(
-        row: pd.Series, get_material_func: Callable[[str], AdditiveMaterial], material_name: str
+    def _apply_heat_source_parameters(
+        row: pd.Series, material: AdditiveMaterial
     ) -> AdditiveMaterial:
-        """Create a material object from the parametric study data frame and apply material
-        parameters based on the heat source model.
+        """Apply the heat source material parameters of a row to a material.
 
         Parameters
         ----------
         row : pd.Series
             Row from the parametric study data frame.
-        get_material_func : Callable[[str], AdditiveMaterial]
-            Function to get the material object from the material name.
-        material_name : str
-            Name of the material.
+        material : AdditiveMaterial
+            Material to update.
 
         Returns
         -------
         AdditiveMaterial
-            Material object with parameters applied from the data frame.
+            The updated material.
 
         """
-        material = get_material_func(material_name)
-
         # Apply dynamic defocus heat source material parameters only if heat source is dynamic_defocus
         if (
             isinstance(row[ColumnNames.HEAT_SOURCE], str)
@@ -2574,6 +2998,8 @@ class ParametricStudy:
     def _create_microstructure_input(
         row: pd.Series, material: AdditiveMaterial, machine: AdditiveMachine
     ) -> MicrostructureInput:
+        """Create a microstructure input from a row filled by :meth:`_fill_input_defaults`."""
+        # Thermal parameters are not filled, missing values mean they are not provided
         use_provided_thermal_param = (
             not np.isnan(row[ColumnNames.COOLING_RATE])
             or not np.isnan(row[ColumnNames.THERMAL_GRADIENT])
@@ -2589,21 +3015,9 @@ class ParametricStudy:
             sample_size_z=row[ColumnNames.MICRO_SIZE_Z],
             sensor_dimension=row[ColumnNames.MICRO_SENSOR_DIM],
             use_provided_thermal_parameters=use_provided_thermal_param,
-            sample_min_x=(
-                row[ColumnNames.MICRO_MIN_X]
-                if not np.isnan(row[ColumnNames.MICRO_MIN_X])
-                else MicrostructureInput.DEFAULT_POSITION_COORDINATE
-            ),
-            sample_min_y=(
-                row[ColumnNames.MICRO_MIN_Y]
-                if not np.isnan(row[ColumnNames.MICRO_MIN_Y])
-                else MicrostructureInput.DEFAULT_POSITION_COORDINATE
-            ),
-            sample_min_z=(
-                row[ColumnNames.MICRO_MIN_Z]
-                if not np.isnan(row[ColumnNames.MICRO_MIN_Z])
-                else MicrostructureInput.DEFAULT_POSITION_COORDINATE
-            ),
+            sample_min_x=row[ColumnNames.MICRO_MIN_X],
+            sample_min_y=row[ColumnNames.MICRO_MIN_Y],
+            sample_min_z=row[ColumnNames.MICRO_MIN_Z],
             cooling_rate=(
                 row[ColumnNames.COOLING_RATE]
                 if not np.isnan(row[ColumnNames.COOLING_RATE])
@@ -2624,13 +3038,7 @@ class ParametricStudy:
                 if not np.isnan(row[ColumnNames.MICRO_MELT_POOL_DEPTH])
                 else MicrostructureInput.DEFAULT_MELT_POOL_DEPTH
             ),
-            # Use np.isscalar as RANDOM_SEED is of type Int64 and an empty value
-            # will come in as pd.NA which is not scalar. np.isnan will result in a TypeError.
-            random_seed=(
-                row[ColumnNames.RANDOM_SEED]
-                if np.isscalar(row[ColumnNames.RANDOM_SEED])
-                else MicrostructureInput.DEFAULT_RANDOM_SEED
-            ),
+            random_seed=row[ColumnNames.RANDOM_SEED],
         )
         # overwrite the ID value with the simulation ID from the table
         ms_input._id = row[ColumnNames.ID]
@@ -2672,15 +3080,16 @@ class ParametricStudy:
 
         # Filter the data frame based on the provided simulation IDs
         if isinstance(simulation_ids, list) and len(simulation_ids) > 0:
-            simulation_ids_list = []
+            existing = self._id_index()
+            selected_ids = set()
             for sim_id in simulation_ids:
-                if sim_id not in view[ColumnNames.ID].values:
+                if sim_id not in existing:
                     LOG.warning(f"Simulation ID '{sim_id}' not found in the parametric study")
-                elif sim_id in simulation_ids_list:
+                elif sim_id in selected_ids:
                     LOG.debug(f"Simulation ID '{sim_id}' has already been added")
                 else:
-                    simulation_ids_list.append(sim_id)
-            view = view[view[ColumnNames.ID].isin(simulation_ids_list)]
+                    selected_ids.add(sim_id)
+            view = view[view[ColumnNames.ID].isin(selected_ids)]
         else:
             # Select only the simulations with status NEW if no simulation IDs are provided
             view = view[view[ColumnNames.STATUS] == SimulationStatus.NEW]
@@ -0,0 +1,411 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides storage backends for parametric study files."""
+
+from __future__ import annotations
+
+import os
+import pathlib
+import pickle  # nosec: B403
+import platform
+import sqlite3
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+import dill  # nosec: B403
+import numpy as np
+import pandas as pd
+
+from .constants import ColumnNames
+
+if TYPE_CHECKING:
+    from ansys.additive.core.parametric_study.parametric_study import ParametricStudy
+
+
+class StudyStorage(ABC):
+    """Provides the interface for reading and writing parametric study files."""
+
+    @abstractmethod
+    def save(self, study: ParametricStudy, file_name: str | os.PathLike):
+        """Write a parametric study to a file.
+
+        Parameters
+        ----------
+        study : ParametricStudy
+            Parametric study to write.
+        file_name : str, os.PathLike
+            Name of the file to write.
+
+        """
+
+    @abstractmethod
+    def load(self, study: ParametricStudy, file_name: str | os.PathLike):
+        """Read a parametric study from a file.
+
+        Parameters
+        ----------
+        study : ParametricStudy
+            Uninitialized parametric study to populate with the contents of the file.
+        file_name : str, os.PathLike
+            Name of the file to read.
+
+        """
+
+    @abstractmethod
+    def mark_modified(self, index: pd.Index):
+        """Record rows of the study data frame that were modified in place.
+
+        Backends that write only the changed rows use this to find them. Rows that
+        are added or removed do not need to be marked.
+
+        Parameters
+        ----------
+        index : pandas.Index
+            Index labels of the modified rows.
+
+        """
+
+
+class PickleStudyStorage(StudyStorage):
+    """Stores a parametric study as a single pickled object.
+
+    The whole study is rewritten each time it is saved. This is the format used by
+    earlier versions of PyAdditive.
+    """
+
+    def save(self, study: ParametricStudy, file_name: str | os.PathLike):
+        """Write a parametric study to a file.
+
+        Parameters
+        ----------
+        study : ParametricStudy
+            Parametric study to write.
+        file_name : str, os.PathLike
+            Name of the file to write.
+
+        """
+        pathlib.Path(file_name).parent.mkdir(parents=True, exist_ok=True)
+        with open(file_name, "wb") as f:
+            dill.dump(study, f)
+
+    def load(self, study: ParametricStudy, file_name: str | os.PathLike):
+        """Read a parametric study from a file.
+
+        Parameters
+        ----------
+        study : ParametricStudy
+            Uninitialized parametric study to populate with the contents of the file.
+        file_name : str, os.PathLike
+            Name of the file to read.
+
+        """
+        # Hack to allow for sharing study files cross-platform.
+        temp = None
+        if platform.system() == "Windows":
+            temp = pathlib.PosixPath
+            pathlib.PosixPath = pathlib.WindowsPath
+        else:
+            temp = pathlib.WindowsPath
+            pathlib.WindowsPath = pathlib.PosixPath
+
+        try:
+            with open(file_name, "rb") as f:
+                loaded = dill.load(f)  # noqa: S301 # nosec: B301
+        except Exception:
+            raise
+        finally:
+            # Undo hack
+            if platform.system() == "Windows":
+                pathlib.PosixPath = temp
+            else:
+                pathlib.WindowsPath = temp
+
+        if not isinstance(loaded, type(study)):
+            raise ValueError(f"{file_name} is not a parametric study.")
+
+        study.__dict__.update(loaded.__dict__)
+
+    def mark_modified(self, index: pd.Index):
+        """Record rows of the study data frame that were modified in place.
+
+        The whole study is written on each save, so modified rows are not tracked.
+
+        Parameters
+        ----------
+        index : pandas.Index
+            Index labels of the modified rows.
+
+        """
+
+
+class SQLiteStudyStorage(StudyStorage):
+    """Stores a parametric study in an SQLite database.
+
+    Each row of the study data frame is stored as a separate record. After the
+    first save, only the rows that were added or modified are written and removed
+    rows are deleted. The database uses write-ahead logging, so a save appends the
+    changed pages to the log instead of rewriting the file.
+    """
+
+    _FILE_HEADER = b"SQLite format 3\x00"
+
+    def __init__(self):
+        """Initialize the storage."""
+        self._reset()
+
+    def _reset(self):
+        # State of the file as of the last save or load, used to find changed rows
+        self._path = None
+        self._data_frame = None
+        self._schema = None
+        self._index = None
+        self._ids = None
+        self._modified = set()
+
+    def __getstate__(self):
+        """Exclude the saved state when pickling so that the next save writes all rows."""
+        return {}
+
+    def __setstate__(self, state):
+        """Initialize the storage when unpickling."""
+        self._reset()
+
+    @staticmethod
+    def is_study_file(file_name: str | os.PathLike) -> bool:
+        """Check if a file is an SQLite database.
+
+        Parameters
+        ----------
+        file_name : str, os.PathLike
+            Name of the file to check.
+
+        Returns
+        -------
+        bool
+            ``True`` if the file is an SQLite database, ``False`` otherwise.
+
+        """
+        try:
+            with open(file_name, "rb") as f:
+                return f.read(len(SQLiteStudyStorage._FILE_HEADER)) == (
+                    SQLiteStudyStorage._FILE_HEADER
+                )
+        except OSError:
+            return False
+
+    def mark_modified(self, index: pd.Index):
+        """Record rows of the study data frame that were modified in place.
+
+        Parameters
+        ----------
+        index : pandas.Index
+            Index labels of the modified rows.
+
+        """
+        self._modified.update(index)
+
+    def save(self, study: ParametricStudy, file_name: str | os.PathLike):
+        """Write a parametric study to a file.
+
+        If the file was written by the previous save and the data frame has not been
+        replaced since, only the changed rows are written.
+
+        Parameters
+        ----------
+        study : ParametricStudy
+            Parametric study to write.
+        file_name : str, os.PathLike
+            Name of the file to write.
+
+        """
+        path = pathlib.Path(file_name).absolute()
+        df = study._data_frame
+        schema = (list(df.columns), list(df.dtypes))
+        keyed = pd.api.types.is_integer_dtype(df.index.dtype) and df.index.is_unique
+
+        if (
+            keyed
+            and self._path == path
+            and self._data_frame is df
+            and self._schema == schema
+            and self.is_study_file(path)
+        ):
+            self._write_changes(study, path)
+        else:
+            self._write_all(study, path, keyed)
+
+        self._path = path
+        self._data_frame = df
+        self._schema = schema
+        self._index = df.index
+        self._ids = _simulation_ids(df)
+        self._modified = set()
+
+    def _write_changes(self, study: ParametricStudy, path: pathlib.Path):
+        df = study._data_frame
+        removed = self._index.difference(df.index)
+        # Rows whose ID differs from the last save were replaced, for example by
+        # renumbering the index in place
+        common = df.index.intersection(self._index)
+        previous_ids = pd.Series(self._ids, index=self._index).reindex(common).to_numpy()
+        replaced = common[_simulation_ids(df.loc[common]) != previous_ids]
+        changed = (
+            df.index.difference(self._index)
+            .union(replaced)
+            .union(df.index.intersection(pd.Index(list(self._modified), dtype=df.index.dtype)))
+        )
+
+        connection = self._connect(path)
+        try:
+            with connection:
+                connection.executemany(
+                    "DELETE FROM simulations WHERE row_key = ?",
+                    ((int(k),) for k in removed),
+                )
+                connection.executemany(
+                    "INSERT OR REPLACE INTO simulations (row_key, id, data) VALUES (?, ?, ?)",
+                    self._records(df.loc[changed], keyed=True),
+                )
+                self._write_study_values(
+                    connection, study, write_index=not df.index.equals(self._index)
+                )
+        finally:
+            connection.close()
+
+    def _write_all(self, study: ParametricStudy, path: pathlib.Path, keyed: bool):
+        df = study._data_frame
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + ".tmp")
+        _remove_database(temp_path)
+
+        connection = self._connect(temp_path)
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            with connection:
+                connection.execute("CREATE TABLE study (key TEXT PRIMARY KEY, value BLOB)")
+                connection.execute(
+                    "CREATE TABLE simulations (row_key INTEGER PRIMARY KEY, id TEXT, data BLOB)"
+                )
+                connection.executemany(
+                    "INSERT INTO simulations (row_key, id, data) VALUES (?, ?, ?)",
+                    self._records(df, keyed),
+                )
+                self._write_study_values(connection, study, write_index=True, keyed=keyed)
+        finally:
+            connection.close()
+
+        _remove_database(path)
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def _connect(path: pathlib.Path) -> sqlite3.Connection:
+        connection = sqlite3.connect(path)
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    @staticmethod
+    def _records(df: pd.DataFrame, keyed: bool):
+        ids = _simulation_ids(df)
+        keys = df.index if keyed else range(len(df))
+        for key, id, values in zip(keys, ids, df.itertuples(index=False, name=None), strict=True):
+            yield (
+                int(key),
+                id if isinstance(id, str) else None,
+                pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL),
+            )
+
+    @staticmethod
+    def _write_study_values(
+        connection: sqlite3.Connection,
+        study: ParametricStudy,
+        write_index: bool,
+        keyed: bool = True,
+    ):
+        df = study._data_frame
+        values = {
+            "format_version": study._format_version,
+            "material_name": study._material_name,
+            "columns": list(df.columns),
+            "dtypes": list(df.dtypes),
+        }
+        if write_index:
+            values["index"] = df.index
+            values["keyed"] = keyed
+        connection.executemany(
+            "INSERT OR REPLACE INTO study (key, value) VALUES (?, ?)",
+            ((k, pickle.dumps(v, protocol=pickle.HIGHEST_PROTOCOL)) for k, v in values.items()),
+        )
+
+    def load(self, study: ParametricStudy, file_name: str | os.PathLike):
+        """Read a parametric study from a file.
+
+        Parameters
+        ----------
+        study : ParametricStudy
+            Uninitialized parametric study to populate with the contents of the file.
+        file_name : str, os.PathLike
+            Name of the file to read.
+
+        """
+        path = pathlib.Path(file_name).absolute()
+        connection = sqlite3.connect(path)
+        try:
+            values = {
+                key: pickle.loads(value)  # noqa: S301 # nosec: B301
+                for key, value in connection.execute("SELECT key, value FROM study")
+            }
+            rows = dict(connection.execute("SELECT row_key, data FROM simulations"))
+        except sqlite3.DatabaseError as e:
+            raise ValueError(f"{file_name} is not a parametric study.") from e
+        finally:
+            connection.close()
+
+        index = values["index"]
+        keys = index if values["keyed"] else range(len(index))
+        records = [pickle.loads(rows[int(k)]) for k in keys]  # noqa: S301 # nosec: B301
+        df = pd.DataFrame(records, columns=values["columns"], index=index, dtype=object)
+        df = df.astype(dict(zip(values["columns"], values["dtypes"], strict=True)))
+
+        study._data_frame = df
+        study._format_version = values["format_version"]
+        study._material_name = values["material_name"]
+        study._storage = self
+
+        self._path = path
+        self._data_frame = df
+        self._schema = (list(df.columns), list(df.dtypes))
+        self._index = df.index
+        self._ids = _simulation_ids(df)
+        self._modified = set()
+
+
+def _simulation_ids(df: pd.DataFrame) -> np.ndarray:
+    """Get a copy of the simulation IDs of a study data frame."""
+    if ColumnNames.ID not in df.columns:
+        return np.full(len(df), None, dtype=object)
+    return df[ColumnNames.ID].to_numpy(dtype=object, copy=True)
+
+
+def _remove_database(path: pathlib.Path):
+    """Remove an SQLite database and its write-ahead log files."""
+    for suffix in ("", "-wal", "-shm"):
+        pathlib.Path(str(path) + suffix).unlink(missing_ok=True)
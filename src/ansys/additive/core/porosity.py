@@ -27,6 +27,7 @@ from ansys.additive.core.machine import AdditiveMachine
 from ansys.additive.core.material import AdditiveMaterial
 from ansys.additive.core.simulation import (
     SimulationInputBase,
+    SimulationLogs,
     SimulationStatus,
     SimulationSummaryBase,
 )
@@ -170,7 +171,7 @@ class PorositySummary(SimulationSummaryBase):
         self,
         input: PorosityInput,
         result: PorosityResult,
-        logs: str,
+        logs: str | SimulationLogs,
         status: SimulationStatus = SimulationStatus.COMPLETED,
     ):
         """Initialize a ``PorositySummary`` object."""
@@ -178,7 +179,7 @@ class PorositySummary(SimulationSummaryBase):
             raise ValueError("Invalid input type passed to init, " + self.__class__.__name__)
         if not isinstance(result, PorosityResult):
             raise ValueError("Invalid result type passed to init, " + self.__class__.__name__)
-        if not isinstance(logs, str):
+        if not isinstance(logs, (str, SimulationLogs)):
             raise ValueError("Invalid logs type passed to init, " + self.__class__.__name__)
         super().__init__(logs, status)
         self._input = input
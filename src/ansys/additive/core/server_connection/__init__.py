@@ -21,5 +21,8 @@
 # SOFTWARE.
 """Server connection definition and utilities."""
 
+from ansys.additive.core.server_connection.async_server_connection import (  # noqa: F401
+    AsyncServerConnection,
+)
 from ansys.additive.core.server_connection.constants import DEFAULT_PRODUCT_VERSION  # noqa: F401
 from ansys.additive.core.server_connection.server_connection import ServerConnection  # noqa: F401
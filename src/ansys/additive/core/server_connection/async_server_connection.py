@@ -0,0 +1,189 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Provides an asyncio connection to the Additive server."""
+
+import asyncio
+import logging
+from pathlib import Path
+
+import grpc
+from google.longrunning.operations_pb2_grpc import OperationsStub
+from google.protobuf.empty_pb2 import Empty
+
+from ansys.additive.core.server_connection.constants import TransportMode
+from ansys.additive.core.server_connection.network_utils import create_aio_channel
+from ansys.additive.core.server_connection.server_connection import ServerConnectionStatus
+from ansys.api.additive.v0.additive_materials_pb2_grpc import MaterialsServiceStub
+from ansys.api.additive.v0.additive_server_info_pb2_grpc import ServerInfoServiceStub
+from ansys.api.additive.v0.additive_settings_pb2_grpc import SettingsServiceStub
+from ansys.api.additive.v0.additive_simulation_pb2_grpc import SimulationServiceStub
+
+
+class AsyncServerConnection:
+    """Provides an asyncio connection to a running Additive server.
+
+    The service stubs are bound to a :class:`grpc.aio.Channel`, so each call returns
+    an awaitable instead of blocking the calling thread. Unlike
+    :class:`ServerConnection <.server_connection.ServerConnection>`, this class does not
+    start a server. Either ``channel`` or ``addr`` must be provided.
+
+    Parameters
+    ----------
+    transport_mode : TransportMode | str
+        The transport mode to use for the connection. Can be a member of the :class:`TransportMode <.constants.TransportMode>` enum or a string
+        ('insecure', 'mtls', or 'uds').
+    certs_dir : Path | str | None
+        Directory containing certificates for mTLS connections. Applicable if `transport_mode` is 'mtls'.
+    uds_dir : Path | str | None
+        Directory containing Unix Domain Socket files. Applicable if `transport_mode` is 'uds'.
+    uds_id : str | None
+        Identifier for the Unix Domain Socket. Applicable if `transport_mode` is 'uds'.
+    allow_remote_host: bool
+        Whether to allow connections to remote hosts when using 'insecure' or 'mtls' transport modes.
+    channel: grpc.aio.Channel, None
+        Asyncio gRPC channel connected to server.
+    addr: str, None
+        IPv4 address of server of the form ``host:port``.
+    log: logging.Logger, None
+        Log to write connection messages to.
+
+    """
+
+    def __init__(
+        self,
+        transport_mode: TransportMode | str | None = None,
+        certs_dir: Path | str | None = None,
+        uds_dir: Path | str | None = None,
+        uds_id: str | None = None,
+        allow_remote_host: bool = False,
+        channel: grpc.aio.Channel | None = None,
+        addr: str | None = None,
+        log: logging.Logger | None = None,
+    ) -> None:
+        """Initialize an asyncio server connection."""
+        if channel and addr:
+            raise ValueError("Both 'channel' and 'addr' cannot both be specified.")
+        if not channel and not addr:
+            raise ValueError("Either 'channel' or 'addr' must be specified.")
+
+        self._log = log if log else logging.getLogger(__name__)
+        self._uds_file = None
+        self._target = addr if addr else ""
+
+        if channel:
+            self._channel = channel
+        else:
+            if transport_mode is None:
+                raise ValueError("'transport_mode' must be specified if 'channel' is not provided.")
+            self._channel, self._uds_file = create_aio_channel(
+                addr, transport_mode, certs_dir, uds_dir, uds_id, allow_remote_host
+            )
+            if self._uds_file:
+                self._target = str(self._uds_file)
+
+        # assign service stubs
+        self._materials_stub = MaterialsServiceStub(self._channel)
+        self._simulation_stub = SimulationServiceStub(self._channel)
+        self._server_info_stub = ServerInfoServiceStub(self._channel)
+        self._operations_stub = OperationsStub(self._channel)
+        self._settings_stub = SettingsServiceStub(self._channel)
+
+    async def close(self) -> None:
+        """Close the channel to the server."""
+        if self._channel is not None:
+            await self._channel.close()
+            self._channel = None
+
+    @property
+    def channel_str(self) -> str:
+        """GRPC channel target.
+
+        The form is generally ``"ip:port"``. In the case of UDS channels, the form is
+        the path to the UDS socket file. An empty string is returned if the connection
+        was created from an existing channel.
+        """
+        return self._target
+
+    @property
+    def materials_stub(self) -> MaterialsServiceStub:
+        """Materials service stub."""
+        return self._materials_stub
+
+    @property
+    def simulation_stub(self) -> SimulationServiceStub:
+        """Simulation service stub."""
+        return self._simulation_stub
+
+    @property
+    def operations_stub(self) -> OperationsStub:
+        """Operations service stub."""
+        return self._operations_stub
+
+    @property
+    def settings_stub(self) -> SettingsServiceStub:
+        """Settings service stub."""
+        return self._settings_stub
+
+    @property
+    def uds_file(self) -> Path | None:
+        """Path to the Unix Domain Socket file if using 'uds' transport mode, otherwise None."""
+        return self._uds_file
+
+    async def status(self) -> ServerConnectionStatus:
+        """Return the server connection status."""
+        if self._channel is None:
+            return ServerConnectionStatus(False)
+        try:
+            response = await self._server_info_stub.About(Empty())
+        except grpc.RpcError:
+            return ServerConnectionStatus(False, self.channel_str)
+        metadata = {}
+        for key in response.metadata:
+            metadata[key] = response.metadata[key]
+        return ServerConnectionStatus(True, self.channel_str, metadata)
+
+    async def ready(self, retries: int = 5) -> bool:
+        """Return whether the server is ready.
+
+        Parameters
+        ----------
+        retries: int
+            Number of times to retry before giving up. An linearly increasing delay
+            is used between each retry.
+
+        Returns
+        -------
+        bool:
+            True means server is ready. False means the number of retries was exceeded
+            without receiving a response from the server.
+
+        """
+        ready = False
+        for i in range(retries + 1):
+            try:
+                await self._server_info_stub.About(Empty())
+                ready = True
+                break
+            except grpc.RpcError:
+                await asyncio.sleep(i + 1)
+
+        return ready
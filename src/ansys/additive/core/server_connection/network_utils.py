@@ -22,11 +22,14 @@
 """Provides network connection utility functions."""
 
 import ipaddress
+import os
 import socket
 from pathlib import Path
 
+import grpc
+
 from ansys.tools.common.cyberchannel import create_channel as create_cyber_channel
-from ansys.tools.common.cyberchannel import verify_uds_socket
+from ansys.tools.common.cyberchannel import determine_uds_folder, verify_uds_socket
 
 from .constants import UNIX_DOMAIN_SOCKET_SERVICE_NAME, TransportMode
 
@@ -59,6 +62,36 @@ def is_loopback(ip):
         return False  # Invalid IP address
 
 
+def _parse_target(target: str) -> tuple[str, str, str]:
+    """Split a ``host:port`` target string and validate its parts.
+
+    Returns
+    -------
+    tuple[str, str, str]
+        Host name, port string and resolved IP address.
+
+    """
+    (host, port_str) = target.split(":")
+    if not host:
+        raise ValueError(
+            f"Improperly formed target string {target}, it should be of the form 'host:port'"
+        )
+    ip = socket.gethostbyname(host)
+    check_valid_ip(ip)
+    check_valid_port(int(port_str))
+    return host, port_str, ip
+
+
+def _to_transport_mode(transport_mode: TransportMode | str) -> TransportMode:
+    """Convert a transport mode string to a :class:`TransportMode` member."""
+    if isinstance(transport_mode, str):
+        try:
+            transport_mode = TransportMode[transport_mode.upper()]
+        except KeyError as exc:
+            raise ValueError(f"Invalid transport mode string: {transport_mode}") from exc
+    return transport_mode
+
+
 def create_channel(
     target: str,
     transport_mode: TransportMode | str,
@@ -104,20 +137,8 @@ def create_channel(
 
     """
 
-    (host, port_str) = target.split(":")
-    if not host:
-        raise ValueError(
-            f"Improperly formed target string {target}, it should be of the form 'host:port'"
-        )
-    ip = socket.gethostbyname(host)
-    check_valid_ip(ip)
-    check_valid_port(int(port_str))
-
-    if isinstance(transport_mode, str):
-        try:
-            transport_mode = TransportMode[transport_mode.upper()]
-        except KeyError as exc:
-            raise ValueError(f"Invalid transport mode string: {transport_mode}") from exc
+    (host, port_str, ip) = _parse_target(target)
+    transport_mode = _to_transport_mode(transport_mode)
 
     match transport_mode:
         case TransportMode.INSECURE:
@@ -164,3 +185,105 @@ def create_channel(
             return uds_channel, Path(uds_channel._channel.target().decode().removeprefix("unix:"))  # type: ignore
         case _:
             raise ValueError(f"Unsupported transport mode: {transport_mode}")
+
+
+def create_aio_channel(
+    target: str,
+    transport_mode: TransportMode | str,
+    certs_dir: Path | str | None,
+    uds_dir: Path | str | None,
+    uds_id: str | None,
+    allow_remote_host: bool = False,
+    max_rcv_msg_len: int = MAX_RCV_MSG_LEN,
+) -> tuple[grpc.aio.Channel, Path | None]:
+    """Create an asyncio gRPC channel.
+
+    This is the :mod:`grpc.aio` counterpart of :func:`create_channel` and applies
+    the same validation rules for each transport mode.
+
+    Parameters
+    ----------
+    target: str
+        IP address of the host to connect to, of the form ``host:port``.
+    transport_mode : TransportMode | str
+        The transport mode to use for the connection. Can be a member of the :class:`TransportMode <.constants.TransportMode>` enum or a string
+        ('insecure', 'mtls', or 'uds').
+    certs_dir : Path | str | None
+        Directory containing certificates for mTLS connections. If ``None``, the
+        ``ANSYS_GRPC_CERTIFICATES`` environment variable is used, then the ``certs``
+        folder in the current working directory.
+    uds_dir : Path | str | None
+        Directory containing Unix Domain Socket files. If ``None``, the ``~/.conn``
+        folder is used.
+    uds_id : str | None
+        Identifier for the Unix Domain Socket.
+    allow_remote_host: bool
+        Whether to allow connections to remote hosts when using 'insecure' or 'mtls' transport modes.
+    max_rcv_msg_len: int
+        Size, in bytes, of the buffer used to receive messages. Default is :obj:`MAX_RCV_MSG_LEN`.
+
+    Raises
+    ------
+    ValueError
+        If the target string is improperly formed, the transport mode is invalid, or an unsupported transport mode is specified.
+    FileNotFoundError
+        If a certificate file is missing when using 'mtls' transport mode.
+    ConnectionError
+        If unable to connect to the Unix Domain Socket when using 'uds' transport mode.
+
+    Returns
+    -------
+    channel: grpc.aio.Channel
+        Insecure or secure asyncio gRPC channel, depending on the transport mode.
+    uds_file: Path | None
+        Path to the Unix Domain Socket file if using 'uds' transport mode, otherwise None.
+
+    """
+    (host, port_str, ip) = _parse_target(target)
+    transport_mode = _to_transport_mode(transport_mode)
+    options = [("grpc.max_receive_message_length", max_rcv_msg_len)]
+
+    match transport_mode:
+        case TransportMode.INSECURE:
+            if not allow_remote_host and not is_loopback(ip):
+                raise ValueError(
+                    "Connections to remote hosts are not allowed. Set 'allow_remote_host=True' to override."
+                )
+            return grpc.aio.insecure_channel(f"{host}:{port_str}", options=options), None
+
+        case TransportMode.MTLS:
+            if certs_dir:
+                certs_folder = Path(certs_dir)
+            elif os.environ.get("ANSYS_GRPC_CERTIFICATES"):
+                certs_folder = Path(os.environ["ANSYS_GRPC_CERTIFICATES"])
+            else:
+                certs_folder = Path("certs")
+            try:
+                credentials = grpc.ssl_channel_credentials(
+                    root_certificates=(certs_folder / "ca.crt").read_bytes(),
+                    private_key=(certs_folder / "client.key").read_bytes(),
+                    certificate_chain=(certs_folder / "client.crt").read_bytes(),
+                )
+            except FileNotFoundError as e:
+                raise FileNotFoundError(
+                    f"Certificate file not found: {e.filename}. Ensure that the certificates are "
+                    f"present in the '{certs_folder}' folder or set the 'ANSYS_GRPC_CERTIFICATES' "
+                    "environment variable."
+                ) from e
+            return grpc.aio.secure_channel(f"{host}:{port_str}", credentials, options=options), None
+
+        case TransportMode.UDS:
+            uds_service = UNIX_DOMAIN_SOCKET_SERVICE_NAME
+            uds_folder = Path(uds_dir) if uds_dir else None
+            if not verify_uds_socket(uds_service, uds_folder, uds_id):
+                raise ConnectionError(
+                    f"Could not connect to UDS socket in {uds_folder or 'None'} with id {uds_id or 'None'}."
+                )
+            socket_name = f"{uds_service}-{uds_id}.sock" if uds_id else f"{uds_service}.sock"
+            uds_file = determine_uds_folder(uds_folder) / socket_name
+            # Set default authority to "localhost" for UDS connection,
+            # see https://github.com/grpc/grpc/issues/34305
+            options.insert(0, ("grpc.default_authority", "localhost"))
+            return grpc.aio.insecure_channel(f"unix:{uds_file}", options=options), uds_file
+        case _:
+            raise ValueError(f"Unsupported transport mode: {transport_mode}")
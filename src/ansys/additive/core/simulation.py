@@ -21,6 +21,8 @@
 # SOFTWARE.
 """Provides common definitions and classes for simulations."""
 
+import os
+from collections.abc import Iterator
 from enum import Enum
 
 from ansys.additive.core.misc import short_uuid
@@ -75,19 +77,79 @@ class SimulationInputBase:
         return self._id
 
 
+class SimulationLogs:
+    """Provides simulation logs stored in a file.
+
+    The logs are read from the file each time they are accessed rather than held
+    in memory.
+
+    Parameters
+    ----------
+    path: str
+        Path to the log file.
+
+    """
+
+    def __init__(self, path: str):
+        """Initialize a ``SimulationLogs`` object."""
+        self._path = path
+
+    @property
+    def path(self) -> str:
+        """Path to the log file."""
+        return self._path
+
+    def read(self) -> str:
+        """Read the full contents of the log file."""
+        with open(self._path, encoding="utf-8", errors="replace") as f:
+            return f.read()
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the lines of the log file without reading it all into memory."""
+        with open(self._path, encoding="utf-8", errors="replace") as f:
+            yield from f
+
+    def __fspath__(self) -> str:
+        return self._path
+
+    def __str__(self) -> str:
+        return self._path
+
+    def __eq__(self, __o: object) -> bool:
+        if not isinstance(__o, SimulationLogs):
+            return False
+        return os.path.abspath(self._path) == os.path.abspath(__o._path)
+
+    def __hash__(self) -> int:
+        return hash(os.path.abspath(self._path))
+
+
 class SimulationSummaryBase:
     """Provides a base class for simulation summaries."""
 
-    def __init__(self, logs: str, status: SimulationStatus = SimulationStatus.COMPLETED):
+    def __init__(
+        self, logs: str | SimulationLogs, status: SimulationStatus = SimulationStatus.COMPLETED
+    ):
         """Initialize a ``SimulationSummaryBase`` object."""
         self._logs = logs
         self._status = status
 
     @property
     def logs(self) -> str:
-        """Simulation logs."""
+        """Simulation logs.
+
+        If the logs are stored in a file, the file is read each time this property is
+        accessed. Use :attr:`log_file` to stream large logs instead.
+        """
+        if isinstance(self._logs, SimulationLogs):
+            return self._logs.read()
         return self._logs
 
+    @property
+    def log_file(self) -> SimulationLogs | None:
+        """Simulation logs stored in a file, or ``None`` if the logs are held in memory."""
+        return self._logs if isinstance(self._logs, SimulationLogs) else None
+
     @property
     def status(self) -> SimulationStatus:
         """Simulation status."""
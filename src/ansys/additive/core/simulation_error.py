@@ -25,6 +25,7 @@ from ansys.additive.core.material_tuning import MaterialTuningInput
 from ansys.additive.core.microstructure import MicrostructureInput
 from ansys.additive.core.microstructure_3d import Microstructure3DInput
 from ansys.additive.core.porosity import PorosityInput
+from ansys.additive.core.simulation import SimulationLogs
 from ansys.additive.core.single_bead import SingleBeadInput
 from ansys.additive.core.thermal_history import ThermalHistoryInput
 
@@ -43,7 +44,7 @@ class SimulationError:
             | MaterialTuningInput
         ),
         message: str,
-        logs: str,
+        logs: str | SimulationLogs,
     ):
         """Initialize a ``SimulationError`` object."""
         self._input = input
@@ -71,5 +72,16 @@ class SimulationError:
 
     @property
     def logs(self) -> str:
-        """Provides simulation logs."""
+        """Provides simulation logs.
+
+        If the logs are stored in a file, the file is read each time this property is
+        accessed. Use :attr:`log_file` to stream large logs instead.
+        """
+        if isinstance(self._logs, SimulationLogs):
+            return self._logs.read()
         return self._logs
+
+    @property
+    def log_file(self) -> SimulationLogs | None:
+        """Provides simulation logs stored in a file, or ``None`` if held in memory."""
+        return self._logs if isinstance(self._logs, SimulationLogs) else None
@@ -21,10 +21,17 @@
 # SOFTWARE.
 """Set up methods for grpc simulation requests."""
 
+import asyncio
+import functools
 import hashlib
 import os
-from collections.abc import Iterator
+import queue
+import threading
+import time
+import weakref
+from collections.abc import AsyncIterator, Callable, Iterator
 
+from ansys.additive.core.logger import LOG
 from ansys.additive.core.microstructure import MicrostructureInput
 from ansys.additive.core.microstructure_3d import Microstructure3DInput
 from ansys.additive.core.porosity import PorosityInput
@@ -33,36 +40,208 @@ from ansys.additive.core.progress_handler import (
     Progress,
     ProgressState,
 )
-from ansys.additive.core.server_connection import ServerConnection
+from ansys.additive.core.server_connection import AsyncServerConnection, ServerConnection
 from ansys.additive.core.single_bead import SingleBeadInput
 from ansys.additive.core.thermal_history import ThermalHistoryInput
 from ansys.api.additive.v0.additive_simulation_pb2 import (
     SimulationRequest,
     UploadFileRequest,
+    UploadFileResponse,
 )
 
+DEFAULT_UPLOAD_CHUNK_SIZE = 2 * 1024**2
+"""Default size in bytes of the chunks a file is uploaded in."""
+UPLOAD_READ_AHEAD = 4
+"""Number of file chunks read and hashed ahead of the upload stream."""
 
-def __file_upload_reader(file_name: str, chunk_size=2 * 1024**2) -> Iterator[UploadFileRequest]:
-    """Read a file and return an iterator of UploadFileRequests."""
+
+class _ChunkReadAhead:
+    """Read and hash the chunks of a file on a worker thread.
+
+    Chunks are read ahead of the consumer, so reading and hashing overlap with
+    sending earlier chunks. Use as a context manager to stop the worker thread
+    when the consumer is done.
+    """
+
+    def __init__(self, file_name: str, chunk_size: int, depth: int = UPLOAD_READ_AHEAD):
+        if chunk_size <= 0:
+            raise ValueError("The upload chunk size must be greater than zero")
+        self._file_name = file_name
+        self._chunk_size = chunk_size
+        self._chunks: queue.Queue = queue.Queue(maxsize=depth)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._read, daemon=True)
+
+    def __enter__(self) -> "_ChunkReadAhead":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _put(self, item) -> None:
+        while not self._stop.is_set():
+            try:
+                self._chunks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _read(self) -> None:
+        try:
+            with open(self._file_name, mode="rb") as f:
+                while not self._stop.is_set():
+                    chunk = f.read(self._chunk_size)
+                    if not chunk:
+                        break
+                    self._put((chunk, hashlib.md5(chunk, usedforsecurity=False).hexdigest()))
+        except Exception as e:
+            self._put(e)
+        self._put(None)
+
+    def next_chunk(self) -> tuple[bytes, str] | None:
+        """Get the next chunk and its MD5 digest, or ``None`` at the end of the file."""
+        while True:
+            try:
+                item = self._chunks.get(timeout=0.1)
+            except queue.Empty:
+                if self._stop.is_set():
+                    return None
+                continue
+            if isinstance(item, Exception):
+                raise item
+            return item
+
+
+class _UploadThroughput:
+    """Track the amount of data handed to an upload stream and its rate."""
+
+    def __init__(self):
+        self.bytes_sent = 0
+        self._start = time.monotonic()
+
+    def add(self, nbytes: int) -> None:
+        """Record that a chunk of ``nbytes`` was sent."""
+        self.bytes_sent += nbytes
+
+    @property
+    def mb_per_s(self) -> float:
+        """Average upload rate in MB/s."""
+        elapsed = time.monotonic() - self._start
+        return self.bytes_sent / 1024**2 / elapsed if elapsed > 0 else 0.0
+
+    def __str__(self):
+        return f"Uploaded {self.bytes_sent / 1024**2:.1f} MB at {self.mb_per_s:.1f} MB/s"
+
+
+def __file_upload_reader(
+    file_name: str,
+    chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+    throughput: _UploadThroughput | None = None,
+) -> Iterator[UploadFileRequest]:
+    """Read a file and return an iterator of UploadFileRequests.
+
+    The file is read and hashed on a worker thread ahead of the returned requests.
+    """
     file_size = os.path.getsize(file_name)
     short_name = os.path.basename(file_name)
-    with open(file_name, mode="rb") as f:
-        while True:
-            chunk = f.read(chunk_size)
-            if not chunk:
-                break
+    with _ChunkReadAhead(file_name, chunk_size) as chunks:
+        while (item := chunks.next_chunk()) is not None:
+            chunk, md5 = item
+            if throughput:
+                throughput.add(len(chunk))
             yield UploadFileRequest(
                 name=short_name,
                 total_size=file_size,
                 content=chunk,
-                content_md5=hashlib.md5(chunk, usedforsecurity=False).hexdigest(),
+                content_md5=md5,
             )
 
 
+async def __file_upload_reader_async(
+    file_name: str,
+    chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+    throughput: _UploadThroughput | None = None,
+) -> AsyncIterator[UploadFileRequest]:
+    """Read a file and return an asynchronous iterator of UploadFileRequests.
+
+    Waiting for the next chunk does not block the event loop.
+    """
+    file_size = os.path.getsize(file_name)
+    short_name = os.path.basename(file_name)
+    with _ChunkReadAhead(file_name, chunk_size) as chunks:
+        while (item := await asyncio.to_thread(chunks.next_chunk)) is not None:
+            chunk, md5 = item
+            if throughput:
+                throughput.add(len(chunk))
+            yield UploadFileRequest(
+                name=short_name,
+                total_size=file_size,
+                content=chunk,
+                content_md5=md5,
+            )
+
+
+def _upload_progress(
+    sim_id: str,
+    response: UploadFileResponse,
+    throughput: _UploadThroughput,
+    progress_handler: IProgressHandler | None,
+) -> None:
+    """Report the progress of a file upload, including its throughput."""
+    progress = Progress.from_proto_msg(sim_id, response.progress)
+    if progress_handler:
+        if progress.state != ProgressState.ERROR:
+            progress.message = (
+                f"{progress.message} - {throughput}" if progress.message else str(throughput)
+            )
+        progress_handler.update(progress)
+    if progress.state == ProgressState.ERROR:
+        raise Exception(progress.message)
+
+
+# Remote names of the files uploaded to each server, by file content digest
+_uploaded_files: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+# Locks that prevent concurrent uploads of the same file to a server
+_upload_locks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_upload_locks_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=64)
+def __cached_file_digest(file_name: str, size: int, mtime_ns: int) -> str:
+    """Compute the digest of a file version identified by its size and modification time."""
+    digest = hashlib.sha256()
+    with open(file_name, mode="rb") as f:
+        while chunk := f.read(2 * 1024**2):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _file_digest(file_name: str) -> str:
+    """Get the SHA-256 digest of a file's content.
+
+    The digest is computed once for each version of a file.
+    """
+    stat = os.stat(file_name)
+    return __cached_file_digest(os.path.abspath(file_name), stat.st_size, stat.st_mtime_ns)
+
+
+def _upload_lock(
+    server: ServerConnection | AsyncServerConnection,
+    digest: str,
+    lock_type: Callable[[], "threading.Lock | asyncio.Lock"],
+) -> "threading.Lock | asyncio.Lock":
+    """Get the lock that guards uploading a file to a server."""
+    with _upload_locks_lock:
+        return _upload_locks.setdefault(server, {}).setdefault(digest, lock_type())
+
+
 def _setup_thermal_history(
     input: ThermalHistoryInput,
     server: ServerConnection,
     progress_handler: IProgressHandler | None = None,
+    upload_chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
 ) -> SimulationRequest:
     """Initialize a thermal history simulation.
 
@@ -74,23 +253,95 @@ def _setup_thermal_history(
         Server to use for the simulation.
     progress_handler: IProgressHandler, None, default: None
         Handler for progress updates. If ``None``, no progress updates are provided.
+    upload_chunk_size: int, default: DEFAULT_UPLOAD_CHUNK_SIZE
+        Size in bytes of the chunks the geometry file is uploaded in.
+
+    Returns
+    -------
+    :class:`SimulationRequest`
+
+    Notes
+    -----
+    A geometry file is uploaded to a server only once. Later inputs with a
+    geometry file of the same content reuse the uploaded file.
+
+    """
+    if not input.geometry or not input.geometry.path:
+        raise ValueError("The geometry path is not defined in the simulation input")
+
+    digest = _file_digest(input.geometry.path)
+    with _upload_lock(server, digest, threading.Lock):
+        uploaded = _uploaded_files.setdefault(server, {})
+        remote_geometry_path = uploaded.get(digest)
+        if remote_geometry_path is not None:
+            LOG.debug(f"Using {remote_geometry_path} uploaded for {input.geometry.path}")
+            return input._to_simulation_request(remote_geometry_path=remote_geometry_path)
+
+        remote_geometry_path = ""
+        throughput = _UploadThroughput()
+        for response in server.simulation_stub.UploadFile(
+            __file_upload_reader(input.geometry.path, upload_chunk_size, throughput)
+        ):
+            remote_geometry_path = response.remote_file_name
+            _upload_progress(input.id, response, throughput, progress_handler)
+        LOG.debug(f"{input.geometry.path}: {throughput}")
+        if remote_geometry_path:
+            uploaded[digest] = remote_geometry_path
+
+    return input._to_simulation_request(remote_geometry_path=remote_geometry_path)
+
+
+async def _setup_thermal_history_async(
+    input: ThermalHistoryInput,
+    server: AsyncServerConnection,
+    progress_handler: IProgressHandler | None = None,
+    upload_chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+) -> SimulationRequest:
+    """Initialize a thermal history simulation using an asyncio server connection.
+
+    Parameters
+    ----------
+    input: ThermalHistoryInput
+        Simulation input parameters.
+    server: AsyncServerConnection
+        Server to use for the simulation.
+    progress_handler: IProgressHandler, None, default: None
+        Handler for progress updates. If ``None``, no progress updates are provided.
+    upload_chunk_size: int, default: DEFAULT_UPLOAD_CHUNK_SIZE
+        Size in bytes of the chunks the geometry file is uploaded in.
 
     Returns
     -------
     :class:`SimulationRequest`
 
+    Notes
+    -----
+    A geometry file is uploaded to a server only once. Later inputs with a
+    geometry file of the same content reuse the uploaded file.
+
     """
     if not input.geometry or not input.geometry.path:
         raise ValueError("The geometry path is not defined in the simulation input")
 
-    remote_geometry_path = ""
-    for response in server.simulation_stub.UploadFile(__file_upload_reader(input.geometry.path)):
-        remote_geometry_path = response.remote_file_name
-        progress = Progress.from_proto_msg(input.id, response.progress)
-        if progress_handler:
-            progress_handler.update(progress)
-        if progress.state == ProgressState.ERROR:
-            raise Exception(progress.message)
+    digest = await asyncio.to_thread(_file_digest, input.geometry.path)
+    async with _upload_lock(server, digest, asyncio.Lock):
+        uploaded = _uploaded_files.setdefault(server, {})
+        remote_geometry_path = uploaded.get(digest)
+        if remote_geometry_path is not None:
+            LOG.debug(f"Using {remote_geometry_path} uploaded for {input.geometry.path}")
+            return input._to_simulation_request(remote_geometry_path=remote_geometry_path)
+
+        remote_geometry_path = ""
+        throughput = _UploadThroughput()
+        call = server.simulation_stub.UploadFile(
+            __file_upload_reader_async(input.geometry.path, upload_chunk_size, throughput)
+        )
+        async for response in call:
+            remote_geometry_path = response.remote_file_name
+            _upload_progress(input.id, response, throughput, progress_handler)
+        LOG.debug(f"{input.geometry.path}: {throughput}")
+        if remote_geometry_path:
+            uploaded[digest] = remote_geometry_path
 
     return input._to_simulation_request(remote_geometry_path=remote_geometry_path)
 
@@ -105,6 +356,7 @@ def create_request(
     ),
     server: ServerConnection,
     progress_handler: IProgressHandler | None = None,
+    upload_chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
 ) -> SimulationRequest:
     """Create a simulation request and set up any pre-requisites on a server, such as an STL file for a
     thermal history simulation.
@@ -117,6 +369,50 @@ def create_request(
         Server to use for the simulation.
     progress_handler: IProgressHandler, None, default: None
         Handler for progress updates. If ``None``, no progress updates are provided.
+    upload_chunk_size: int, default: DEFAULT_UPLOAD_CHUNK_SIZE
+        Size in bytes of the chunks files are uploaded in.
+
+    Returns
+    -------
+    A SimulationRequest
+
+    """  # noqa: E501
+    if isinstance(simulation_input, ThermalHistoryInput):
+        request = _setup_thermal_history(
+            simulation_input, server, progress_handler, upload_chunk_size
+        )
+    else:
+        request = simulation_input._to_simulation_request()
+
+    return request
+
+
+async def create_request_async(
+    simulation_input: (
+        SingleBeadInput
+        | PorosityInput
+        | MicrostructureInput
+        | ThermalHistoryInput
+        | Microstructure3DInput
+    ),
+    server: AsyncServerConnection,
+    progress_handler: IProgressHandler | None = None,
+    upload_chunk_size: int = DEFAULT_UPLOAD_CHUNK_SIZE,
+) -> SimulationRequest:
+    """Create a simulation request using an asyncio server connection.
+
+    See :func:`create_request` for details.
+
+    Parameters
+    ----------
+    simulation_input: SingleBeadInput, PorosityInput, MicrostructureInput, ThermalHistoryInput, Microstructure3DInput
+        Parameters to use for simulation.
+    server: AsyncServerConnection
+        Server to use for the simulation.
+    progress_handler: IProgressHandler, None, default: None
+        Handler for progress updates. If ``None``, no progress updates are provided.
+    upload_chunk_size: int, default: DEFAULT_UPLOAD_CHUNK_SIZE
+        Size in bytes of the chunks files are uploaded in.
 
     Returns
     -------
@@ -124,7 +420,9 @@ def create_request(
 
     """  # noqa: E501
     if isinstance(simulation_input, ThermalHistoryInput):
-        request = _setup_thermal_history(simulation_input, server, progress_handler)
+        request = await _setup_thermal_history_async(
+            simulation_input, server, progress_handler, upload_chunk_size
+        )
     else:
         request = simulation_input._to_simulation_request()
 
@@ -24,8 +24,12 @@
 import base64
 import io
 import os
+import shutil
 import zipfile
+from collections.abc import Callable, Container
+from typing import BinaryIO
 
+import grpc
 from google.longrunning.operations_pb2 import (
     CancelOperationRequest,
     GetOperationRequest,
@@ -37,7 +41,7 @@ from google.protobuf.duration_pb2 import Duration
 from google.rpc.code_pb2 import Code
 from google.rpc.error_details_pb2 import ErrorInfo
 
-from ansys.additive.core.download import download_file
+from ansys.additive.core.download import download_file, download_files
 from ansys.additive.core.logger import LOG
 from ansys.additive.core.material_tuning import (
     MaterialTuningInput,
@@ -58,7 +62,7 @@ from ansys.additive.core.progress_handler import (
     ProgressState,
 )
 from ansys.additive.core.server_connection import ServerConnection
-from ansys.additive.core.simulation import SimulationStatus
+from ansys.additive.core.simulation import SimulationLogs, SimulationStatus
 from ansys.additive.core.simulation_error import SimulationError
 from ansys.additive.core.single_bead import SingleBeadInput, SingleBeadSummary
 from ansys.additive.core.thermal_history import (
@@ -82,9 +86,20 @@ class SimulationTask:
         The simulation input.
     user_data_path: str
         The path to the user data directory.
+    keep_logs_in_memory: bool, default: False
+        Whether to hold the simulation logs in memory. If ``False``, the logs are written
+        to a file in the simulation folder under ``user_data_path`` and read on access.
+    defer_vtk_files: bool, default: True
+        Whether the VTK files of microstructure summaries are written when their paths
+        are first accessed. If ``False``, they are written when the summary is created.
+    result_file_members: Container[str], None, default: None
+        Names of the files to extract from downloaded result archives, such as specific
+        thermal history VTK files. If ``None``, all files are extracted.
 
     """  # noqa: E501
 
+    LOG_FILE_NAME = "simulation.log"
+
     def __init__(
         self,
         server_connection: ServerConnection,
@@ -98,13 +113,21 @@ class SimulationTask:
             | MaterialTuningInput
         ),
         user_data_path: str,
+        keep_logs_in_memory: bool = False,
+        defer_vtk_files: bool = True,
+        result_file_members: Container[str] | None = None,
     ):
         """Initialize the simulation task."""
         self._server = server_connection
         self._user_data_path = user_data_path
+        self._keep_logs_in_memory = keep_logs_in_memory
+        self._defer_vtk_files = defer_vtk_files
+        self._result_file_members = result_file_members
         self._long_running_op = long_running_operation
         self._simulation_input = simulation_input
         self._summary = None
+        # Result files downloaded ahead of creating the summary, by remote file name
+        self._downloaded_files: dict[str, str] = {}
 
     @property
     def simulation_id(self) -> str:
@@ -187,6 +210,30 @@ class SimulationTask:
         if progress_handler:
             progress_handler.update(progress)
 
+    def _wait_future(self, progress_update_interval: int = 5) -> grpc.Future:
+        """Start a non-blocking WaitOperation() call for this task.
+
+        The returned future resolves with the awaited operation when the operation
+        completes on the server or when ``progress_update_interval`` expires,
+        whichever comes first. This allows many operations to be awaited at once
+        without dedicating a thread to each of them.
+
+        Parameters
+        ----------
+        progress_update_interval: int, default: 5
+            A timeout value (in seconds) to give to the WaitOperation() call to return an
+            updated message for a progress update.
+
+        Returns
+        -------
+        grpc.Future
+            Future holding the awaited operation.
+
+        """
+        timeout = Duration(seconds=progress_update_interval)
+        wait_request = WaitOperationRequest(name=self._long_running_op.name, timeout=timeout)
+        return self._server.operations_stub.WaitOperation.future(wait_request)
+
     def cancel(self) -> None:
         """Cancel a running simulation."""
         LOG.debug(f"Cancelling {self._long_running_op.name}")
@@ -255,7 +302,8 @@ class SimulationTask:
                 info = ErrorInfo()
                 operation.error.details[0].Unpack(info)
                 if info.metadata["mimetype"] != "application/zip":
-                    logs = base64.b64decode(info.metadata["logs"]).decode("utf-8")
+                    log_bytes = base64.b64decode(info.metadata["logs"])
+                    logs = self._write_logs(lambda out: out.write(log_bytes))
                 else:
                     logs = self._extract_logs(base64.b64decode(info.metadata["logs"]))
 
@@ -286,6 +334,7 @@ class SimulationTask:
             Progress created from long-running operation metadata.
 
         """
+        self._long_running_op = operation
         if operation.done:
             # If operation is completed, get the summary and update progress. The server
             # should always mark the operation done on either a successful completion or
@@ -322,17 +371,13 @@ class SimulationTask:
         logs = ""
         if response.logs:
             logs = self._extract_logs(response.logs)
+        result_files = self._result_files(response)
         if response.HasField("melt_pool"):
             thermal_history_output = None
             if self._check_if_thermal_history_is_present(response):
-                thermal_history_output = os.path.join(
-                    self._user_data_path, self._simulation_input.id, "thermal_history"
-                )
-                download_file(
-                    self._server.simulation_stub,
-                    response.melt_pool.thermal_history_vtk_zip,
-                    thermal_history_output,
-                )
+                remote_file_name = response.melt_pool.thermal_history_vtk_zip
+                thermal_history_output = result_files[remote_file_name]
+                self._download_file(remote_file_name, thermal_history_output)
             return SingleBeadSummary(
                 self._simulation_input,
                 response.melt_pool,
@@ -354,6 +399,7 @@ class SimulationTask:
                 logs,
                 self._user_data_path,
                 simulation_status,
+                self._defer_vtk_files,
             )
         if response.HasField("microstructure_3d_result"):
             return Microstructure3DSummary(
@@ -362,27 +408,110 @@ class SimulationTask:
                 logs,
                 self._user_data_path,
                 simulation_status,
+                self._defer_vtk_files,
             )
         if response.HasField("thermal_history_result"):
-            path = os.path.join(self._user_data_path, self._simulation_input.id, "coax_ave_output")
-            local_zip = download_file(
-                self._server.simulation_stub,
-                response.thermal_history_result.coax_ave_zip_file,
-                path,
-            )
-            with zipfile.ZipFile(local_zip, "r") as zip:
-                zip.extractall(path)
-            os.remove(local_zip)
+            remote_file_name = response.thermal_history_result.coax_ave_zip_file
+            path = self._download_file(remote_file_name, result_files[remote_file_name])
             return ThermalHistorySummary(self._simulation_input, path, logs, simulation_status)
 
+    def _result_files(self, response: SimulationResponse) -> dict[str, str]:
+        """Get the result files to download from the server for a simulation response.
+
+        Parameters
+        ----------
+        response: SimulationResponse
+            The simulation response.
+
+        Returns
+        -------
+        dict[str, str]
+            Local folder to download each remote file to, keyed by remote file name.
+
+        """
+        result_folder = os.path.join(self._user_data_path, self._simulation_input.id)
+        files = {}
+        if response.HasField("melt_pool") and self._check_if_thermal_history_is_present(response):
+            files[response.melt_pool.thermal_history_vtk_zip] = os.path.join(
+                result_folder, "thermal_history"
+            )
+        if response.HasField("thermal_history_result"):
+            files[response.thermal_history_result.coax_ave_zip_file] = os.path.join(
+                result_folder, "coax_ave_output"
+            )
+        return files
+
+    def _download_result_files(self, operation: Operation) -> None:
+        """Download and extract the result files of a completed operation concurrently.
+
+        The extracted files are used by the next summary creation instead of
+        downloading them again.
+
+        Parameters
+        ----------
+        operation: [google.longrunning.Operation]
+            The long-running operation.
+
+        """
+        if not operation.done or not operation.HasField("response"):
+            return
+        response = SimulationResponse()
+        operation.response.Unpack(response)
+        files = {
+            remote_file_name: local_folder
+            for remote_file_name, local_folder in self._result_files(response).items()
+            if remote_file_name not in self._downloaded_files
+        }
+        if files:
+            self._downloaded_files.update(
+                download_files(
+                    self._server.simulation_stub,
+                    files,
+                    extract=True,
+                    members=self._result_file_members,
+                )
+            )
+
+    def _download_file(self, remote_file_name: str, local_folder: str) -> str:
+        """Download a result archive from the server and extract it.
+
+        The archive is extracted as it is received. Files extracted by
+        :meth:`_download_result_files` are used if available.
+
+        Parameters
+        ----------
+        remote_file_name: str
+            Path to the archive on the server.
+        local_folder: str
+            Folder on the localhost to extract the archive to.
+
+        Returns
+        -------
+        str
+            Local folder the archive was extracted to.
+
+        """
+        extracted_folder = self._downloaded_files.pop(remote_file_name, None)
+        if extracted_folder and os.path.isdir(extracted_folder):
+            return extracted_folder
+        return download_file(
+            self._server.simulation_stub,
+            remote_file_name,
+            local_folder,
+            extract=True,
+            members=self._result_file_members,
+        )
+
     def _check_if_thermal_history_is_present(self, response) -> bool:
         """Check if thermal history output is present in the response."""
         return response.melt_pool.thermal_history_vtk_zip != str()
 
-    def _extract_logs(self, log_bytes: bytes) -> str:
+    def _extract_logs(self, log_bytes: bytes) -> str | SimulationLogs:
         """
         Extract log files from an array of bytes.
 
+        The log files are streamed one after another into a single log, so the time
+        taken grows linearly with the size of the logs.
 
         Parameters
         ----------
@@ -392,29 +521,46 @@ class SimulationTask:
 
         Returns
         -------
-        str
-            A string containing the concatenated log file contents.
-            The name of each log file will precede its contents.
+        str, SimulationLogs
+            The concatenated log file contents, or the file they were written to if the
+            logs are not kept in memory. The name of each log file will precede its contents.
 
         """
         if not log_bytes:
             return ""
 
-        # Create a BytesIO object from log_bytes
-        byte_stream_io = io.BytesIO(log_bytes)
+        with zipfile.ZipFile(io.BytesIO(log_bytes), "r") as zip_ref:
 
-        # Open the ZIP file from the byte stream
-        with zipfile.ZipFile(byte_stream_io, "r") as zip_ref:
-            # Initialize an empty string to store the concatenated content
-            concatenated_content = ""
+            def write(out: BinaryIO) -> None:
+                for file_name in zip_ref.namelist():
+                    out.write(f"File: {file_name}\n".encode())
+                    with zip_ref.open(file_name) as file:
+                        shutil.copyfileobj(file, out)
+                    out.write(b"\n")
 
-            # Iterate through the files in the ZIP archive
-            for file_name in zip_ref.namelist():
-                # Read the content of the file
-                with zip_ref.open(file_name) as file:
-                    file_content = file.read().decode("utf-8")
+            return self._write_logs(write)
 
-                # Concatenate the file name and its content
-                concatenated_content += f"File: {file_name}\n{file_content}\n"
+    def _write_logs(self, write: Callable[[BinaryIO], None]) -> str | SimulationLogs:
+        """Write simulation logs to memory or to the simulation log file.
 
-        return concatenated_content
+        Parameters
+        ----------
+        write : Callable[[BinaryIO], None]
+            Function that writes the UTF-8 encoded logs to a binary stream.
+
+        Returns
+        -------
+        str, SimulationLogs
+            The logs if they are kept in memory, otherwise the file they were written to.
+
+        """
+        if self._keep_logs_in_memory:
+            buffer = io.BytesIO()
+            write(buffer)
+            return buffer.getvalue().decode("utf-8")
+
+        path = os.path.join(self._user_data_path, self.simulation_id, self.LOG_FILE_NAME)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            write(f)
+        return SimulationLogs(path)
@@ -21,11 +21,58 @@
 # SOFTWARE.
 """Manages simulation tasks."""
 
+import contextlib
+import queue
 import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 
+import grpc
+from google.longrunning.operations_pb2 import ListOperationsRequest, Operation
+
+from ansys.additive.core.download import DOWNLOAD_WORKERS
 from ansys.additive.core.logger import LOG
+from ansys.additive.core.material_tuning import MaterialTuningSummary
+from ansys.additive.core.microstructure import MicrostructureInput, MicrostructureSummary
+from ansys.additive.core.microstructure_3d import Microstructure3DSummary
+from ansys.additive.core.porosity import PorosityInput, PorositySummary
 from ansys.additive.core.progress_handler import IProgressHandler, Progress
+from ansys.additive.core.server_connection import ServerConnection
+from ansys.additive.core.simulation import SimulationType
+from ansys.additive.core.simulation_error import SimulationError
 from ansys.additive.core.simulation_task import SimulationTask
+from ansys.additive.core.single_bead import SingleBeadInput, SingleBeadSummary
+from ansys.additive.core.thermal_history import ThermalHistorySummary
+
+MAX_PROGRESS_UPDATE_INTERVAL = 60
+"""Longest time (in seconds) to wait for a progress update from a simulation."""
+MAX_CONCURRENT_STATUS_REQUESTS = 8
+"""Maximum number of GetOperation() calls made in parallel when ListOperations() is unavailable."""
+MAX_CONCURRENT_CANCEL_REQUESTS = 8
+"""Maximum number of CancelOperation() calls made in parallel."""
+MAX_LISTED_OPERATION_NAMES = 200
+"""Maximum number of operation names in the filter of a ListOperations() call."""
+
+# Simulation type of each input type that can be part of a parametric study
+_SIMULATION_TYPES = {
+    SingleBeadInput: SimulationType.SINGLE_BEAD,
+    PorosityInput: SimulationType.POROSITY,
+    MicrostructureInput: SimulationType.MICROSTRUCTURE,
+}
+
+
+def _name_filter(names: Iterable[str]) -> str:
+    """Create a ListOperations() filter matching operations by name."""
+    return " OR ".join(f'name = "{name}"' for name in names)
+
+
+def _name_batches(names: dict[str, int]) -> list[dict[str, int]]:
+    """Split task indices keyed by operation name into batches listed with one filter each."""
+    items = list(names.items())
+    return [
+        dict(items[i : i + MAX_LISTED_OPERATION_NAMES])
+        for i in range(0, len(items), MAX_LISTED_OPERATION_NAMES)
+    ]
 
 
 class SimulationTaskManager:
@@ -34,6 +81,14 @@ class SimulationTaskManager:
     def __init__(self):
         """Initialize the simulation task manager."""
         self._tasks: list[SimulationTask] = []
+        # Tasks whose operations may still be running, keyed by their index in _tasks
+        self._pending: dict[int, SimulationTask] = {}
+        # Tasks whose operations are done, keyed by their index in _tasks
+        self._finished: dict[int, SimulationTask] = {}
+        # Last progress received for each task, keyed by its index in _tasks
+        self._progress: dict[int, Progress] = {}
+        # IDs of the server connections that rejected ListOperations()
+        self._unlisted_servers: set[int] = set()
 
     @property
     def tasks(self) -> list[SimulationTask]:
@@ -48,7 +103,20 @@ class SimulationTaskManager:
     @property
     def done(self) -> bool:
         """Check if all tasks are done."""
-        return all(t.done for t in self._tasks)
+        self._update_finished()
+        return not self._pending
+
+    @property
+    def pending_count(self) -> int:
+        """Get the number of tasks that are not done."""
+        self._update_finished()
+        return len(self._pending)
+
+    @property
+    def finished_count(self) -> int:
+        """Get the number of tasks that are done."""
+        self._update_finished()
+        return len(self._finished)
 
     def add_task(self, task: SimulationTask):
         """Add a task to this manager.
@@ -59,54 +127,452 @@ class SimulationTaskManager:
             The simulation task holding the long-running operation and corresponding server.
 
         """
+        if task.done:
+            self._finished[len(self._tasks)] = task
+        else:
+            self._pending[len(self._tasks)] = task
         self._tasks.append(task)
 
+    def _finish(self, i: int) -> None:
+        """Move the task at index ``i`` from the pending tasks to the finished tasks."""
+        if i in self._pending:
+            self._finished[i] = self._pending.pop(i)
+
+    def _update_finished(self) -> None:
+        """Move pending tasks that completed outside of this manager to the finished tasks."""
+        for i in [i for i, t in self._pending.items() if t.done]:
+            self._finish(i)
+
+    def _needs_status(self, i: int) -> bool:
+        """Check if the status of the task at index ``i`` must be fetched from the server."""
+        return i in self._pending or i not in self._progress
+
+    def _record_status(
+        self, i: int, progress: Progress, progress_handler: IProgressHandler | None
+    ) -> None:
+        """Store the progress of the task at index ``i`` and finish it if it is done."""
+        self._progress[i] = progress
+        if self._tasks[i].done:
+            self._finish(i)
+        if progress_handler:
+            progress_handler.update(progress)
+
+    def _group_by_server(self, indices: list[int]) -> list[tuple[ServerConnection, dict[str, int]]]:
+        """Group tasks by the server running them.
+
+        Parameters
+        ----------
+        indices: list[int]
+            Indices of the tasks to group.
+
+        Returns
+        -------
+        list[tuple[ServerConnection, dict[str, int]]]
+            Each server connection with the indices of its tasks, keyed by operation name.
+
+        """
+        servers: dict[int, tuple[ServerConnection, dict[str, int]]] = {}
+        for i in indices:
+            task = self._tasks[i]
+            server = task._server
+            servers.setdefault(id(server), (server, {}))[1][task._long_running_op.name] = i
+        return list(servers.values())
+
+    def _list_operations(self, indices: list[int]) -> dict[int, Operation]:
+        """Fetch the operations of tasks with paged ListOperations() calls.
+
+        The operations of each server are listed in batches of at most
+        ``MAX_LISTED_OPERATION_NAMES`` names, with one filter per batch. The listing of a
+        batch stops as soon as all of its operations are found. Servers that reject
+        ListOperations() are not listed again.
+
+        Parameters
+        ----------
+        indices: list[int]
+            Indices of the tasks to fetch operations for.
+
+        Returns
+        -------
+        dict[int, Operation]
+            Operations found in the listings, keyed by task index.
+
+        """
+        operations = {}
+        for server, names in self._group_by_server(indices):
+            if id(server) in self._unlisted_servers:
+                continue
+            try:
+                for batch in _name_batches(names):
+                    # Page tokens are only valid with the filter they were returned for
+                    name_filter = _name_filter(batch)
+                    page_token = ""
+                    while batch:
+                        response = server.operations_stub.ListOperations(
+                            ListOperationsRequest(filter=name_filter, page_token=page_token)
+                        )
+                        for op in response.operations:
+                            if op.name in batch:
+                                operations[batch.pop(op.name)] = op
+                        page_token = response.next_page_token
+                        if not page_token:
+                            break
+            except grpc.RpcError as e:
+                LOG.debug(f"Unable to list operations, fetching them individually: {e}")
+                self._unlisted_servers.add(id(server))
+        return operations
+
     def status(
         self, progress_handler: IProgressHandler | None = None
     ) -> list[tuple[str, Progress]]:
         """Get status of each operation stored in this manager.
 
+        Only the operations of tasks that are not done are fetched from the server. The
+        last known status is returned for the other tasks. The operations are fetched
+        with one paged ListOperations() call per server. Operations that are not listed,
+        for example because the server does not support ListOperations(), are fetched
+        with concurrent GetOperation() calls.
+
         Parameters
         ----------
         progress_handler: IProgressHandler, None, default: None
-            Handler for progress updates. If ``None``, no progress updates are provided.
+            Handler for progress updates of the operations fetched from the server. If
+            ``None``, no progress updates are provided.
 
         Returns
         -------
         List of tuples with each tuple containing the operation name and an instance of Progress
 
         """
-        status_all = []
+        indices = [i for i in range(len(self._tasks)) if self._needs_status(i)]
+        operations = self._list_operations(indices)
+        for i, operation in operations.items():
+            self._record_status(
+                i, self._tasks[i]._update_operation_status(operation), progress_handler
+            )
 
-        for t in self._tasks:
-            progress = t.status()
-            status_all.append((progress.sim_id, progress))
-            if progress_handler:
-                progress_handler.update(progress)
+        # Fall back to fetching the remaining operations one by one
+        remaining = [i for i in indices if i not in operations]
+        workers = max(1, min(MAX_CONCURRENT_STATUS_REQUESTS, len(remaining)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            progresses = pool.map(lambda i: self._tasks[i].status(), remaining)
+            for i, progress in zip(remaining, progresses, strict=True):
+                self._record_status(i, progress, progress_handler)
 
-        return status_all
+        return [(p.sim_id, p) for p in (self._progress[i] for i in range(len(self._tasks)))]
 
-    def wait_all(self, progress_handler: IProgressHandler | None = None) -> None:
-        """Wait for all simulations to finish. A simple loop that waits for each task will wait for the
-        simulation that takes the longest. This works because wait returns immediately if operation is done.
+    def wait_all(
+        self,
+        progress_handler: IProgressHandler | None = None,
+        progress_update_interval: int = 5,
+    ) -> None:
+        """Wait for all simulations to finish.
+
+        All outstanding operations are awaited concurrently, so a simulation that
+        finishes early is processed as soon as the server reports it done rather than
+        after the simulations added before it.
 
         Parameters
         ----------
         progress_handler: IProgressHandler, None, default: None
             Handler for progress updates. If ``None``, no progress updates are provided.
+        progress_update_interval: int, default: 5
+            A timeout value (in seconds) to give to each WaitOperation() call to return an
+            updated message for a progress update.
 
         """
         LOG.debug(f"Waiting for {len(self._tasks)} tasks to complete")
-        for t in self._tasks:
-            t.wait(progress_handler=progress_handler)
+        for _ in self._wait_for_completions(progress_handler, progress_update_interval):
+            pass
+
+    def as_completed(
+        self,
+        progress_handler: IProgressHandler | None = None,
+        progress_update_interval: int = 5,
+        timeout: float | None = None,
+    ) -> Iterator[
+        SingleBeadSummary
+        | PorositySummary
+        | MicrostructureSummary
+        | ThermalHistorySummary
+        | Microstructure3DSummary
+        | MaterialTuningSummary
+        | SimulationError
+    ]:
+        """Wait for all simulations to finish and yield each summary as it becomes available.
+
+        Summaries are yielded in the order the simulations complete, not the order in
+        which they were added. Simulations that finish without a summary, such as
+        cancelled simulations, are not yielded.
+
+        Parameters
+        ----------
+        progress_handler: IProgressHandler, None, default: None
+            Handler for progress updates. If ``None``, no progress updates are provided.
+        progress_update_interval: int, default: 5
+            A timeout value (in seconds) to give to each WaitOperation() call to return an
+            updated message for a progress update.
+        timeout: float, None, default: None
+            Maximum time (in seconds) to wait for all simulations to complete. If ``None``,
+            there is no limit.
+
+        Yields
+        ------
+        SingleBeadSummary, PorositySummary, MicrostructureSummary, ThermalHistorySummary, Microstructure3DSummary, MaterialTuningSummary, SimulationError
+            Summary of each completed simulation.
+
+        Raises
+        ------
+        TimeoutError
+            If simulations are still running after ``timeout`` seconds.
+
+        """  # noqa: E501
+        for task in self._wait_for_completions(progress_handler, progress_update_interval, timeout):
+            if task.summary:
+                yield task.summary
+
+    def _wait_for_completions(
+        self,
+        progress_handler: IProgressHandler | None = None,
+        progress_update_interval: int = 5,
+        timeout: float | None = None,
+    ) -> Iterator[SimulationTask]:
+        """Await all tasks concurrently and yield each one as it completes.
 
-    def cancel_all(self) -> None:
-        """Cancel all simulations belonging to this simulation task manager."""
-        LOG.debug("Cancelling all tasks")
-        for t in self._tasks:
-            t.cancel()
-            time.sleep(0.1)
+        A non-blocking WaitOperation() call is kept in flight for every unfinished
+        task. The server answers each call as soon as the operation completes, so
+        the wait timeout only controls how often progress is reported. It starts at
+        ``progress_update_interval`` and doubles, up to
+        :data:`MAX_PROGRESS_UPDATE_INTERVAL`, while a task's progress does not change.
+        Tasks that are already done are not sent to the server, and the progress
+        handler is only updated when a task's progress changes.
+
+        The result files of completed operations are downloaded by a pool of
+        worker threads, so a large download does not hold up other tasks. Responses
+        are processed on the calling thread in the order they become ready, so
+        progress handlers do not need to be thread safe.
+
+        Parameters
+        ----------
+        progress_handler: IProgressHandler, None, default: None
+            Handler for progress updates. If ``None``, no progress updates are provided.
+        progress_update_interval: int, default: 5
+            Initial timeout value (in seconds) to give to each WaitOperation() call to
+            return an updated message for a progress update.
+        timeout: float, None, default: None
+            Maximum time (in seconds) to wait for all tasks to complete. If ``None``,
+            there is no limit.
+
+        Yields
+        ------
+        SimulationTask
+            Each task, once its operation is done and its summary has been updated.
+
+        Raises
+        ------
+        TimeoutError
+            If tasks are still outstanding after ``timeout`` seconds.
+
+        """
+        responses = queue.SimpleQueue()
+        # Outstanding WaitOperation() calls and their timeouts, keyed by task index
+        in_flight: dict[int, grpc.Future] = {}
+        intervals: dict[int, int] = {}
+        deadline = None if timeout is None else time.monotonic() + timeout
+        downloads = ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS)
+
+        def download_results(i: int, future: grpc.Future) -> None:
+            try:
+                self._tasks[i]._download_result_files(future.result())
+            except Exception as e:
+                # The files are downloaded again when the summary is created
+                LOG.debug(f"Unable to download results of {self._tasks[i].simulation_id}: {e}")
+            responses.put((i, future, None))
+
+        def on_done(i: int, future: grpc.Future) -> None:
+            # The pool has been shut down if the caller stopped iterating
+            with contextlib.suppress(RuntimeError):
+                downloads.submit(download_results, i, future)
+
+        def start_wait(i: int) -> None:
+            try:
+                future = self._tasks[i]._wait_future(intervals[i])
+            except Exception as e:
+                responses.put((i, None, e))
+                return
+            in_flight[i] = future
+            future.add_done_callback(lambda f: on_done(i, f))
+
+        def report(i: int, progress: Progress) -> None:
+            if self._progress.get(i) == progress:
+                return
+            self._progress[i] = progress
+            if progress_handler:
+                progress_handler.update(progress)
+
+        for i, t in enumerate(self._tasks):
+            if i in self._finished or t.done:
+                # Nothing to wait for on the server
+                responses.put((i, None, None))
+            else:
+                intervals[i] = progress_update_interval
+                start_wait(i)
+
+        outstanding = len(self._tasks)
+        try:
+            while outstanding:
+                remaining = None if deadline is None else max(0, deadline - time.monotonic())
+                try:
+                    i, future, error = responses.get(timeout=remaining)
+                except queue.Empty:
+                    raise TimeoutError(
+                        f"{outstanding} of {len(self._tasks)} simulations did not complete "
+                        f"within {timeout} seconds"
+                    ) from None
+                outstanding -= 1
+                in_flight.pop(i, None)
+                task = self._tasks[i]
+                if future is None and not error and not self._needs_status(i):
+                    # The summary is already up to date
+                    yield task
+                    continue
+                try:
+                    if error:
+                        raise error
+                    awaited_operation = future.result() if future else task._long_running_op
+                    previous = self._progress.get(i)
+                    progress = task._update_operation_status(awaited_operation)
+                    report(i, progress)
+                    if not awaited_operation.done:
+                        if progress == previous:
+                            intervals[i] = min(
+                                2 * intervals[i],
+                                max(progress_update_interval, MAX_PROGRESS_UPDATE_INTERVAL),
+                            )
+                        else:
+                            intervals[i] = progress_update_interval
+                        start_wait(i)
+                        outstanding += 1
+                        continue
+                except Exception as e:
+                    LOG.error(f"Error while awaiting operation: {e}")
+                    # Fetch the status to ensure the summary is updated
+                    report(i, task.status())
+
+                if task.done:
+                    self._finish(i)
+                yield task
+        finally:
+            # Stop waiting on the server if the caller stops iterating early
+            for future in in_flight.values():
+                future.cancel()
+            downloads.shutdown(wait=False, cancel_futures=True)
+
+    def _select_pending(
+        self,
+        simulation_ids: list[str] | None = None,
+        types: list[SimulationType] | None = None,
+        predicate: Callable[[SimulationTask], bool] | None = None,
+    ) -> list[int]:
+        """Get the indices of the pending tasks matching all of the given filters.
+
+        Parameters
+        ----------
+        simulation_ids: list[str], None, default: None
+            IDs of the simulations to select. If ``None``, simulations are not
+            filtered by ID.
+        types: list[SimulationType], None, default: None
+            Types of the simulations to select. If ``None``, simulations are not
+            filtered by type.
+        predicate: Callable[[SimulationTask], bool], None, default: None
+            Function returning ``True`` for each task to select. If ``None``,
+            simulations are not filtered by this function.
+
+        Returns
+        -------
+        list[int]
+            Indices of the selected tasks.
+
+        """
+        self._update_finished()
+        ids = None if simulation_ids is None else set(simulation_ids)
+        return [
+            i
+            for i, t in self._pending.items()
+            if (ids is None or t.simulation_id in ids)
+            and (types is None or _SIMULATION_TYPES.get(type(t._simulation_input)) in types)
+            and (predicate is None or predicate(t))
+        ]
+
+    def cancel(
+        self,
+        simulation_ids: list[str] | None = None,
+        types: list[SimulationType] | None = None,
+        predicate: Callable[[SimulationTask], bool] | None = None,
+    ) -> dict[str, bool]:
+        """Cancel the unfinished simulations matching all of the given filters.
+
+        The cancellation requests are sent concurrently, up to
+        :data:`MAX_CONCURRENT_CANCEL_REQUESTS` at a time.
+
+        Parameters
+        ----------
+        simulation_ids: list[str], None, default: None
+            IDs of the simulations to cancel. If ``None``, simulations are not
+            filtered by ID.
+        types: list[SimulationType], None, default: None
+            Types of the simulations to cancel. If ``None``, simulations are not
+            filtered by type.
+        predicate: Callable[[SimulationTask], bool], None, default: None
+            Function returning ``True`` for each task to cancel. If ``None``,
+            simulations are not filtered by this function.
+
+        Returns
+        -------
+        dict[str, bool]
+            Whether the cancellation of each selected simulation was accepted by the
+            server, keyed by simulation ID.
+
+        Examples
+        --------
+        Cancel the single bead simulations of a study with a priority of 1 or less.
+
+        >>> ids = study.data_frame().query(f"`{ColumnNames.PRIORITY}` <= 1")[ColumnNames.ID]
+        >>> task_mgr.cancel(simulation_ids=list(ids), types=[SimulationType.SINGLE_BEAD])
+
+        """
+        tasks = [self._tasks[i] for i in self._select_pending(simulation_ids, types, predicate)]
+        LOG.debug(f"Cancelling {len(tasks)} tasks")
+
+        def cancel_task(task: SimulationTask) -> bool:
+            try:
+                task.cancel()
+                return True
+            except Exception as e:
+                LOG.error(f"Unable to cancel {task.simulation_id}: {e}")
+                return False
+
+        workers = max(1, min(MAX_CONCURRENT_CANCEL_REQUESTS, len(tasks)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(cancel_task, tasks)
+            return dict(zip([t.simulation_id for t in tasks], results, strict=True))
+
+    def cancel_all(self) -> dict[str, bool]:
+        """Cancel all unfinished simulations belonging to this simulation task manager.
+
+        Returns
+        -------
+        dict[str, bool]
+            Whether the cancellation of each simulation was accepted by the server,
+            keyed by simulation ID.
+
+        """
+        return self.cancel()
 
     def summaries(self):
-        """Get a list of the summaries of completed simulations only."""
-        return [t.summary for t in self._tasks if t.summary]
+        """Get a list of the summaries of completed simulations only.
+
+        Summaries are listed in the order their tasks were added.
+        """
+        self._update_finished()
+        finished = (self._finished[i] for i in sorted(self._finished))
+        return [t.summary for t in finished if t.summary]
@@ -29,10 +29,12 @@ import zipfile
 import numpy as np
 from pandas import DataFrame
 
+from ansys.additive.core import misc
 from ansys.additive.core.machine import AdditiveMachine
 from ansys.additive.core.material import AdditiveMaterial
 from ansys.additive.core.simulation import (
     SimulationInputBase,
+    SimulationLogs,
     SimulationStatus,
     SimulationSummaryBase,
 )
@@ -206,22 +208,19 @@ class MeltPool:
             Path to the thermal history output file.
 
         """
-        bead_length = [ts.laser_x for ts in msg.time_steps]
-        length = [ts.length for ts in msg.time_steps]
-        width = [ts.width for ts in msg.time_steps]
-        depth = [ts.depth for ts in msg.time_steps]
-        reference_width = [ts.reference_width for ts in msg.time_steps]
-        reference_depth = [ts.reference_depth for ts in msg.time_steps]
-        self._df = DataFrame(
-            index=bead_length,
-            data={
-                MeltPoolColumnNames.LENGTH: length,
-                MeltPoolColumnNames.WIDTH: width,
-                MeltPoolColumnNames.DEPTH: depth,
-                MeltPoolColumnNames.REFERENCE_WIDTH: reference_width,
-                MeltPoolColumnNames.REFERENCE_DEPTH: reference_depth,
+        time_steps = misc.decode_repeated_field(
+            msg.time_steps,
+            {
+                "laser_x": np.float64,
+                MeltPoolColumnNames.LENGTH: np.float64,
+                MeltPoolColumnNames.WIDTH: np.float64,
+                MeltPoolColumnNames.DEPTH: np.float64,
+                MeltPoolColumnNames.REFERENCE_WIDTH: np.float64,
+                MeltPoolColumnNames.REFERENCE_DEPTH: np.float64,
             },
         )
+        bead_length = time_steps.pop("laser_x")
+        self._df = DataFrame(index=bead_length, data=time_steps)
         self._df.index.name = "bead_length"
         self._thermal_history_output = thermal_history_output
 
@@ -300,7 +299,7 @@ class SingleBeadSummary(SimulationSummaryBase):
         self,
         input: SingleBeadInput,
         msg: MeltPoolMessage,
-        logs: str,
+        logs: str | SimulationLogs,
         thermal_history_output: str | None = None,
         status: SimulationStatus = SimulationStatus.COMPLETED,
     ):
@@ -309,7 +308,7 @@ class SingleBeadSummary(SimulationSummaryBase):
             raise ValueError("Invalid input type passed to init, " + self.__class__.__name__)
         if not isinstance(msg, MeltPoolMessage):
             raise ValueError("Invalid message type passed to init, " + self.__class__.__name__)
-        if not isinstance(logs, str):
+        if not isinstance(logs, (str, SimulationLogs)):
             raise ValueError("Invalid logs type passed to init, " + self.__class__.__name__)
         super().__init__(logs, status)
         self._input = input
@@ -334,9 +333,14 @@ class SingleBeadSummary(SimulationSummaryBase):
         return repr
 
     def _extract_thermal_history(self, thermal_history_output):
-        """Extract the thermal history output."""
+        """Extract the thermal history output.
+
+        Output that was extracted while it was downloaded is used as is.
+        """
         zip_file = os.path.join(thermal_history_output, self.THERMAL_HISTORY_OUTPUT_ZIP)
         if not os.path.isfile(zip_file):
+            if os.path.isdir(thermal_history_output) and os.listdir(thermal_history_output):
+                return
             raise FileNotFoundError("Thermal history files not found: " + zip_file)
         with zipfile.ZipFile(zip_file, "r") as zip_ref:
             zip_ref.extractall(thermal_history_output)
@@ -26,6 +26,7 @@ from ansys.additive.core.machine import AdditiveMachine
 from ansys.additive.core.material import AdditiveMaterial
 from ansys.additive.core.simulation import (
     SimulationInputBase,
+    SimulationLogs,
     SimulationStatus,
     SimulationSummaryBase,
 )
@@ -251,13 +252,13 @@ class ThermalHistorySummary(SimulationSummaryBase):
         self,
         input: ThermalHistoryInput,
         coax_ave_output_folder: str,
-        logs: str,
+        logs: str | SimulationLogs,
         status: SimulationStatus = SimulationStatus.COMPLETED,
     ):
         """Initialize a ``ThermalHistorySummary`` object."""
         if not isinstance(input, ThermalHistoryInput):
             raise ValueError("Invalid input type passed to init, " + self.__class__.__name__)
-        if not isinstance(logs, str):
+        if not isinstance(logs, (str, SimulationLogs)):
             raise ValueError("Invalid logs type passed to init, " + self.__class__.__name__)
         super().__init__(logs, status)
         self._input = input
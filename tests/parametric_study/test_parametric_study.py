@@ -56,8 +56,10 @@ from ansys.additive.core.parametric_study.constants import ColumnNames
 from ansys.additive.core.parametric_study.parametric_study import (
     FORMAT_VERSION,
     ParametricStudy,
+    _parameter_keys,
 )
 from ansys.additive.core.parametric_study.parametric_utils import build_rate
+from ansys.additive.core.parametric_study.storage import PickleStudyStorage
 from ansys.api.additive.v0.additive_domain_pb2 import (
     GrainStatistics,
     MicrostructureResult,
@@ -712,6 +714,74 @@ def test_generate_single_bead_permutations_only_adds_valid_permutations(
     assert df.loc[0, ColumnNames.SCAN_SPEED] == MachineConstants.DEFAULT_SCAN_SPEED
 
 
+def test_generate_single_bead_permutations_logs_each_invalid_value_once(
+    tmp_path: pathlib.Path, caplog
+):
+    # arrange
+    study = ParametricStudy(tmp_path / "test_study", "material")
+    caplog.set_level(logging.ERROR, logger="PyAdditive_global")
+    powers = [MachineConstants.MAX_LASER_POWER + 1, 50.0, 100.0]
+    scan_speeds = [MachineConstants.MIN_SCAN_SPEED - 1, 1.0, 2.0]
+
+    # act
+    result = study.generate_single_bead_permutations(
+        powers, scan_speeds, heater_temperatures=[80.0, 100.0]
+    )
+
+    # assert
+    assert result == 8
+    assert len(caplog.records) == 2
+    assert "laser_power" in caplog.records[0].message
+    assert "scan_speed" in caplog.records[1].message
+
+
+def test_generate_single_bead_permutations_adds_nothing_for_invalid_shared_parameter(
+    tmp_path: pathlib.Path, caplog
+):
+    # arrange
+    study = ParametricStudy(tmp_path / "test_study", "material")
+    caplog.set_level(logging.ERROR, logger="PyAdditive_global")
+
+    # act
+    result = study.generate_single_bead_permutations(
+        [50.0, 100.0], [1.0, 2.0], bead_length=SingleBeadInput.MAX_BEAD_LENGTH + 1
+    )
+
+    # assert
+    assert result == 0
+    assert len(study.data_frame()) == 0
+    assert len(caplog.records) == 1
+    assert "bead_length" in caplog.records[0].message
+
+
+def test_generate_single_bead_permutations_orders_permutations_by_parameter(
+    tmp_path: pathlib.Path,
+):
+    # arrange
+    study = ParametricStudy(tmp_path / "test_study", "material")
+    powers = [50.0, 100.0]
+    scan_speeds = [1.0, 2.0]
+    layer_thicknesses = [30e-6, 50e-6]
+
+    # act
+    study.generate_single_bead_permutations(
+        powers, scan_speeds, layer_thicknesses=layer_thicknesses
+    )
+
+    # assert
+    df = study.data_frame()
+    expected = [(p, v, l) for p in powers for v in scan_speeds for l in layer_thicknesses]
+    actual = list(
+        zip(
+            df[ColumnNames.LASER_POWER],
+            df[ColumnNames.SCAN_SPEED],
+            df[ColumnNames.LAYER_THICKNESS],
+        )
+    )
+    assert actual == expected
+    assert df[ColumnNames.ID].is_unique
+
+
 def test_generate_single_bead_permuations_returns_correct_number_of_simulations_added(
     tmp_path: pathlib.Path,
 ):
@@ -1506,6 +1576,24 @@ def test_add_inputs_creates_new_rows(tmp_path: pathlib.Path):
     assert len(df[df[ColumnNames.STATUS] == SimulationStatus.NEW]) == 3
 
 
+def test_add_inputs_appends_rows_and_saves_once(tmp_path: pathlib.Path):
+    # arrange
+    study = ParametricStudy(tmp_path / "test_study", "material")
+    inputs = [SingleBeadInput(), PorosityInput(), MicrostructureInput()]
+
+    # act
+    with (
+        patch.object(ParametricStudy, "_append_rows", wraps=study._append_rows) as append_rows,
+        patch.object(ParametricStudy, "save", wraps=study.save) as save,
+    ):
+        study.add_inputs(inputs)
+
+    # assert
+    append_rows.assert_called_once()
+    save.assert_called_once()
+    assert len(study.data_frame()) == 3
+
+
 def test_add_inputs_raises_error_for_invalid_input(tmp_path: pathlib.Path):
     # arrange
     study = ParametricStudy(tmp_path / "test_study", "material")
@@ -1994,6 +2082,164 @@ def test_create_unique_id_returns_unique_id(tmp_path: pathlib.Path):
     assert len(id2) > len("sim_")
 
 
+def _with_id(input, id: str):
+    input._id = id
+    return input
+
+
+def test_create_unique_id_returns_id_when_not_in_study(tmp_path: pathlib.Path):
+    # arrange
+    study = ParametricStudy(tmp_path / "test_study", "material")
+    study.add_inputs(
+        [
+            _with_id(SingleBeadInput(), "sim_1_extra"),
+            _with_id(SingleBeadInput(bead_length=0.002), "sim_2"),
+        ]
+    )
+
+    # act
+    id = study._create_unique_id(id="sim_1")
+    id2 = study._create_unique_id(id="sim_2")
+
+    # assert
+    assert id == "sim_1"
+    assert id2.startswith("sim_2_")
+
+
+def test_id_index_tracks_added_and_removed_simulations(tmp_path: pathlib.Path):
+    # arrange
+    study = ParametricStudy(tmp_path / "test_study", "material")
+    study.add_inputs(
+        [
+            _with_id(SingleBeadInput(), "sim_1"),
+            _with_id(SingleBeadInput(bead_length=0.002), "sim_2"),
+        ]
+    )
+    assert set(study._id_index()) == {"sim_1", "sim_2"}
+
+    # act
+    study.remove("sim_1")
+    study.add_inputs([_with_id(PorosityInput(), "sim_3")])
+    study.set_simulation_status("sim_3", SimulationStatus.SKIP)
+
+    # assert
+    assert set(study._id_index()) == {"sim_2", "sim_3"}
+    df = study.data_frame()
+    assert df.loc[df[ColumnNames.ID] == "sim_3", ColumnNames.STATUS].tolist() == [
+        SimulationStatus.SKIP
+    ]
+    assert df.loc[df[ColumnNames.ID] == "sim_2", ColumnNames.STATUS].tolist() == [
+        SimulationStatus.NEW
+    ]
+
+
+def test_id_index_is_rebuilt_when_study_is_loaded(tmp_path: pathlib.Path):
+    # arrange
+    study = ParametricStudy(tmp_path / "test_study", "material")
+    study.add_inputs([_with_id(SingleBeadInput(), "sim_1")])
+    study._id_index()
+
+    # act
+    loaded = ParametricStudy.load(study.file_name)
+    loaded.set_priority("sim_1", 5)
+
+    # assert
+    assert "_id_index_cache" not in study.__getstate__()
+    assert loaded.data_frame().loc[0, ColumnNames.PRIORITY] == 5
+
+
+def test_data_frame_lists_simulations_in_added_order_with_contiguous_index(
+    tmp_path: pathlib.Path,
+):
+    # arrange
+    study = ParametricStudy(tmp_path / "test_study", "material")
+    study.add_inputs(
+        [
+            _with_id(PorosityInput(), "sim_1"),
+            _with_id(SingleBeadInput(), "sim_2"),
+            _with_id(SingleBeadInput(bead_length=0.002), "sim_3"),
+        ]
+    )
+    study.remove("sim_2")
+
+    # act
+    study.add_inputs([_with_id(SingleBeadInput(bead_length=0.004), "sim_4")])
+
+    # assert
+    df = study.data_frame()
+    assert df.index.equals(pd.RangeIndex(3))
+    assert df[ColumnNames.ID].tolist() == ["sim_1", "sim_3", "sim_4"]
+    assert study._data_frame.index.tolist() == [0, 2, 3]
+
+
+def test_remove_duplicate_entries_checks_only_added_rows(tmp_path: pathlib.Path):
+    # arrange
+    study = ParametricStudy(tmp_path / "test_study", "material")
+    study.add_inputs([SingleBeadInput(bead_length=(i + 1) * 0.001) for i in range(5)])
+    checked = []
+
+    def spy(parameters):
+        checked.append(len(parameters))
+        return _parameter_keys(parameters)
+
+    # act
+    with patch(
+        "ansys.additive.core.parametric_study.parametric_study._parameter_keys",
+        side_effect=spy,
+    ):
+        added = study.add_inputs(
+            [SingleBeadInput(bead_length=0.001), SingleBeadInput(bead_length=0.01)]
+        )
+
+    # assert
+    assert checked == [2]
+    assert added == 1
+    assert len(study.data_frame()) == 6
+
+
+def test_remove_duplicate_entries_ignores_floating_point_noise(tmp_path: pathlib.Path):
+    # arrange
+    study = ParametricStudy(tmp_path / "test_study", "material")
+    study.add_inputs([SingleBeadInput(bead_length=0.0021)])
+
+    # act
+    added = study.add_inputs([SingleBeadInput(bead_length=0.001 + 0.0011)])
+
+    # assert
+    assert 0.001 + 0.0011 != 0.0021
+    assert added == 0
+    assert len(study.data_frame()) == 1
+
+
+def test_add_inputs_after_remove_adds_removed_simulation(tmp_path: pathlib.Path):
+    # arrange
+    study = ParametricStudy(tmp_path / "test_study", "material")
+    study.add_inputs([_with_id(SingleBeadInput(), "sim_1")])
+    study.remove("sim_1")
+
+    # act
+    added = study.add_inputs([_with_id(SingleBeadInput(), "sim_2")])
+
+    # assert
+    assert added == 1
+    assert study.data_frame()[ColumnNames.ID].tolist() == ["sim_2"]
+
+
+def test_parameter_index_is_rebuilt_when_study_is_loaded(tmp_path: pathlib.Path):
+    # arrange
+    study = ParametricStudy(tmp_path / "test_study", "material")
+    study.add_inputs([SingleBeadInput()])
+
+    # act
+    loaded = ParametricStudy.load(study.file_name)
+    added = loaded.add_inputs([SingleBeadInput(), SingleBeadInput(bead_length=0.002)])
+
+    # assert
+    assert "_parameter_index_cache" not in study.__getstate__()
+    assert added == 1
+    assert len(loaded.data_frame()) == 2
+
+
 def test_clear_removes_all_rows_but_not_columns(tmp_path: pathlib.Path):
     # arrange
     study = ParametricStudy(tmp_path / "test_study", "material")
@@ -2096,6 +2342,97 @@ def test_update_format_updates_Ansys_242_to_latest(tmp_path: pathlib.Path):
     assert ColumnNames.PV_RATIO in updated_study.data_frame().columns
 
 
+def test_batch_defers_save_until_exit(tmp_path: pathlib.Path):
+    # arrange
+    study = ParametricStudy(tmp_path / "test_study", "material")
+    study.add_inputs([SingleBeadInput(), PorosityInput()])
+    ids = study.data_frame()[ColumnNames.ID].tolist()
+    storage_save = Mock(wraps=study.storage.save)
+    study.storage.save = storage_save
+
+    # act
+    with study.batch():
+        study.set_priority(ids, 3)
+        study.set_iteration(ids, 4)
+        study.set_simulation_status(ids[0], SimulationStatus.RUNNING)
+        saves_in_batch = storage_save.call_count
+
+    # assert
+    assert saves_in_batch == 0
+    assert storage_save.call_count == 1
+    loaded = ParametricStudy.load(study.file_name)
+    assert (loaded.data_frame()[ColumnNames.ITERATION] == 4).all()
+
+
+def test_batch_saves_when_max_changes_reached(tmp_path: pathlib.Path):
+    # arrange
+    study = ParametricStudy(tmp_path / "test_study", "material")
+    study.add_inputs([SingleBeadInput()])
+    ids = study.data_frame()[ColumnNames.ID].tolist()
+    study.storage.save = Mock(wraps=study.storage.save)
+
+    # act
+    with study.batch(max_changes=2):
+        for priority in range(5):
+            study.set_priority(ids, priority)
+
+    # assert
+    # two saves triggered by the change limit, one for the remaining change on exit
+    assert study.storage.save.call_count == 3
+
+
+def test_batch_saves_when_max_interval_elapsed(tmp_path: pathlib.Path):
+    # arrange
+    study = ParametricStudy(tmp_path / "test_study", "material")
+    study.add_inputs([SingleBeadInput()])
+    ids = study.data_frame()[ColumnNames.ID].tolist()
+    study.storage.save = Mock(wraps=study.storage.save)
+
+    # act
+    with study.batch(max_interval=0):
+        study.set_priority(ids, 2)
+        study.set_priority(ids, 3)
+
+    # assert
+    assert study.storage.save.call_count == 2
+
+
+def test_nested_batch_saves_once_when_outer_batch_exits(tmp_path: pathlib.Path):
+    # arrange
+    study = ParametricStudy(tmp_path / "test_study", "material")
+    study.add_inputs([SingleBeadInput()])
+    ids = study.data_frame()[ColumnNames.ID].tolist()
+    study.storage.save = Mock(wraps=study.storage.save)
+
+    # act
+    with study.batch():
+        with study.batch():
+            study.set_priority(ids, 2)
+        saves_after_inner = study.storage.save.call_count
+        study.set_priority(ids, 3)
+
+    # assert
+    assert saves_after_inner == 0
+    assert study.storage.save.call_count == 1
+
+
+def test_batch_saves_changes_when_exception_raised(tmp_path: pathlib.Path):
+    # arrange
+    study = ParametricStudy(tmp_path / "test_study", "material", PickleStudyStorage())
+    study.add_inputs([SingleBeadInput()])
+    ids = study.data_frame()[ColumnNames.ID].tolist()
+
+    # act
+    with pytest.raises(RuntimeError), study.batch():
+        study.set_priority(ids, 7)
+        raise RuntimeError("error")
+
+    # assert
+    loaded = ParametricStudy.load(study.file_name)
+    assert loaded.data_frame()[ColumnNames.PRIORITY].tolist() == [7]
+    assert not hasattr(loaded, "_batch")
+
+
 def test_reset_simulation_status_sets_status_to_new(tmp_path: pathlib.Path):
     # arrange
     study = ParametricStudy(tmp_path / "test_study", "material")
@@ -2586,6 +2923,96 @@ def test_simulation_inputs_calls_client_call_for_material(
     mock_client_call.assert_called_once_with(material_name)
 
 
+def test_simulation_inputs_calls_client_call_once_for_all_simulations(
+    tmp_path: pathlib.Path,
+):
+    # arrange
+    material_name = "material"
+    study = ParametricStudy(tmp_path / "test_study", material_name)
+    dynamic_defocus = AdditiveMachine(
+        heat_source_model=MachineConstants.HEAT_SOURCE_MODEL_NAME_DYNAMIC_DEFOCUS
+    )
+    material = AdditiveMaterial(
+        name=material_name,
+        laser_shape_parameter=3.0,
+        laser_distribution_parameter=MaterialConstants.DEFAULT_LASER_DISTRIBUTION_PARAMETER,
+        fresnal_absorption_coefficient=MaterialConstants.DEFAULT_FRESNAL_ABSORPTION_COEFFICIENT,
+        absorption_in_conduction_mode=MaterialConstants.DEFAULT_ABSORPTION_CONDUCTION_MODE,
+    )
+    study.add_inputs(
+        [
+            SingleBeadInput(bead_length=0.001),
+            SingleBeadInput(bead_length=0.002),
+            PorosityInput(),
+            SingleBeadInput(machine=dynamic_defocus, material=material),
+        ]
+    )
+    server_material = AdditiveMaterial(name=material_name)
+    mock_client_call = Mock(return_value=server_material)
+
+    # act
+    inputs = study.simulation_inputs(mock_client_call)
+
+    # assert
+    mock_client_call.assert_called_once_with(material_name)
+    assert len(inputs) == 4
+    assert inputs[0].material is not inputs[1].material
+    assert server_material.laser_shape_parameter == 0
+    assert inputs[0].material.laser_shape_parameter == (
+        MaterialConstants.DEFAULT_LASER_SHAPE_PARAMETER
+    )
+    assert inputs[3].material.laser_shape_parameter == 3.0
+
+
+def test_iter_simulation_inputs_creates_inputs_lazily(tmp_path: pathlib.Path):
+    # arrange
+    study = ParametricStudy(tmp_path / "test_study", "material")
+    study.add_inputs([SingleBeadInput(bead_length=0.001), SingleBeadInput(bead_length=0.002)])
+    mock_client_call = Mock(side_effect=lambda name: AdditiveMaterial(name=name))
+
+    # act
+    inputs = study.iter_simulation_inputs(mock_client_call)
+
+    # assert
+    mock_client_call.assert_not_called()
+    assert next(inputs).bead_length == 0.001
+    assert next(inputs).bead_length == 0.002
+    with pytest.raises(StopIteration):
+        next(inputs)
+
+
+@pytest.mark.parametrize("heat_source_value", [float("nan"), ""])
+def test_iter_simulation_inputs_assigns_default_values(
+    heat_source_value, tmp_path: pathlib.Path
+):
+    # arrange
+    study = ParametricStudy(tmp_path / "test_study", "material")
+    study.add_inputs([MicrostructureInput()])
+    df = study.data_frame()
+    for column in [
+        ColumnNames.START_ANGLE,
+        ColumnNames.HATCH_SPACING,
+        ColumnNames.DEFOCUS,
+        ColumnNames.MICRO_MIN_X,
+    ]:
+        df[column] = float("nan")
+    df[ColumnNames.HEAT_SOURCE] = heat_source_value
+    study._data_frame = df
+
+    def mock_client_call(name: str):
+        return AdditiveMaterial(name=name)
+
+    # act
+    input = next(study.iter_simulation_inputs(mock_client_call))
+
+    # assert
+    assert input.machine.starting_layer_angle == MachineConstants.DEFAULT_STARTING_LAYER_ANGLE
+    assert input.machine.hatch_spacing == MachineConstants.DEFAULT_HATCH_SPACING
+    assert input.machine.defocus == MachineConstants.DEFAULT_DEFOCUS
+    assert input.machine.heat_source_model == MachineConstants.DEFAULT_HEAT_SOURCE_MODEL_NAME
+    assert input.sample_min_x == MicrostructureInput.DEFAULT_POSITION_COORDINATE
+
+
 def test_simulation_inputs_logs_warning_when_no_simulations_meet_criteria(
     tmp_path: pathlib.Path,
     caplog,
@@ -2954,6 +3381,12 @@ def test_create_machine_assigns_all_values():
     assert machine.defocus == defocus
 
 
+def _fill_input_defaults(series: pd.Series) -> pd.Series:
+    columns = [getattr(ColumnNames, k) for k in ColumnNames.__dict__ if not k.startswith("_")]
+    df = series.to_frame().T.reindex(columns=columns)
+    return ParametricStudy._fill_input_defaults(df).iloc[0]
+
+
 @pytest.mark.parametrize("heat_source_value", [float("nan"), ""])
 def test_create_machine_assigns_default_values(heat_source_value):
     # arrange
@@ -2980,7 +3413,7 @@ def test_create_machine_assigns_default_values(heat_source_value):
     )
 
     # act
-    machine = ParametricStudy._create_machine(series)
+    machine = ParametricStudy._create_machine(_fill_input_defaults(series))
 
     # assert
     assert isinstance(machine, AdditiveMachine)
@@ -3149,7 +3582,7 @@ def test_create_microstructure_input_assigns_defaults_for_nans():
 
     # act
     input = ParametricStudy._create_microstructure_input(
-        series, material=material, machine=machine
+        _fill_input_defaults(series), material=material, machine=machine
     )
 
     # assert
@@ -3266,26 +3699,10 @@ def test_add_missing_column_with_default_value_propagates_to_all_rows(tmp_path:
     assert (df[new_col_name] == default_value).all()
 
 
-def test_create_material_calls_get_material_func():
-    # arrange
-    material_name = "IN718"
-    expected_material = AdditiveMaterial(name=material_name)
-    get_material_func = Mock(return_value=expected_material)
-    row = pd.Series({ColumnNames.HEAT_SOURCE: MachineConstants.DEFAULT_HEAT_SOURCE_MODEL_NAME})
-
-    # act
-    material = ParametricStudy._create_material(row, get_material_func, material_name)
-
-    # assert
-    get_material_func.assert_called_once_with(material_name)
-    assert material is expected_material
-
-
-def test_create_material_applies_dynamic_defocus_material_parameters():
+def test_apply_heat_source_parameters_applies_dynamic_defocus_material_parameters():
     # arrange
     material_name = "IN718"
     material = AdditiveMaterial(name=material_name)
-    get_material_func = Mock(return_value=material)
 
     laser_shape = 2
     laser_distribution = 3
@@ -3303,7 +3720,7 @@ def test_create_material_applies_dynamic_defocus_material_parameters():
     )
 
     # act
-    updated_material = ParametricStudy._create_material(row, get_material_func, material_name)
+    updated_material = ParametricStudy._apply_heat_source_parameters(row, material)
 
     # assert
     assert updated_material.laser_shape_parameter == laser_shape
@@ -3312,7 +3729,7 @@ def test_create_material_applies_dynamic_defocus_material_parameters():
     assert updated_material.absorption_in_conduction_mode == absorption_conduction
 
 
-def test_create_material_does_not_apply_dynamic_defocus_parameters_for_non_dynamic_heat_source():
+def test_apply_heat_source_parameters_resets_material_parameters_for_non_dynamic_heat_source():
     # arrange
     material_name = "IN718"
     material = AdditiveMaterial(name=material_name)
@@ -3320,7 +3737,6 @@ def test_create_material_does_not_apply_dynamic_defocus_parameters_for_non_dynam
     material.laser_distribution_parameter = 3.5
     material.fresnal_absorption_coefficient = 0.35
     material.absorption_in_conduction_mode = 0.65
-    get_material_func = Mock(return_value=material)
 
     row = pd.Series(
         {
@@ -3333,7 +3749,7 @@ def test_create_material_does_not_apply_dynamic_defocus_parameters_for_non_dynam
     )
 
     # act
-    updated_material = ParametricStudy._create_material(row, get_material_func, material_name)
+    updated_material = ParametricStudy._apply_heat_source_parameters(row, material)
 
     # assert
     assert (
@@ -3354,7 +3770,7 @@ def test_create_material_does_not_apply_dynamic_defocus_parameters_for_non_dynam
     )
 
 
-def test_create_material_skips_nan_dynamic_defocus_parameters():
+def test_apply_heat_source_parameters_skips_nan_dynamic_defocus_parameters():
     # arrange
     material_name = "IN718"
     material = AdditiveMaterial(name=material_name)
@@ -3362,7 +3778,6 @@ def test_create_material_skips_nan_dynamic_defocus_parameters():
     material.laser_distribution_parameter = 2.0
     material.fresnal_absorption_coefficient = 0.35
     material.absorption_in_conduction_mode = 0.65
-    get_material_func = Mock(return_value=material)
 
     row = pd.Series(
         {
@@ -3375,7 +3790,7 @@ def test_create_material_skips_nan_dynamic_defocus_parameters():
     )
 
     # act
-    updated_material = ParametricStudy._create_material(row, get_material_func, material_name)
+    updated_material = ParametricStudy._apply_heat_source_parameters(row, material)
 
     # assert
     assert updated_material.laser_shape_parameter == 1.0
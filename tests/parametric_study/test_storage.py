@@ -0,0 +1,216 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pathlib
+import shutil
+import sqlite3
+from unittest.mock import patch
+
+import dill
+
+from ansys.additive.core import (
+    PorosityInput,
+    SimulationStatus,
+    SingleBeadInput,
+)
+from ansys.additive.core.parametric_study.constants import ColumnNames
+from ansys.additive.core.parametric_study.parametric_study import ParametricStudy
+from ansys.additive.core.parametric_study.storage import (
+    PickleStudyStorage,
+    SQLiteStudyStorage,
+)
+from tests import test_utils
+
+
+def _study_with_inputs(path: pathlib.Path, storage=None) -> ParametricStudy:
+    study = ParametricStudy(path, "material", storage)
+    material = test_utils.get_test_material()
+    study.add_inputs(
+        [
+            SingleBeadInput(material=material, bead_length=0.001),
+            SingleBeadInput(material=material, bead_length=0.002),
+            PorosityInput(material=material),
+        ]
+    )
+    return study
+
+
+def _stored_rows(file_name) -> dict:
+    connection = sqlite3.connect(file_name)
+    try:
+        return dict(connection.execute("SELECT row_key, id FROM simulations"))
+    finally:
+        connection.close()
+
+
+def test_new_study_is_stored_in_sqlite_database_in_wal_mode(tmp_path: pathlib.Path):
+    # act
+    study = ParametricStudy(tmp_path / "study", "material")
+
+    # assert
+    assert isinstance(study.storage, SQLiteStudyStorage)
+    assert SQLiteStudyStorage.is_study_file(study.file_name)
+    connection = sqlite3.connect(study.file_name)
+    assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    connection.close()
+
+
+def test_is_study_file_returns_false_for_other_files(tmp_path: pathlib.Path):
+    # arrange
+    text_file = tmp_path / "text.ps"
+    text_file.write_text("test")
+
+    # act, assert
+    assert not SQLiteStudyStorage.is_study_file(text_file)
+    assert not SQLiteStudyStorage.is_study_file(tmp_path / "missing.ps")
+
+
+def test_sqlite_save_and_load_preserves_data_frame(tmp_path: pathlib.Path):
+    # arrange
+    study = _study_with_inputs(tmp_path / "study")
+    ids = study.data_frame()[ColumnNames.ID].tolist()
+    study.set_simulation_status(ids[0], SimulationStatus.ERROR, "error message")
+    study.set_priority(ids[1], 3)
+
+    # act
+    loaded = ParametricStudy.load(study.file_name)
+
+    # assert
+    assert isinstance(loaded.storage, SQLiteStudyStorage)
+    assert loaded.data_frame().equals(study.data_frame())
+    assert list(loaded.data_frame().dtypes) == list(study.data_frame().dtypes)
+    assert loaded.material_name == "material"
+    assert loaded.format_version == study.format_version
+
+
+def test_sqlite_save_writes_only_modified_rows(tmp_path: pathlib.Path):
+    # arrange
+    study = _study_with_inputs(tmp_path / "study")
+    ids = study.data_frame()[ColumnNames.ID].tolist()
+    written = []
+    records = SQLiteStudyStorage._records
+
+    def spy(df, keyed):
+        written.extend(df[ColumnNames.ID])
+        return records(df, keyed)
+
+    # act
+    with (
+        patch.object(SQLiteStudyStorage, "_records", side_effect=spy),
+        patch.object(SQLiteStudyStorage, "_write_all") as write_all,
+    ):
+        study.set_simulation_status(ids[1], SimulationStatus.COMPLETED)
+        study.remove(ids[2])
+
+    # assert
+    write_all.assert_not_called()
+    assert written == [ids[1]]
+    assert sorted(_stored_rows(study.file_name).values()) == sorted(ids[:2])
+    loaded = ParametricStudy.load(study.file_name)
+    assert loaded.data_frame().equals(study.data_frame())
+
+
+def test_sqlite_save_rewrites_file_when_data_frame_replaced(tmp_path: pathlib.Path):
+    # arrange
+    study = _study_with_inputs(tmp_path / "study")
+
+    # act
+    study.clear()
+
+    # assert
+    assert _stored_rows(study.file_name) == {}
+    assert ParametricStudy.load(study.file_name).data_frame().empty
+
+
+def test_sqlite_save_to_new_file_writes_all_rows(tmp_path: pathlib.Path):
+    # arrange
+    study = _study_with_inputs(tmp_path / "study")
+    copy_file = tmp_path / "copy" / "study.ps"
+
+    # act
+    study.save(copy_file)
+
+    # assert
+    assert len(_stored_rows(copy_file)) == 3
+    assert ParametricStudy.load(copy_file).data_frame().equals(study.data_frame())
+
+
+def test_pickle_storage_writes_dill_file(tmp_path: pathlib.Path):
+    # arrange
+    study = _study_with_inputs(tmp_path / "study", PickleStudyStorage())
+
+    # act
+    with open(study.file_name, "rb") as f:
+        pickled = dill.load(f)
+    loaded = ParametricStudy.load(study.file_name)
+
+    # assert
+    assert pickled.data_frame().equals(study.data_frame())
+    assert isinstance(loaded.storage, PickleStudyStorage)
+    assert loaded.data_frame().equals(study.data_frame())
+
+
+def test_load_keeps_format_of_study_written_without_storage(tmp_path: pathlib.Path):
+    # arrange
+    study_file = tmp_path / "study.ps"
+    shutil.copyfile(test_utils.get_test_file_path("windows.ps"), study_file)
+    original = ParametricStudy.__new__(ParametricStudy)
+    PickleStudyStorage().load(original, study_file)
+
+    # act
+    study = ParametricStudy.load(study_file)
+
+    # assert
+    assert isinstance(study.storage, PickleStudyStorage)
+    assert not SQLiteStudyStorage.is_study_file(study_file)
+    assert study.data_frame().equals(original.data_frame())
+
+
+def test_init_with_storage_converts_study_written_without_storage(tmp_path: pathlib.Path):
+    # arrange
+    study_file = tmp_path / "study.ps"
+    shutil.copyfile(test_utils.get_test_file_path("windows.ps"), study_file)
+    original = ParametricStudy.__new__(ParametricStudy)
+    PickleStudyStorage().load(original, study_file)
+
+    # act
+    study = ParametricStudy(study_file, "material", SQLiteStudyStorage())
+
+    # assert
+    assert isinstance(study.storage, SQLiteStudyStorage)
+    assert SQLiteStudyStorage.is_study_file(study_file)
+    reloaded = ParametricStudy.load(study_file)
+    assert len(reloaded.data_frame()) == len(original.data_frame())
+    assert reloaded.data_frame().equals(study.data_frame())
+
+
+def test_init_with_storage_converts_existing_file(tmp_path: pathlib.Path):
+    # arrange
+    study = _study_with_inputs(tmp_path / "study")
+
+    # act
+    converted = ParametricStudy(study.file_name, "material", PickleStudyStorage())
+
+    # assert
+    assert isinstance(converted.storage, PickleStudyStorage)
+    assert not SQLiteStudyStorage.is_study_file(study.file_name)
+    assert ParametricStudy.load(study.file_name).data_frame().equals(study.data_frame())
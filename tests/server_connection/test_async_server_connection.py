@@ -0,0 +1,125 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import grpc
+import pytest
+
+from ansys.additive.core.server_connection.async_server_connection import (
+    AsyncServerConnection,
+)
+from ansys.additive.core.server_connection.server_connection import ServerConnectionStatus
+from ansys.api.additive.v0.additive_server_info_pb2 import AboutResponse
+
+
+def test_init_raises_exception_if_channel_and_addr_provided():
+    # act, assert
+    with pytest.raises(ValueError, match="cannot both be specified"):
+        AsyncServerConnection(channel=Mock(), addr="127.0.0.1:50052")
+
+
+def test_init_raises_exception_if_channel_and_addr_missing():
+    # act, assert
+    with pytest.raises(ValueError, match="must be specified"):
+        AsyncServerConnection()
+
+
+def test_init_raises_exception_if_transport_mode_missing_with_addr():
+    # act, assert
+    with pytest.raises(ValueError, match="'transport_mode' must be specified"):
+        AsyncServerConnection(addr="127.0.0.1:50052")
+
+
+def test_init_creates_channel_and_stubs_from_addr():
+    # arrange
+    async def connect():
+        return AsyncServerConnection(addr="127.0.0.1:50052", transport_mode="insecure")
+
+    # act
+    server = asyncio.run(connect())
+
+    # assert
+    assert server.channel_str == "127.0.0.1:50052"
+    assert server.uds_file is None
+    assert server.materials_stub is not None
+    assert server.simulation_stub is not None
+    assert server.operations_stub is not None
+    assert server.settings_stub is not None
+
+
+def test_status_returns_connected_status_with_metadata():
+    # arrange
+    server = AsyncServerConnection(channel=Mock())
+    response = AboutResponse()
+    response.metadata["version"] = "1.0"
+    server._server_info_stub = Mock()
+    server._server_info_stub.About = AsyncMock(return_value=response)
+
+    # act
+    status = asyncio.run(server.status())
+
+    # assert
+    assert status == ServerConnectionStatus(True, "", {"version": "1.0"})
+
+
+def test_status_returns_not_connected_when_rpc_fails():
+    # arrange
+    server = AsyncServerConnection(channel=Mock())
+    server._server_info_stub = Mock()
+    server._server_info_stub.About = AsyncMock(side_effect=grpc.RpcError())
+
+    # act
+    status = asyncio.run(server.status())
+
+    # assert
+    assert status.connected is False
+
+
+def test_ready_retries_until_server_responds(monkeypatch):
+    # arrange
+    monkeypatch.setattr(asyncio, "sleep", AsyncMock())
+    server = AsyncServerConnection(channel=Mock())
+    server._server_info_stub = Mock()
+    server._server_info_stub.About = AsyncMock(side_effect=[grpc.RpcError(), AboutResponse()])
+
+    # act
+    ready = asyncio.run(server.ready())
+
+    # assert
+    assert ready is True
+    assert server._server_info_stub.About.call_count == 2
+
+
+def test_close_closes_channel():
+    # arrange
+    channel = Mock()
+    channel.close = AsyncMock()
+    server = AsyncServerConnection(channel=channel)
+
+    # act
+    asyncio.run(server.close())
+
+    # assert
+    channel.close.assert_awaited_once()
+    assert asyncio.run(server.status()).connected is False
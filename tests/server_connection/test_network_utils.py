@@ -19,6 +19,7 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import asyncio
 from pathlib import Path
 from unittest.mock import create_autospec, patch
 
@@ -31,6 +32,7 @@ from ansys.additive.core.server_connection.network_utils import (
     MAX_RCV_MSG_LEN,
     check_valid_ip,
     check_valid_port,
+    create_aio_channel,
     create_channel,
 )
 
@@ -200,4 +202,76 @@ def test_create_channel_sets_max_rcv_msg_len(monkeypatch):
     # assert
     mock_insecure_channel.assert_called_with(
         target, options=[("grpc.max_receive_message_length", msg_len)]
-    )
\ No newline at end of file
+    )
+
+def test_create_aio_channel_returns_expected_insecure_channel():
+    # arrange
+    target = "127.0.0.1:1234"
+
+    async def create():
+        return create_aio_channel(
+            target=target, transport_mode="insecure", certs_dir=None, uds_dir=None, uds_id=None
+        )
+
+    # act
+    channel, uds_file = asyncio.run(create())
+
+    # assert
+    assert isinstance(channel, grpc.aio.Channel)
+    assert uds_file is None
+
+
+def test_create_aio_channel_requires_allow_remote_host_for_non_loopback_insecure_channel():
+    # act, assert
+    with pytest.raises(ValueError, match="allow_remote_host"):
+        create_aio_channel(
+            target="1.2.3.4:1234", transport_mode="insecure", certs_dir=None, uds_dir=None, uds_id=None
+        )
+
+
+def test_create_aio_channel_returns_expected_uds_channel():
+    # arrange
+    target = "127.0.0.1:1234"
+    uds_dir = Path("test_aio_uds_channel")
+
+    async def create():
+        return create_aio_channel(target=target, transport_mode=TransportMode.UDS, certs_dir=None, uds_dir=uds_dir, uds_id="111111")
+
+    # act
+    with patch("ansys.additive.core.server_connection.network_utils.verify_uds_socket", return_value=True):
+        channel, uds_file = asyncio.run(create())
+
+    # assert
+    assert isinstance(channel, grpc.aio.Channel)
+    assert uds_file == uds_dir / "additive-111111.sock"
+
+
+def test_create_aio_channel_raises_exception_for_missing_uds_socket():
+    # act, assert
+    with pytest.raises(ConnectionError):
+        create_aio_channel(target="127.0.0.1:1234", transport_mode="uds", certs_dir=None, uds_dir="test_aio_uds_missing", uds_id="111111")
+
+
+def test_create_aio_channel_returns_expected_secure_channel(monkeypatch, tmp_path):
+    # arrange
+    mock_secure_channel = create_autospec(grpc.aio.secure_channel, return_value=None)
+    monkeypatch.setattr(grpc.aio, "secure_channel", mock_secure_channel)
+    mock_credentials = create_autospec(grpc.ssl_channel_credentials, return_value="creds")
+    monkeypatch.setattr(grpc, "ssl_channel_credentials", mock_credentials)
+    (tmp_path / "client.crt").write_text("cert")
+    (tmp_path / "client.key").write_text("key")
+    (tmp_path / "ca.crt").write_text("ca")
+    target = "127.0.0.1:1234"
+
+    # act
+    create_aio_channel(target=target, transport_mode=TransportMode.MTLS, certs_dir=tmp_path, uds_dir=None, uds_id=None)
+
+    # assert
+    mock_credentials.assert_called_once_with(root_certificates=b"ca", private_key=b"key", certificate_chain=b"cert")
+    mock_secure_channel.assert_called_with(target, "creds", options=[("grpc.max_receive_message_length", MAX_RCV_MSG_LEN)])
+
+
+def test_create_aio_channel_raises_exception_for_missing_certs(tmp_path):
+    # act, assert
+    with pytest.raises(FileNotFoundError):
+        create_aio_channel(target="127.0.0.1:1234", transport_mode=TransportMode.MTLS, certs_dir=tmp_path, uds_dir=None, uds_id=None)
@@ -22,12 +22,12 @@
 
 import logging
 import pathlib
+import threading
 from unittest import mock
 from unittest.mock import (
     ANY,
     MagicMock,
     Mock,
-    PropertyMock,
     call,
     create_autospec,
     patch,
@@ -54,7 +54,7 @@ from ansys.additive.core import (
 )
 from ansys.additive.core.exceptions import BetaFeatureNotEnabledError
 from ansys.additive.core.machine import AdditiveMachine, MachineConstants
-from ansys.additive.core.material import AdditiveMaterial
+from ansys.additive.core.material import AdditiveMaterial, MaterialConstants
 from ansys.additive.core.material_tuning import MaterialTuningInput
 from ansys.additive.core.parametric_study.constants import ColumnNames
 from ansys.additive.core.parametric_study.parametric_study import ParametricStudy
@@ -207,6 +207,108 @@ def test_apply_server_settings_returns_appropriate_responses(server):
     assert result == ["applied"]
 
 
+def test_Additive_init_connects_to_each_server_connection(monkeypatch: pytest.MonkeyPatch):
+    # arrange
+    channel = grpc.insecure_channel("target")
+    connections = [_mock_pooled_server(), _mock_pooled_server()]
+    mock_connect = create_autospec(
+        ansys.additive.core.additive.Additive._connect_to_server,
+        side_effect=connections,
+    )
+    monkeypatch.setattr(ansys.additive.core.additive.Additive, "_connect_to_server", mock_connect)
+
+    # act
+    additive = Additive(server_connections=["host1:50052", channel])
+
+    # assert
+    assert mock_connect.call_count == 2
+    assert mock_connect.call_args_list[0][0][:3] == (None, "host1", 50052)
+    assert mock_connect.call_args_list[1][0][0] == channel
+    assert additive._servers == connections
+    assert additive._server == connections[0]
+
+
+@pytest.mark.parametrize("address", ["host", "host:", ":50052", "host:port"])
+def test_Additive_init_raises_for_improperly_formed_server_connection(address):
+    # act, assert
+    with pytest.raises(ValueError, match="Improperly formed server address"):
+        Additive(server_connections=[address])
+
+
+def _mock_pooled_server(num_concurrent_sims: int = 1) -> Mock:
+    server = Mock(ServerConnection)
+    response = SettingsResponse()
+    response.messages.append("applied")
+    server.settings_stub.ApplySettings = Mock(return_value=response)
+    settings = ListSettingsResponse()
+    setting = settings.settings.add()
+    setting.key = "NumConcurrentSims"
+    setting.value = str(num_concurrent_sims)
+    server.settings_stub.ListSettings = Mock(return_value=settings)
+    return server
+
+
+def test_apply_server_settings_applies_to_all_servers(monkeypatch: pytest.MonkeyPatch):
+    # arrange
+    servers = [_mock_pooled_server(3), _mock_pooled_server(4)]
+    monkeypatch.setattr(
+        ansys.additive.core.additive.Additive, "_connect_to_server", Mock(side_effect=servers)
+    )
+    additive = Additive(server_connections=["host1:1", "host2:2"])
+
+    # act
+    result = additive.apply_server_settings({"NumConcurrentSims": "3"})
+
+    # assert
+    assert result == ["applied", "applied"]
+    for server in servers:
+        assert server.settings_stub.ApplySettings.call_count == 2
+    assert additive._server_capacities == [3, 4]
+
+
+def test_simulate_async_distributes_inputs_by_server_queue_depth(monkeypatch: pytest.MonkeyPatch):
+    # arrange
+    servers = [_mock_pooled_server(), _mock_pooled_server()]
+    monkeypatch.setattr(
+        ansys.additive.core.additive.Additive, "_connect_to_server", Mock(side_effect=servers)
+    )
+    additive = Additive(server_connections=["host1:1", "host2:2"])
+    running_tasks = [Mock(SimulationTask, done=False) for _ in range(3)]
+    finished_task = Mock(SimulationTask, done=True)
+    for task in [*running_tasks, finished_task]:
+        additive._server_tasks[0].add(task)
+    additive._simulate = Mock(side_effect=lambda *args: Mock(SimulationTask, done=False))
+    inputs = [SingleBeadInput(material=test_utils.get_test_material()) for _ in range(4)]
+
+    # act
+    additive.simulate_async(inputs)
+
+    # assert
+    used = {call[0][0].id: call[0][1] for call in additive._simulate.call_args_list}
+    assert [used[i.id] for i in inputs] == [servers[1], servers[1], servers[1], servers[0]]
+    for server in servers:
+        server.operations_stub.ListOperations.assert_not_called()
+
+
+def test_simulate_async_distributes_inputs_by_server_capacity(monkeypatch: pytest.MonkeyPatch):
+    # arrange
+    servers = [_mock_pooled_server(1), _mock_pooled_server(3)]
+    monkeypatch.setattr(
+        ansys.additive.core.additive.Additive, "_connect_to_server", Mock(side_effect=servers)
+    )
+    additive = Additive(server_connections=["host1:1", "host2:2"])
+    additive._simulate = Mock(side_effect=lambda *args: Mock(SimulationTask, done=False))
+    inputs = [SingleBeadInput(material=test_utils.get_test_material()) for _ in range(4)]
+
+    # act
+    additive.simulate_async(inputs)
+
+    # assert
+    used = [call[0][1] for call in additive._simulate.call_args_list]
+    assert used.count(servers[0]) == 1
+    assert used.count(servers[1]) == 3
+
+
 @patch("ansys.additive.core.additive.ServerConnection")
 def test_list_server_settings_returns_appropriate_responses(server):
     # arrange
@@ -313,6 +415,7 @@ def test_about_prints_server_status_messages():
     mockServer = Mock(ServerConnection)
     mockServer.status.return_value = f"server status"
     mock_additive._server = mockServer
+    mock_additive._servers = [mockServer]
 
     # act
     about = mock_additive.about(mock_additive)
@@ -460,12 +563,13 @@ def test_simulate_async_with_input_list_calls_internal_simulate_n_times(connecti
         _simulate_patch.return_value = sim_task
     additive = Additive(enable_beta_features=True)
     additive._simulate = _simulate_patch
+    material = test_utils.get_test_material()
     inputs = [
-        SingleBeadInput(),
-        PorosityInput(),
-        MicrostructureInput(),
-        ThermalHistoryInput(),
-        Microstructure3DInput(),
+        SingleBeadInput(material=material),
+        PorosityInput(material=material),
+        MicrostructureInput(material=material),
+        ThermalHistoryInput(material=material),
+        Microstructure3DInput(material=material),
     ]
 
     # act
@@ -478,12 +582,54 @@ def test_simulate_async_with_input_list_calls_internal_simulate_n_times(connecti
     _simulate_patch.assert_has_calls(calls, any_order=True)
 
 
+@patch("ansys.additive.core.additive.ServerConnection")
+def test_simulate_async_with_input_list_submits_in_parallel(_, caplog):
+    # arrange
+    additive = Additive()
+    barrier = threading.Barrier(2, timeout=5)
+
+    def simulate(sim_input, server, progress_handler):
+        # Blocks forever unless two submissions are in flight at the same time
+        barrier.wait()
+        return Mock(SimulationTask, simulation_id=sim_input.id)
+
+    additive._simulate = simulate
+    inputs = [SingleBeadInput(material=test_utils.get_test_material()) for _ in range(4)]
+    caplog.set_level(logging.INFO, "PyAdditive_global")
+
+    # act
+    task_manager = additive.simulate_async(inputs)
+
+    # assert
+    assert [t.simulation_id for t in task_manager.tasks] == [i.id for i in inputs]
+    assert "Submitted 4 simulations in" in caplog.text
+
+
+@patch("ansys.additive.core.additive.ServerConnection")
+def test_simulate_async_validates_all_inputs_before_submitting(_):
+    # arrange
+    additive = Additive()
+    additive._simulate = Mock()
+    inputs = [SingleBeadInput(material=test_utils.get_test_material()), SingleBeadInput()]
+
+    # act, assert
+    with pytest.raises(ValueError, match="A material is not assigned"):
+        additive.simulate_async(inputs)
+    additive._simulate.assert_not_called()
+
+
 @patch("ansys.additive.core.additive.ServerConnection")
 def test_simulate_study_async_performs_expected_steps(tmp_path: pathlib.Path):
     # arrange
     additive = Additive()
     additive.simulate_async = MagicMock(return_value=SimulationTaskManager())
-    material = AdditiveMaterial(name="material")
+    material = AdditiveMaterial(
+        name="material",
+        laser_shape_parameter=MaterialConstants.DEFAULT_LASER_SHAPE_PARAMETER,
+        laser_distribution_parameter=MaterialConstants.DEFAULT_LASER_DISTRIBUTION_PARAMETER,
+        fresnal_absorption_coefficient=MaterialConstants.DEFAULT_FRESNAL_ABSORPTION_COEFFICIENT,
+        absorption_in_conduction_mode=MaterialConstants.DEFAULT_ABSORPTION_CONDUCTION_MODE,
+    )
     additive.material = Mock(return_value=material)
     sb = SingleBeadInput(material=material)
     p = PorosityInput(material=material)
@@ -542,11 +688,9 @@ def test_simulate_study_performs_expected_steps(_, tmp_path: pathlib.Path):
     # arrange
     additive = Additive()
     mock_task_mgr = Mock(SimulationTaskManager)
-    mock_done = PropertyMock(side_effect=[False, True])
-    type(mock_task_mgr).done = mock_done
-    mock_summaries_list = [test_utils.get_test_SingleBeadSummary()]
-    mock_task_mgr.summaries.return_value = mock_summaries_list
-    mock_task_mgr.status = Mock(SimulationTaskManager.status)
+    summary1 = test_utils.get_test_SingleBeadSummary()
+    summary2 = test_utils.get_test_SingleBeadSummary()
+    mock_task_mgr.as_completed.return_value = iter([summary1, summary2])
     additive.simulate_study_async = MagicMock(return_value=mock_task_mgr)
     sb = SingleBeadInput()
     p = PorosityInput()
@@ -569,10 +713,11 @@ def test_simulate_study_performs_expected_steps(_, tmp_path: pathlib.Path):
     assert isinstance(
         additive.simulate_study_async.call_args[0][5], ParametricStudyProgressHandler
     )
-    mock_task_mgr.status.assert_called_once()
+    mock_task_mgr.as_completed.assert_called_once()
     assert isinstance(
-        mock_task_mgr.status.call_args[0][0], ParametricStudyProgressHandler
+        mock_task_mgr.as_completed.call_args[0][0], ParametricStudyProgressHandler
     )
+    assert study.update.call_args_list == [call([summary1]), call([summary2])]
 
 
 # patch needed for Additive() call
@@ -1101,6 +1246,112 @@ def test_remove_material_raises_ValueError_when_removing_reserved_material(
         additive.remove_material(material_name)
 
 
+@patch("ansys.additive.core.additive.ServerConnection")
+def test_material_returns_cached_copy_of_material(mock_connection):
+    # arrange
+    material = test_utils.get_test_material()
+    mock_connection_with_stub = Mock()
+    mock_connection_with_stub.materials_stub.GetMaterial.return_value = (
+        material._to_material_message()
+    )
+    mock_connection.return_value = mock_connection_with_stub
+    additive = Additive()
+    first = additive.material(material.name)
+    first.elastic_modulus = 1
+    first.thermal_properties_data[0].density = 1
+
+    # act
+    second = additive.material(material.name)
+
+    # assert
+    mock_connection_with_stub.materials_stub.GetMaterial.assert_called_once()
+    assert second is not first
+    assert second == material
+
+
+@patch("ansys.additive.core.additive.ServerConnection")
+def test_material_requests_material_every_time_when_cache_disabled(mock_connection):
+    # arrange
+    material = test_utils.get_test_material()
+    mock_connection_with_stub = Mock()
+    mock_connection_with_stub.materials_stub.GetMaterial.return_value = (
+        material._to_material_message()
+    )
+    mock_connection.return_value = mock_connection_with_stub
+    additive = Additive(material_cache_size=0)
+
+    # act
+    additive.material(material.name)
+    additive.material(material.name)
+
+    # assert
+    assert mock_connection_with_stub.materials_stub.GetMaterial.call_count == 2
+
+
+@patch("ansys.additive.core.additive.ServerConnection")
+def test_materials_list_returns_cached_copy_of_names(mock_connection):
+    # arrange
+    mock_connection_with_stub = Mock()
+    mock_connection_with_stub.materials_stub.GetMaterialsList.return_value = (
+        GetMaterialsListResponse(names=["material1", "material2"])
+    )
+    mock_connection.return_value = mock_connection_with_stub
+    additive = Additive()
+    additive.materials_list().append("material3")
+
+    # act
+    result = additive.materials_list()
+
+    # assert
+    assert result == ["material1", "material2"]
+    mock_connection_with_stub.materials_stub.GetMaterialsList.assert_called_once()
+
+
+def _add_test_material(additive: Additive):
+    additive.add_material(
+        test_utils.get_test_file_path(pathlib.Path("Material") / "material-data.json"),
+        test_utils.get_test_file_path(pathlib.Path("Material") / "Test_Lookup.csv"),
+        test_utils.get_test_file_path(pathlib.Path("Material") / "Test_CW_Lookup.csv"),
+    )
+
+
+@pytest.mark.parametrize(
+    "invalidate",
+    [
+        _add_test_material,
+        lambda additive: additive.remove_material("vibranium"),
+        lambda additive: additive.clear_material_cache(),
+    ],
+)
+@patch("ansys.additive.core.additive.ServerConnection")
+def test_material_cache_is_cleared(mock_connection, invalidate):
+    # arrange
+    material = test_utils.get_test_material()
+    mock_connection_with_stub = Mock()
+    mock_connection_with_stub.materials_stub.GetMaterial.return_value = (
+        material._to_material_message()
+    )
+    mock_connection_with_stub.materials_stub.GetMaterialsList.return_value = (
+        GetMaterialsListResponse(names=["vibranium"])
+    )
+    mock_connection_with_stub.materials_stub.AddMaterial.return_value = AddMaterialResponse(
+        id="id", material=AdditiveMaterial()._to_material_message()
+    )
+    mock_connection.return_value = mock_connection_with_stub
+    additive = Additive()
+    additive.material(material.name)
+    additive.materials_list()
+
+    # act
+    invalidate(additive)
+    additive.material(material.name)
+    additive.materials_list()
+
+    # assert
+    assert mock_connection_with_stub.materials_stub.GetMaterial.call_count == 2
+    assert mock_connection_with_stub.materials_stub.GetMaterialsList.call_count == 2
+
+
 @patch("ansys.additive.core.additive.ServerConnection")
 def test_tune_material_async_raises_exception_if_output_path_exists(
     _, tmp_path: pathlib.Path
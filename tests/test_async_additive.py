@@ -0,0 +1,336 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+import logging
+import pathlib
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+from google.longrunning.operations_pb2 import Operation
+
+from ansys.additive.core import (
+    AsyncAdditive,
+    PorosityInput,
+    SingleBeadInput,
+    SingleBeadSummary,
+    ThermalHistoryInput,
+)
+from ansys.additive.core.async_simulation_task import AsyncSimulationTask
+from ansys.additive.core.async_simulation_task_manager import AsyncSimulationTaskManager
+from ansys.additive.core.exceptions import BetaFeatureNotEnabledError
+from ansys.additive.core.material import AdditiveMaterial
+from ansys.additive.core.parametric_study.constants import ColumnNames
+from ansys.additive.core.parametric_study.parametric_study import ParametricStudy
+from ansys.additive.core.progress_handler import Progress, ProgressState
+from ansys.additive.core.simulation import SimulationStatus
+from ansys.additive.core.simulation_error import SimulationError
+from ansys.api.additive.v0.additive_materials_pb2 import GetMaterialsListResponse
+from ansys.api.additive.v0.additive_settings_pb2 import SettingsResponse
+
+from . import test_utils
+
+
+def _mock_async_server() -> Mock:
+    server = Mock()
+    server.ready = AsyncMock(return_value=True)
+    server.close = AsyncMock()
+    server.channel_str = "127.0.0.1:50052"
+    server.settings_stub.ApplySettings = AsyncMock(return_value=SettingsResponse())
+    server.materials_stub.GetMaterial = AsyncMock(
+        return_value=test_utils.get_test_material()._to_material_message()
+    )
+    server.materials_stub.GetMaterialsList = AsyncMock(
+        return_value=GetMaterialsListResponse(names=["a", "b"])
+    )
+    server.simulation_stub.Simulate = AsyncMock(side_effect=lambda r: Operation(name=r.id))
+    return server
+
+
+def _connected_client(server: Mock, **kwargs) -> AsyncAdditive:
+    additive = AsyncAdditive(**kwargs)
+    additive._server = server
+    return additive
+
+
+def test_init_raises_exception_for_sync_channel():
+    # act, assert
+    with pytest.raises(ValueError, match="grpc.aio.Channel"):
+        AsyncAdditive(channel=Mock())
+
+
+def test_init_uses_env_var_when_host_not_provided(monkeypatch):
+    # arrange
+    monkeypatch.setenv("ANSYS_ADDITIVE_ADDRESS", "1.2.3.4:5678")
+
+    # act
+    additive = AsyncAdditive()
+
+    # assert
+    assert additive._addr == "1.2.3.4:5678"
+    assert not additive.connected
+
+
+@patch("ansys.additive.core.async_additive.AsyncServerConnection")
+def test_context_manager_connects_applies_settings_and_closes(mock_connection):
+    # arrange
+    server = _mock_async_server()
+    mock_connection.return_value = server
+
+    async def run():
+        async with AsyncAdditive(host="localhost", nsims_per_server=3) as additive:
+            assert additive.connected
+        return additive
+
+    # act
+    additive = asyncio.run(run())
+
+    # assert
+    assert mock_connection.call_args.kwargs["addr"] == "localhost:50052"
+    server.ready.assert_awaited_once()
+    request = server.settings_stub.ApplySettings.await_args[0][0]
+    assert request.settings[0].key == "NumConcurrentSims"
+    assert request.settings[0].value == "3"
+    server.close.assert_awaited_once()
+    assert not additive.connected
+
+
+@patch("ansys.additive.core.async_additive.AsyncServerConnection")
+def test_connect_raises_exception_when_server_not_ready(mock_connection):
+    # arrange
+    server = _mock_async_server()
+    server.ready.return_value = False
+    mock_connection.return_value = server
+
+    # act, assert
+    with pytest.raises(RuntimeError, match="Unable to connect"):
+        asyncio.run(AsyncAdditive(host="localhost").connect())
+
+
+def test_materials_list_and_material_await_materials_service():
+    # arrange
+    server = _mock_async_server()
+    additive = _connected_client(server)
+
+    # act
+    names = asyncio.run(additive.materials_list())
+    material = asyncio.run(additive.material("name"))
+
+    # assert
+    assert list(names) == ["a", "b"]
+    assert material == test_utils.get_test_material()
+    assert server.materials_stub.GetMaterial.await_args[0][0].name == "name"
+
+
+def test_simulate_async_submits_each_input():
+    # arrange
+    server = _mock_async_server()
+    additive = _connected_client(server)
+    inputs = [
+        SingleBeadInput(material=test_utils.get_test_material()),
+        PorosityInput(material=test_utils.get_test_material()),
+    ]
+
+    # act
+    task_mgr = asyncio.run(additive.simulate_async(inputs))
+
+    # assert
+    assert isinstance(task_mgr, AsyncSimulationTaskManager)
+    assert server.simulation_stub.Simulate.await_count == 2
+    assert task_mgr.simulation_ids == [i.id for i in inputs]
+    assert all(isinstance(t, AsyncSimulationTask) for t in task_mgr.tasks)
+
+
+def test_simulate_async_returns_errored_task_when_submission_fails():
+    # arrange
+    server = _mock_async_server()
+    server.simulation_stub.Simulate.side_effect = Exception("submit failed")
+    additive = _connected_client(server)
+    sim_input = SingleBeadInput(material=test_utils.get_test_material())
+
+    # act
+    task_mgr = asyncio.run(additive.simulate_async(sim_input))
+
+    # assert
+    assert task_mgr.tasks[0].done
+    assert task_mgr.simulation_ids == [sim_input.id]
+
+
+@pytest.mark.parametrize(
+    "sim_input, exception",
+    [
+        (SingleBeadInput(), ValueError),
+        (ThermalHistoryInput(material=test_utils.get_test_material()), BetaFeatureNotEnabledError),
+    ],
+)
+def test_simulate_async_validates_inputs(sim_input, exception):
+    # arrange
+    additive = _connected_client(_mock_async_server())
+
+    # act, assert
+    with pytest.raises(exception):
+        asyncio.run(additive.simulate_async(sim_input))
+
+
+def test_simulate_async_validates_all_inputs_before_submitting():
+    # arrange
+    server = _mock_async_server()
+    additive = _connected_client(server)
+    inputs = [SingleBeadInput(material=test_utils.get_test_material()), SingleBeadInput()]
+
+    # act, assert
+    with pytest.raises(ValueError):
+        asyncio.run(additive.simulate_async(inputs))
+    server.simulation_stub.Simulate.assert_not_awaited()
+
+
+def test_simulate_async_with_empty_input_list_raises_exception():
+    # arrange
+    additive = _connected_client(_mock_async_server())
+
+    # act, assert
+    with pytest.raises(ValueError, match="No simulation inputs provided"):
+        asyncio.run(additive.simulate_async([]))
+
+
+def test_simulate_waits_and_returns_summaries(caplog):
+    # arrange
+    additive = _connected_client(_mock_async_server())
+    sim_input = SingleBeadInput(material=test_utils.get_test_material())
+    summary = SingleBeadSummary(sim_input, test_utils.get_test_melt_pool_message(), "logs")
+    error = SimulationError(sim_input, "error message", "logs")
+    task_mgr = Mock(AsyncSimulationTaskManager)
+    task_mgr.wait_all = AsyncMock()
+    task_mgr.summaries.side_effect = [[summary], [error]]
+    additive.simulate_async = AsyncMock(return_value=task_mgr)
+    caplog.set_level(logging.ERROR, "PyAdditive_global")
+
+    # act
+    single = asyncio.run(additive.simulate(sim_input))
+    many = asyncio.run(additive.simulate([sim_input]))
+
+    # assert
+    assert single is summary
+    assert many == [error]
+    assert task_mgr.wait_all.await_count == 2
+    assert "error message" in caplog.text
+
+
+def test_simulate_study_async_fetches_material_once(tmp_path: pathlib.Path):
+    # arrange
+    server = _mock_async_server()
+    additive = _connected_client(server)
+    additive.simulate_async = AsyncMock(return_value=AsyncSimulationTaskManager())
+    material = AdditiveMaterial(name="material")
+    inputs = [SingleBeadInput(material=material), PorosityInput(material=material)]
+    study = ParametricStudy(tmp_path / "test-study", "material")
+    study.add_inputs(inputs)
+
+    # act
+    asyncio.run(additive.simulate_study_async(study))
+
+    # assert
+    server.materials_stub.GetMaterial.assert_awaited_once()
+    submitted = additive.simulate_async.await_args[0][0]
+    assert len(submitted) == 2
+    assert submitted[0].material is not submitted[1].material
+    assert all(
+        s == SimulationStatus.PENDING for s in study.data_frame()[ColumnNames.STATUS].values
+    )
+
+
+def test_simulate_study_updates_study_as_tasks_complete(tmp_path: pathlib.Path):
+    # arrange
+    additive = _connected_client(_mock_async_server())
+    sim_input = SingleBeadInput(material=test_utils.get_test_material())
+    summary = test_utils.get_test_SingleBeadSummary(sim_input)
+    task = Mock(AsyncSimulationTask)
+    task.wait = AsyncMock()
+    task.done = False
+    task.summary = summary
+    task_mgr = AsyncSimulationTaskManager()
+    task_mgr.add_task(task)
+    additive.simulate_study_async = AsyncMock(return_value=task_mgr)
+    study = MagicMock(ParametricStudy)
+
+    # act
+    asyncio.run(additive.simulate_study(study))
+
+    # assert
+    task.wait.assert_awaited_once()
+    study.batch.assert_called_once()
+    study.update.assert_called_once_with([summary])
+    study.save.assert_called_once_with(study.file_name)
+
+
+def test_simulate_study_records_all_results_of_tasks_completing_together(
+    tmp_path: pathlib.Path,
+):
+    # arrange
+    additive = _connected_client(_mock_async_server())
+    material = test_utils.get_test_material()
+    inputs = [SingleBeadInput(bead_length=0.001 + i * 1e-5, material=material) for i in range(40)]
+    study = ParametricStudy(tmp_path / "test-study", material.name)
+    study.add_inputs(inputs)
+    task_mgr = AsyncSimulationTaskManager()
+    for sim_input in inputs:
+        task = Mock(AsyncSimulationTask)
+        task.done = False
+        task.summary = test_utils.get_test_SingleBeadSummary(sim_input)
+
+        async def wait(progress_handler=None, task=task, sim_id=sim_input.id, **kwargs):
+            await asyncio.sleep(0)
+            task.done = True
+            progress_handler.update(
+                Progress(
+                    sim_id=sim_id,
+                    state=ProgressState.COMPLETED,
+                    percent_complete=100,
+                    message="",
+                    context="",
+                )
+            )
+
+        task.wait = wait
+        task_mgr.add_task(task)
+    additive.simulate_study_async = AsyncMock(return_value=task_mgr)
+
+    # act
+    asyncio.run(additive.simulate_study(study))
+
+    # assert
+    for df in [study.data_frame(), ParametricStudy.load(study.file_name).data_frame()]:
+        assert len(df) == 40
+        assert all(s == SimulationStatus.COMPLETED for s in df[ColumnNames.STATUS].values)
+        assert all(df[ColumnNames.MELT_POOL_LENGTH].notna())
+
+
+def test_simulate_study_resets_status_on_error(tmp_path: pathlib.Path):
+    # arrange
+    additive = _connected_client(_mock_async_server())
+    additive.simulate_study_async = AsyncMock(side_effect=Exception("boom"))
+    study = Mock(ParametricStudy)
+
+    # act, assert
+    with pytest.raises(RuntimeError):
+        asyncio.run(additive.simulate_study(study))
+    study.reset_simulation_status.assert_called_once()
@@ -0,0 +1,314 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+import pathlib
+from unittest.mock import AsyncMock, Mock, PropertyMock, patch
+
+import grpc
+from google.longrunning.operations_pb2 import ListOperationsResponse, Operation
+
+from ansys.additive.core import (
+    SingleBeadInput,
+    SingleBeadSummary,
+    StlFile,
+    ThermalHistoryInput,
+    ThermalHistorySummary,
+)
+from ansys.additive.core.async_simulation_task import AsyncSimulationTask
+from ansys.additive.core.async_simulation_task_manager import AsyncSimulationTaskManager
+from ansys.additive.core.progress_handler import Progress, ProgressState
+from ansys.api.additive.v0.additive_domain_pb2 import ProgressState as ProgressMsgState
+from ansys.api.additive.v0.additive_domain_pb2 import ThermalHistoryResult
+from ansys.api.additive.v0.additive_operations_pb2 import OperationMetadata
+from ansys.api.additive.v0.additive_simulation_pb2 import SimulationResponse
+
+from . import test_utils
+
+
+def _operation(sim_id: str, done: bool, response: SimulationResponse = None) -> Operation:
+    operation = Operation(name=sim_id, done=done)
+    operation.metadata.Pack(
+        OperationMetadata(
+            simulation_id=sim_id,
+            percent_complete=100.0 if done else 50.0,
+            state=(
+                ProgressMsgState.PROGRESS_STATE_COMPLETED
+                if done
+                else ProgressMsgState.PROGRESS_STATE_EXECUTING
+            ),
+        )
+    )
+    if response:
+        operation.response.Pack(response)
+    return operation
+
+
+def _mock_async_server() -> Mock:
+    server = Mock()
+    server.operations_stub.GetOperation = AsyncMock()
+    server.operations_stub.WaitOperation = AsyncMock()
+    server.operations_stub.CancelOperation = AsyncMock()
+    return server
+
+
+def test_status_awaits_get_operation_and_returns_progress(tmp_path: pathlib.Path):
+    # arrange
+    sim_input = SingleBeadInput()
+    server = _mock_async_server()
+    server.operations_stub.GetOperation.return_value = _operation(sim_input.id, False)
+    task = AsyncSimulationTask(server, Operation(name=sim_input.id), sim_input, tmp_path)
+
+    # act
+    progress = asyncio.run(task.status())
+
+    # assert
+    server.operations_stub.GetOperation.assert_awaited_once()
+    assert progress.sim_id == sim_input.id
+    assert progress.state == ProgressState.RUNNING
+    assert not task.done
+
+
+def test_wait_loops_until_done_and_creates_summary(tmp_path: pathlib.Path):
+    # arrange
+    sim_input = SingleBeadInput()
+    response = SimulationResponse(
+        id=sim_input.id, melt_pool=test_utils.get_test_melt_pool_message()
+    )
+    server = _mock_async_server()
+    server.operations_stub.WaitOperation.side_effect = [
+        _operation(sim_input.id, False),
+        _operation(sim_input.id, True, response),
+    ]
+    server.operations_stub.GetOperation.return_value = _operation(sim_input.id, True, response)
+    handler = Mock()
+    task = AsyncSimulationTask(server, Operation(name=sim_input.id), sim_input, tmp_path)
+
+    # act
+    asyncio.run(task.wait(progress_update_interval=1, progress_handler=handler))
+
+    # assert
+    assert server.operations_stub.WaitOperation.await_count == 2
+    assert handler.update.call_count == 3
+    assert task.done
+    assert isinstance(task.summary, SingleBeadSummary)
+
+
+def test_cancel_awaits_cancel_operation(tmp_path: pathlib.Path):
+    # arrange
+    server = _mock_async_server()
+    task = AsyncSimulationTask(server, Operation(name="op1"), SingleBeadInput(), tmp_path)
+
+    # act
+    asyncio.run(task.cancel())
+
+    # assert
+    request = server.operations_stub.CancelOperation.await_args[0][0]
+    assert request.name == "op1"
+
+
+@patch("ansys.additive.core.async_simulation_task.download_files_async")
+def test_status_downloads_result_files_before_creating_summary(
+    mock_download, tmp_path: pathlib.Path
+):
+    # arrange
+    sim_input = ThermalHistoryInput(
+        geometry=StlFile(test_utils.get_test_file_path("5x5x1_0x_0y_0z.stl"))
+    )
+    results_folder = tmp_path / "results"
+    results_folder.mkdir()
+    mock_download.return_value = {"remote.zip": str(results_folder)}
+    response = SimulationResponse(
+        id=sim_input.id,
+        thermal_history_result=ThermalHistoryResult(coax_ave_zip_file="remote.zip"),
+    )
+    server = _mock_async_server()
+    server.operations_stub.GetOperation.return_value = _operation(sim_input.id, True, response)
+    task = AsyncSimulationTask(server, Operation(name=sim_input.id), sim_input, tmp_path)
+
+    # act
+    asyncio.run(task.status())
+
+    # assert
+    mock_download.assert_awaited_once_with(
+        server.simulation_stub,
+        {"remote.zip": str(tmp_path / sim_input.id / "coax_ave_output")},
+        extract=True,
+        members=None,
+    )
+    assert isinstance(task.summary, ThermalHistorySummary)
+    assert task.summary.coax_ave_output_folder == str(results_folder)
+
+
+def _mock_async_task(sim_id: str) -> Mock:
+    task = Mock(AsyncSimulationTask)
+    type(task).done = PropertyMock(return_value=False)
+    type(task).simulation_id = PropertyMock(return_value=sim_id)
+    task.status = AsyncMock(
+        return_value=Progress(
+            sim_id=sim_id,
+            state=ProgressState.COMPLETED,
+            percent_complete=100,
+            message="",
+            context="",
+        )
+    )
+    task.wait = AsyncMock()
+    task.cancel = AsyncMock()
+    task._server = Mock()
+    task._server.operations_stub.ListOperations = AsyncMock(
+        side_effect=grpc.RpcError("unimplemented")
+    )
+    task._long_running_op = Operation(name=sim_id)
+    return task
+
+
+def test_task_manager_status_gathers_each_task_status():
+    # arrange
+    task_mgr = AsyncSimulationTaskManager()
+    task_mgr.add_task(_mock_async_task("id1"))
+    task_mgr.add_task(_mock_async_task("id2"))
+    handler = Mock()
+
+    # act
+    result = asyncio.run(task_mgr.status(handler))
+
+    # assert
+    assert [sim_id for sim_id, _ in result] == ["id1", "id2"]
+    assert handler.update.call_count == 2
+
+
+def test_task_manager_status_does_not_list_operations_again_after_server_rejects_it():
+    # arrange
+    task = _mock_async_task("id1")
+    task_mgr = AsyncSimulationTaskManager()
+    task_mgr.add_task(task)
+
+    # act
+    asyncio.run(task_mgr.status())
+    asyncio.run(task_mgr.status())
+
+    # assert
+    task._server.operations_stub.ListOperations.assert_awaited_once()
+    assert task.status.await_count == 2
+
+
+def test_task_manager_status_lists_operations_of_pending_tasks():
+    # arrange
+    task1 = _mock_async_task("id1")
+    task2 = _mock_async_task("id2")
+    server = task1._server
+    server.operations_stub.ListOperations = AsyncMock(
+        return_value=ListOperationsResponse(operations=[Operation(name="id1", done=True)])
+    )
+    task2._server = server
+    task1._update_operation_status_async = AsyncMock(
+        return_value=Progress(
+            sim_id="id1",
+            state=ProgressState.COMPLETED,
+            percent_complete=100,
+            message="listed",
+            context="",
+        )
+    )
+    task_mgr = AsyncSimulationTaskManager()
+    task_mgr.add_task(task1)
+    task_mgr.add_task(task2)
+
+    # act
+    result = asyncio.run(task_mgr.status())
+
+    # assert
+    assert [(sim_id, p.message) for sim_id, p in result] == [("id1", "listed"), ("id2", "")]
+    server.operations_stub.ListOperations.assert_awaited_once()
+    task1._update_operation_status_async.assert_awaited_once_with(Operation(name="id1", done=True))
+    task1.status.assert_not_awaited()
+    task2.status.assert_awaited_once()
+
+
+def test_task_manager_wait_all_and_cancel_all_await_each_task():
+    # arrange
+    task1 = _mock_async_task("id1")
+    task2 = _mock_async_task("id2")
+    task_mgr = AsyncSimulationTaskManager()
+    task_mgr.add_task(task1)
+    task_mgr.add_task(task2)
+
+    # act
+    asyncio.run(task_mgr.wait_all(progress_update_interval=2))
+    asyncio.run(task_mgr.cancel_all())
+
+    # assert
+    for task in (task1, task2):
+        task.wait.assert_awaited_once_with(progress_update_interval=2, progress_handler=None)
+        task.cancel.assert_awaited_once()
+    assert task_mgr.tasks == [task1, task2]
+
+
+def test_task_manager_as_completed_yields_summaries_in_completion_order():
+    # arrange
+    task1 = _mock_async_task("id1")
+    task2 = _mock_async_task("id2")
+    task1.summary = "summary1"
+    task2.summary = "summary2"
+    task1_release = None
+
+    async def wait_for_release(**kwargs):
+        await task1_release.wait()
+
+    async def release(**kwargs):
+        task1_release.set()
+
+    task1.wait.side_effect = wait_for_release
+    task2.wait.side_effect = release
+    task_mgr = AsyncSimulationTaskManager()
+    task_mgr.add_task(task1)
+    task_mgr.add_task(task2)
+
+    async def collect():
+        nonlocal task1_release
+        task1_release = asyncio.Event()
+        return [s async for s in task_mgr.as_completed()]
+
+    # act
+    summaries = asyncio.run(collect())
+
+    # assert
+    assert summaries == ["summary2", "summary1"]
+
+
+def test_task_manager_cancel_returns_result_of_each_selected_task():
+    # arrange
+    task1 = _mock_async_task("id1")
+    task1.cancel.side_effect = RuntimeError("no connection")
+    task2 = _mock_async_task("id2")
+    task3 = _mock_async_task("id3")
+    task_mgr = AsyncSimulationTaskManager()
+    for t in [task1, task2, task3]:
+        task_mgr.add_task(t)
+
+    # act
+    result = asyncio.run(task_mgr.cancel(simulation_ids=["id1", "id2"]))
+
+    # assert
+    assert result == {"id1": False, "id2": True}
+    task3.cancel.assert_not_awaited()
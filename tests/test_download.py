@@ -20,14 +20,25 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import asyncio
 import hashlib
+import io
 import os
 import tempfile
+import zipfile
 from unittest.mock import Mock
 
+import grpc
 import pytest
 
-from ansys.additive.core.download import download_file
+from ansys.additive.core.download import (
+    download_file,
+    download_file_async,
+    download_files,
+    download_files_async,
+    extract_download_file_response,
+    handle_download_file_response,
+)
 from ansys.api.additive.v0.additive_domain_pb2 import (
     DownloadFileResponse,
     Progress,
@@ -36,6 +47,8 @@ from ansys.api.additive.v0.additive_domain_pb2 import (
 from ansys.api.additive.v0.additive_simulation_pb2 import DownloadFileRequest
 from ansys.api.additive.v0.additive_simulation_pb2_grpc import SimulationServiceStub
 
+from . import test_utils
+
 
 def test_download_file_calls_service_with_expected_params():
     # arrange
@@ -99,7 +112,312 @@ def test_download_raises_exception_if_md5_check_fails():
 
     # act
     with pytest.raises(ValueError, match="Download error, MD5 sums did not match"):
-        local_file = download_file(mock_stub, remote_file_name, tmp_dir)
+        local_file = download_file(mock_stub, remote_file_name, tmp_dir, retries=1)
 
     # assert
-    mock_stub.DownloadFile.assert_called_once_with(expected_request)
+    assert mock_stub.DownloadFile.call_count == 2
+    mock_stub.DownloadFile.assert_called_with(expected_request)
+    assert os.listdir(tmp_dir) == []
+
+
+def test_download_file_async_writes_streamed_content(tmp_path):
+    # arrange
+    remote_file_name = os.path.join("remote", "myfile.txt")
+    content = bytes(range(255))
+
+    async def mock_download_endpoint(request: DownloadFileRequest):
+        for chunk in (content[:100], content[100:]):
+            yield DownloadFileResponse(
+                file_name="ignored",
+                total_size=len(content),
+                content=chunk,
+                content_md5=hashlib.md5(chunk).hexdigest(),
+            )
+
+    mock_stub = Mock(SimulationServiceStub)
+    mock_stub.DownloadFile = Mock(side_effect=mock_download_endpoint)
+
+    # act
+    local_file = asyncio.run(download_file_async(mock_stub, remote_file_name, str(tmp_path)))
+
+    # assert
+    mock_stub.DownloadFile.assert_called_once_with(
+        DownloadFileRequest(remote_file_name=remote_file_name)
+    )
+    assert local_file == os.path.join(str(tmp_path), "myfile.txt")
+    with open(local_file, "rb") as f:
+        assert f.read() == content
+
+
+class _StreamInterrupted(grpc.RpcError):
+    pass
+
+
+def _download_responses(content: bytes, chunk_size: int, fail_after: int | None = None):
+    for n, start in enumerate(range(0, len(content), chunk_size)):
+        if n == fail_after:
+            raise _StreamInterrupted("stream interrupted")
+        chunk = content[start : start + chunk_size]
+        yield DownloadFileResponse(
+            file_name="ignored",
+            total_size=len(content),
+            content=chunk,
+            content_md5=hashlib.md5(chunk).hexdigest(),
+        )
+
+
+def test_download_file_retries_interrupted_download(tmp_path):
+    # arrange
+    content = bytes(range(255)) * 4
+    mock_stub = Mock(SimulationServiceStub)
+    mock_stub.DownloadFile = Mock(
+        side_effect=[
+            _download_responses(content, 100, fail_after=3),
+            _download_responses(content, 100),
+        ]
+    )
+
+    # act
+    local_file = download_file(mock_stub, "myfile.txt", str(tmp_path))
+
+    # assert
+    assert mock_stub.DownloadFile.call_count == 2
+    with open(local_file, "rb") as f:
+        assert f.read() == content
+
+
+def test_download_file_raises_exception_after_retries(tmp_path):
+    # arrange
+    content = bytes(range(255))
+    mock_stub = Mock(SimulationServiceStub)
+    mock_stub.DownloadFile = Mock(
+        side_effect=lambda _: _download_responses(content, 100, fail_after=1)
+    )
+
+    # act, assert
+    with pytest.raises(grpc.RpcError):
+        download_file(mock_stub, "myfile.txt", str(tmp_path), retries=2)
+    assert mock_stub.DownloadFile.call_count == 3
+    assert os.listdir(tmp_path) == []
+
+
+def test_download_file_keeps_existing_file_when_download_fails(tmp_path):
+    # arrange
+    (tmp_path / "myfile.txt").write_bytes(b"previous")
+    mock_stub = Mock(SimulationServiceStub)
+    mock_stub.DownloadFile = Mock(
+        side_effect=lambda _: _download_responses(bytes(range(255)), 100, fail_after=1)
+    )
+
+    # act, assert
+    with pytest.raises(grpc.RpcError):
+        download_file(mock_stub, "myfile.txt", str(tmp_path), retries=0)
+    assert os.listdir(tmp_path) == ["myfile.txt"]
+    assert (tmp_path / "myfile.txt").read_bytes() == b"previous"
+
+
+def test_download_file_retries_download_with_wrong_size(tmp_path):
+    # arrange
+    content = bytes(range(255))
+    truncated = [next(_download_responses(content, 100))]
+    mock_stub = Mock(SimulationServiceStub)
+    mock_stub.DownloadFile = Mock(side_effect=[truncated, _download_responses(content, 100)])
+
+    # act
+    local_file = download_file(mock_stub, "myfile.txt", str(tmp_path))
+
+    # assert
+    assert mock_stub.DownloadFile.call_count == 2
+    assert os.listdir(tmp_path) == ["myfile.txt"]
+    with open(local_file, "rb") as f:
+        assert f.read() == content
+
+
+def test_download_file_removes_extracted_files_when_extraction_fails(tmp_path):
+    # arrange
+    with open(test_utils.get_test_file_path("gridfullthermal.zip"), "rb") as f:
+        content = f.read()
+    mock_stub = Mock(SimulationServiceStub)
+    mock_stub.DownloadFile = Mock(
+        side_effect=lambda _: _download_responses(content, 4096, fail_after=5)
+    )
+
+    # act, assert
+    with pytest.raises(grpc.RpcError):
+        download_file(mock_stub, "results.zip", str(tmp_path), retries=0, extract=True)
+    assert os.listdir(tmp_path) == []
+
+
+def test_download_files_downloads_each_file(tmp_path):
+    # arrange
+    contents = {f"remote/file{i}.txt": bytes([i]) * 100 for i in range(3)}
+    mock_stub = Mock(SimulationServiceStub)
+    mock_stub.DownloadFile = Mock(
+        side_effect=lambda request: _download_responses(contents[request.remote_file_name], 10)
+    )
+    files = {name: str(tmp_path / f"folder{i}") for i, name in enumerate(contents)}
+
+    # act
+    local_files = download_files(mock_stub, files)
+
+    # assert
+    assert list(local_files) == list(files)
+    for name, local_file in local_files.items():
+        assert local_file == os.path.join(files[name], os.path.basename(name))
+        with open(local_file, "rb") as f:
+            assert f.read() == contents[name]
+
+
+def test_download_files_async_downloads_each_file(tmp_path):
+    # arrange
+    contents = {f"remote/file{i}.txt": bytes([i]) * 100 for i in range(3)}
+
+    async def mock_download_endpoint(request: DownloadFileRequest):
+        for response in _download_responses(contents[request.remote_file_name], 10):
+            yield response
+
+    mock_stub = Mock(SimulationServiceStub)
+    mock_stub.DownloadFile = Mock(side_effect=mock_download_endpoint)
+    files = {name: str(tmp_path) for name in contents}
+
+    # act
+    local_files = asyncio.run(download_files_async(mock_stub, files, max_workers=2))
+
+    # assert
+    for name, local_file in local_files.items():
+        with open(local_file, "rb") as f:
+            assert f.read() == contents[name]
+
+
+@pytest.mark.parametrize("chunk_size", [7, 1000, 2 * 1024**2])
+def test_extract_download_file_response_extracts_archive_while_streaming(chunk_size, tmp_path):
+    # arrange
+    zip_file = test_utils.get_test_file_path("thermal_history_results.zip")
+    with open(zip_file, "rb") as f:
+        content = f.read()
+
+    # act
+    extracted = extract_download_file_response(
+        str(tmp_path), _download_responses(content, chunk_size)
+    )
+
+    # assert
+    with zipfile.ZipFile(zip_file) as zip_ref:
+        names = zip_ref.namelist()
+        assert extracted == [str(tmp_path / name) for name in names]
+        for name in names:
+            with open(tmp_path / name, "rb") as f:
+                assert f.read() == zip_ref.read(name)
+    assert sorted(os.listdir(tmp_path)) == sorted(names)
+
+
+def test_extract_download_file_response_extracts_selected_members(tmp_path):
+    # arrange
+    zip_file = test_utils.get_test_file_path("gridfullthermal.zip")
+    with open(zip_file, "rb") as f:
+        content = f.read()
+    with zipfile.ZipFile(zip_file) as zip_ref:
+        members = zip_ref.namelist()[1:3]
+
+    # act
+    extract_download_file_response(str(tmp_path), _download_responses(content, 4096), members)
+
+    # assert
+    assert sorted(os.listdir(tmp_path)) == sorted(members)
+
+
+def test_extract_download_file_response_handles_data_descriptors(tmp_path):
+    # arrange
+    class UnseekableStream(io.RawIOBase):
+        def __init__(self):
+            self.content = bytearray()
+
+        def writable(self):
+            return True
+
+        def write(self, b):
+            self.content += b
+            return len(b)
+
+    stream = UnseekableStream()
+    with zipfile.ZipFile(stream, "w", zipfile.ZIP_DEFLATED) as zip_ref:
+        zip_ref.writestr(os.path.join("folder", "a.txt"), b"a" * 1000)
+        with zip_ref.open("b.bin", "w", force_zip64=True) as f:
+            f.write(bytes(range(256)) * 10)
+
+    # act
+    extract_download_file_response(str(tmp_path), _download_responses(bytes(stream.content), 50))
+
+    # assert
+    with open(tmp_path / "folder" / "a.txt", "rb") as f:
+        assert f.read() == b"a" * 1000
+    with open(tmp_path / "b.bin", "rb") as f:
+        assert f.read() == bytes(range(256)) * 10
+
+
+@pytest.mark.parametrize("members", [None, ["a.txt", "c.txt"]])
+def test_extract_download_file_response_spools_stored_members_with_data_descriptors(
+    members, tmp_path
+):
+    # arrange
+    class UnseekableStream(io.RawIOBase):
+        def __init__(self):
+            self.content = bytearray()
+
+        def writable(self):
+            return True
+
+        def write(self, b):
+            self.content += b
+            return len(b)
+
+    stream = UnseekableStream()
+    with zipfile.ZipFile(stream, "w") as zip_ref:
+        zip_ref.writestr("a.txt", b"a" * 1000, zipfile.ZIP_DEFLATED)
+        zip_ref.writestr("b.bin", bytes(range(256)) * 10, zipfile.ZIP_STORED)
+        zip_ref.writestr("c.txt", b"c" * 1000, zipfile.ZIP_DEFLATED)
+
+    # act
+    extracted = extract_download_file_response(
+        str(tmp_path), _download_responses(bytes(stream.content), 50), members
+    )
+
+    # assert
+    expected = members or ["a.txt", "b.bin", "c.txt"]
+    assert extracted == [str(tmp_path / name) for name in expected]
+    assert sorted(os.listdir(tmp_path)) == expected
+    with open(tmp_path / "a.txt", "rb") as f:
+        assert f.read() == b"a" * 1000
+    with open(tmp_path / "c.txt", "rb") as f:
+        assert f.read() == b"c" * 1000
+    if members is None:
+        with open(tmp_path / "b.bin", "rb") as f:
+            assert f.read() == bytes(range(256)) * 10
+
+
+def test_extract_download_file_response_raises_exception_if_archive_is_incomplete(tmp_path):
+    # arrange
+    with open(test_utils.get_test_file_path("thermal_history_results.zip"), "rb") as f:
+        content = f.read()[:1000]
+
+    # act, assert
+    with pytest.raises(ValueError, match="zip archive is incomplete"):
+        extract_download_file_response(str(tmp_path), _download_responses(content, 100))
+
+
+def test_download_file_extracts_archive_without_writing_it(tmp_path):
+    # arrange
+    zip_file = test_utils.get_test_file_path("thermal_history_results.zip")
+    with open(zip_file, "rb") as f:
+        content = f.read()
+    mock_stub = Mock(SimulationServiceStub)
+    mock_stub.DownloadFile = Mock(side_effect=lambda _: _download_responses(content, 1000))
+
+    # act
+    local_folder = download_file(mock_stub, "remote/results.zip", str(tmp_path), extract=True)
+
+    # assert
+    assert local_folder == str(tmp_path)
+    assert not os.path.exists(tmp_path / "results.zip")
+    with zipfile.ZipFile(zip_file) as zip_ref:
+        assert sorted(os.listdir(tmp_path)) == sorted(zip_ref.namelist())
@@ -334,6 +334,47 @@ def test_AdditiveMaterial_eq():
     assert material != not_material
 
 
+def test_AdditiveMaterial_hash_matches_equal_materials():
+    # arrange
+    material = test_utils.get_test_material()
+    same = test_utils.get_test_material()
+    different = test_utils.get_test_material()
+    different.thermal_properties_data[-1].density += 1
+
+    # act, assert
+    assert hash(material) == hash(same)
+    assert material == same
+    assert material != different
+    assert len({material, same, different}) == 2
+
+
+def test_AdditiveMaterial_hash_changes_when_material_changes():
+    # arrange
+    material = test_utils.get_test_material()
+    original_hash = hash(material)
+
+    # act
+    material.elastic_modulus += 1
+
+    # assert
+    assert hash(material) != original_hash
+    assert material != test_utils.get_test_material()
+
+
+def test_is_default_returns_true_only_for_unassigned_material():
+    # arrange
+    with_data = AdditiveMaterial(
+        characteristic_width_data=[CharacteristicWidthDataPoint()],
+    )
+    with_parameter = AdditiveMaterial(name="name")
+
+    # act, assert
+    assert AdditiveMaterial()._is_default()
+    assert not with_data._is_default()
+    assert not with_parameter._is_default()
+    assert not test_utils.get_test_material()._is_default()
+
+
 def test_characteristic_width_data_setter_raises_exception_for_nonsequence_type():
     # arrange
     material = AdditiveMaterial()
@@ -795,4 +836,142 @@ def test_AdditiveMaterial_throws_exception_when_setting_invalid_absorption_in_co
         material.absorption_in_conduction_mode = -0.1
 
     with pytest.raises(ValueError, match="absorption_in_conduction_mode must be between"):
-        material.absorption_in_conduction_mode = 1.1
\ No newline at end of file
+        material.absorption_in_conduction_mode = 1.1
+
+
+def test_copy_on_write_copy_equals_material_and_shares_data_tables():
+    # arrange
+    material = test_utils.get_test_material()
+
+    # act
+    copy = material._copy_on_write()
+
+    # assert
+    assert copy is not material
+    assert copy == material
+    assert copy._thermal_properties_data is material._thermal_properties_data
+    assert copy._to_material_message() == material._to_material_message()
+
+
+def test_copy_on_write_copy_changes_do_not_change_material():
+    # arrange
+    material = test_utils.get_test_material()
+    expected = test_utils.get_test_material()
+    copy = material._copy_on_write()
+
+    # act
+    copy.elastic_modulus = 1
+    copy.thermal_properties_data[0].density = 1
+    copy.characteristic_width_data.append(CharacteristicWidthDataPoint())
+
+    # assert
+    assert material == expected
+    assert copy != material
+    assert isinstance(copy.thermal_properties_data, list)
+    assert copy.thermal_properties_data[0].density == 1
+
+
+def test_to_material_message_returns_memoized_message():
+    # arrange
+    material = test_utils.get_test_material()
+
+    # act
+    msg = material._to_material_message()
+
+    # assert
+    assert material._to_material_message() is msg
+    assert material._copy_on_write()._to_material_message() is msg
+    assert AdditiveMaterial._from_material_message(msg) == material
+
+
+def test_to_material_message_reflects_setter_changes():
+    # arrange
+    material = test_utils.get_test_material()
+    msg = material._to_material_message()
+
+    # act
+    material.elastic_modulus = 123
+
+    # assert
+    updated = material._to_material_message()
+    assert updated is not msg
+    assert updated.elastic_modulus == 123
+    assert msg.elastic_modulus != 123
+
+
+def test_to_material_message_reflects_data_table_changes():
+    # arrange
+    material = test_utils.get_test_material()
+    msg = material._to_material_message()
+
+    # act
+    material.thermal_properties_data[0].density = 123
+    material.characteristic_width_data.append(CharacteristicWidthDataPoint())
+
+    # assert
+    updated = material._to_material_message()
+    assert updated.thermal_properties_data_points[0].density == 123
+    assert len(updated.characteristic_width_data_points) == (
+        len(msg.characteristic_width_data_points) + 1
+    )
+    assert msg.thermal_properties_data_points[0].density != 123
+
+
+def test_to_material_message_reflects_changes_to_held_data_points():
+    # arrange
+    material = test_utils.get_test_material()
+    point = material.thermal_properties_data[0]
+    width = material.characteristic_width_data[0]
+    msg = material._to_material_message()
+    digest = material._content_digest()
+    other = test_utils.get_test_material()
+
+    # act
+    point.density = 123
+    width.characteristic_width = 0.5
+
+    # assert
+    updated = material._to_material_message()
+    assert updated is not msg
+    assert updated.thermal_properties_data_points[0].density == 123
+    assert updated.characteristic_width_data_points[0].characteristic_width == 0.5
+    assert material._content_digest() != digest
+    assert material != other
+    assert hash(material) != hash(other)
+
+
+def test_to_material_message_reflects_changes_to_data_tables_held_before_memoization():
+    # arrange
+    material = test_utils.get_test_material()
+    thermal_properties = material.thermal_properties_data
+    widths = material.characteristic_width_data
+    msg = material._to_material_message()
+
+    # act
+    thermal_properties.append(ThermalPropertiesDataPoint(density=123))
+    del widths[0]
+
+    # assert
+    assert material.thermal_properties_data is thermal_properties
+    updated = material._to_material_message()
+    assert updated.thermal_properties_data_points[-1].density == 123
+    assert (
+        len(updated.thermal_properties_data_points) == len(msg.thermal_properties_data_points) + 1
+    )
+    assert len(updated.characteristic_width_data_points) == (
+        len(msg.characteristic_width_data_points) - 1
+    )
+
+
+def test_AdditiveMaterial_eq_and_repr_ignore_memoized_message():
+    # arrange
+    material = test_utils.get_test_material()
+    other = test_utils.get_test_material()
+
+    # act
+    material._to_material_message()
+
+    # assert
+    assert material == other
+    assert other == material
+    assert repr(material) == repr(other)
@@ -0,0 +1,149 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+
+from ansys.additive.core.material_cache import MaterialCache
+from tests import test_utils
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_init_raises_exception_for_invalid_arguments():
+    # act, assert
+    with pytest.raises(ValueError, match="max_size must not be negative"):
+        MaterialCache(max_size=-1)
+    with pytest.raises(ValueError, match="ttl must be greater than zero"):
+        MaterialCache(ttl=0)
+
+
+def test_material_returns_None_for_unknown_material():
+    # arrange
+    cache = MaterialCache()
+
+    # act, assert
+    assert cache.material("unknown") is None
+
+
+def test_material_returns_copy_of_added_material():
+    # arrange
+    cache = MaterialCache()
+    material = test_utils.get_test_material()
+    expected = test_utils.get_test_material()
+    added = cache.add_material("name", material)
+    added.thermal_properties_data[0].density = 1
+
+    # act
+    result = cache.material("name")
+    result.elastic_modulus = 1
+
+    # assert
+    assert added is not material
+    assert result is not material
+    assert material == expected
+    assert cache.material("name") == expected
+
+
+def test_add_material_removes_least_recently_used_material():
+    # arrange
+    cache = MaterialCache(max_size=2)
+    cache.add_material("a", test_utils.get_test_material())
+    cache.add_material("b", test_utils.get_test_material())
+    cache.material("a")
+
+    # act
+    cache.add_material("c", test_utils.get_test_material())
+
+    # assert
+    assert len(cache) == 2
+    assert cache.material("a") is not None
+    assert cache.material("b") is None
+    assert cache.material("c") is not None
+
+
+def test_add_material_does_not_cache_when_max_size_is_zero():
+    # arrange
+    cache = MaterialCache(max_size=0)
+    material = test_utils.get_test_material()
+
+    # act
+    result = cache.add_material("name", material)
+    cache.set_names(["name"])
+
+    # assert
+    assert result is material
+    assert cache.material("name") is None
+    assert cache.names() is None
+
+
+def test_entries_expire_after_ttl():
+    # arrange
+    clock = FakeClock()
+    cache = MaterialCache(ttl=10, clock=clock)
+    cache.add_material("name", test_utils.get_test_material())
+    cache.set_names(["name"])
+
+    # act
+    clock.now = 9.9
+    before = (cache.material("name"), cache.names())
+    clock.now = 10
+    after = (cache.material("name"), cache.names())
+
+    # assert
+    assert before[0] is not None
+    assert before[1] == ["name"]
+    assert after == (None, None)
+    assert len(cache) == 0
+
+
+def test_names_returns_copy_of_names():
+    # arrange
+    cache = MaterialCache()
+    names = ["a", "b"]
+    cache.set_names(names)
+    names.append("c")
+
+    # act
+    cache.names().append("d")
+
+    # assert
+    assert cache.names() == ["a", "b"]
+
+
+def test_clear_removes_materials_and_names():
+    # arrange
+    cache = MaterialCache()
+    cache.add_material("name", test_utils.get_test_material())
+    cache.set_names(["name"])
+
+    # act
+    cache.clear()
+
+    # assert
+    assert cache.material("name") is None
+    assert cache.names() is None
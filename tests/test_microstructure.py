@@ -22,6 +22,7 @@
 
 import math
 import os
+import pickle
 import shutil
 import tempfile
 
@@ -32,6 +33,7 @@ from ansys.additive.core.material import AdditiveMaterial
 from ansys.additive.core.microstructure import (
     MicrostructureInput,
     MicrostructureSummary,
+    _DeferredFile,
 )
 from ansys.api.additive.v0.additive_domain_pb2 import (
     GrainStatistics,
@@ -443,6 +445,104 @@ def test_MicrostructureInput_repr_returns_expected_string():
     )
 
 
+def test_MicrostructureSummary_writes_vtk_files_on_first_access(tmp_path):
+    # arrange
+    input = MicrostructureInput()
+    result = MicrostructureResult(xy_vtk=b"xy", xz_vtk=b"xz", yz_vtk=b"yz")
+    output_dir = tmp_path / input.id
+
+    # act
+    summary = MicrostructureSummary(input, result, "logs", str(tmp_path))
+
+    # assert
+    assert summary.xy_average_grain_size == 0
+    assert not output_dir.exists()
+    with open(summary.xy_vtk, "rb") as f:
+        assert f.read() == b"xy"
+    assert os.listdir(output_dir) == ["xy.vtk"]
+    assert summary.xy_vtk == str(output_dir / "xy.vtk")
+
+
+def test_DeferredFile_holds_large_content_outside_memory(tmp_path, monkeypatch):
+    # arrange
+    monkeypatch.setattr(_DeferredFile, "SPILL_SIZE", 10)
+    content = bytes(range(100))
+
+    # act
+    deferred = _DeferredFile(str(tmp_path / "sub" / "large.vtk"), content)
+
+    # assert
+    assert deferred._content is None
+    spill = deferred._spill
+    assert isinstance(spill, str)
+    assert not (tmp_path / "sub").exists()
+    with open(deferred.path, "rb") as f:
+        assert f.read() == content
+    assert not os.path.exists(spill)
+    assert str(deferred) == str(tmp_path / "sub" / "large.vtk")
+
+
+def test_DeferredFile_removes_spilled_content_when_deleted(tmp_path, monkeypatch):
+    # arrange
+    monkeypatch.setattr(_DeferredFile, "SPILL_SIZE", 10)
+    deferred = _DeferredFile(str(tmp_path / "large.vtk"), bytes(range(100)))
+    spill = deferred._spill
+
+    # act
+    del deferred
+
+    # assert
+    assert not os.path.exists(spill)
+    assert not (tmp_path / "large.vtk").exists()
+
+
+def test_MicrostructureSummary_with_large_vtk_files_can_be_pickled(tmp_path, monkeypatch):
+    # arrange
+    monkeypatch.setattr(_DeferredFile, "SPILL_SIZE", 10)
+    content = bytes(range(100))
+    input = MicrostructureInput()
+    result = MicrostructureResult(xy_vtk=content, xz_vtk=b"xz", yz_vtk=b"yz")
+    summary = MicrostructureSummary(input, result, "logs", str(tmp_path))
+
+    # act
+    copy = pickle.loads(pickle.dumps(summary))
+
+    # assert
+    assert copy._result._xy_vtk._content is None
+    assert not (tmp_path / input.id).exists()
+    with open(copy.xy_vtk, "rb") as f:
+        assert f.read() == content
+    with open(summary.xz_vtk, "rb") as f:
+        assert f.read() == b"xz"
+
+
+def test_MicrostructureSummary_vtk_paths_accept_summaries_pickled_by_earlier_versions(tmp_path):
+    # arrange
+    summary = MicrostructureSummary(
+        MicrostructureInput(), MicrostructureResult(xy_vtk=b"xy"), "logs", str(tmp_path)
+    )
+    path = str(tmp_path / "xy.vtk")
+    summary._result._xy_vtk = path
+
+    # act
+    copy = pickle.loads(pickle.dumps(summary))
+
+    # assert
+    assert copy.xy_vtk == path
+
+
+def test_MicrostructureSummary_writes_vtk_files_on_init_when_not_deferred(tmp_path):
+    # arrange
+    input = MicrostructureInput()
+    result = MicrostructureResult(xy_vtk=b"xy", xz_vtk=b"xz", yz_vtk=b"yz")
+
+    # act
+    MicrostructureSummary(input, result, "logs", str(tmp_path), defer_vtk_files=False)
+
+    # assert
+    assert sorted(os.listdir(tmp_path / input.id)) == ["xy.vtk", "xz.vtk", "yz.vtk"]
+
+
 def test_MicrostructureSummary_repr_returns_expected_string():
     # arrange
     input = MicrostructureInput()
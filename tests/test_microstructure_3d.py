@@ -109,6 +109,23 @@ def test_Microstructure3DSummary_init_returns_expected_value():
     shutil.rmtree(user_data_path)
 
 
+def test_Microstructure3DSummary_writes_vtk_file_on_first_access(tmp_path):
+    # arrange
+    input = Microstructure3DInput()
+    result_3d = Microstructure3DResult(
+        three_d_vtk=b"3d", two_d_result=MicrostructureResult(xy_vtk=b"xy")
+    )
+
+    # act
+    summary = Microstructure3DSummary(input, result_3d, "logs", str(tmp_path))
+
+    # assert
+    assert not (tmp_path / input.id).exists()
+    with open(summary.grain_3d_vtk, "rb") as f:
+        assert f.read() == b"3d"
+    assert os.listdir(tmp_path / input.id) == [summary._3D_GRAIN_VTK_NAME]
+
+
 @pytest.mark.parametrize(
     "invalid_obj",
     [
@@ -20,7 +20,10 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from ansys.additive.core.misc import short_uuid
+import numpy as np
+
+from ansys.additive.core.misc import decode_repeated_field, short_uuid, short_uuids
+from ansys.api.additive.v0.additive_domain_pb2 import GrainStatistics
 
 
 def test_short_uuid_returns_string_of_expected_length():
@@ -33,3 +36,47 @@ def test_short_uuid_returns_string_of_expected_length():
     # assert
     assert isinstance(result, str)
     assert len(result) == nchars
+
+
+def test_short_uuids_returns_alphanumeric_strings_of_expected_length():
+    # act
+    result = short_uuids(100, 7)
+
+    # assert
+    assert len(result) == 100
+    assert all(isinstance(r, str) and len(r) == 7 and r.isalnum() for r in result)
+    assert len(set(result)) > 1
+
+
+def test_decode_repeated_field_returns_array_per_field():
+    # arrange
+    messages = [
+        GrainStatistics(grain_number=1, area_fraction=0.25, diameter_um=2.5),
+        GrainStatistics(grain_number=2, area_fraction=0.75, diameter_um=5.0),
+    ]
+
+    # act
+    result = decode_repeated_field(
+        messages, {"grain_number": np.int64, "area_fraction": np.float64, "diameter_um": float}
+    )
+
+    # assert
+    assert list(result) == ["grain_number", "area_fraction", "diameter_um"]
+    assert result["grain_number"].dtype == np.int64
+    assert result["grain_number"].tolist() == [1, 2]
+    assert result["area_fraction"].tolist() == [0.25, 0.75]
+    assert result["diameter_um"].tolist() == [2.5, 5.0]
+
+
+def test_decode_repeated_field_handles_single_field_and_no_messages():
+    # arrange
+    messages = [GrainStatistics(diameter_um=3.0)]
+
+    # act
+    single = decode_repeated_field(messages, {"diameter_um": np.float64})
+    empty = decode_repeated_field([], {"grain_number": np.int64, "diameter_um": np.float64})
+
+    # assert
+    assert single["diameter_um"].tolist() == [3.0]
+    assert empty["grain_number"].shape == (0,)
+    assert empty["diameter_um"].shape == (0,)
@@ -19,8 +19,10 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import pathlib
 
-from ansys.additive.core import SimulationError, SingleBeadInput
+from ansys.additive.core import SimulationError, SimulationLogs, SingleBeadInput
+from ansys.additive.core.simulation import SimulationSummaryBase
 
 
 def test_SimulationError_init_assigns_values():
@@ -34,3 +36,54 @@ def test_SimulationError_init_assigns_values():
     assert error.input == input
     assert error.message == "message"
     assert error.logs == "log messages"
+
+
+def test_SimulationError_reads_logs_from_file(tmp_path: pathlib.Path):
+    # arrange
+    log_file = tmp_path / "simulation.log"
+    log_file.write_text("log messages")
+    logs = SimulationLogs(str(log_file))
+
+    # act
+    error = SimulationError(input=SingleBeadInput(), message="message", logs=logs)
+
+    # assert
+    assert error.logs == "log messages"
+    assert error.log_file == logs
+
+
+def test_SimulationLogs_equal_for_same_file_are_hashed_alike(tmp_path: pathlib.Path, monkeypatch):
+    # arrange
+    monkeypatch.chdir(tmp_path)
+    relative = SimulationLogs("simulation.log")
+    absolute = SimulationLogs(str(tmp_path / "simulation.log"))
+
+    # act, assert
+    assert relative == absolute
+    assert hash(relative) == hash(absolute)
+    assert len({relative, absolute}) == 1
+
+
+def test_SimulationSummaryBase_reads_logs_from_file_on_access(tmp_path: pathlib.Path):
+    # arrange
+    log_file = tmp_path / "simulation.log"
+    log_file.write_text("first\n")
+    summary = SimulationSummaryBase(SimulationLogs(str(log_file)))
+    log_file.write_text("first\nsecond\n")
+
+    # act
+    logs = summary.logs
+
+    # assert
+    assert logs == "first\nsecond\n"
+    assert list(summary.log_file) == ["first\n", "second\n"]
+    assert str(summary.log_file) == str(log_file)
+
+
+def test_SimulationSummaryBase_log_file_is_None_for_logs_in_memory():
+    # act
+    summary = SimulationSummaryBase("log messages")
+
+    # assert
+    assert summary.logs == "log messages"
+    assert summary.log_file is None
@@ -20,8 +20,10 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import asyncio
 import hashlib
 import os
+import shutil
 from unittest.mock import Mock, patch
 
 import pytest
@@ -36,8 +38,11 @@ from ansys.additive.core import (
 )
 from ansys.additive.core.simulation_requests import (
     __file_upload_reader,
+    __file_upload_reader_async,
+    _UploadThroughput,
     create_request,
     _setup_thermal_history,
+    _setup_thermal_history_async,
 )
 from ansys.api.additive.v0.additive_domain_pb2 import Progress as ProgressMsg
 from ansys.api.additive.v0.additive_domain_pb2 import ProgressState as ProgressMsgState
@@ -170,3 +175,199 @@ def test_file_upload_reader_returns_expected_number_of_requests():
         assert len(request.content) <= chunk_size
         assert request.content_md5 == hashlib.md5(request.content).hexdigest()
     assert n + 1 == expected_iterations
+
+
+def test_file_upload_reader_reports_bytes_sent():
+    # arrange
+    file_name = os.path.abspath(__file__)
+    throughput = _UploadThroughput()
+
+    # act
+    requests = list(__file_upload_reader(file_name, 1024, throughput))
+
+    # assert
+    with open(file_name, "rb") as f:
+        assert b"".join(r.content for r in requests) == f.read()
+    assert throughput.bytes_sent == os.path.getsize(file_name)
+    assert "MB/s" in str(throughput)
+
+
+def test_file_upload_reader_stops_when_closed_early():
+    # arrange
+    reader = __file_upload_reader(os.path.abspath(__file__), 16)
+
+    # act
+    first = next(reader)
+    reader.close()
+
+    # assert
+    assert len(first.content) == 16
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_file_upload_reader_with_invalid_chunk_size_raises_exception(chunk_size):
+    # act, assert
+    with pytest.raises(ValueError, match="chunk size must be greater than zero"):
+        next(__file_upload_reader(os.path.abspath(__file__), chunk_size))
+
+
+def test_file_upload_reader_with_missing_file_raises_exception(tmp_path):
+    # arrange
+    file_name = tmp_path / "missing.stl"
+
+    # act, assert
+    with pytest.raises(FileNotFoundError):
+        list(__file_upload_reader(str(file_name)))
+
+
+def test_file_upload_reader_async_returns_same_requests_as_reader():
+    # arrange
+    file_name = os.path.abspath(__file__)
+
+    async def read_all():
+        return [r async for r in __file_upload_reader_async(file_name, 1024)]
+
+    # act
+    requests = asyncio.run(read_all())
+
+    # assert
+    assert requests == list(__file_upload_reader(file_name, 1024))
+
+
+def test_setup_thermal_history_uses_upload_chunk_size_and_reports_throughput():
+    # arrange
+    input = ThermalHistoryInput(
+        geometry=StlFile(test_utils.get_test_file_path("5x5x1_0x_0y_0z.stl"))
+    )
+    chunk_sizes = []
+
+    def upload(requests):
+        for request in requests:
+            chunk_sizes.append(len(request.content))
+            yield UploadFileResponse(
+                remote_file_name="remote/file/name",
+                progress=ProgressMsg(
+                    state=ProgressMsgState.PROGRESS_STATE_EXECUTING, message="uploading"
+                ),
+            )
+
+    server = Mock()
+    server.simulation_stub.UploadFile.side_effect = upload
+    progress_handler = Mock()
+
+    # act
+    _setup_thermal_history(input, server, progress_handler, upload_chunk_size=128)
+
+    # assert
+    assert len(chunk_sizes) > 1
+    assert all(size <= 128 for size in chunk_sizes)
+    assert progress_handler.update.call_count == len(chunk_sizes)
+    progress = progress_handler.update.call_args.args[0]
+    assert progress.message.startswith("uploading - Uploaded")
+    assert progress.message.endswith("MB/s")
+
+
+def _upload_server(remote_file_name: str = "remote/file/name") -> Mock:
+    server = Mock()
+    server.simulation_stub.UploadFile.side_effect = lambda _: [
+        UploadFileResponse(
+            remote_file_name=remote_file_name,
+            progress=ProgressMsg(state=ProgressMsgState.PROGRESS_STATE_COMPLETED),
+        )
+    ]
+    return server
+
+
+def test_setup_thermal_history_uploads_geometry_once_per_server(tmp_path):
+    # arrange
+    stl_file = test_utils.get_test_file_path("5x5x1_0x_0y_0z.stl")
+    copy_file = tmp_path / "copy.stl"
+    shutil.copyfile(stl_file, copy_file)
+    inputs = [
+        ThermalHistoryInput(geometry=StlFile(stl_file)),
+        ThermalHistoryInput(geometry=StlFile(stl_file)),
+        ThermalHistoryInput(geometry=StlFile(str(copy_file))),
+    ]
+    server = _upload_server()
+    other_server = _upload_server("other/file/name")
+
+    # act
+    requests = [_setup_thermal_history(input, server) for input in inputs]
+    other_request = _setup_thermal_history(inputs[0], other_server)
+
+    # assert
+    server.simulation_stub.UploadFile.assert_called_once()
+    other_server.simulation_stub.UploadFile.assert_called_once()
+    assert all(
+        r.thermal_history_input.stl_file.name == "remote/file/name" for r in requests
+    )
+    assert other_request.thermal_history_input.stl_file.name == "other/file/name"
+
+
+def test_setup_thermal_history_uploads_changed_geometry_again(tmp_path):
+    # arrange
+    stl_file = tmp_path / "part.stl"
+    shutil.copyfile(test_utils.get_test_file_path("5x5x1_0x_0y_0z.stl"), stl_file)
+    input = ThermalHistoryInput(geometry=StlFile(str(stl_file)))
+    server = _upload_server()
+    _setup_thermal_history(input, server)
+
+    # act
+    with open(stl_file, "ab") as f:
+        f.write(b"\n")
+    _setup_thermal_history(input, server)
+
+    # assert
+    assert server.simulation_stub.UploadFile.call_count == 2
+
+
+def test_setup_thermal_history_does_not_reuse_failed_upload():
+    # arrange
+    input = ThermalHistoryInput(
+        geometry=StlFile(test_utils.get_test_file_path("5x5x1_0x_0y_0z.stl"))
+    )
+    server = Mock()
+    server.simulation_stub.UploadFile.side_effect = lambda _: [
+        UploadFileResponse(
+            remote_file_name="remote/file/name",
+            progress=ProgressMsg(state=ProgressMsgState.PROGRESS_STATE_ERROR, message="error"),
+        )
+    ]
+    with pytest.raises(Exception, match="error"):
+        _setup_thermal_history(input, server)
+
+    # act
+    with pytest.raises(Exception, match="error"):
+        _setup_thermal_history(input, server)
+
+    # assert
+    assert server.simulation_stub.UploadFile.call_count == 2
+
+
+def test_setup_thermal_history_async_uploads_geometry_once_for_concurrent_inputs():
+    # arrange
+    stl_file = test_utils.get_test_file_path("5x5x1_0x_0y_0z.stl")
+    inputs = [ThermalHistoryInput(geometry=StlFile(stl_file)) for _ in range(3)]
+    server = Mock()
+
+    async def upload(_):
+        await asyncio.sleep(0)
+        yield UploadFileResponse(
+            remote_file_name="remote/file/name",
+            progress=ProgressMsg(state=ProgressMsgState.PROGRESS_STATE_COMPLETED),
+        )
+
+    server.simulation_stub.UploadFile.side_effect = upload
+
+    async def setup_all():
+        return await asyncio.gather(
+            *(_setup_thermal_history_async(input, server) for input in inputs)
+        )
+
+    # act
+    requests = asyncio.run(setup_all())
+
+    # assert
+    server.simulation_stub.UploadFile.assert_called_once()
+    assert [r.id for r in requests] == [input.id for input in inputs]
+    assert all(r.thermal_history_input.stl_file.name == "remote/file/name" for r in requests)
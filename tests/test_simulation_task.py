@@ -55,7 +55,7 @@ from ansys.additive.core.material_tuning import (
     MaterialTuningSummary,
 )
 from ansys.additive.core.progress_handler import IProgressHandler, Progress
-from ansys.additive.core.simulation import SimulationStatus
+from ansys.additive.core.simulation import SimulationLogs, SimulationStatus
 from ansys.additive.core.simulation_error import SimulationError
 from ansys.api.additive.v0.additive_domain_pb2 import (
     MaterialTuningResult,
@@ -164,12 +164,7 @@ def test_unpack_summary_returns_correct_summary(
         )
     elif isinstance(result, ThermalHistoryResult):
         # arrange
-        results_file = tmp_path / "results.zip"
-        shutil.copyfile(
-            test_utils.get_test_file_path("thermal_history_results.zip"),
-            str(results_file),
-        )
-        mock_download_file.return_value = str(results_file)
+        mock_download_file.return_value = str(tmp_path / "coax_ave_output")
         sim_response = SimulationResponse(
             id=sim_input.id,
             thermal_history_result=ThermalHistoryResult(coax_ave_zip_file="zip-file"),
@@ -344,6 +339,25 @@ def test_wait_calls_update_progress_and_break_with_completed_operations(
     assert update_mock.call_count == 2
 
 
+def test_wait_future_starts_nonblocking_wait_operation(tmp_path: pathlib.Path):
+    # arrange
+    mock_server = Mock()
+    mock_server.operations_stub.WaitOperation.future.return_value = "future"
+    task = SimulationTask(
+        mock_server, Operation(name="op1"), SingleBeadInput(), tmp_path
+    )
+
+    # act
+    future = task._wait_future(progress_update_interval=3)
+
+    # assert
+    assert future == "future"
+    mock_server.operations_stub.WaitOperation.assert_not_called()
+    request = mock_server.operations_stub.WaitOperation.future.call_args[0][0]
+    assert request.name == "op1"
+    assert request.timeout.seconds == 3
+
+
 @patch("ansys.additive.core.additive.ServerConnection")
 def test_simulation_id_property_returns_id_from_input(
     mock_server, tmp_path: pathlib.Path
@@ -402,7 +416,9 @@ def test_extract_logs():
     byte_stream.seek(0)
     zipped_logs = byte_stream.read()
 
-    task = SimulationTask(Mock(), Operation(), SingleBeadInput(), pathlib.Path())
+    task = SimulationTask(
+        Mock(), Operation(), SingleBeadInput(), pathlib.Path(), keep_logs_in_memory=True
+    )
 
     # act
     logs = task._extract_logs(zipped_logs)
@@ -411,6 +427,31 @@ def test_extract_logs():
     assert logs == expected_logs
 
 
+def test_extract_logs_writes_logs_to_simulation_folder(tmp_path: pathlib.Path):
+    # arrange
+    byte_stream = io.BytesIO()
+    with zipfile.ZipFile(byte_stream, "w") as zip_ref:
+        zip_ref.writestr("first.log", "first line\n")
+        zip_ref.writestr("second.log", "second line")
+    sim_input = SingleBeadInput()
+    task = SimulationTask(Mock(), Operation(), sim_input, tmp_path)
+
+    # act
+    logs = task._extract_logs(byte_stream.getvalue())
+
+    # assert
+    assert isinstance(logs, SimulationLogs)
+    assert logs.path == str(tmp_path / sim_input.id / SimulationTask.LOG_FILE_NAME)
+    assert logs.read() == "File: first.log\nfirst line\n\nFile: second.log\nsecond line\n"
+    assert list(logs) == [
+        "File: first.log\n",
+        "first line\n",
+        "\n",
+        "File: second.log\n",
+        "second line\n",
+    ]
+
+
 def test_extract_logs_with_empty_logs():
     # arrange
     task = SimulationTask(Mock(), Operation(), SingleBeadInput(), pathlib.Path())
@@ -506,6 +547,69 @@ def test_create_summary(
         assert summary.status == SimulationStatus.WARNING
 
 
+@patch("ansys.additive.core.simulation_task.download_file")
+@patch("ansys.additive.core.simulation_task.download_files")
+def test_create_summary_uses_result_files_downloaded_ahead(
+    mock_download_files, mock_download_file, tmp_path: pathlib.Path
+):
+    # arrange
+    sim_input = ThermalHistoryInput()
+    results_folder = tmp_path / "results"
+    results_folder.mkdir()
+    mock_download_files.return_value = {"zip-file": str(results_folder)}
+    response = SimulationResponse(
+        thermal_history_result=ThermalHistoryResult(coax_ave_zip_file="zip-file")
+    )
+    operation = Operation(name="id", done=True)
+    operation.response.Pack(response)
+    task = SimulationTask(Mock(), Operation(), sim_input, tmp_path)
+    metadata = OperationMetadata(state=ProgressMsgState.PROGRESS_STATE_COMPLETED)
+
+    # act
+    task._download_result_files(operation)
+    summary = task._create_summary(response, Progress.from_operation_metadata(metadata))
+
+    # assert
+    mock_download_files.assert_called_once_with(
+        task._server.simulation_stub,
+        {"zip-file": str(tmp_path / sim_input.id / "coax_ave_output")},
+        extract=True,
+        members=None,
+    )
+    mock_download_file.assert_not_called()
+    assert summary.coax_ave_output_folder == str(results_folder)
+
+
+@patch("ansys.additive.core.simulation_task.download_file")
+def test_create_summary_extracts_thermal_history_results_while_downloading(
+    mock_download_file, tmp_path: pathlib.Path
+):
+    # arrange
+    sim_input = ThermalHistoryInput()
+    mock_download_file.side_effect = lambda stub, name, folder, **kwargs: folder
+    response = SimulationResponse(
+        thermal_history_result=ThermalHistoryResult(coax_ave_zip_file="zip-file")
+    )
+    task = SimulationTask(
+        Mock(), Operation(), sim_input, tmp_path, result_file_members=["coax_ave.vtk"]
+    )
+    metadata = OperationMetadata(state=ProgressMsgState.PROGRESS_STATE_COMPLETED)
+
+    # act
+    summary = task._create_summary(response, Progress.from_operation_metadata(metadata))
+
+    # assert
+    expected_folder = str(tmp_path / sim_input.id / "coax_ave_output")
+    mock_download_file.assert_called_once_with(
+        task._server.simulation_stub,
+        "zip-file",
+        expected_folder,
+        extract=True,
+        members=["coax_ave.vtk"],
+    )
+    assert summary.coax_ave_output_folder == expected_folder
+
+
 def test_create_summary_with_logs_calls_extract_logs(
     tmp_path: pathlib.Path,
 ):
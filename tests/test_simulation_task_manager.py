@@ -20,13 +20,28 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import logging
+import threading
+from concurrent.futures import Future
 from unittest.mock import Mock, PropertyMock
 
+import grpc
+import pytest
+from google.longrunning.operations_pb2 import (
+    ListOperationsRequest,
+    ListOperationsResponse,
+    Operation,
+)
+
+from ansys.additive.core.porosity import PorosityInput
 from ansys.additive.core.progress_handler import Progress, ProgressState
+from ansys.additive.core.simulation import SimulationType
 from ansys.additive.core.simulation_task_manager import (
     SimulationTask,
     SimulationTaskManager,
 )
+from ansys.additive.core.single_bead import SingleBeadInput
+from ansys.additive.core.thermal_history import ThermalHistoryInput
 
 
 def test_add_task_stores_task():
@@ -41,6 +56,12 @@ def test_add_task_stores_task():
     assert len(taskMgr._tasks) == 1
 
 
+def _server_without_list_operations() -> Mock:
+    server = Mock()
+    server.operations_stub.ListOperations.side_effect = grpc.RpcError("unimplemented")
+    return server
+
+
 def test_status_return_list_of_tuples_of_id_and_Progress():
     # arrange
     progress1 = Progress(
@@ -51,6 +72,8 @@ def test_status_return_list_of_tuples_of_id_and_Progress():
         context="context",
     )
     mock_task1 = Mock(SimulationTask)
+    mock_task1._server = _server_without_list_operations()
+    mock_task1._long_running_op = Operation(name="id1")
     mock_task1.status.return_value = progress1
 
     progress2 = Progress(
@@ -61,6 +84,8 @@ def test_status_return_list_of_tuples_of_id_and_Progress():
         context="context",
     )
     mock_task2 = Mock(SimulationTask)
+    mock_task2._server = _server_without_list_operations()
+    mock_task2._long_running_op = Operation(name="id2")
     mock_task2.status.return_value = progress2
 
     taskMgr = SimulationTaskManager()
@@ -76,38 +101,513 @@ def test_status_return_list_of_tuples_of_id_and_Progress():
     assert result[1] == (progress2.sim_id, progress2)
 
 
-def test_wait_all_calls_each_task_wait():
+def test_status_only_fetches_status_of_pending_tasks():
     # arrange
-    mock_task1 = Mock(SimulationTask)
-    mock_task2 = Mock(SimulationTask)
+    done = Progress(
+        sim_id="done", message="", state=ProgressState.COMPLETED, percent_complete=100, context=""
+    )
+    running = Progress(
+        sim_id="running", message="", state=ProgressState.RUNNING, percent_complete=50, context=""
+    )
+    finished_task = Mock(SimulationTask)
+    type(finished_task).done = PropertyMock(side_effect=[False, True, True])
+    finished_task.status.return_value = done
+    finished_task.summary = "summary"
+    finished_task._server = _server_without_list_operations()
+    finished_task._long_running_op = Operation(name="done")
+    pending_task = Mock(SimulationTask)
+    type(pending_task).done = PropertyMock(return_value=False)
+    pending_task.status.return_value = running
+    pending_task._server = finished_task._server
+    pending_task._long_running_op = Operation(name="running")
+    mock_handler = Mock()
+
+    taskMgr = SimulationTaskManager()
+    taskMgr.add_task(finished_task)
+    taskMgr.add_task(pending_task)
+
+    # act
+    taskMgr.status()
+    result = taskMgr.status(mock_handler)
+
+    # assert
+    assert result == [("done", done), ("running", running)]
+    finished_task.status.assert_called_once()
+    assert pending_task.status.call_count == 2
+    mock_handler.update.assert_called_once_with(running)
+    assert taskMgr.finished_count == 1
+    assert taskMgr.pending_count == 1
+    assert not taskMgr.done
+    assert taskMgr.summaries() == ["summary"]
+
+
+def test_status_refreshes_tasks_with_paged_ListOperations_per_server():
+    # arrange
+    server = Mock()
+    server.operations_stub.ListOperations.side_effect = [
+        ListOperationsResponse(
+            operations=[Operation(name="other"), Operation(name="id1")], next_page_token="2"
+        ),
+        ListOperationsResponse(operations=[Operation(name="id2", done=True)]),
+    ]
+    tasks = []
+    for name in ["id1", "id2", "id3"]:
+        task = Mock(SimulationTask)
+        type(task).done = PropertyMock(return_value=False)
+        task._server = server
+        task._long_running_op = Operation(name=name)
+        task._update_operation_status.return_value = Progress(
+            sim_id=name,
+            message="listed",
+            state=ProgressState.RUNNING,
+            percent_complete=0,
+            context="",
+        )
+        task.status.return_value = Progress(
+            sim_id=name,
+            message="fetched",
+            state=ProgressState.RUNNING,
+            percent_complete=0,
+            context="",
+        )
+        tasks.append(task)
+
+    taskMgr = SimulationTaskManager()
+    for t in tasks:
+        taskMgr.add_task(t)
+    mock_handler = Mock()
+
+    # act
+    taskMgr.status(mock_handler)
+
+    # assert
+    assert server.operations_stub.ListOperations.call_args_list[0].args == (
+        ListOperationsRequest(filter='name = "id1" OR name = "id2" OR name = "id3"'),
+    )
+    assert server.operations_stub.ListOperations.call_args_list[1].args == (
+        ListOperationsRequest(
+            filter='name = "id1" OR name = "id2" OR name = "id3"', page_token="2"
+        ),
+    )
+    tasks[0]._update_operation_status.assert_called_once_with(Operation(name="id1"))
+    tasks[1]._update_operation_status.assert_called_once_with(Operation(name="id2", done=True))
+    tasks[0].status.assert_not_called()
+    tasks[1].status.assert_not_called()
+    tasks[2].status.assert_called_once()
+    assert sorted(
+        (c.args[0].sim_id, c.args[0].message) for c in mock_handler.update.call_args_list
+    ) == [("id1", "listed"), ("id2", "listed"), ("id3", "fetched")]
+
+
+def test_status_stops_listing_when_all_operations_found():
+    # arrange
+    server = Mock()
+    server.operations_stub.ListOperations.return_value = ListOperationsResponse(
+        operations=[Operation(name="id1")], next_page_token="2"
+    )
+    task = Mock(SimulationTask)
+    type(task).done = PropertyMock(return_value=False)
+    task._server = server
+    task._long_running_op = Operation(name="id1")
+
+    taskMgr = SimulationTaskManager()
+    taskMgr.add_task(task)
+
+    # act
+    taskMgr.status()
+
+    # assert
+    server.operations_stub.ListOperations.assert_called_once()
+    task.status.assert_not_called()
+
+
+def test_status_lists_operations_in_batches_of_names(monkeypatch):
+    # arrange
+    monkeypatch.setattr(
+        "ansys.additive.core.simulation_task_manager.MAX_LISTED_OPERATION_NAMES", 2
+    )
+    server = Mock()
+    server.operations_stub.ListOperations.side_effect = [
+        ListOperationsResponse(operations=[Operation(name="id1"), Operation(name="id2")]),
+        ListOperationsResponse(operations=[Operation(name="id3")]),
+    ]
+    taskMgr = SimulationTaskManager()
+    for name in ["id1", "id2", "id3"]:
+        task = Mock(SimulationTask)
+        type(task).done = PropertyMock(return_value=False)
+        task._server = server
+        task._long_running_op = Operation(name=name)
+        taskMgr.add_task(task)
+
+    # act
+    taskMgr.status()
+
+    # assert
+    assert [c.args for c in server.operations_stub.ListOperations.call_args_list] == [
+        (ListOperationsRequest(filter='name = "id1" OR name = "id2"'),),
+        (ListOperationsRequest(filter='name = "id3"'),),
+    ]
+    for task in taskMgr.tasks:
+        task.status.assert_not_called()
+
+
+def test_status_does_not_list_operations_again_after_server_rejects_it():
+    # arrange
+    server = _server_without_list_operations()
+    task = Mock(SimulationTask)
+    type(task).done = PropertyMock(return_value=False)
+    task._server = server
+    task._long_running_op = Operation(name="id1")
+    taskMgr = SimulationTaskManager()
+    taskMgr.add_task(task)
+
+    # act
+    taskMgr.status()
+    taskMgr.status()
+
+    # assert
+    server.operations_stub.ListOperations.assert_called_once()
+    assert task.status.call_count == 2
+
+
+def test_done_and_summaries_track_tasks_completed_outside_manager():
+    # arrange
+    tasks = []
+    for i in range(3):
+        task = Mock(SimulationTask)
+        type(task).done = PropertyMock(return_value=False)
+        task.summary = f"summary{i}"
+        tasks.append(task)
+
+    taskMgr = SimulationTaskManager()
+    for t in tasks:
+        taskMgr.add_task(t)
+
+    # act
+    for t in reversed(tasks):
+        type(t).done = PropertyMock(return_value=True)
+
+    # assert
+    assert taskMgr.done
+    assert taskMgr.pending_count == 0
+    assert taskMgr.finished_count == 3
+    assert taskMgr.summaries() == ["summary0", "summary1", "summary2"]
+
+
+def _completed_future(result=None, exception=None) -> Future:
+    future = Future()
+    if exception:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
+    return future
+
+
+def _mock_task(sim_id: str, *awaited_operations) -> Mock:
+    task = Mock(SimulationTask)
+    type(task).simulation_id = PropertyMock(return_value=sim_id)
+    type(task).done = PropertyMock(return_value=False)
+    task._wait_future.side_effect = [_completed_future(op) for op in awaited_operations]
+    task.status.return_value = Progress(
+        sim_id=sim_id,
+        message="done",
+        state=ProgressState.COMPLETED,
+        percent_complete=100,
+        context="context",
+    )
+    return task
+
+
+def test_wait_all_awaits_each_task_and_updates_status():
+    # arrange
+    mock_task1 = _mock_task("id1", Operation(name="id1", done=True))
+    mock_task2 = _mock_task("id2", Operation(name="id2", done=True))
+    mock_handler = Mock()
 
     taskMgr = SimulationTaskManager()
     taskMgr.add_task(mock_task1)
     taskMgr.add_task(mock_task2)
 
+    # act
+    taskMgr.wait_all(progress_handler=mock_handler, progress_update_interval=2)
+
+    # assert
+    mock_task1._wait_future.assert_called_once_with(2)
+    mock_task2._wait_future.assert_called_once_with(2)
+    mock_task1.status.assert_not_called()
+    mock_task2.status.assert_not_called()
+    assert mock_handler.update.call_count == 2
+
+
+def test_wait_all_reissues_wait_until_operation_done():
+    # arrange
+    mock_task = _mock_task(
+        "id1",
+        Operation(name="id1", done=False),
+        Operation(name="id1", done=False),
+        Operation(name="id1", done=True),
+    )
+
+    taskMgr = SimulationTaskManager()
+    taskMgr.add_task(mock_task)
+
+    # act
+    taskMgr.wait_all()
+
+    # assert
+    assert mock_task._wait_future.call_count == 3
+    assert mock_task._update_operation_status.call_count == 3
+    mock_task.status.assert_not_called()
+
+
+def test_wait_all_does_not_wait_on_tasks_that_are_already_done():
+    # arrange
+    done_op = Operation(name="id1", done=True)
+    mock_task = _mock_task("id1")
+    type(mock_task).done = PropertyMock(return_value=True)
+    mock_task._long_running_op = done_op
+
+    taskMgr = SimulationTaskManager()
+    taskMgr.add_task(mock_task)
+
+    # act
+    taskMgr.wait_all()
+
+    # assert
+    mock_task._wait_future.assert_not_called()
+    mock_task._update_operation_status.assert_called_once_with(done_op)
+    mock_task.status.assert_not_called()
+
+
+def test_wait_all_backs_off_while_progress_is_unchanged():
+    # arrange
+    mock_task = _mock_task(
+        "id1",
+        *[Operation(name="id1", done=False)] * 6,
+        Operation(name="id1", done=True),
+    )
+    running = Progress(
+        sim_id="id1", state=ProgressState.RUNNING, percent_complete=10, message="", context=""
+    )
+    advanced = running.model_copy(update={"percent_complete": 20})
+    completed = running.model_copy(update={"state": ProgressState.COMPLETED})
+    mock_task._update_operation_status.side_effect = [
+        running,
+        running,
+        running,
+        advanced,
+        advanced,
+        advanced,
+        completed,
+    ]
+    mock_handler = Mock()
+
+    taskMgr = SimulationTaskManager()
+    taskMgr.add_task(mock_task)
+
+    # act
+    taskMgr.wait_all(progress_handler=mock_handler, progress_update_interval=20)
+
+    # assert
+    intervals = [c.args[0] for c in mock_task._wait_future.call_args_list]
+    assert intervals == [20, 20, 40, 60, 20, 40, 60]
+    assert [c.args[0] for c in mock_handler.update.call_args_list] == [
+        running,
+        advanced,
+        completed,
+    ]
+
+
+def test_wait_for_completions_yields_tasks_in_completion_order():
+    # arrange
+    slow_future = Future()
+    slow_task = _mock_task("slow")
+    slow_task._wait_future.side_effect = [slow_future]
+    fast_task = _mock_task("fast", Operation(name="fast", done=True))
+
+    taskMgr = SimulationTaskManager()
+    taskMgr.add_task(slow_task)
+    taskMgr.add_task(fast_task)
+
+    # act
+    completions = taskMgr._wait_for_completions()
+    first = next(completions)
+    slow_future.set_result(Operation(name="slow", done=True))
+    second = next(completions)
+
+    # assert
+    assert first is fast_task
+    assert second is slow_task
+
+
+def test_wait_for_completions_downloads_results_without_blocking_other_tasks():
+    # arrange
+    download_started = threading.Event()
+    release_download = threading.Event()
+    large_task = _mock_task("large", Operation(name="large", done=True))
+
+    def download(_):
+        download_started.set()
+        release_download.wait(5)
+
+    large_task._download_result_files.side_effect = download
+    small_future = Future()
+    small_task = _mock_task("small")
+    small_task._wait_future.side_effect = [small_future]
+
+    taskMgr = SimulationTaskManager()
+    taskMgr.add_task(large_task)
+    taskMgr.add_task(small_task)
+
+    # act
+    completions = taskMgr._wait_for_completions()
+    download_started.wait(5)
+    small_future.set_result(Operation(name="small", done=True))
+    first = next(completions)
+    release_download.set()
+    second = next(completions)
+
+    # assert
+    assert first is small_task
+    assert second is large_task
+    large_task._download_result_files.assert_called_once_with(Operation(name="large", done=True))
+
+
+def test_as_completed_yields_summaries_in_completion_order():
+    # arrange
+    slow_future = Future()
+    slow_task = _mock_task("slow")
+    slow_task._wait_future.side_effect = [slow_future]
+    slow_task.summary = "slow summary"
+    fast_task = _mock_task("fast", Operation(name="fast", done=True))
+    fast_task.summary = "fast summary"
+    cancelled_task = _mock_task("cancelled", Operation(name="cancelled", done=True))
+    cancelled_task.summary = None
+
+    taskMgr = SimulationTaskManager()
+    for t in [slow_task, fast_task, cancelled_task]:
+        taskMgr.add_task(t)
+
+    # act
+    summaries = taskMgr.as_completed()
+    first = next(summaries)
+    slow_future.set_result(Operation(name="slow", done=True))
+    rest = list(summaries)
+
+    # assert
+    assert first == "fast summary"
+    assert rest == ["slow summary"]
+
+
+def test_as_completed_raises_TimeoutError_and_cancels_outstanding_waits():
+    # arrange
+    pending_future = Future()
+    pending_task = _mock_task("pending")
+    pending_task._wait_future.side_effect = [pending_future]
+
+    taskMgr = SimulationTaskManager()
+    taskMgr.add_task(pending_task)
+
+    # act, assert
+    with pytest.raises(TimeoutError, match="1 of 1 simulations did not complete"):
+        list(taskMgr.as_completed(timeout=0.01))
+    assert pending_future.cancelled()
+
+
+def test_wait_all_logs_error_and_updates_status_when_wait_fails(caplog):
+    # arrange
+    mock_task = _mock_task("id1")
+    mock_task._wait_future.side_effect = [_completed_future(exception=RuntimeError("boom"))]
+    mock_task2 = _mock_task("id2")
+    mock_task2._wait_future.side_effect = RuntimeError("no connection")
+
+    taskMgr = SimulationTaskManager()
+    taskMgr.add_task(mock_task)
+    taskMgr.add_task(mock_task2)
+
+    caplog.set_level(logging.ERROR, "PyAdditive_global")
+
     # act
     taskMgr.wait_all()
 
     # assert
-    mock_task1.wait.assert_called_once()
-    mock_task2.wait.assert_called_once()
+    assert "boom" in caplog.text
+    assert "no connection" in caplog.text
+    mock_task.status.assert_called_once()
+    mock_task2.status.assert_called_once()
+
+
+def _cancellable_task(sim_id: str, simulation_input=None) -> Mock:
+    task = Mock(SimulationTask)
+    type(task).simulation_id = PropertyMock(return_value=sim_id)
+    type(task).done = PropertyMock(return_value=False)
+    task._simulation_input = simulation_input
+    return task
 
 
 def test_cancel_all_calls_each_task_cancel():
     # arrange
-    mock_task1 = Mock(SimulationTask)
-    mock_task2 = Mock(SimulationTask)
+    mock_task1 = _cancellable_task("id1")
+    mock_task2 = _cancellable_task("id2")
 
     taskMgr = SimulationTaskManager()
     taskMgr.add_task(mock_task1)
     taskMgr.add_task(mock_task2)
 
     # act
-    taskMgr.cancel_all()
+    result = taskMgr.cancel_all()
 
     # assert
     mock_task1.cancel.assert_called_once()
     mock_task2.cancel.assert_called_once()
+    assert result == {"id1": True, "id2": True}
+
+
+def test_cancel_all_skips_finished_tasks_and_reports_failures(caplog):
+    # arrange
+    finished_task = _cancellable_task("finished")
+    type(finished_task).done = PropertyMock(return_value=True)
+    failing_task = _cancellable_task("failing")
+    failing_task.cancel.side_effect = RuntimeError("no connection")
+    running_task = _cancellable_task("running")
+
+    taskMgr = SimulationTaskManager()
+    for t in [finished_task, failing_task, running_task]:
+        taskMgr.add_task(t)
+    caplog.set_level(logging.ERROR, "PyAdditive_global")
+
+    # act
+    result = taskMgr.cancel_all()
+
+    # assert
+    finished_task.cancel.assert_not_called()
+    assert result == {"failing": False, "running": True}
+    assert "no connection" in caplog.text
+
+
+def test_cancel_only_cancels_tasks_matching_all_filters():
+    # arrange
+    tasks = [
+        _cancellable_task("sb1", SingleBeadInput()),
+        _cancellable_task("sb2", SingleBeadInput()),
+        _cancellable_task("p1", PorosityInput()),
+        _cancellable_task("th1", ThermalHistoryInput()),
+    ]
+    taskMgr = SimulationTaskManager()
+    for t in tasks:
+        taskMgr.add_task(t)
+
+    # act
+    by_type = taskMgr.cancel(types=[SimulationType.SINGLE_BEAD, SimulationType.POROSITY])
+    by_id_and_type = taskMgr.cancel(
+        simulation_ids=["sb2", "p1", "th1"], types=[SimulationType.SINGLE_BEAD]
+    )
+    by_predicate = taskMgr.cancel(predicate=lambda t: t.simulation_id.startswith("th"))
+
+    # assert
+    assert by_type == {"sb1": True, "sb2": True, "p1": True}
+    assert by_id_and_type == {"sb2": True}
+    assert by_predicate == {"th1": True}
 
 
 def test_simulation_ids():
@@ -22,6 +22,7 @@
 
 import os
 import shutil
+import zipfile
 
 import pytest
 
@@ -153,6 +154,22 @@ def test_SingleBeadSummary_init_raises_exception_for_invalid_single_bead_input(
         SingleBeadSummary(invalid_obj, MeltPoolMessage(), "logs", tmp_path)
 
 
+def test_SingleBeadSummary_init_uses_extracted_thermal_history(
+    tmp_path: pytest.TempPathFactory,
+):
+    # arrange
+    melt_pool_msg = test_utils.get_test_melt_pool_message_with_thermal_history()
+    with zipfile.ZipFile(test_utils.get_test_file_path("gridfullthermal.zip")) as zip_ref:
+        zip_ref.extractall(tmp_path)
+
+    # act
+    summary = SingleBeadSummary(SingleBeadInput(), melt_pool_msg, "logs", tmp_path)
+
+    # assert
+    assert summary.melt_pool.thermal_history_output == tmp_path
+    assert len(os.listdir(tmp_path)) == 11
+
+
 def test_SingleBeadSummary_init_raises_exception_if_thermal_history_file_not_found(
     tmp_path: pytest.TempPathFactory,
 ):